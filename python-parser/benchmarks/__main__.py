@@ -0,0 +1,127 @@
+"""벤치마크 실행
+
+python -m benchmarks run --preset medium --compare      # 기준과 비교 (회귀면 종료 코드 1)
+python -m benchmarks run --preset medium --save-baseline
+python -m benchmarks generate /tmp/synthetic --preset large
+"""
+
+import argparse
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from .suite import (
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    DEFAULT_WARMUP,
+    MIN_DELTA_SECONDS,
+    compare,
+    environment_differences,
+    format_rows,
+    load_report,
+    run_suite,
+    save_report,
+)
+from .synthetic_project import PRESETS, generate_project
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _spec(args):
+    spec = PRESETS[args.preset]
+    return spec if args.seed is None else replace(spec, seed=args.seed)
+
+
+def _generate(args) -> int:
+    stats = generate_project(Path(args.directory), _spec(args))
+    print(" ".join(f"{key}={value}" for key, value in stats.items()))
+    return 0
+
+
+def _run(args) -> int:
+    from src.infrastructure.observability.logs import configure_logging
+
+    # 생성기 요약 로그가 측정 결과 출력에 섞이지 않도록 경고만 기록
+    configure_logging(level="WARNING")
+    spec = _spec(args)
+
+    def report_result(name, result):
+        print(f"{name:<28} {result['median_seconds'] * 1000:10.1f}ms", flush=True)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project = Path(args.project or tmpdir) / "synthetic"
+        stats = generate_project(project, spec)
+        print(
+            f"project: {args.preset} " + " ".join(f"{k}={v}" for k, v in stats.items())
+        )
+        report = run_suite(
+            project,
+            spec,
+            stats,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            patterns=args.only,
+            on_result=report_result,
+        )
+
+    if args.output:
+        save_report(report, Path(args.output))
+    if args.save_baseline:
+        save_report(report, Path(args.save_baseline))
+        print(f"baseline saved: {args.save_baseline}")
+    if not args.compare:
+        return 0
+
+    baseline = load_report(Path(args.compare))
+    try:
+        rows = compare(report, baseline, args.threshold, args.min_delta)
+    except ValueError as e:
+        print(f"cannot compare: {e}", file=sys.stderr)
+        return 2
+    for key, (before, now) in environment_differences(report, baseline).items():
+        print(f"warning: {key} differs from baseline ({before} -> {now})")
+    print(format_rows(rows))
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"regressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_project_options(command):
+        command.add_argument("--preset", choices=sorted(PRESETS), default="medium")
+        command.add_argument("--seed", type=int, default=None)
+
+    run = commands.add_parser("run", help="합성 프로젝트로 벤치마크 실행")
+    add_project_options(run)
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    run.add_argument(
+        "--only", action="append", default=[], help="벤치마크 이름 패턴 (parser.*)"
+    )
+    run.add_argument("--project", help="합성 프로젝트를 만들 디렉토리 (남겨 둠)")
+    run.add_argument("--output", help="결과 JSON 경로")
+    run.add_argument(
+        "--save-baseline", nargs="?", const=str(DEFAULT_BASELINE), default=None
+    )
+    run.add_argument("--compare", nargs="?", const=str(DEFAULT_BASELINE), default=None)
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run.add_argument("--min-delta", type=float, default=MIN_DELTA_SECONDS)
+    run.set_defaults(handler=_run)
+
+    generate = commands.add_parser("generate", help="합성 프로젝트만 생성")
+    generate.add_argument("directory")
+    add_project_options(generate)
+    generate.set_defaults(handler=_generate)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+import fnmatch
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .synthetic_project import ProjectSpec
+
+# 기준 파일 형식 버전 (필드가 바뀌면 올림)
+SCHEMA_VERSION = 1
+
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+
+# 중앙값이 기준보다 이 비율 넘게 느려지면 회귀
+DEFAULT_THRESHOLD = 0.25
+# 이보다 작은 차이(초)는 측정 잡음으로 보고 회귀로 치지 않음
+MIN_DELTA_SECONDS = 0.002
+
+# 저장소 조회 벤치마크에서 조회할 심볼 수
+QUERY_SAMPLE = 200
+
+BASE_URL = "http://localhost:8000"
+
+
+@dataclass
+class Benchmark:
+    """벤치마크 하나 (setup 결과를 run에 넘기고 run만 측정)"""
+
+    name: str
+    description: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = field(default=lambda: None)
+    # 한 번 실행에서 처리하는 항목 수 (처리량 계산용, 0이면 생략)
+    items: Callable[[], int] = field(default=lambda: 0)
+    unit: str = "files"
+
+
+def measure(
+    benchmark: Benchmark, repeat: int = DEFAULT_REPEAT, warmup: int = DEFAULT_WARMUP
+) -> Dict[str, Any]:
+    """warmup번 버린 뒤 repeat번 측정한 시간 통계 (초)"""
+    timings = []
+    for iteration in range(warmup + repeat):
+        state = benchmark.setup()
+        # 이전 실행의 쓰레기 수집이 측정 구간에 끼지 않도록 미리 정리
+        gc.collect()
+        started = time.perf_counter()
+        benchmark.run(state)
+        elapsed = time.perf_counter() - started
+        if iteration >= warmup:
+            timings.append(elapsed)
+
+    median = statistics.median(timings)
+    result = {
+        "median_seconds": round(median, 6),
+        "min_seconds": round(min(timings), 6),
+        "mean_seconds": round(statistics.mean(timings), 6),
+        "stdev_seconds": round(statistics.stdev(timings), 6) if repeat > 1 else 0.0,
+        "runs": repeat,
+    }
+    items = benchmark.items()
+    if items and median > 0:
+        result[f"{benchmark.unit}_per_second"] = round(items / median, 1)
+    return result
+
+
+class _Context:
+    """벤치마크가 공유하는 입력 (분석 결과는 처음 필요할 때 한 번만 만듦)"""
+
+    def __init__(self, project: Path):
+        self.project = project
+        self.files = sorted(
+            path for path in project.rglob("*.py") if path.stat().st_size
+        )
+
+    def analysis_request(self):
+        from src.application.use_cases.analyze_code_use_case import AnalysisRequest
+
+        return AnalysisRequest(project_path=self.project)
+
+    @cached_property
+    def analyzed(self):
+        """분석을 마친 유스케이스 (저장소 조회 벤치마크 입력)"""
+        from src.application.use_cases.analyze_code_use_case import (
+            AnalyzeCodeUseCase,
+        )
+
+        use_case = AnalyzeCodeUseCase()
+        use_case.execute(self.analysis_request())
+        return use_case
+
+    @cached_property
+    def query_names(self) -> List[str]:
+        symbols = self.analyzed.symbol_repository.get_all()
+        sample = random.Random(0).sample(symbols, min(QUERY_SAMPLE, len(symbols)))
+        return [symbol.full_name for symbol in sample]
+
+    def prepared(self) -> "_Context":
+        """분석과 조회 대상 선택을 측정 전에 끝냄"""
+        self.query_names
+        return self
+
+    @cached_property
+    def warm_fragment_cache(self):
+        from src.infrastructure.cache.fragment_cache import ViewSetFragmentCache
+
+        cache = ViewSetFragmentCache()
+        self.generate(cache)
+        return cache
+
+    @cached_property
+    def viewsets(self) -> int:
+        from src.infrastructure.generators.api_documentation_generator import (
+            discover_viewsets,
+        )
+
+        return len(discover_viewsets(self.project))
+
+    def generate(self, fragment_cache):
+        from src.infrastructure.generators.api_documentation_generator import (
+            generate_api_documentation,
+        )
+
+        return generate_api_documentation(
+            self.project,
+            BASE_URL,
+            static_analysis=True,
+            fragment_cache=fragment_cache,
+        )
+
+
+def _parse_all(parser_factory: Callable[[], Any], files: List[Path]):
+    parser = parser_factory()
+    for file_path in files:
+        parser.parse_file(file_path)
+
+
+def _point_queries(context: _Context) -> None:
+    use_case = context.analyzed
+    symbols = use_case.symbol_repository
+    calls = use_case.call_repository
+    chunks = use_case.chunk_repository
+    for full_name in context.query_names:
+        short_name = full_name.rsplit(".", 1)[-1]
+        symbols.find_by_name(full_name)
+        symbols.find_by_name(short_name)
+        calls.find_by_caller(full_name)
+        calls.find_by_callee(short_name)
+        chunks.find_by_symbol(short_name)
+    for file_path in context.files:
+        symbols.find_by_file(file_path)
+        chunks.find_by_file(file_path)
+
+
+def _scans(context: _Context) -> None:
+    use_case = context.analyzed
+    use_case.symbol_repository.find_unused_symbols()
+    use_case.symbol_repository.get_statistics()
+    use_case.call_repository.get_statistics()
+    use_case.chunk_repository.get_statistics()
+    use_case.call_repository.get_reverse_call_graph()
+
+
+def _cold_generation(context: _Context):
+    from src.infrastructure.cache.fragment_cache import ViewSetFragmentCache
+    from src.infrastructure.generators.viewset_discovery import default_viewset_index
+
+    # 서버 시작 직후 첫 요청처럼 발견 인덱스와 필드 캐시를 비운 상태
+    default_viewset_index.clear()
+    return ViewSetFragmentCache()
+
+
+def build_benchmarks(project: Path) -> List[Benchmark]:
+    """project를 입력으로 하는 파서/분석/저장소/문서 생성 벤치마크 목록"""
+    from src.application.use_cases.analyze_code_use_case import AnalyzeCodeUseCase
+    from src.infrastructure.parsers.hybrid_parser import HybridParser
+    from src.infrastructure.parsers.python_parser import PythonParser
+
+    context = _Context(project)
+    files = context.files
+    return [
+        Benchmark(
+            "parser.python",
+            "PythonParser.parse_file로 모든 파일 파싱",
+            lambda _: _parse_all(PythonParser, files),
+            items=lambda: len(files),
+        ),
+        Benchmark(
+            "parser.hybrid",
+            "HybridParser.parse_file로 모든 파일 파싱",
+            lambda _: _parse_all(HybridParser, files),
+            items=lambda: len(files),
+        ),
+        Benchmark(
+            "analysis.execute",
+            "AnalyzeCodeUseCase.execute (새 저장소에 프로젝트 전체 분석)",
+            lambda use_case: use_case.execute(context.analysis_request()),
+            setup=AnalyzeCodeUseCase,
+            items=lambda: len(files),
+        ),
+        Benchmark(
+            "repository.point_queries",
+            "심볼 이름/호출자/피호출자/청크/파일별 조회",
+            _point_queries,
+            setup=context.prepared,
+            items=lambda: len(context.query_names) * 5 + len(files) * 2,
+            unit="queries",
+        ),
+        Benchmark(
+            "repository.scans",
+            "미사용 심볼, 저장소 통계, 역방향 호출 그래프",
+            _scans,
+            setup=context.prepared,
+        ),
+        Benchmark(
+            "generation.static_cold",
+            "generate_api_documentation (정적 분석, 발견 인덱스/필드 캐시 없음)",
+            context.generate,
+            setup=lambda: _cold_generation(context),
+            items=lambda: context.viewsets,
+            unit="viewsets",
+        ),
+        Benchmark(
+            "generation.static_warm",
+            "generate_api_documentation (정적 분석, 변경 없는 재생성)",
+            context.generate,
+            setup=lambda: context.warm_fragment_cache,
+            items=lambda: context.viewsets,
+            unit="viewsets",
+        ),
+    ]
+
+
+def select(benchmarks: List[Benchmark], patterns: Sequence[str]) -> List[Benchmark]:
+    """이름이 패턴(`parser.*` 등) 중 하나와 맞는 벤치마크 (패턴이 없으면 전부)"""
+    if not patterns:
+        return benchmarks
+    return [
+        benchmark
+        for benchmark in benchmarks
+        if any(fnmatch.fnmatch(benchmark.name, pattern) for pattern in patterns)
+    ]
+
+
+def environment() -> Dict[str, Any]:
+    """측정 환경 (다른 환경의 기준과 비교하면 경고)"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(
+    project: Path,
+    spec: ProjectSpec,
+    project_stats: Dict[str, int],
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    patterns: Sequence[str] = (),
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """벤치마크를 실행해 기준 파일 형식의 보고서를 만듦"""
+    results = {}
+    for benchmark in select(build_benchmarks(project), patterns):
+        results[benchmark.name] = measure(benchmark, repeat, warmup)
+        if on_result is not None:
+            on_result(benchmark.name, results[benchmark.name])
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "project": {"spec": asdict(spec), "stats": project_stats},
+        "repeat": repeat,
+        "warmup": warmup,
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = MIN_DELTA_SECONDS,
+) -> List[Dict[str, Any]]:
+    """벤치마크별 기준 대비 중앙값 변화와 상태(ok/regression/improvement/new/missing)
+
+    합성 프로젝트 규모가 다르면 비교할 수 없으므로 ValueError.
+    """
+    if baseline.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"unsupported baseline schema: {baseline.get('schema')}")
+    if current["project"]["spec"] != baseline["project"]["spec"]:
+        raise ValueError(
+            "baseline was recorded for a different project spec: "
+            f"{baseline['project']['spec']}"
+        )
+
+    rows = []
+    names = list(current["results"]) + [
+        name for name in baseline["results"] if name not in current["results"]
+    ]
+    for name in names:
+        now = current["results"].get(name)
+        before = baseline["results"].get(name)
+        row = {"name": name, "baseline": None, "current": None, "change": None}
+        if before is None:
+            row.update(status="new", current=now["median_seconds"])
+        elif now is None:
+            row.update(status="missing", baseline=before["median_seconds"])
+        else:
+            base, value = before["median_seconds"], now["median_seconds"]
+            change = (value - base) / base if base else 0.0
+            status = "ok"
+            if change > threshold and value - base > min_delta:
+                status = "regression"
+            elif change < -threshold and base - value > min_delta:
+                status = "improvement"
+            row.update(
+                status=status, baseline=base, current=value, change=round(change, 4)
+            )
+        rows.append(row)
+    return rows
+
+
+def environment_differences(
+    current: Dict[str, Any], baseline: Dict[str, Any]
+) -> Dict[str, Any]:
+    """기준과 다른 측정 환경 항목 (기준값, 현재값)"""
+    before = baseline.get("environment", {})
+    now = current["environment"]
+    return {
+        key: (before.get(key), value)
+        for key, value in now.items()
+        if before.get(key) != value
+    }
+
+
+def format_rows(rows: List[Dict[str, Any]]) -> str:
+    """비교 결과 표"""
+
+    def seconds(value):
+        return "-" if value is None else f"{value * 1000:.1f}ms"
+
+    width = max([len(row["name"]) for row in rows] + [9])
+    lines = [
+        f"{'benchmark':<{width}}  {'baseline':>10}  {'current':>10}  change  status"
+    ]
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.0%}"
+        lines.append(
+            f"{row['name']:<{width}}  {seconds(row['baseline']):>10}  "
+            f"{seconds(row['current']):>10}  {change:>6}  {row['status']}"
+        )
+    return "\n".join(lines)
+
+
+def save_report(report: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,372 @@
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+# 앱/엔티티 이름 (부족하면 번호를 붙여 재사용)
+APP_NAMES = [
+    "billing",
+    "catalog",
+    "orders",
+    "accounts",
+    "inventory",
+    "shipping",
+    "reports",
+    "payments",
+    "reviews",
+    "notifications",
+]
+ENTITY_NAMES = [
+    "Invoice",
+    "Product",
+    "Order",
+    "Customer",
+    "Shipment",
+    "Payment",
+    "Review",
+    "Coupon",
+    "Warehouse",
+    "Refund",
+]
+
+# 모델 필드 종류 (필드 정의, 순서대로 돌아가며 사용)
+MODEL_FIELDS = [
+    "models.CharField(max_length=100, help_text='{name}')",
+    "models.IntegerField(default=0)",
+    "models.DecimalField(max_digits=10, decimal_places=2)",
+    "models.BooleanField(default=False)",
+    "models.DateTimeField(auto_now_add=True)",
+    "models.TextField(blank=True, null=True)",
+    "models.EmailField(blank=True)",
+    "models.JSONField(default=dict)",
+]
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """합성 Django 프로젝트 규모
+
+    calls_per_method는 메서드 하나가 같은 클래스/다른 모듈의 메서드를 부르는
+    횟수(호출 밀도)이고, 같은 seed면 항상 같은 코드를 만든다.
+    """
+
+    apps: int = 4
+    modules_per_app: int = 5
+    classes_per_module: int = 4
+    methods_per_class: int = 6
+    calls_per_method: int = 3
+    viewsets_per_app: int = 3
+    fields_per_model: int = 8
+    seed: int = 0
+
+
+PRESETS: Dict[str, ProjectSpec] = {
+    "tiny": ProjectSpec(
+        apps=1,
+        modules_per_app=2,
+        classes_per_module=2,
+        methods_per_class=3,
+        calls_per_method=2,
+        viewsets_per_app=2,
+        fields_per_model=4,
+    ),
+    "small": ProjectSpec(apps=2, modules_per_app=3, viewsets_per_app=2),
+    "medium": ProjectSpec(),
+    "large": ProjectSpec(
+        apps=10,
+        modules_per_app=10,
+        classes_per_module=6,
+        methods_per_class=8,
+        calls_per_method=4,
+        viewsets_per_app=6,
+        fields_per_model=12,
+    ),
+}
+
+
+def _name(names: List[str], index: int) -> str:
+    base = names[index % len(names)]
+    return base if index < len(names) else f"{base}{index // len(names)}"
+
+
+class SyntheticProjectGenerator:
+    """ViewSet/serializer/model과 서비스 모듈을 가진 Django 프로젝트 생성기
+
+    구조는 `app/<앱>/{models,serializers,views,urls}.py`와
+    `app/<앱>/services/module_N.py`이며, 분석/생성 벤치마크 입력으로 쓴다.
+    """
+
+    def __init__(self, spec: ProjectSpec):
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+        self.stats = {"files": 0, "bytes": 0, "lines": 0, "classes": 0}
+        self.stats.update({"methods": 0, "calls": 0, "viewsets": 0})
+
+    def generate(self, root: Path) -> Dict[str, int]:
+        """root 아래에 프로젝트를 만들고 파일/클래스/메서드/호출 수를 돌려줌"""
+        root = Path(root)
+        apps = [_name(APP_NAMES, i) for i in range(self.spec.apps)]
+        self._write(root / "manage.py", self._manage())
+        self._write(root / "config" / "__init__.py", "")
+        self._write(root / "config" / "settings.py", self._settings(apps))
+        self._write(root / "config" / "urls.py", self._root_urls(apps))
+        for app_index, app in enumerate(apps):
+            self._generate_app(root / "app" / app, app, app_index)
+        return dict(self.stats)
+
+    def _generate_app(self, app_dir: Path, app: str, app_index: int) -> None:
+        start = app_index * self.spec.viewsets_per_app
+        entities = [
+            _name(ENTITY_NAMES, start + i) for i in range(self.spec.viewsets_per_app)
+        ]
+        self._write(app_dir / "__init__.py", "")
+        self._write(app_dir / "models.py", self._models(entities))
+        self._write(app_dir / "serializers.py", self._serializers(entities))
+        self._write(app_dir / "views.py", self._views(entities))
+        self._write(app_dir / "urls.py", self._urls(app, entities))
+        self._write(app_dir / "services" / "__init__.py", "")
+        for module_index in range(self.spec.modules_per_app):
+            self._write(
+                app_dir / "services" / f"module_{module_index}.py",
+                self._service_module(module_index),
+            )
+        self.stats["viewsets"] += len(entities)
+
+    def _write(self, path: Path, content: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        self.stats["files"] += 1
+        self.stats["bytes"] += len(content.encode("utf-8"))
+        self.stats["lines"] += content.count("\n")
+
+    @staticmethod
+    def _manage() -> str:
+        return (
+            "import os\nimport sys\n\n\n"
+            "def main():\n"
+            '    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")\n'
+            "    from django.core.management import execute_from_command_line\n\n"
+            "    execute_from_command_line(sys.argv)\n\n\n"
+            'if __name__ == "__main__":\n    main()\n'
+        )
+
+    @staticmethod
+    def _settings(apps: List[str]) -> str:
+        installed = "".join(f'    "{app}",\n' for app in apps)
+        return (
+            'SECRET_KEY = "benchmark"\n'
+            "DEBUG = True\n"
+            'ROOT_URLCONF = "config.urls"\n'
+            "INSTALLED_APPS = [\n"
+            '    "django.contrib.contenttypes",\n'
+            '    "rest_framework",\n'
+            f"{installed}]\n"
+            "DATABASES = {\n"
+            '    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}\n'
+            "}\n"
+        )
+
+    @staticmethod
+    def _root_urls(apps: List[str]) -> str:
+        includes = "".join(
+            f'    path("api/v1/", include("{app}.urls")),\n' for app in apps
+        )
+        return (
+            "from django.urls import include, path\n\n"
+            f"urlpatterns = [\n{includes}]\n"
+        )
+
+    def _models(self, entities: List[str]) -> str:
+        lines = ["from django.db import models", "", ""]
+        for index, entity in enumerate(entities):
+            lines.append(f"class {entity}(models.Model):")
+            lines.append(f'    """{entity} 모델"""')
+            lines.append("")
+            for field_index in range(self.spec.fields_per_model):
+                field = f"{entity.lower()}_field_{field_index}"
+                definition = MODEL_FIELDS[field_index % len(MODEL_FIELDS)]
+                lines.append(f"    {field} = {definition.format(name=field)}")
+            if index > 0:
+                lines.append(
+                    f"    parent = models.ForeignKey({entities[index - 1]}, "
+                    "on_delete=models.CASCADE, null=True)"
+                )
+            lines.extend(["", "    class Meta:", '        ordering = ["-id"]', "", ""])
+            self.stats["classes"] += 1
+        return "\n".join(lines)
+
+    def _serializers(self, entities: List[str]) -> str:
+        lines = [
+            "from rest_framework import serializers",
+            "",
+            f"from .models import {', '.join(entities)}",
+            "",
+            "",
+        ]
+        for index, entity in enumerate(entities):
+            lines.append(f"class {entity}Serializer(serializers.ModelSerializer):")
+            if index > 0:
+                lines.append(
+                    f"    parent = {entities[index - 1]}Serializer(read_only=True)"
+                )
+            lines.append("    label = serializers.SerializerMethodField()")
+            lines.extend(["", "    class Meta:", f"        model = {entity}"])
+            if index % 2:
+                lines.append('        fields = "__all__"')
+            else:
+                fields = ["id"] + [
+                    f"{entity.lower()}_field_{i}"
+                    for i in range(self.spec.fields_per_model)
+                ]
+                lines.append(f"        fields = {fields + ['label']!r}")
+            lines.append('        read_only_fields = ["id"]')
+            lines.extend(
+                ["", "    def get_label(self, obj):", "        return str(obj)"]
+            )
+            lines.extend(["", ""])
+            self.stats["classes"] += 1
+            self.stats["methods"] += 1
+        return "\n".join(lines)
+
+    def _views(self, entities: List[str]) -> str:
+        lines = [
+            "from rest_framework import viewsets",
+            "from rest_framework.decorators import action",
+            "from rest_framework.response import Response",
+            "",
+            "from . import serializers",
+            f"from .models import {', '.join(entities)}",
+            "from .services.module_0 import Service0",
+            "",
+            "",
+        ]
+        for entity in entities:
+            lines.extend(
+                [
+                    f"class {entity}ViewSet(viewsets.ModelViewSet):",
+                    f'    """{entity} API"""',
+                    "",
+                    f"    queryset = {entity}.objects.all()",
+                    f"    serializer_class = serializers.{entity}Serializer",
+                    "",
+                    "    @action(detail=True, methods=['post'])",
+                    "    def process(self, request, pk=None):",
+                    f'        """{entity} 처리"""',
+                    "        instance = self.get_object()",
+                    "        result = Service0().run_0(instance)",
+                    "        return Response({'result': result})",
+                    "",
+                    "",
+                ]
+            )
+            self.stats["classes"] += 1
+            self.stats["methods"] += 1
+            self.stats["calls"] += 3
+        return "\n".join(lines)
+
+    @staticmethod
+    def _urls(app: str, entities: List[str]) -> str:
+        registrations = "".join(
+            f'router.register(r"{entity.lower()}s", views.{entity}ViewSet)\n'
+            for entity in entities
+        )
+        return (
+            "from rest_framework.routers import DefaultRouter\n\n"
+            "from . import views\n\n"
+            f'app_name = "{app}"\n'
+            "router = DefaultRouter()\n"
+            f"{registrations}"
+            "urlpatterns = router.urls\n"
+        )
+
+    def _service_module(self, module_index: int) -> str:
+        spec = self.spec
+        imported = sorted(
+            {
+                self.random.randrange(spec.modules_per_app)
+                for _ in range(min(2, spec.modules_per_app))
+            }
+            - {module_index}
+        )
+        lines = ["import logging", "from typing import Any, Dict, List, Optional", ""]
+        lines.extend(f"from . import module_{other}" for other in imported)
+        lines.extend(["", "logger = logging.getLogger(__name__)", "", ""])
+        lines.extend(
+            [
+                f"def helper_{module_index}(values: List[Any]) -> Dict[str, Any]:",
+                '    """값 목록 요약"""',
+                "    return {'count': len(values), 'first': values[0] if values else None}",
+                "",
+                "",
+            ]
+        )
+        for class_index in range(spec.classes_per_module):
+            lines.extend(self._service_class(module_index, class_index, imported))
+        return "\n".join(lines)
+
+    def _service_class(
+        self, module_index: int, class_index: int, imported: List[int]
+    ) -> List[str]:
+        spec = self.spec
+        name = (
+            f"Service{class_index}"
+            if module_index == 0
+            else (f"Module{module_index}Service{class_index}")
+        )
+        lines = [
+            f"class {name}:",
+            f'    """서비스 {module_index}.{class_index}"""',
+            "",
+            "    def __init__(self, limit: Optional[int] = None):",
+            "        self.limit = limit or 10",
+            "        self.cache: Dict[str, Any] = {}",
+            "",
+        ]
+        for method_index in range(spec.methods_per_class):
+            lines.extend(
+                [
+                    f"    def run_{method_index}(self, item: Any, depth: int = 0) -> Any:",
+                    f'        """단계 {method_index} 실행"""',
+                    "        if depth > self.limit:",
+                    "            return None",
+                    "        results = []",
+                    "        for index in range(3):",
+                    "            if index % 2 == 0:",
+                    "                results.append(index)",
+                    "            elif item is None:",
+                    "                continue",
+                ]
+            )
+            for _ in range(spec.calls_per_method):
+                lines.append(f"        {self._call(module_index, imported)}")
+            lines.extend(
+                [
+                    f"        summary = helper_{module_index}(results)",
+                    "        logger.debug('done %s', summary)",
+                    "        return summary",
+                    "",
+                ]
+            )
+            self.stats["methods"] += 1
+            self.stats["calls"] += spec.calls_per_method + 3
+        lines.append("")
+        self.stats["classes"] += 1
+        return lines
+
+    def _call(self, module_index: int, imported: List[int]) -> str:
+        spec = self.spec
+        method = self.random.randrange(spec.methods_per_class)
+        if imported and self.random.random() < 0.4:
+            other = self.random.choice(imported)
+            cls = self.random.randrange(spec.classes_per_module)
+            target = f"Service{cls}" if other == 0 else f"Module{other}Service{cls}"
+            return (
+                f"results.append(module_{other}.{target}(self.limit)"
+                f".run_{method}(item, depth + 1))"
+            )
+        return f"results.append(self.run_{method}(item, depth + 1))"
+
+
+def generate_project(root: Path, spec: ProjectSpec) -> Dict[str, int]:
+    """spec 규모의 합성 프로젝트를 root에 생성"""
+    return SyntheticProjectGenerator(spec).generate(root)
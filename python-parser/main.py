@@ -1,13 +1,29 @@
-from fastapi import FastAPI
+import time
+
+_STARTED_AT = time.perf_counter()
+
+import os
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
 
+from src.infrastructure.observability.logs import configure_logging
+from src.infrastructure.observability.metrics import HTTP_REQUEST_SECONDS
+from src.infrastructure.observability.startup import StartupTimeline
 from src.presentation.controllers.analysis_controller import router as analysis_router
 from src.presentation.controllers.api_docs_controller import router as api_docs_router
+from src.presentation.controllers.debug_controller import router as debug_router
+from src.presentation.controllers.progress_controller import router as progress_router
+from src.presentation.controllers.metrics_controller import router as metrics_router
+
+startup_timeline = StartupTimeline(started_at=_STARTED_AT)
+startup_timeline.mark("imports_done")
 
 
 def create_app() -> FastAPI:
     """FastAPI 애플리케이션 생성"""
+    # LOG_LEVEL/LOG_FORMAT 등 환경 변수로 서비스 로그 레벨과 형식 설정
+    configure_logging()
     app = FastAPI(
         title="Python Code Analysis & API Documentation Generator",
         description="Clean Architecture 기반 Python 코드 분석 및 API 문서 생성 서비스",
@@ -15,6 +31,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
     )
+    app.state.startup_timeline = startup_timeline
 
     # CORS 설정
     app.add_middleware(
@@ -28,6 +45,33 @@ def create_app() -> FastAPI:
     # 라우터 등록
     app.include_router(analysis_router)
     app.include_router(api_docs_router)
+    app.include_router(debug_router)
+    app.include_router(progress_router)
+    app.include_router(metrics_router)
+
+    @app.on_event("startup")
+    async def mark_ready():
+        startup_timeline.mark("ready")
+
+    @app.middleware("http")
+    async def record_request(request: Request, call_next):
+        started = time.perf_counter()
+        # 처리되지 않은 예외로 끝난 요청은 500으로 집계
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            if not startup_timeline.has("first_request"):
+                startup_timeline.mark("first_request")
+            # 경로 변수 값 대신 라우트 템플릿으로 집계 (라벨 수 제한)
+            route = request.scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                request.method,
+                getattr(route, "path", "unmatched"),
+                status,
+            ).observe(time.perf_counter() - started)
 
     @app.get("/")
     async def root():
@@ -48,6 +92,16 @@ def create_app() -> FastAPI:
 
 
 app = create_app()
+startup_timeline.mark("app_created")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8009, reload=True, log_level="info")
+    import uvicorn
+
+    # reload 모드는 감시용 프로세스를 하나 더 띄우므로 개발 시에만 켠다
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8009,
+        reload=os.getenv("UVICORN_RELOAD", "false").lower() == "true",
+        log_level="info",
+    )
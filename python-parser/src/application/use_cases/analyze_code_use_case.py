@@ -1,6 +1,6 @@
 from typing import List, Dict, Optional, Any
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ...domain.repositories.call_repository import CallRepository
 from ...domain.repositories.chunk_repository import ChunkRepository
@@ -15,6 +15,23 @@ from ...infrastructure.repositories.memory_symbol_repository import (
 )
 from ...infrastructure.repositories.memory_call_repository import MemoryCallRepository
 from ...infrastructure.repositories.memory_chunk_repository import MemoryChunkRepository
+from ...infrastructure.observability.metrics import (
+    ANALYSIS_PROJECT_BYTES,
+    ANALYSIS_PROJECT_FILES,
+    ANALYSIS_REPOSITORY_ITEMS,
+    ANALYSIS_SECONDS,
+)
+from ...infrastructure.observability.timings import FileTimings, PhaseTimer
+from ...infrastructure.runtime.deadline import check_deadline, stop_reason
+from ...infrastructure.runtime.progress import (
+    progress_advance,
+    progress_current,
+    progress_phase,
+)
+from ...infrastructure.observability.logs import RunSummary, get_logger
+from ...infrastructure.observability.profiler import profiled
+
+logger = get_logger(__name__)
 
 
 @dataclass
@@ -26,6 +43,8 @@ class AnalysisRequest:
     include_docs: bool = True
     max_file_size: Optional[int] = None
     exclude_patterns: List[str] = None
+    # 타이밍 요약에 포함할 가장 느린 파일 수
+    slowest_files: int = 10
 
     def __post_init__(self):
         if self.exclude_patterns is None:
@@ -41,6 +60,21 @@ class AnalysisResult:
     chunks: List[CodeChunk]
     statistics: Dict[str, any]
     duration: float
+    # 기한 초과/취소로 중간에 멈춘 경우 건너뛴 파일과 사유
+    partial: bool = False
+    skipped_files: List[str] = field(default_factory=list)
+    stop_reason: Optional[str] = None
+    # 단계별 소요 시간, 파일별 소요 시간 백분위와 가장 느린 파일
+    timings: Dict[str, Any] = field(default_factory=dict)
+
+    def completion_dict(self) -> Dict[str, Any]:
+        """부분 결과 여부 요약 (응답용)"""
+        return {
+            "partial": self.partial,
+            "stop_reason": self.stop_reason,
+            "skipped_files_count": len(self.skipped_files),
+            "skipped_files": self.skipped_files,
+        }
 
 
 class AnalyzeCodeUseCase:
@@ -57,41 +91,118 @@ class AnalyzeCodeUseCase:
         self.symbol_repository = symbol_repository or MemorySymbolRepository()
         self.call_repository = call_repository or MemoryCallRepository()
         self.chunk_repository = chunk_repository or MemoryChunkRepository()
+        # 메모리 집계용 직전 분석 정보 (결과 크기 / 소스 크기 배수 계산)
+        self.last_project: Optional[Path] = None
+        self.last_source_bytes = 0
 
+    @profiled("analysis")
     def execute(self, request: AnalysisRequest) -> AnalysisResult:
         """프로젝트 분석 실행"""
         import time
 
         start_time = time.time()
 
+        # 대기 중에 기한이 지났으면 기존 결과를 지우기 전에 중단
+        check_deadline()
+
+        timer = PhaseTimer()
+        file_timings = FileTimings()
+
         # 기존 데이터 클리어
-        self._clear_existing_data()
+        with timer.span("clear"):
+            self._clear_existing_data()
 
         # 프로젝트 파일 스캔
-        files = self._scan_project_files(request)
+        progress_phase("scan")
+        with timer.span("scan"):
+            files = self._scan_project_files(request)
+        progress_phase("parse", total=len(files))
 
         all_symbols = []
         all_calls = []
         all_chunks = []
-
-        # 각 파일 분석
-        for file_path in files:
+        skipped_files: List[str] = []
+        stopped = None
+        # 파일마다 줄을 남기지 않고 결과별 개수를 모아 끝에 한 줄로 기록
+        summary = RunSummary(logger, "분석 완료: %s")
+
+        # 각 파일 분석 (파일 사이마다 기한/취소 확인)
+        for index, file_path in enumerate(files):
+            stopped = stop_reason()
+            if stopped:
+                skipped_files = [str(path) for path in files[index:]]
+                logger.warning(
+                    "분석 중단 (%s): %s/%s개 파일 분석, %s개 건너뜀",
+                    stopped,
+                    index,
+                    len(files),
+                    len(skipped_files),
+                )
+                break
+            progress_current(str(file_path))
+            file_phases: Dict[str, float] = {}
+            file_started = time.perf_counter()
             try:
-                symbols, calls, chunks = self._analyze_file(file_path, request)
+                symbols, calls, chunks = self._analyze_file(
+                    file_path, request, file_phases
+                )
                 all_symbols.extend(symbols)
                 all_calls.extend(calls)
                 all_chunks.extend(chunks)
             except Exception as e:
-                print(f"파일 분석 중 오류 발생: {file_path} - {e}")
-                continue
+                logger.warning("파일 분석 중 오류 발생: %s - %s", file_path, e)
+                summary.count("failed", str(file_path))
+            finally:
+                file_timings.record(
+                    self._relative_path(file_path, request.project_path),
+                    time.perf_counter() - file_started,
+                    self._file_size(file_path),
+                    file_phases,
+                )
+                progress_advance()
+
+        # 파일별 read/parse/symbols/calls/chunks 시간을 단계로 합산
+        for name, seconds in file_timings.phase_totals().items():
+            timer.add(name, seconds, count=len(files) - len(skipped_files))
 
         # 결과 저장
-        self._save_analysis_results(all_symbols, all_calls, all_chunks)
+        progress_phase("save")
+        with timer.span("index"):
+            self._save_analysis_results(all_symbols, all_calls, all_chunks)
 
         # 통계 생성
-        statistics = self._generate_statistics(all_symbols, all_calls, all_chunks)
+        progress_phase("statistics")
+        with timer.span("statistics"):
+            statistics = self._generate_statistics(all_symbols, all_calls, all_chunks)
 
         duration = time.time() - start_time
+        file_summary = file_timings.summary(slowest=request.slowest_files)
+        ANALYSIS_SECONDS.labels("partial" if skipped_files else "complete").observe(
+            duration
+        )
+        ANALYSIS_PROJECT_FILES.observe(file_summary["count"])
+        ANALYSIS_PROJECT_BYTES.observe(file_summary["total_bytes"])
+        ANALYSIS_REPOSITORY_ITEMS.labels("symbols").set(len(all_symbols))
+        ANALYSIS_REPOSITORY_ITEMS.labels("calls").set(len(all_calls))
+        ANALYSIS_REPOSITORY_ITEMS.labels("chunks").set(len(all_chunks))
+        self.last_project = request.project_path
+        self.last_source_bytes = file_summary["total_bytes"]
+        timings = {
+            "phases": timer.to_dict(),
+            "files": file_summary,
+        }
+        summary.log(
+            request.project_path.name,
+            files=file_summary["count"],
+            skipped=len(skipped_files),
+            symbols=len(all_symbols),
+            chunks=len(all_chunks),
+            seconds=duration,
+            **{
+                f"{name}_seconds": phase["seconds"]
+                for name, phase in timings["phases"].items()
+            },
+        )
 
         return AnalysisResult(
             symbols=all_symbols,
@@ -99,6 +210,10 @@ class AnalyzeCodeUseCase:
             chunks=all_chunks,
             statistics=statistics,
             duration=duration,
+            partial=bool(skipped_files),
+            skipped_files=skipped_files,
+            stop_reason=stopped if skipped_files else None,
+            timings=timings,
         )
 
     def execute_file(
@@ -281,6 +396,7 @@ class AnalyzeCodeUseCase:
                 continue
 
             files.append(file_path)
+            progress_advance()
 
         return files
 
@@ -295,15 +411,32 @@ class AnalyzeCodeUseCase:
         return any(pattern in str(file_path) for pattern in doc_patterns)
 
     def _analyze_file(
-        self, file_path: Path, request: AnalysisRequest
+        self,
+        file_path: Path,
+        request: AnalysisRequest,
+        timings: Optional[Dict[str, float]] = None,
     ) -> tuple[List[CodeSymbol], List[CallRelationship], List[CodeChunk]]:
-        """파일 분석"""
+        """파일 분석 (timings에 파서 단계별 소요 시간 기록)"""
         # 실제 구현에서는 파서 서비스를 주입받아 사용
         # 여기서는 간단한 예시로 구현
         from ...infrastructure.parsers.python_parser import PythonParser
 
         parser = PythonParser()
-        return parser.parse_file(file_path)
+        return parser.parse_file(file_path, timings)
+
+    @staticmethod
+    def _relative_path(file_path: Path, project_path: Path) -> str:
+        try:
+            return str(file_path.relative_to(project_path))
+        except ValueError:
+            return str(file_path)
+
+    @staticmethod
+    def _file_size(file_path: Path) -> Optional[int]:
+        try:
+            return file_path.stat().st_size
+        except OSError:
+            return None
 
     def _save_analysis_results(
         self,
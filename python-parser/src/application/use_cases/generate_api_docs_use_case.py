@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from ...domain.repositories.symbol_repository import SymbolRepository
 from ...domain.repositories.api_documentation_repository import (
@@ -9,6 +9,21 @@ from ...domain.entities.api_documentation import ApiDocumentation
 from ...infrastructure.generators.api_documentation_generator import (
     generate_api_documentation,
 )
+from ...infrastructure.vcs.git_state import read_head
+from ...infrastructure.cache.generation_cache import GenerationKey
+from ...infrastructure.runtime.deadline import stop_reason
+from ...infrastructure.runtime.progress import (
+    progress_advance,
+    progress_phase,
+    progress_result,
+)
+from ...infrastructure.observability.metrics import CACHE_LOOKUPS
+from ...infrastructure.observability.logs import get_logger
+
+logger = get_logger(__name__)
+
+# git 정보가 없을 때 사용할 버전 라벨
+DEFAULT_VERSION_LABEL = "working-tree"
 
 
 class GenerateApiDocsUseCase:
@@ -18,48 +33,182 @@ class GenerateApiDocsUseCase:
         self,
         symbol_repository: SymbolRepository,
         api_documentation_repository: ApiDocumentationRepository,
+        introspection_pool=None,
+        spec_store=None,
+        project_scheduler=None,
+        generation_cache=None,
     ):
         self.symbol_repository = symbol_repository
         self.api_documentation_repository = api_documentation_repository
+        # 프로젝트별 Django 워커 풀 (None이면 현재 프로세스에서 Django 설정)
+        self.introspection_pool = introspection_pool
+        # 버전별 스펙 저장소 (None이면 버전 기록 안 함)
+        self.spec_store = spec_store
+        # 전체 프로젝트 병렬 생성 스케줄러 (None이면 순차 실행)
+        self.project_scheduler = project_scheduler
+        # git HEAD 기준 생성 캐시 (None이면 매번 새로 생성)
+        self.generation_cache = generation_cache
 
     def execute(
         self,
         project_path: Path,
         base_url: str = "http://localhost:8000",
         output_file: Optional[Path] = None,
+        static_analysis: bool = False,
+        version: Optional[str] = None,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
-        """API 문서 생성 실행"""
+        """API 문서 생성 실행 (refresh가 True면 캐시를 무시하고 새로 생성)"""
 
-        # 1. 심볼 데이터 조회
-        symbols = self.symbol_repository.get_all()
+        # 1. 캐시 조회 (HEAD와 작업 트리가 그대로면 저장된 문서 사용)
+        progress_phase("cache")
+        cache_key, documentation = self._lookup_cache(
+            project_path, base_url, static_analysis, refresh
+        )
+        if documentation is not None:
+            cache_status = "hit"
+        elif cache_key is None:
+            cache_status = "bypass"
+        else:
+            cache_status = "refresh" if refresh else "miss"
 
-        # 2. API 문서 생성 (함수 직접 호출)
-        documentation = generate_api_documentation(
-            project_path=project_path, base_url=base_url
+        if documentation is None:
+            # 2. API 문서 생성 (함수 직접 호출)
+            documentation = generate_api_documentation(
+                project_path=project_path,
+                base_url=base_url,
+                introspection_pool=self.introspection_pool,
+                static_analysis=static_analysis,
+            )
+            if documentation.info.get("partial"):
+                # 중간에 멈춘 문서는 캐시/저장하지 않고 응답으로만 돌려준다
+                result = self._summarize(documentation, persisted=False)
+                result["cache"] = "bypass"
+                return result
+            if cache_key is not None:
+                self.generation_cache.put(cache_key, documentation)
+
+        # 3. 저장 및 결과 반환
+        progress_phase("store")
+        result = self._store_documentation(
+            project_path, documentation, output_file, version
         )
-        print(f"[DEBUG] 생성된 엔드포인트 개수: {len(documentation.endpoints)}")
-        openapi_dict = documentation.to_openapi_dict()
-        print(f"[DEBUG] OpenAPI dict keys: {list(openapi_dict.keys())}")
-        print(
-            f"[DEBUG] OpenAPI paths keys: {list(openapi_dict.get('paths', {}).keys())}"
+        result["cache"] = cache_status
+        return result
+
+    def execute_cached(
+        self,
+        project_path: Path,
+        base_url: str = "http://localhost:8000",
+        output_file: Optional[Path] = None,
+        static_analysis: bool = False,
+        version: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """생성 캐시에 적중하면 생성 없이 저장 후 결과 반환 (아니면 None)
+
+        입장 제어 전에 호출해 캐시 적중 요청이 생성 슬롯을 기다리지 않게 한다.
+        미스는 이어지는 execute가 다시 조회하면서 기록한다.
+        """
+        if self.generation_cache is None:
+            return None
+        cache_key = self.generation_cache.key_for(
+            project_path, base_url, static_analysis
+        )
+        documentation = self.generation_cache.get(cache_key) if cache_key else None
+        if documentation is None:
+            return None
+
+        CACHE_LOOKUPS.labels("generation", "hit").inc()
+        logger.info(
+            "생성 캐시 적중: %s (%s)", cache_key.project, cache_key.head_commit[:12]
+        )
+        result = self._store_documentation(
+            project_path, documentation, output_file, version
         )
+        result["cache"] = "hit"
+        return result
 
-        # 3. 리포지토리에 저장
+    def _lookup_cache(
+        self,
+        project_path: Path,
+        base_url: str,
+        static_analysis: bool,
+        refresh: bool = False,
+    ) -> Tuple[Optional[GenerationKey], Optional[ApiDocumentation]]:
+        """캐시 키 계산 및 조회 (캐시를 쓸 수 없으면 키가 None)"""
+        if self.generation_cache is None:
+            CACHE_LOOKUPS.labels("generation", "bypass").inc()
+            return None, None
+        cache_key = self.generation_cache.key_for(
+            project_path, base_url, static_analysis
+        )
+        if cache_key is None or refresh:
+            result = "bypass" if cache_key is None else "refresh"
+            CACHE_LOOKUPS.labels("generation", result).inc()
+            return cache_key, None
+        documentation = self.generation_cache.get(cache_key)
+        CACHE_LOOKUPS.labels(
+            "generation", "miss" if documentation is None else "hit"
+        ).inc()
+        if documentation is not None:
+            logger.info(
+                "생성 캐시 적중: %s (%s)", cache_key.project, cache_key.head_commit[:12]
+            )
+        return cache_key, documentation
+
+    def _store_documentation(
+        self,
+        project_path: Path,
+        documentation: ApiDocumentation,
+        output_file: Optional[Path] = None,
+        version: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """생성된 문서를 리포지토리/파일/버전 저장소에 저장하고 결과 요약 반환"""
+        openapi_dict = documentation.to_openapi_dict()
+
+        # 1. 리포지토리에 저장
         self.api_documentation_repository.save(documentation)
 
-        # 4. 파일로 저장 (옵션)
+        # 2. 파일로 저장 (옵션)
         if output_file:
             self.api_documentation_repository.save_to_file(documentation, output_file)
 
-        # 5. 결과 반환
+        # 3. 버전 저장 (라벨 미지정 시 현재 git 브랜치)
+        project_name = documentation.title.replace(" API Documentation", "")
+        spec_version = None
+        if self.spec_store is not None:
+            if not version:
+                head = read_head(project_path)
+                version = (head.label if head else None) or DEFAULT_VERSION_LABEL
+            spec_version = self.spec_store.put(project_name, version, openapi_dict)
+
+        # 4. 결과 반환
+        result = self._summarize(documentation, openapi_dict)
+        result["output_file"] = str(output_file) if output_file else None
+        result["spec_version"] = spec_version.summary() if spec_version else None
+        return result
+
+    def _summarize(
+        self,
+        documentation: ApiDocumentation,
+        openapi_dict: Optional[Dict[str, Any]] = None,
+        persisted: bool = True,
+    ) -> Dict[str, Any]:
+        """생성 결과 요약 (부분 결과면 건너뛴 ViewSet과 사유 포함)"""
+        info = documentation.info
         return {
             "project_name": documentation.title.replace(" API Documentation", ""),
             "version": documentation.version,
-            "framework": documentation.info.get("framework", "unknown"),
+            "framework": info.get("framework", "unknown"),
             "total_endpoints": len(documentation.endpoints),
             "base_url": documentation.base_url,
-            "output_file": str(output_file) if output_file else None,
-            "documentation": documentation.to_openapi_dict(),
+            "output_file": None,
+            "spec_version": None,
+            "partial": bool(info.get("partial")),
+            "persisted": persisted,
+            "stop_reason": info.get("stop_reason"),
+            "skipped_viewsets": info.get("skipped_viewsets", []),
+            "documentation": openapi_dict or documentation.to_openapi_dict(),
         }
 
     def generate_for_all_projects(
@@ -67,36 +216,151 @@ class GenerateApiDocsUseCase:
         projects_dir: Path,
         base_url: str = "http://localhost:8000",
         output_dir: Optional[Path] = None,
+        static_analysis: bool = False,
+        max_concurrency: Optional[int] = None,
+        project_timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """모든 프로젝트에 대해 API 문서 생성"""
+        """모든 프로젝트에 대해 API 문서 생성
+
+        project_scheduler가 있으면 프로젝트마다 별도 프로세스에서 병렬로 생성하고,
+        끝나는 순서대로 저장한다 (느린 프로젝트가 다른 프로젝트를 막지 않음).
+        프로젝트마다 끝나는 즉시 결과를 진행 상황(results)과 로그로 알린다.
+        """
+        # 프로젝트 디렉토리 탐색
+        project_paths = [
+            project_path
+            for project_path in projects_dir.iterdir()
+            if project_path.is_dir() and (project_path / ".git").exists()
+        ]
+
+        def output_file_for(project_path: Path) -> Optional[Path]:
+            if output_dir:
+                return output_dir / f"{project_path.name}_api_docs.json"
+            return None
 
         results = []
 
-        # 프로젝트 디렉토리 탐색
-        for project_path in projects_dir.iterdir():
-            if project_path.is_dir() and (project_path / ".git").exists():
-                try:
-                    # 개별 프로젝트 API 문서 생성
-                    output_file = None
-                    if output_dir:
-                        output_file = output_dir / f"{project_path.name}_api_docs.json"
+        def report(result: Dict[str, Any]) -> None:
+            """프로젝트 하나가 끝날 때마다 결과를 기록하고 진행 스트림으로 알림"""
+            results.append(result)
+            outcome = {
+                key: result[key]
+                for key in (
+                    "project_name",
+                    "status",
+                    "error",
+                    "total_endpoints",
+                    "partial",
+                    "cache",
+                    "duration",
+                )
+                if key in result
+            }
+            outcome.setdefault("status", "success")
+            progress_result(outcome)
+            progress_advance(outcome["project_name"])
+            logger.info(
+                "프로젝트 완료: %s (%s, %s/%s)",
+                outcome["project_name"],
+                outcome["status"],
+                len(results),
+                len(project_paths),
+            )
 
-                    result = self.execute(project_path, base_url, output_file)
-                    results.append(result)
+        def failure(project_path: Path, error: str, status: str, **extra):
+            return {
+                "project_name": project_path.name,
+                "error": error,
+                "status": status,
+                **extra,
+            }
 
+        if self.project_scheduler is None:
+            progress_phase("projects", total=len(project_paths))
+            for index, project_path in enumerate(project_paths):
+                # 프로젝트 사이마다 기한/취소 확인
+                stopped = stop_reason()
+                if stopped:
+                    for skipped in project_paths[index:]:
+                        report(failure(skipped, stopped, "skipped"))
+                    break
+                try:
+                    # 개별 프로젝트 API 문서 생성
+                    report(
+                        self.execute(
+                            project_path,
+                            base_url,
+                            output_file_for(project_path),
+                            static_analysis=static_analysis,
+                        )
+                    )
                 except Exception as e:
-                    results.append(
-                        {
-                            "project_name": project_path.name,
-                            "error": str(e),
-                            "status": "failed",
-                        }
+                    report(failure(project_path, str(e), "failed"))
+        else:
+            # 캐시 적중 프로젝트는 바로 저장하고 나머지만 스케줄링
+            progress_phase("projects", total=len(project_paths))
+            cache_keys = {}
+            scheduled = []
+            for project_path in project_paths:
+                cache_key, documentation = self._lookup_cache(
+                    project_path, base_url, static_analysis
+                )
+                if documentation is None:
+                    cache_keys[project_path] = cache_key
+                    scheduled.append(project_path)
+                    continue
+                result = self._store_documentation(
+                    project_path, documentation, output_file_for(project_path)
+                )
+                result["cache"] = "hit"
+                report(result)
+
+            # 자식 프로세스는 각자 Django를 설정하므로 워커 풀을 쓰지 않는다
+            outcomes = self.project_scheduler.run(
+                scheduled,
+                generate_api_documentation,
+                kwargs={"base_url": base_url, "static_analysis": static_analysis},
+                max_concurrency=max_concurrency,
+                project_timeout=project_timeout,
+            )
+            for outcome in outcomes:
+                project_path = outcome.project_path
+                duration = round(outcome.duration, 3)
+                if outcome.status != "success":
+                    report(
+                        failure(
+                            project_path,
+                            outcome.error,
+                            outcome.status,
+                            duration=duration,
+                        )
                     )
+                    continue
+                try:
+                    if cache_keys.get(project_path) is not None:
+                        self.generation_cache.put(
+                            cache_keys[project_path], outcome.result
+                        )
+                    result = self._store_documentation(
+                        project_path, outcome.result, output_file_for(project_path)
+                    )
+                    result["duration"] = duration
+                    report(result)
+                except Exception as e:
+                    report(failure(project_path, str(e), "failed", duration=duration))
 
         return {
             "total_projects": len(results),
             "successful": len([r for r in results if "error" not in r]),
             "failed": len([r for r in results if "error" in r]),
+            "timed_out": len([r for r in results if r.get("status") == "timeout"]),
+            "skipped": len(
+                [r for r in results if r.get("status") in ("skipped", "cancelled")]
+            ),
+            "partial": any(
+                r.get("partial") or r.get("status") in ("skipped", "cancelled")
+                for r in results
+            ),
             "results": results,
         }
 
@@ -104,6 +368,56 @@ class GenerateApiDocsUseCase:
         """프로젝트별 API 문서 조회"""
         return self.api_documentation_repository.find_by_project(project_name)
 
+    def get_spec_index(
+        self, project_name: str, fragment_url: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """태그별 스펙 조각 인덱스 조회"""
+        return self.api_documentation_repository.get_spec_index(
+            project_name, fragment_url
+        )
+
+    def get_tag_spec(self, project_name: str, tag: str) -> Optional[Dict[str, Any]]:
+        """태그 하나의 스펙 조각 조회"""
+        return self.api_documentation_repository.get_tag_spec(project_name, tag)
+
+    def match_endpoints(
+        self, project_name: str, path: str, method: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """요청 경로를 처리하는 오퍼레이션 조회 (구체적인 경로 우선)"""
+        return self.api_documentation_repository.match_endpoints(
+            project_name, path, method
+        )
+
+    def search_endpoints(
+        self, project_name: str, **filters: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        """메서드/태그/경로 접두사/검색어로 오퍼레이션 필터링"""
+        return self.api_documentation_repository.search_endpoints(
+            project_name, **filters
+        )
+
+    def list_versions(self, project_name: str) -> List[Dict[str, Any]]:
+        """프로젝트의 스펙 버전 목록 조회"""
+        if self.spec_store is None:
+            return []
+        return self.spec_store.list_versions(project_name)
+
+    def get_versioned_spec(
+        self, project_name: str, version: str
+    ) -> Optional[Dict[str, Any]]:
+        """특정 버전의 OpenAPI 스펙 조회"""
+        if self.spec_store is None:
+            return None
+        return self.spec_store.get_spec(project_name, version)
+
+    def diff_versions(
+        self, project_name: str, base: str, head: str
+    ) -> Optional[Dict[str, Any]]:
+        """두 버전 사이의 오퍼레이션 단위 구조 diff"""
+        if self.spec_store is None:
+            return None
+        return self.spec_store.diff(project_name, base, head)
+
     def get_all_documentations(self) -> Dict[str, Any]:
         """모든 API 문서 조회"""
         docs = self.api_documentation_repository.get_all()
@@ -32,6 +32,22 @@ class ApiParameter:
     required: bool = False
     description: Optional[str] = None
     example: Optional[Any] = None
+    # components/parameters 참조 ("#/components/parameters/...")
+    ref: Optional[str] = None
+
+    def to_openapi_dict(self) -> Dict[str, Any]:
+        """OpenAPI 파라미터 객체로 변환"""
+        if self.ref:
+            return {"$ref": self.ref}
+
+        return {
+            "name": self.name,
+            "in": self.type.value,
+            "required": self.required,
+            "description": self.description,
+            "schema": {"type": self.data_type},
+            "example": self.example,
+        }
 
 
 @dataclass
@@ -60,6 +76,7 @@ class ApiDocumentation:
     endpoints: List[ApiEndpoint] = field(default_factory=list)
     tags: List[str] = field(default_factory=list)
     info: Dict[str, Any] = field(default_factory=dict)
+    components: Dict[str, Any] = field(default_factory=dict)
 
     def to_openapi_dict(self) -> Dict[str, Any]:
         """OpenAPI 3.0 형식으로 변환"""
@@ -78,15 +95,7 @@ class ApiDocumentation:
                 "tags": endpoint.tags,
                 "deprecated": endpoint.deprecated,
                 "parameters": [
-                    {
-                        "name": param.name,
-                        "in": param.type.value,
-                        "required": param.required,
-                        "description": param.description,
-                        "schema": {"type": param.data_type},
-                        "example": param.example,
-                    }
-                    for param in endpoint.parameters
+                    param.to_openapi_dict() for param in endpoint.parameters
                 ],
                 "responses": {},
             }
@@ -112,7 +121,7 @@ class ApiDocumentation:
 
             paths[endpoint.path][method_lower] = endpoint_dict
 
-        return {
+        openapi_dict = {
             "openapi": "3.0.0",
             "info": {
                 "title": self.title,
@@ -125,6 +134,11 @@ class ApiDocumentation:
             "tags": [{"name": tag} for tag in self.tags],
         }
 
+        if self.components:
+            openapi_dict["components"] = self.components
+
+        return openapi_dict
+
 
 @dataclass
 class CodeAnalysisResult:
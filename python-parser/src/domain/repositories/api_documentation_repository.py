@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 from ..entities.api_documentation import ApiDocumentation
@@ -23,6 +23,38 @@ class ApiDocumentationRepository(ABC):
         """프로젝트별 API 문서 조회"""
         pass
 
+    @abstractmethod
+    def get_spec_index(
+        self, project_name: str, fragment_url: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """태그별 스펙 조각 목록(인덱스) 조회"""
+        pass
+
+    @abstractmethod
+    def get_tag_spec(self, project_name: str, tag: str) -> Optional[Dict[str, Any]]:
+        """태그 하나의 스펙 조각 조회"""
+        pass
+
+    @abstractmethod
+    def match_endpoints(
+        self, project_name: str, path: str, method: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """요청 경로(또는 경로 템플릿)를 처리하는 오퍼레이션 조회"""
+        pass
+
+    @abstractmethod
+    def search_endpoints(
+        self,
+        project_name: str,
+        query: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """조건에 맞는 오퍼레이션 목록 조회"""
+        pass
+
     @abstractmethod
     def get_all(self) -> List[ApiDocumentation]:
         """모든 API 문서 조회"""
@@ -0,0 +1,148 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+from ..generators.static_serializer_extractor import StaticSerializerExtractor
+
+StatKey = Tuple[int, int]
+
+
+def _stat_key(path: Path) -> Optional[StatKey]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ViewSetFragmentCache:
+    """ViewSet별 serializer 필드 추출 결과 캐시
+
+    키는 ViewSet 클래스 소스(같은 파일의 다른 클래스 제외)와 정적 import 분석으로 찾은
+    serializer/model 등 의존 모듈 소스의 해시다. 의존 모듈이 바뀐 ViewSet만 다시
+    추출하고, 엔드포인트 조립은 매번 캐시된 필드로 수행한다.
+    파일 내용 해시와 의존성 목록은 (mtime, 크기)가 같으면 재사용하므로 적중 시에는
+    파싱 없이 stat만 한다. 여러 생성 스레드가 공유하므로 내부 dict는 모두 _lock
+    아래에서 읽고 쓰며, 파일 읽기/파싱은 잠금 밖에서 한다.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        # (views 파일, ViewSet, 모드) -> (의존성 해시, 필드)
+        self._entries: Dict[Tuple[str, str, str], Tuple[str, Any]] = {}
+        self._file_hashes: Dict[Path, Tuple[StatKey, str]] = {}
+        self._class_hashes: Dict[Tuple[Path, str], Tuple[StatKey, Optional[str]]] = {}
+        # views 파일 -> (자신과 의존 파일들의 stat, 의존 파일 목록)
+        self._dependencies: Dict[Path, Tuple[Tuple, List[Path]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def dependency_digest(
+        self,
+        views_file: Path,
+        viewset_name: str,
+        extractor: StaticSerializerExtractor,
+        context: str = "",
+    ) -> Optional[str]:
+        """ViewSet과 의존 모듈 소스의 해시 (ViewSet을 찾지 못하면 None)"""
+        views_file = Path(views_file).resolve()
+        class_hash = self._class_hash(views_file, viewset_name, extractor)
+        if class_hash is None:
+            return None
+
+        digest = hashlib.sha1(f"{context}|{viewset_name}|{class_hash}".encode())
+        for path in self._dependency_files(views_file, extractor):
+            file_hash = self._file_hash(path)
+            digest.update(f"|{path}:{file_hash}".encode())
+        return digest.hexdigest()
+
+    def get(self, views_file: Path, viewset_name: str, mode: str, digest: str):
+        """의존성 해시가 같으면 캐시된 필드 반환, 아니면 None"""
+        key = (str(Path(views_file).resolve()), viewset_name, mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == digest:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(
+        self, views_file: Path, viewset_name: str, mode: str, digest: str, fields
+    ) -> None:
+        """추출 결과 저장 (ViewSet당 최신 항목 하나만 유지)"""
+        key = (str(Path(views_file).resolve()), viewset_name, mode)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (digest, fields)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._file_hashes.clear()
+            self._class_hashes.clear()
+            self._dependencies.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _file_hash(self, path: Path) -> Optional[str]:
+        stat_key = _stat_key(path)
+        if stat_key is None:
+            return None
+        with self._lock:
+            cached = self._file_hashes.get(path)
+        if cached and cached[0] == stat_key:
+            return cached[1]
+        try:
+            file_hash = hashlib.sha1(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        with self._lock:
+            self._file_hashes[path] = (stat_key, file_hash)
+        return file_hash
+
+    def _class_hash(
+        self, views_file: Path, viewset_name: str, extractor: StaticSerializerExtractor
+    ) -> Optional[str]:
+        stat_key = _stat_key(views_file)
+        if stat_key is None:
+            return None
+        with self._lock:
+            cached = self._class_hashes.get((views_file, viewset_name))
+        if cached and cached[0] == stat_key:
+            return cached[1]
+        source = extractor.class_source(views_file, viewset_name)
+        class_hash = (
+            hashlib.sha1(source.encode("utf-8")).hexdigest()
+            if source is not None
+            else None
+        )
+        with self._lock:
+            self._class_hashes[(views_file, viewset_name)] = (stat_key, class_hash)
+        return class_hash
+
+    def _dependency_files(
+        self, views_file: Path, extractor: StaticSerializerExtractor
+    ) -> List[Path]:
+        with self._lock:
+            cached = self._dependencies.get(views_file)
+        if cached:
+            signature, dependencies = cached
+            current = tuple(_stat_key(p) for p in [views_file, *dependencies])
+            if current == signature:
+                return dependencies
+
+        dependencies = extractor.local_dependencies(views_file)
+        signature = tuple(_stat_key(p) for p in [views_file, *dependencies])
+        with self._lock:
+            self._dependencies[views_file] = (signature, dependencies)
+        return dependencies
+
+
+# 프로세스 전체에서 공유하는 기본 캐시
+default_fragment_cache = ViewSetFragmentCache()
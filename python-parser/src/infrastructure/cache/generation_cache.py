@@ -0,0 +1,266 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+from ...domain.entities.api_documentation import (
+    ApiDocumentation,
+    ApiEndpoint,
+    ApiParameter,
+    HttpMethod,
+    ParameterType,
+)
+from ..generators.openapi_components import structural_hash
+from ..vcs.git_state import read_head, working_tree_fingerprint
+from ..observability.logs import get_logger
+from ..observability.memory import SAMPLE_SIZE, estimate_size, usage
+
+logger = get_logger(__name__)
+
+# 생성 결과에 영향을 주는 코드 (바뀌면 캐시 무효화)
+SRC_ROOT = Path(__file__).resolve().parents[2]
+GENERATOR_SOURCES = [
+    "infrastructure/generators/*.py",
+    "domain/entities/api_documentation.py",
+]
+
+
+@lru_cache(maxsize=1)
+def generator_version() -> str:
+    """문서 생성기 소스 해시"""
+    digest = hashlib.sha1()
+    for pattern in GENERATOR_SOURCES:
+        for path in sorted(SRC_ROOT.glob(pattern)):
+            digest.update(path.relative_to(SRC_ROOT).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class GenerationKey:
+    """생성 캐시 키"""
+
+    project: str
+    head_commit: str
+    dirty_fingerprint: str
+    generator_version: str
+    base_url: str
+    static_analysis: bool
+
+    @property
+    def digest(self) -> str:
+        return structural_hash(asdict(self))
+
+
+def documentation_to_dict(documentation: ApiDocumentation) -> Dict[str, Any]:
+    """ApiDocumentation -> JSON 직렬화 가능한 dict"""
+    data = asdict(documentation)
+    for endpoint in data["endpoints"]:
+        endpoint["method"] = endpoint["method"].value
+        for parameter in endpoint["parameters"]:
+            parameter["type"] = parameter["type"].value
+    return data
+
+
+def documentation_from_dict(data: Dict[str, Any]) -> ApiDocumentation:
+    """documentation_to_dict의 역변환"""
+    endpoints = []
+    for endpoint in data.get("endpoints", []):
+        parameters = [
+            ApiParameter(**{**p, "type": ParameterType(p["type"])})
+            for p in endpoint.get("parameters", [])
+        ]
+        endpoints.append(
+            ApiEndpoint(
+                **{
+                    **endpoint,
+                    "method": HttpMethod(endpoint["method"]),
+                    "parameters": parameters,
+                }
+            )
+        )
+    return ApiDocumentation(**{**data, "endpoints": endpoints})
+
+
+class GenerationCache:
+    """(HEAD 커밋, 작업 트리 지문, 생성기 버전, base_url) 키의 문서 생성 캐시
+
+    `<cache_dir>/<project>/<key digest>.json`으로 디스크에 저장해 재시작 후에도 유지되고,
+    최근 항목은 메모리에도 둔다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_memory_entries: int = 64,
+        max_entries_per_project: int = 20,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_memory_entries = max_memory_entries
+        self.max_entries_per_project = max_entries_per_project
+        self._memory: "OrderedDict[str, ApiDocumentation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(
+        self, project_path: Path, base_url: str, static_analysis: bool = False
+    ) -> Optional[GenerationKey]:
+        """현재 프로젝트 상태의 캐시 키 (git 정보가 없으면 None = 캐시 사용 안 함)"""
+        head = read_head(project_path)
+        if head is None or not head.commit:
+            return None
+        dirty = working_tree_fingerprint(project_path)
+        if dirty is None:
+            return None
+        return GenerationKey(
+            project=Path(project_path).name,
+            head_commit=head.commit,
+            dirty_fingerprint=dirty,
+            generator_version=generator_version(),
+            base_url=base_url,
+            static_analysis=static_analysis,
+        )
+
+    def get(self, key: GenerationKey) -> Optional[ApiDocumentation]:
+        """캐시 조회 (메모리 -> 디스크)"""
+        digest = key.digest
+        with self._lock:
+            documentation = self._memory.get(digest)
+            if documentation is not None:
+                self._memory.move_to_end(digest)
+                self.hits += 1
+                return documentation
+
+        entry_file = self._entry_file(key.project, digest)
+        try:
+            with open(entry_file, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            documentation = documentation_from_dict(entry["documentation"])
+        except FileNotFoundError:
+            documentation = None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("손상된 캐시 항목 무시: %s (%s)", entry_file, e)
+            documentation = None
+
+        with self._lock:
+            if documentation is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(digest, documentation)
+        return documentation
+
+    def put(self, key: GenerationKey, documentation: ApiDocumentation) -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 rename)"""
+        digest = key.digest
+        with self._lock:
+            self._remember(digest, documentation)
+
+        project_dir = self.cache_dir / key.project
+        project_dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "key": asdict(key),
+            "created_at": datetime.now().isoformat(),
+            "documentation": documentation_to_dict(documentation),
+        }
+        fd, temp_path = tempfile.mkstemp(dir=project_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, self._entry_file(key.project, digest))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        self._prune(project_dir)
+
+    def clear(self, project: Optional[str] = None) -> int:
+        """캐시 삭제 (project가 없으면 전체), 삭제한 디스크 항목 수 반환
+
+        project는 캐시 디렉토리 바로 아래 이름만 받는다 (경로면 ValueError).
+        """
+        project_dirs = (
+            [self._project_dir(project)]
+            if project
+            else [p for p in self.cache_dir.glob("*") if p.is_dir()]
+        )
+        with self._lock:
+            self._memory.clear()
+        removed = 0
+        for project_dir in project_dirs:
+            for entry_file in project_dir.glob("*.json"):
+                entry_file.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "generator_version": generator_version(),
+            }
+
+    def memory_usage(self, sample: int = SAMPLE_SIZE) -> Dict[str, Any]:
+        """메모리에 둔 캐시 항목의 프로젝트별 크기 추정"""
+        with self._lock:
+            documentations = list(self._memory.values())
+        projects: Dict[str, int] = {}
+        for documentation in documentations:
+            # 문서 저장소와 같은 프로젝트 이름으로 집계
+            project = documentation.title.replace(" API Documentation", "")
+            projects[project] = (
+                projects.get(project, 0)
+                + estimate_size(documentation.endpoints, sample)
+                + estimate_size(documentation.components, sample)
+            )
+        return usage(
+            len(documentations), sum(projects.values()), sample, projects=projects
+        )
+
+    def spill(self) -> int:
+        """메모리 항목 해제 (디스크 항목은 남으므로 다음 조회는 디스크에서 읽음)"""
+        with self._lock:
+            released = len(self._memory)
+            self._memory.clear()
+        return released
+
+    def _project_dir(self, project: str) -> Path:
+        # 경로 구분자/상위 디렉토리로 캐시 밖 파일을 지우지 않도록 이름만 허용
+        if project in (".", "..") or "/" in project or os.sep in project:
+            raise ValueError(f"invalid project name: {project!r}")
+        project_dir = (self.cache_dir / project).resolve()
+        if project_dir.parent != self.cache_dir.resolve():
+            raise ValueError(f"invalid project name: {project!r}")
+        return project_dir
+
+    def _entry_file(self, project: str, digest: str) -> Path:
+        return self.cache_dir / project / f"{digest}.json"
+
+    def _remember(self, digest: str, documentation: ApiDocumentation) -> None:
+        self._memory[digest] = documentation
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _prune(self, project_dir: Path) -> None:
+        # 프로젝트별로 오래된 항목부터 정리
+        entries = []
+        for entry_file in project_dir.glob("*.json"):
+            try:
+                entries.append((entry_file.stat().st_mtime_ns, entry_file))
+            except OSError:
+                continue
+        entries.sort()
+        for _, entry_file in entries[: -self.max_entries_per_project]:
+            entry_file.unlink(missing_ok=True)
@@ -1,10 +1,9 @@
-import re
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Any, Tuple
 import sys
+import time
 import os
 import importlib.util
-from rest_framework import serializers
 
 from ...domain.entities.api_documentation import (
     ApiDocumentation,
@@ -13,6 +12,26 @@ from ...domain.entities.api_documentation import (
     ApiParameter,
     ParameterType,
 )
+from .viewset_discovery import default_viewset_index
+from .static_serializer_extractor import StaticSerializerExtractor
+from .openapi_components import ComponentRegistry
+from .field_schema_registry import SerializerSchemaCache
+from ..cache.fragment_cache import ViewSetFragmentCache, default_fragment_cache
+from ..cache.generation_cache import generator_version
+from ..introspection.django_worker_pool import WorkerError, project_fingerprint
+from ..runtime.deadline import check_deadline, stop_reason
+from ..runtime.progress import progress_advance, progress_current, progress_phase
+from ..observability.metrics import (
+    CACHE_LOOKUPS,
+    GENERATION_PHASE_SECONDS,
+    GENERATION_VIEWSETS,
+    VIEW_MODULE_IMPORT_SECONDS,
+)
+from ..observability.logs import INFO, RunSummary, get_logger
+from ..observability.profiler import profiled
+from ..observability.timings import PhaseTimer
+
+logger = get_logger(__name__)
 
 
 def setup_django_environment(project_path: Path):
@@ -38,121 +57,30 @@ def setup_django_environment(project_path: Path):
 
             django.setup()
 
-            print(f"[문서 자동화] Django 환경 설정 완료: {app_dir}")
+            logger.info("Django 환경 설정 완료: %s", app_dir)
             return True
         else:
-            print(f"[문서 자동화] Django app 디렉토리를 찾을 수 없습니다: {app_dir}")
+            logger.warning("Django app 디렉토리를 찾을 수 없습니다: %s", app_dir)
             return False
 
     except Exception as e:
-        print(f"[문서 자동화] Django 환경 설정 실패: {e}")
+        logger.warning("Django 환경 설정 실패: %s", e)
         return False
 
 
-def _map_field_type_to_schema(field_type):
-    """Django 필드 타입을 OpenAPI 스키마로 변환"""
-    field_type_str = str(field_type).lower()
-
-    if "charfield" in field_type_str or "textfield" in field_type_str:
-        return {"type": "string"}
-    elif "integerfield" in field_type_str or "positiveintegerfield" in field_type_str:
-        return {"type": "integer"}
-    elif "floatfield" in field_type_str or "decimalfield" in field_type_str:
-        return {"type": "number"}
-    elif "booleanfield" in field_type_str:
-        return {"type": "boolean"}
-    elif "datefield" in field_type_str or "datetimefield" in field_type_str:
-        return {"type": "string", "format": "date-time"}
-    elif "emailfield" in field_type_str:
-        return {"type": "string", "format": "email"}
-    elif "urlfield" in field_type_str:
-        return {"type": "string", "format": "uri"}
-    elif "filefield" in field_type_str or "imagefield" in field_type_str:
-        return {"type": "string", "format": "binary"}
-    else:
-        return {"type": "string"}
-
-
-def _drf_field_to_openapi_type(field):
-    if isinstance(field, serializers.IntegerField):
-        return {"type": "integer"}
-    if isinstance(field, serializers.DecimalField):
-        return {"type": "number", "format": "decimal"}
-    if isinstance(field, serializers.FloatField):
-        return {"type": "number", "format": "float"}
-    if isinstance(field, serializers.BooleanField):
-        return {"type": "boolean"}
-    if isinstance(field, serializers.DateTimeField):
-        return {"type": "string", "format": "date-time"}
-    if isinstance(field, serializers.DateField):
-        return {"type": "string", "format": "date"}
-    if isinstance(field, serializers.CharField):
-        return {"type": "string"}
-    if isinstance(field, serializers.SerializerMethodField):
-        return {"type": "string"}
-    if isinstance(field, serializers.ListField):
-        child_type = (
-            _drf_field_to_openapi_type(field.child)
-            if hasattr(field, "child")
-            else {"type": "string"}
-        )
-        return {"type": "array", "items": child_type}
-    if isinstance(field, serializers.DictField):
-        return {"type": "object"}
-    return {"type": "string"}
-
-
-def extract_serializer_fields(serializer_class):
+def extract_serializer_fields(
+    serializer_class, schema_cache: Optional[SerializerSchemaCache] = None
+):
+    """serializer 클래스의 필드 스키마 (schema_cache를 넘기면 생성 작업 동안 재사용)"""
+    if schema_cache is None:
+        schema_cache = SerializerSchemaCache()
     try:
-        serializer_instance = serializer_class()
-        fields = getattr(serializer_instance, "fields", None)
-        if fields is not None and hasattr(fields, "items"):
-            result = {}
-            for name, field in fields.items():
-                schema = _drf_field_to_openapi_type(field)
-                if getattr(field, "required", False):
-                    schema["required"] = True
-                if getattr(field, "allow_null", False):
-                    schema["nullable"] = True
-                if getattr(field, "read_only", False):
-                    schema["readOnly"] = True
-                if getattr(field, "help_text", None):
-                    schema["description"] = str(field.help_text)
-                result[name] = schema
-            return result
+        return schema_cache.fields(serializer_class)
     except Exception as e:
-        print(f"[문서 자동화] serializer 필드 추출 실패: {e}")
+        logger.debug("serializer 필드 추출 실패: %s", e)
     return {}
 
 
-def _extract_field_schema(field):
-    """DRF 필드를 OpenAPI 스키마로 변환"""
-    try:
-        from rest_framework import fields as drf_fields
-
-        if isinstance(field, drf_fields.CharField):
-            return {"type": "string"}
-        if isinstance(field, drf_fields.IntegerField):
-            return {"type": "integer"}
-        if isinstance(field, drf_fields.FloatField):
-            return {"type": "number"}
-        if isinstance(field, drf_fields.BooleanField):
-            return {"type": "boolean"}
-        if isinstance(field, drf_fields.DateTimeField):
-            return {"type": "string", "format": "date-time"}
-        if isinstance(field, drf_fields.DateField):
-            return {"type": "string", "format": "date"}
-        if isinstance(field, drf_fields.EmailField):
-            return {"type": "string", "format": "email"}
-        if isinstance(field, drf_fields.URLField):
-            return {"type": "string", "format": "uri"}
-        if hasattr(field, "child"):  # ListField 등
-            return {"type": "array", "items": _extract_field_schema(field.child)}
-        return {"type": "string"}
-    except Exception:
-        return {"type": "string"}
-
-
 def _generate_default_schema():
     """fallback: 기본 스키마 반환"""
     return {
@@ -163,155 +91,19 @@ def _generate_default_schema():
     }
 
 
-def _extract_fields_from_file(file_path, class_name):
-    """파일에서 serializer 필드 정보 추출"""
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # 클래스 정의 찾기
-        class_pattern = rf"class\s+{class_name}\s*\([^)]*\):"
-        if not re.search(class_pattern, content):
-            return None
-
-        # 필드 패턴 찾기
-        field_pattern = r"(\w+)\s*=\s*serializers\.(\w+)Field\s*\([^)]*\)"
-        fields = re.findall(field_pattern, content)
-
-        if fields:
-            return {
-                name: _map_field_type_to_schema(f"serializers.{field_type}Field")
-                for name, field_type in fields
-            }
-
-        return None
-    except Exception as e:
-        print(f"[문서 자동화] 파일에서 필드 추출 실패: {e}")
-        return None
-
-
-def get_serializer_class_from_viewset(viewset_cls):
-    """ViewSet에서 serializer 클래스 추출"""
-    try:
-        # 1. 직접 serializer_class 속성 확인
-        if hasattr(viewset_cls, "serializer_class") and viewset_cls.serializer_class:
-            return viewset_cls.serializer_class
-
-        # 2. get_serializer_class 메서드 확인
-        if hasattr(viewset_cls, "get_serializer_class"):
-            try:
-                return viewset_cls.get_serializer_class()
-            except Exception:
-                pass
-
-        # 3. ViewSetMock 객체인 경우
-        if hasattr(viewset_cls, "serializer_class_name"):
-            try:
-                # 파일에서 serializer 클래스 import 시도
-                file_path = viewset_cls.__file__
-                if file_path and Path(file_path).exists():
-                    # 같은 디렉토리의 serializers.py 파일에서 찾기
-                    serializers_path = Path(file_path).parent / "serializers.py"
-                    if serializers_path.exists():
-                        with open(serializers_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-
-                            # serializer 클래스 정의 찾기
-                            class_pattern = rf"class\s+{viewset_cls.serializer_class_name}\s*\([^)]*\):"
-                            if re.search(class_pattern, content):
-                                # 간단한 Mock Serializer 클래스 생성
-                                class MockSerializer:
-                                    def __init__(self):
-                                        self.fields = self._extract_fields_from_content(
-                                            content, viewset_cls.serializer_class_name
-                                        )
-
-                                    def _extract_fields_from_content(
-                                        self, content, class_name
-                                    ):
-                                        """파일 내용에서 serializer 필드 추출"""
-                                        fields = {}
-
-                                        # 클래스 정의 찾기
-                                        class_start = content.find(
-                                            f"class {class_name}"
-                                        )
-                                        if class_start == -1:
-                                            return fields
-
-                                        # 클래스 본문 찾기
-                                        brace_count = 0
-                                        class_body_start = -1
-                                        for i in range(class_start, len(content)):
-                                            if content[i] == "{":
-                                                brace_count += 1
-                                                if class_body_start == -1:
-                                                    class_body_start = i
-                                            elif content[i] == "}":
-                                                brace_count -= 1
-                                                if brace_count == 0:
-                                                    class_body_end = i
-                                                    break
-
-                                        if (
-                                            class_body_start == -1
-                                            or class_body_end == -1
-                                        ):
-                                            return fields
-
-                                        class_body = content[
-                                            class_body_start:class_body_end
-                                        ]
-
-                                        # 필드 정의 찾기
-                                        field_pattern = (
-                                            r"(\w+)\s*=\s*serializers\.(\w+)\([^)]*\)"
-                                        )
-                                        matches = re.findall(field_pattern, class_body)
-
-                                        for field_name, field_type in matches:
-                                            fields[field_name] = (
-                                                self._create_field_mock(field_type)
-                                            )
-
-                                        return fields
-
-                                    def _create_field_mock(self, field_type):
-                                        """필드 타입에 따른 Mock 필드 생성"""
-
-                                        class MockField:
-                                            def __init__(self, field_type):
-                                                self.field_type = field_type
-
-                                            def __class__(self):
-                                                class MockClass:
-                                                    __name__ = f"{field_type}Field"
-
-                                                return MockClass
-
-                                        return MockField(field_type)
-
-                                return MockSerializer()
-            except Exception as e:
-                print(f"[문서 자동화] Serializer 클래스 추출 실패: {e}")
-
-        return None
-    except Exception as e:
-        print(f"[문서 자동화] Serializer 클래스 추출 실패: {e}")
-        return None
-
-
-def extract_serializer_from_viewset(viewset_class, viewset_name):
+def extract_serializer_from_viewset(
+    viewset_class, viewset_name, schema_cache: Optional[SerializerSchemaCache] = None
+):
     """ViewSet에서 실제 사용하는 serializer 추출"""
     try:
         # 1. ViewSet 클래스에서 serializer_class 속성 확인
         if hasattr(viewset_class, "serializer_class"):
             serializer_class = viewset_class.serializer_class
             if serializer_class:
-                print(
-                    f"[문서 자동화] {viewset_name}에서 serializer_class 발견: {serializer_class}"
+                logger.debug(
+                    "%s에서 serializer_class 발견: %s", viewset_name, serializer_class
                 )
-                return extract_serializer_fields(serializer_class)
+                return extract_serializer_fields(serializer_class, schema_cache)
 
         # 2. ViewSet의 list 메서드에서 serializer 사용 패턴 파싱
         if hasattr(viewset_class, "list"):
@@ -322,15 +114,15 @@ def extract_serializer_from_viewset(viewset_class, viewset_name):
 
                 try:
                     source = inspect.getsource(list_method)
-                    print(f"[문서 자동화] {viewset_name} list 메서드 소스 분석 중...")
+                    logger.debug("%s list 메서드 소스 분석 중...", viewset_name)
 
                     # RevenueShareViewSet 패턴 매칭
                     if (
                         "RevenueShareSeasonSerializer" in source
                         or "RevenueShareContentSerializer" in source
                     ):
-                        print(
-                            f"[문서 자동화] {viewset_name}에서 RevenueShare serializer 패턴 발견"
+                        logger.debug(
+                            "%s에서 RevenueShare serializer 패턴 발견", viewset_name
                         )
                         # revenue.serializers에서 import
                         try:
@@ -340,39 +132,41 @@ def extract_serializer_from_viewset(viewset_class, viewset_name):
                             )
 
                             return extract_serializer_fields(
-                                RevenueShareContentSerializer
+                                RevenueShareContentSerializer, schema_cache
                             )
                         except ImportError:
-                            print(f"[문서 자동화] revenue.serializers import 실패")
+                            logger.debug("revenue.serializers import 실패")
 
                     # RevenueViewSet 패턴 매칭
                     elif "RevenueSerializer" in source:
-                        print(
-                            f"[문서 자동화] {viewset_name}에서 RevenueSerializer 패턴 발견"
-                        )
+                        logger.debug("%s에서 RevenueSerializer 패턴 발견", viewset_name)
                         try:
                             from revenue.serializers import RevenueSerializer
 
-                            return extract_serializer_fields(RevenueSerializer)
+                            return extract_serializer_fields(
+                                RevenueSerializer, schema_cache
+                            )
                         except ImportError:
-                            print(f"[문서 자동화] revenue.serializers import 실패")
+                            logger.debug("revenue.serializers import 실패")
 
                     # AdminUserViewSet 패턴 매칭
                     elif "AdminUserSerializer" in source:
-                        print(
-                            f"[문서 자동화] {viewset_name}에서 AdminUserSerializer 패턴 발견"
+                        logger.debug(
+                            "%s에서 AdminUserSerializer 패턴 발견", viewset_name
                         )
                         try:
                             from account.serializers import AdminUserSerializer
 
-                            return extract_serializer_fields(AdminUserSerializer)
+                            return extract_serializer_fields(
+                                AdminUserSerializer, schema_cache
+                            )
                         except ImportError:
-                            print(f"[문서 자동화] account.serializers import 실패")
+                            logger.debug("account.serializers import 실패")
 
                     # UserActionHistoryViewSet 패턴 매칭
                     elif "UserActionHistorySerializer" in source:
-                        print(
-                            f"[문서 자동화] {viewset_name}에서 UserActionHistorySerializer 패턴 발견"
+                        logger.debug(
+                            "%s에서 UserActionHistorySerializer 패턴 발견", viewset_name
                         )
                         try:
                             from user_action_history.serializers import (
@@ -380,29 +174,27 @@ def extract_serializer_from_viewset(viewset_class, viewset_name):
                             )
 
                             return extract_serializer_fields(
-                                UserActionHistorySerializer
+                                UserActionHistorySerializer, schema_cache
                             )
                         except ImportError:
-                            print(
-                                f"[문서 자동화] user_action_history.serializers import 실패"
-                            )
+                            logger.debug("user_action_history.serializers import 실패")
 
                 except Exception as e:
-                    print(f"[문서 자동화] {viewset_name} 소스 분석 실패: {e}")
+                    logger.debug("%s 소스 분석 실패: %s", viewset_name, e)
 
         # 3. get_serializer_class 메서드 확인
         if hasattr(viewset_class, "get_serializer_class"):
             try:
                 serializer_class = viewset_class.get_serializer_class()
                 if serializer_class:
-                    print(
-                        f"[문서 자동화] {viewset_name}에서 get_serializer_class 발견: {serializer_class}"
+                    logger.debug(
+                        "%s에서 get_serializer_class 발견: %s",
+                        viewset_name,
+                        serializer_class,
                     )
-                    return extract_serializer_fields(serializer_class)
+                    return extract_serializer_fields(serializer_class, schema_cache)
             except Exception as e:
-                print(
-                    f"[문서 자동화] {viewset_name} get_serializer_class 호출 실패: {e}"
-                )
+                logger.debug("%s get_serializer_class 호출 실패: %s", viewset_name, e)
 
         # 4. ViewSet 이름 기반 하드코딩된 매핑 (fallback)
         serializer_mapping = {
@@ -414,8 +206,8 @@ def extract_serializer_from_viewset(viewset_class, viewset_name):
 
         if viewset_name in serializer_mapping:
             serializer_name = serializer_mapping[viewset_name]
-            print(
-                f"[문서 자동화] {viewset_name}에 대해 하드코딩된 매핑 사용: {serializer_name}"
+            logger.debug(
+                "%s에 대해 하드코딩된 매핑 사용: %s", viewset_name, serializer_name
             )
 
             # 앱별 import 시도
@@ -436,14 +228,17 @@ def extract_serializer_from_viewset(viewset_class, viewset_name):
                         f"{app_name}.serializers", fromlist=[serializer_class_name]
                     )
                     serializer_class = getattr(module, serializer_class_name)
-                    return extract_serializer_fields(serializer_class)
+                    return extract_serializer_fields(serializer_class, schema_cache)
                 except Exception as e:
-                    print(
-                        f"[문서 자동화] {app_name}.serializers.{serializer_class_name} import 실패: {e}"
+                    logger.debug(
+                        "%s.serializers.%s import 실패: %s",
+                        app_name,
+                        serializer_class_name,
+                        e,
                     )
 
     except Exception as e:
-        print(f"[문서 자동화] {viewset_name} serializer 추출 실패: {e}")
+        logger.debug("%s serializer 추출 실패: %s", viewset_name, e)
 
     return {}
 
@@ -453,635 +248,444 @@ def generate_openapi_for_viewset(
     file_path: str,
     base_url: str,
     model_name: str = None,
+    module_cache: Optional["ViewModuleCache"] = None,
+    static_extractor: Optional[StaticSerializerExtractor] = None,
+    components: Optional[ComponentRegistry] = None,
 ) -> List[ApiEndpoint]:
     """ViewSet에서 OpenAPI 엔드포인트 생성"""
-    print(f"[문서 자동화] {viewset_name} 파일 경로: {file_path}")
+    logger.debug("%s 파일 경로: %s", viewset_name, file_path)
+
+    serializer_fields, _ = _viewset_fields_in_process(
+        viewset_name, file_path, module_cache, static_extractor
+    )
+    if serializer_fields is None:
+        return []
+
+    return build_viewset_endpoints(
+        viewset_name, model_name, serializer_fields, components
+    )
+
 
+def _viewset_fields_in_process(
+    viewset_name: str,
+    file_path: str,
+    module_cache: Optional["ViewModuleCache"] = None,
+    static_extractor: Optional[StaticSerializerExtractor] = None,
+    schema_cache: Optional[SerializerSchemaCache] = None,
+) -> Tuple[Optional[Dict[str, dict]], bool]:
+    """현재 프로세스에서 ViewSet의 serializer 필드 추출
+
+    (필드, import 성공 여부)를 반환하며 ViewSet을 찾지 못하면 필드가 None이다.
+    """
     # ViewSet 클래스 import 시도
-    viewset_class = import_viewset_class(file_path, viewset_name)
+    viewset_class = import_viewset_class(file_path, viewset_name, module_cache)
 
     if viewset_class:
-        print(f"[문서 자동화] {viewset_name} 클래스 import 성공")
+        logger.debug("%s 클래스 import 성공", viewset_name)
 
         # 실제 serializer 필드 추출
-        serializer_fields = extract_serializer_from_viewset(viewset_class, viewset_name)
-
+        serializer_fields = extract_serializer_from_viewset(
+            viewset_class, viewset_name, schema_cache
+        )
         if serializer_fields:
-            print(
-                f"[문서 자동화] {viewset_name}에서 실제 serializer 필드 추출 성공: {len(serializer_fields)}개 필드"
-            )
-        else:
-            print(
-                f"[문서 자동화] {viewset_name}에서 serializer 필드 추출 실패, 기본 스키마 사용"
-            )
-            serializer_fields = _generate_default_schema()
-
-        # 5개 CRUD 엔드포인트 생성
-        endpoints = []
-
-        # 공통 파라미터 정의
-        common_parameters = [
-            ApiParameter(
-                name="Authorization",
-                type=ParameterType.HEADER,
-                data_type="string",
-                required=True,
-                description="Bearer token for authentication",
-                example="Bearer <your-token-here>",
-            )
-        ]
+            return serializer_fields, True
 
-        # GET 요청용 쿼리 파라미터
-        get_query_parameters = [
-            ApiParameter(
-                name="page",
-                type=ParameterType.QUERY,
-                data_type="integer",
-                required=False,
-                description="Page number for pagination",
-                example=1,
-            ),
-            ApiParameter(
-                name="page_size",
-                type=ParameterType.QUERY,
-                data_type="integer",
-                required=False,
-                description="Number of items per page",
-                example=20,
-            ),
-            ApiParameter(
-                name="search",
-                type=ParameterType.QUERY,
-                data_type="string",
-                required=False,
-                description="Search term for filtering",
-                example="search term",
-            ),
-            ApiParameter(
-                name="ordering",
-                type=ParameterType.QUERY,
-                data_type="string",
-                required=False,
-                description="Field to order by (prefix with - for descending)",
-                example="created_at",
-            ),
-            ApiParameter(
-                name="filter",
-                type=ParameterType.QUERY,
-                data_type="string",
-                required=False,
-                description="Filter parameters",
-                example="status=active",
-            ),
-        ]
+    # fallback: import 없이 정적 분석
+    if static_extractor is None:
+        static_extractor = StaticSerializerExtractor(Path(file_path).parents[2])
+    static_fields = static_extractor.viewset_fields(Path(file_path), viewset_name)
 
-        # POST/PUT 요청용 헤더
-        content_type_header = [
-            ApiParameter(
-                name="Content-Type",
-                type=ParameterType.HEADER,
-                data_type="string",
-                required=True,
-                description="Content type for request body",
-                example="application/json",
-            )
-        ]
+    if static_fields is None and not viewset_class:
+        logger.debug("%s 클래스를 찾을 수 없습니다", viewset_name)
+        return None, False
 
-        # List/Create
-        endpoints.append(
-            ApiEndpoint(
-                path=f"/api/v1/{model_name}/",
-                method=HttpMethod.GET,
-                summary=f"List {model_name}",
-                description=f"Get list of {model_name}",
-                parameters=common_parameters + get_query_parameters,
-                request_body=None,
-                responses={
-                    "200": {
-                        "description": "Success",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "count": {
-                                            "type": "integer",
-                                            "description": "Total number of items",
-                                        },
-                                        "next": {
-                                            "type": "string",
-                                            "description": "URL to next page",
-                                            "nullable": True,
-                                        },
-                                        "previous": {
-                                            "type": "string",
-                                            "description": "URL to previous page",
-                                            "nullable": True,
-                                        },
-                                        "results": {
-                                            "type": "array",
-                                            "items": {
-                                                "type": "object",
-                                                "properties": serializer_fields,
-                                            },
-                                        },
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "401": {
-                        "description": "Unauthorized",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Authentication error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Forbidden",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Permission error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-                tags=[model_name],
-            )
-        )
+    if static_fields:
+        logger.debug("%s serializer 필드 정적 분석 사용", viewset_name)
 
-        endpoints.append(
-            ApiEndpoint(
-                path=f"/api/v1/{model_name}/",
-                method=HttpMethod.POST,
-                summary=f"Create {model_name}",
-                description=f"Create new {model_name}",
-                parameters=common_parameters + content_type_header,
-                request_body={
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": serializer_fields,
-                                "required": [
-                                    field
-                                    for field, schema in serializer_fields.items()
-                                    if schema.get("required", False)
-                                ],
-                            }
-                        }
-                    },
-                },
-                responses={
-                    "201": {
-                        "description": "Created successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": serializer_fields,
-                                }
-                            }
-                        },
-                    },
-                    "400": {
-                        "description": "Bad Request",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "field_name": {
-                                            "type": "array",
-                                            "items": {"type": "string"},
-                                            "description": "Validation errors for specific fields",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "401": {
-                        "description": "Unauthorized",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Authentication error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Forbidden",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Permission error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-                tags=[model_name],
-            )
-        )
+    return static_fields or {}, bool(viewset_class)
 
-        # Retrieve/Update/Delete
-        # ID 파라미터 추가
-        id_parameter = [
-            ApiParameter(
-                name="id",
-                type=ParameterType.PATH,
-                data_type="integer",
-                required=True,
-                description=f"{model_name} ID",
-                example=1,
-            )
-        ]
 
-        endpoints.append(
-            ApiEndpoint(
-                path=f"/api/v1/{model_name}/{{id}}/",
-                method=HttpMethod.GET,
-                summary=f"Get {model_name}",
-                description=f"Get specific {model_name} by ID",
-                parameters=common_parameters + id_parameter,
-                request_body=None,
-                responses={
-                    "200": {
-                        "description": "Success",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": serializer_fields,
-                                }
-                            }
-                        },
-                    },
-                    "404": {
-                        "description": "Not Found",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Not found error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "401": {
-                        "description": "Unauthorized",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Authentication error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Forbidden",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Permission error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                },
-                tags=[model_name],
-            )
-        )
+def _json_content(schema: Dict[str, Any]) -> Dict[str, Any]:
+    return {"application/json": {"schema": schema}}
 
-        endpoints.append(
-            ApiEndpoint(
-                path=f"/api/v1/{model_name}/{{id}}/",
-                method=HttpMethod.PUT,
-                summary=f"Update {model_name}",
-                description=f"Update specific {model_name} by ID",
-                parameters=common_parameters + content_type_header + id_parameter,
-                request_body={
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "type": "object",
-                                "properties": serializer_fields,
-                                "required": [
-                                    field
-                                    for field, schema in serializer_fields.items()
-                                    if schema.get("required", False)
-                                ],
-                            }
-                        }
-                    },
-                },
-                responses={
-                    "200": {
-                        "description": "Updated successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": serializer_fields,
-                                }
-                            }
-                        },
-                    },
-                    "400": {
-                        "description": "Bad Request",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "field_name": {
-                                            "type": "array",
-                                            "items": {"type": "string"},
-                                            "description": "Validation errors for specific fields",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "404": {
-                        "description": "Not Found",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Not found error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "401": {
-                        "description": "Unauthorized",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Authentication error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Forbidden",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Permission error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
+
+def _detail_error_response(description: str, detail_description: str):
+    """detail 메시지를 가진 오류 응답"""
+    return {
+        "description": description,
+        "content": _json_content(
+            {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "string",
+                        "description": detail_description,
+                    }
                 },
-                tags=[model_name],
-            )
-        )
+            }
+        ),
+    }
+
 
-        endpoints.append(
-            ApiEndpoint(
-                path=f"/api/v1/{model_name}/{{id}}/",
-                method=HttpMethod.DELETE,
-                summary=f"Delete {model_name}",
-                description=f"Delete specific {model_name} by ID",
-                parameters=common_parameters + id_parameter,
-                request_body=None,
-                responses={
-                    "204": {"description": "Deleted successfully", "content": None},
-                    "404": {
-                        "description": "Not Found",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Not found error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "401": {
-                        "description": "Unauthorized",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Authentication error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
-                    "403": {
-                        "description": "Forbidden",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "detail": {
-                                            "type": "string",
-                                            "description": "Permission error message",
-                                        }
-                                    },
-                                }
-                            }
-                        },
-                    },
+def _validation_error_response():
+    """필드별 검증 오류 응답"""
+    return {
+        "description": "Bad Request",
+        "content": _json_content(
+            {
+                "type": "object",
+                "properties": {
+                    "field_name": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Validation errors for specific fields",
+                    }
                 },
-                tags=[model_name],
-            )
-        )
+            }
+        ),
+    }
 
-        print(f"[문서 자동화] 5개 CRUD 엔드포인트 생성 완료")
-        print(f"[문서 자동화] {viewset_name}에서 5개 엔드포인트 추출 완료")
-        return endpoints
 
+def build_viewset_endpoints(
+    viewset_name: str,
+    model_name: str,
+    serializer_fields: Dict[str, dict],
+    components: Optional[ComponentRegistry] = None,
+    app_label: Optional[str] = None,
+) -> List[ApiEndpoint]:
+    """serializer 필드 스키마로 ViewSet의 5개 CRUD 엔드포인트 생성
+
+    components가 주어지면 스키마/공통 파라미터/오류 응답을 components에 등록하고
+    $ref로 참조한다. 없으면 기존처럼 모든 객체를 인라인으로 생성한다. app_label은
+    다른 앱의 같은 이름 스키마와 구분할 때 컴포넌트 이름 앞에 붙는다.
+    """
+    if serializer_fields:
+        logger.debug(
+            "%s에서 실제 serializer 필드 추출 성공: %s개 필드",
+            viewset_name,
+            len(serializer_fields),
+        )
     else:
-        print(f"[문서 자동화] {viewset_name} 클래스를 찾을 수 없습니다")
-        return []
+        logger.debug("%s에서 serializer 필드 추출 실패, 기본 스키마 사용", viewset_name)
+        serializer_fields = _generate_default_schema()
+
+    # 공통 파라미터 정의
+    common_parameters = [
+        ApiParameter(
+            name="Authorization",
+            type=ParameterType.HEADER,
+            data_type="string",
+            required=True,
+            description="Bearer token for authentication",
+            example="Bearer <your-token-here>",
+        )
+    ]
+
+    # GET 요청용 쿼리 파라미터
+    get_query_parameters = [
+        ApiParameter(
+            name="page",
+            type=ParameterType.QUERY,
+            data_type="integer",
+            required=False,
+            description="Page number for pagination",
+            example=1,
+        ),
+        ApiParameter(
+            name="page_size",
+            type=ParameterType.QUERY,
+            data_type="integer",
+            required=False,
+            description="Number of items per page",
+            example=20,
+        ),
+        ApiParameter(
+            name="search",
+            type=ParameterType.QUERY,
+            data_type="string",
+            required=False,
+            description="Search term for filtering",
+            example="search term",
+        ),
+        ApiParameter(
+            name="ordering",
+            type=ParameterType.QUERY,
+            data_type="string",
+            required=False,
+            description="Field to order by (prefix with - for descending)",
+            example="created_at",
+        ),
+        ApiParameter(
+            name="filter",
+            type=ParameterType.QUERY,
+            data_type="string",
+            required=False,
+            description="Filter parameters",
+            example="status=active",
+        ),
+    ]
+
+    # POST/PUT 요청용 헤더
+    content_type_header = [
+        ApiParameter(
+            name="Content-Type",
+            type=ParameterType.HEADER,
+            data_type="string",
+            required=True,
+            description="Content type for request body",
+            example="application/json",
+        )
+    ]
+
+    # ID 파라미터 (모델별 설명이 달라 인라인 유지)
+    id_parameter = [
+        ApiParameter(
+            name="id",
+            type=ParameterType.PATH,
+            data_type="integer",
+            required=True,
+            description=f"{model_name} ID",
+            example=1,
+        )
+    ]
+
+    # 스키마 정의
+    item_schema = {"type": "object", "properties": serializer_fields}
+    request_schema = {
+        "type": "object",
+        "properties": serializer_fields,
+        "required": [
+            field
+            for field, schema in serializer_fields.items()
+            if schema.get("required", False)
+        ],
+    }
 
+    # 오류 응답 정의
+    bad_request = _validation_error_response()
+    unauthorized = _detail_error_response(
+        "Unauthorized", "Authentication error message"
+    )
+    forbidden = _detail_error_response("Forbidden", "Permission error message")
+    not_found = _detail_error_response("Not Found", "Not found error message")
 
-def _to_plural(singular):
-    """단수형을 복수형으로 변환"""
-    if singular.endswith("y"):
-        return singular[:-1] + "ies"
-    elif (
-        singular.endswith("s")
-        or singular.endswith("sh")
-        or singular.endswith("ch")
-        or singular.endswith("x")
-        or singular.endswith("z")
-    ):
-        return singular + "es"
-    else:
-        return singular + "s"
+    if components is not None:
+        resource_name = (
+            viewset_name[:-7] if viewset_name.endswith("ViewSet") else viewset_name
+        )
+        common_parameters = [components.parameter(p) for p in common_parameters]
+        get_query_parameters = [components.parameter(p) for p in get_query_parameters]
+        content_type_header = [components.parameter(p) for p in content_type_header]
+
+        item_schema = components.schema(resource_name, item_schema, app_label)
+        request_schema = components.schema(
+            f"{resource_name}Request", request_schema, app_label
+        )
+
+        bad_request = components.response("BadRequest", bad_request)
+        unauthorized = components.response("Unauthorized", unauthorized)
+        forbidden = components.response("Forbidden", forbidden)
+        not_found = components.response("NotFound", not_found)
+
+    list_schema = {
+        "type": "object",
+        "properties": {
+            "count": {
+                "type": "integer",
+                "description": "Total number of items",
+            },
+            "next": {
+                "type": "string",
+                "description": "URL to next page",
+                "nullable": True,
+            },
+            "previous": {
+                "type": "string",
+                "description": "URL to previous page",
+                "nullable": True,
+            },
+            "results": {"type": "array", "items": item_schema},
+        },
+    }
+    if components is not None:
+        list_schema = components.schema(
+            f"Paginated{resource_name}List", list_schema, app_label
+        )
+
+    # 5개 CRUD 엔드포인트 생성
+    endpoints = [
+        # List/Create
+        ApiEndpoint(
+            path=f"/api/v1/{model_name}/",
+            method=HttpMethod.GET,
+            summary=f"List {model_name}",
+            description=f"Get list of {model_name}",
+            parameters=common_parameters + get_query_parameters,
+            request_body=None,
+            responses={
+                "200": {
+                    "description": "Success",
+                    "content": _json_content(list_schema),
+                },
+                "401": unauthorized,
+                "403": forbidden,
+            },
+            tags=[model_name],
+        ),
+        ApiEndpoint(
+            path=f"/api/v1/{model_name}/",
+            method=HttpMethod.POST,
+            summary=f"Create {model_name}",
+            description=f"Create new {model_name}",
+            parameters=common_parameters + content_type_header,
+            request_body={"required": True, "content": _json_content(request_schema)},
+            responses={
+                "201": {
+                    "description": "Created successfully",
+                    "content": _json_content(item_schema),
+                },
+                "400": bad_request,
+                "401": unauthorized,
+                "403": forbidden,
+            },
+            tags=[model_name],
+        ),
+        # Retrieve/Update/Delete
+        ApiEndpoint(
+            path=f"/api/v1/{model_name}/{{id}}/",
+            method=HttpMethod.GET,
+            summary=f"Get {model_name}",
+            description=f"Get specific {model_name} by ID",
+            parameters=common_parameters + id_parameter,
+            request_body=None,
+            responses={
+                "200": {
+                    "description": "Success",
+                    "content": _json_content(item_schema),
+                },
+                "404": not_found,
+                "401": unauthorized,
+                "403": forbidden,
+            },
+            tags=[model_name],
+        ),
+        ApiEndpoint(
+            path=f"/api/v1/{model_name}/{{id}}/",
+            method=HttpMethod.PUT,
+            summary=f"Update {model_name}",
+            description=f"Update specific {model_name} by ID",
+            parameters=common_parameters + content_type_header + id_parameter,
+            request_body={"required": True, "content": _json_content(request_schema)},
+            responses={
+                "200": {
+                    "description": "Updated successfully",
+                    "content": _json_content(item_schema),
+                },
+                "400": bad_request,
+                "404": not_found,
+                "401": unauthorized,
+                "403": forbidden,
+            },
+            tags=[model_name],
+        ),
+        ApiEndpoint(
+            path=f"/api/v1/{model_name}/{{id}}/",
+            method=HttpMethod.DELETE,
+            summary=f"Delete {model_name}",
+            description=f"Delete specific {model_name} by ID",
+            parameters=common_parameters + id_parameter,
+            request_body=None,
+            responses={
+                "204": {"description": "Deleted successfully", "content": None},
+                "404": not_found,
+                "401": unauthorized,
+                "403": forbidden,
+            },
+            tags=[model_name],
+        ),
+    ]
+
+    logger.debug("%s에서 5개 엔드포인트 추출 완료", viewset_name)
+    return endpoints
 
 
 def discover_viewsets(project_path: Path) -> List[Dict[str, str]]:
     """프로젝트에서 ViewSet 클래스들을 자동 발견"""
-    viewset_pattern = r"class\s+(\w+ViewSet)\s*\([^)]*\):"
-    viewsets = []
+    viewsets = default_viewset_index.discover(project_path)
 
-    app_dir = project_path / "app"
-    if not app_dir.exists():
-        return viewsets
+    for viewset_info in viewsets:
+        logger.debug(
+            "자동 발견: %s.%s -> %s",
+            viewset_info["app"],
+            viewset_info["viewset"],
+            viewset_info["url"],
+        )
 
-    # app 디렉토리 내 모든 앱 탐색
-    for app_folder in app_dir.iterdir():
-        if app_folder.is_dir() and not app_folder.name.startswith("."):
-            app_name = app_folder.name
+    stats = default_viewset_index.last_scan_stats
+    logger.debug(
+        "ViewSet 인덱스: 파일 %s개, 캐시 적중 %s개, 재파싱 %s개",
+        stats.get("files", 0),
+        stats.get("cache_hits", 0),
+        stats.get("reparsed", 0),
+    )
+    return viewsets
 
-            # views.py 파일 확인
-            views_file = app_folder / "views.py"
-            if views_file.exists():
-                try:
-                    with open(views_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-
-                    matches = re.findall(viewset_pattern, content)
-                    for viewset_name in matches:
-                        # URL 경로 생성
-                        if viewset_name.endswith("ViewSet"):
-                            model_name = viewset_name[:-7]
-                        else:
-                            model_name = viewset_name
-
-                        plural_name = _to_plural(model_name.lower())
-                        url_path = f"/api/v1/{plural_name}/"
-
-                        viewsets.append(
-                            {"app": app_name, "viewset": viewset_name, "url": url_path}
-                        )
 
-                        print(
-                            f"[문서 자동화] 자동 발견: {app_name}.{viewset_name} -> {url_path}"
-                        )
-                except Exception as e:
-                    print(f"[문서 자동화] {app_name} views.py 읽기 실패: {e}")
+class ViewModuleCache:
+    """views 모듈을 파일 경로별로 한 번만 로드하는 캐시
 
-            # views/ 폴더 확인
-            views_folder = app_folder / "views"
-            if views_folder.exists() and views_folder.is_dir():
-                for view_file in views_folder.glob("*.py"):
-                    if view_file.name != "__init__.py":
-                        try:
-                            with open(view_file, "r", encoding="utf-8") as f:
-                                content = f.read()
-
-                            matches = re.findall(viewset_pattern, content)
-                            for viewset_name in matches:
-                                # URL 경로 생성
-                                if viewset_name.endswith("ViewSet"):
-                                    model_name = viewset_name[:-7]
-                                else:
-                                    model_name = viewset_name
-
-                                plural_name = _to_plural(model_name.lower())
-                                url_path = f"/api/v1/{plural_name}/"
-
-                                viewsets.append(
-                                    {
-                                        "app": f"{app_name}/views/{view_file.stem}",
-                                        "viewset": viewset_name,
-                                        "url": url_path,
-                                    }
-                                )
-
-                                print(
-                                    f"[문서 자동화] 자동 발견: {app_name}/views/{view_file.stem}.{viewset_name} -> {url_path}"
-                                )
-                        except Exception as e:
-                            print(
-                                f"[문서 자동화] {app_name}/views/{view_file.name} 읽기 실패: {e}"
-                            )
+    파일의 (mtime, 크기)가 바뀌면 다음 조회에서 다시 로드한다.
+    """
 
-    return viewsets
+    def __init__(self):
+        self._modules: Dict[Path, Tuple[Tuple[int, int], object]] = {}
+        self._failures: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self.loads = 0
+        self.hits = 0
+        # 모듈 실행(import)에 쓴 시간 합계 (초)
+        self.import_seconds = 0.0
 
+    @staticmethod
+    def _stat_key(file_path: Path) -> Tuple[int, int]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
 
-def import_viewset_class(file_path: str, class_name: str):
-    """파일에서 ViewSet 클래스를 import"""
-    try:
-        # 파일 경로를 절대 경로로 변환
+    def get_module(self, file_path: Path):
+        """resolve된 파일 경로에 해당하는 모듈 반환 (실패 시 None)"""
         file_path = Path(file_path).resolve()
-
+        stat_key = self._stat_key(file_path)
+
+        loaded = self._modules.get(file_path)
+        if loaded is not None and loaded[0] == stat_key:
+            self.hits += 1
+            CACHE_LOOKUPS.labels("view_module", "hit").inc()
+            return loaded[1]
+        failed = self._failures.get(file_path)
+        if failed is not None and failed[0] == stat_key:
+            self.hits += 1
+            CACHE_LOOKUPS.labels("view_module", "hit").inc()
+            return None
+        # 파일이 바뀌었으면 이전 결과를 버리고 다시 로드
+        self._modules.pop(file_path, None)
+        self._failures.pop(file_path, None)
+
+        CACHE_LOOKUPS.labels("view_module", "miss").inc()
+        started = time.perf_counter()
+        try:
+            module = self._load(file_path, stat_key)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.import_seconds += elapsed
+            VIEW_MODULE_IMPORT_SECONDS.observe(elapsed)
+        if module is not None:
+            self._modules[file_path] = (stat_key, module)
+        return module
+
+    def _load(self, file_path: Path, stat_key: Tuple[int, int]):
+        """후보 모듈 이름으로 파일을 실행하고 처음 성공한 모듈을 반환"""
         # Django 프로젝트 루트 경로 설정
         django_root = (
             file_path.parent.parent.parent
@@ -1102,178 +706,316 @@ def import_viewset_class(file_path: str, class_name: str):
             f"app.{app_name}.views.{file_path.stem}",
         ]
 
-        viewset_class = None
-
+        errors = []
         for module_name in possible_module_names:
             try:
-                # 파일을 모듈로 로드
                 spec = importlib.util.spec_from_file_location(module_name, file_path)
                 if spec is None or spec.loader is None:
                     continue
 
                 module = importlib.util.module_from_spec(spec)
                 sys.modules[module_name] = module
+                self.loads += 1
                 spec.loader.exec_module(module)
 
-                # 클래스 가져오기
-                viewset_class = getattr(module, class_name, None)
-                if viewset_class:
-                    print(
-                        f"[문서 자동화] {class_name} 클래스 import 성공 (모듈: {module_name})"
-                    )
-                    return viewset_class
+                logger.debug(
+                    "%s 모듈 로드 성공 (모듈: %s)", file_path.name, module_name
+                )
+                return module
 
             except Exception as e:
-                print(f"[문서 자동화] 모듈 {module_name} 로드 실패: {e}")
-                continue
+                sys.modules.pop(module_name, None)
+                errors.append(f"{module_name}: {e}")
+                logger.debug("모듈 %s 로드 실패: %s", module_name, e)
 
-        if not viewset_class:
-            print(f"[문서 자동화] {class_name} 클래스를 모든 모듈에서 찾을 수 없음")
+        self._failures[file_path] = (stat_key, "; ".join(errors))
+        return None
 
-    except Exception as e:
-        print(f"[문서 자동화] 직접 import 실패: {e}")
+    @property
+    def failures(self) -> int:
+        """import에 실패한 파일 수"""
+        return len(self._failures)
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        self._modules.clear()
+        self._failures.clear()
+
+
+def import_viewset_class(
+    file_path: str, class_name: str, module_cache: Optional[ViewModuleCache] = None
+):
+    """파일에서 ViewSet 클래스를 import"""
+    if module_cache is None:
+        module_cache = ViewModuleCache()
 
-    # fallback: 파일 내용을 직접 파싱
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # 클래스 정의 찾기
-        class_pattern = rf"class\s+{class_name}\s*\([^)]*\):"
-        if re.search(class_pattern, content):
-            print(f"[문서 자동화] {class_name} 클래스 정의 발견 (파일 파싱)")
-            return ViewSetMock(class_name, file_path)
-        else:
-            print(f"[문서 자동화] {class_name} 클래스 정의를 파일에서 찾을 수 없음")
-            return None
+        # 파일 경로를 절대 경로로 변환
+        file_path = Path(file_path).resolve()
 
-    except Exception as parse_error:
-        print(f"[문서 자동화] 파일 파싱 실패: {parse_error}")
+        module = module_cache.get_module(file_path)
+        viewset_class = getattr(module, class_name, None) if module else None
+        if viewset_class:
+            logger.debug("%s 클래스 import 성공", class_name)
+            return viewset_class
+
+        logger.debug("%s 클래스를 모듈에서 찾을 수 없음", class_name)
+
+    except Exception as e:
+        logger.debug("직접 import 실패: %s", e)
+
+    return None
+
+
+def _viewset_fields_from_worker(
+    introspection_pool,
+    project_path: Path,
+    viewset_name: str,
+    views_file_path: Path,
+) -> Optional[Dict[str, dict]]:
+    """Django 워커로 serializer 필드 추출 (ViewSet을 찾지 못하면 None)
+
+    워커 요청 실패는 예외로 전달한다.
+    """
+    result = introspection_pool.request(
+        project_path,
+        "viewset_fields",
+        {"file_path": str(views_file_path), "viewset_name": viewset_name},
+    )
+
+    if not result.get("found"):
+        logger.debug("%s 클래스를 찾을 수 없습니다", viewset_name)
         return None
 
+    return result.get("fields", {})
 
-def generate_api_documentation(project_path: Path, base_url: str) -> ApiDocumentation:
-    """API 문서 생성"""
-    # Django 환경 설정
-    setup_django_environment(project_path)
+
+@profiled("generation")
+def generate_api_documentation(
+    project_path: Path,
+    base_url: str,
+    introspection_pool=None,
+    static_analysis: bool = False,
+    fragment_cache: Optional[ViewSetFragmentCache] = None,
+) -> ApiDocumentation:
+    """API 문서 생성
+
+    static_analysis가 True이면 프로젝트 코드를 import하지 않고 ast 정적 분석만 사용한다.
+    introspection_pool(DjangoWorkerPool)이 주어지면 현재 프로세스에서 Django를
+    설정하지 않고 프로젝트별 워커 프로세스에 serializer 필드 추출을 맡긴다.
+    워커를 시작하지 못하면 경고만 남기고 정적 분석으로 대신한다.
+    요청 기한이 지나거나 취소되면 남은 ViewSet을 건너뛰고 info에 부분 결과로 표시한다.
+    """
+    check_deadline()
+    progress_phase("setup")
+    timer = PhaseTimer()
+    static_extractor = StaticSerializerExtractor(project_path)
+    if fragment_cache is None:
+        fragment_cache = default_fragment_cache
+
+    with timer.span("setup"):
+        if static_analysis:
+            logger.debug("정적 분석 모드 (Django 환경 미사용): %s", project_path)
+        elif introspection_pool is None:
+            # Django 환경 설정
+            setup_django_environment(project_path)
+        else:
+            try:
+                introspection_pool.request(project_path, "begin_generation")
+            except (WorkerError, TimeoutError, OSError) as e:
+                logger.warning("Django 워커 시작 실패, 정적 분석으로 대체: %s", e)
+                introspection_pool, static_analysis = None, True
 
     # ViewSet 자동 발견
-    viewsets = discover_viewsets(project_path)
+    progress_phase("discover")
+    with timer.span("discovery"):
+        viewsets = discover_viewsets(project_path)
+    progress_phase("viewsets", total=len(viewsets))
 
     all_endpoints = []
+    module_cache = ViewModuleCache()
+    schema_cache = SerializerSchemaCache()
+    components = ComponentRegistry()
 
-    for viewset_info in viewsets:
-        app_name = viewset_info["app"]
-        viewset_name = viewset_info["viewset"]
-
-        # app 이름에서 실제 앱 이름 추출
-        if "/" in app_name:
-            actual_app_name = app_name.split("/")[0]
-        else:
-            actual_app_name = app_name
-
-        # ViewSet 파일 경로 찾기
-        if "/" in app_name:
-            # views/ 폴더 내 파일인 경우
-            parts = app_name.split("/")
-            app_folder = parts[0]
-            view_file = parts[2]  # views/filename
-            views_file_path = (
-                project_path / "app" / app_folder / "views" / f"{view_file}.py"
+    # ViewSet별 필드 캐시 키에 포함할 추출 방식/생성기/Django 환경 정보
+    if static_analysis:
+        mode, environment = "static", ""
+    else:
+        mode = "in_process" if introspection_pool is None else "worker"
+        environment = project_fingerprint(project_path)
+    fragment_context = f"{mode}|{generator_version()}|{environment}"
+    fragment_hits = fragment_cache.hits
+    skipped_viewsets: List[str] = []
+    stopped = None
+    # ViewSet마다 줄을 남기지 않고 결과별 개수를 모아 끝에 한 줄로 기록
+    summary = RunSummary(logger, "문서 생성 완료: %s")
+
+    for index, viewset_info in enumerate(viewsets):
+        # ViewSet 사이마다 기한/취소 확인
+        stopped = stop_reason()
+        if stopped:
+            skipped_viewsets = [info["viewset"] for info in viewsets[index:]]
+            logger.warning(
+                "생성 중단 (%s): %s/%s개 ViewSet 처리, %s개 건너뜀",
+                stopped,
+                index,
+                len(viewsets),
+                len(skipped_viewsets),
             )
-        else:
-            # views.py 파일인 경우
-            views_file_path = project_path / "app" / actual_app_name / "views.py"
+            break
 
-        print(f"[문서 자동화] {viewset_name} 파일 경로: {views_file_path}")
+        viewset_name = viewset_info["viewset"]
+        actual_app_name = viewset_info["app_name"]
+        views_file_path = Path(viewset_info["file_path"])
+        progress_current(viewset_name)
 
-        if views_file_path.exists():
-            # ViewSet 클래스 import
-            viewset_cls = import_viewset_class(str(views_file_path), viewset_name)
+        logger.debug("%s 파일 경로: %s", viewset_name, views_file_path)
 
-            if viewset_cls:
-                # OpenAPI 엔드포인트 생성
-                endpoints = generate_openapi_for_viewset(
-                    viewset_name, str(views_file_path), base_url, actual_app_name
-                )
-                all_endpoints.extend(endpoints)
-                print(
-                    f"[문서 자동화] {viewset_name}에서 {len(endpoints)}개 엔드포인트 추출 완료"
+        if not views_file_path.exists():
+            logger.debug(
+                "%s 파일을 찾을 수 없습니다: %s", viewset_name, views_file_path
+            )
+            summary.count("missing_file", viewset_name)
+            progress_advance()
+            continue
+
+        # 의존 모듈(serializer/model 등)이 그대로면 이전 추출 결과 재사용
+        extraction_started = time.perf_counter()
+        digest = fragment_cache.dependency_digest(
+            views_file_path, viewset_name, static_extractor, fragment_context
+        )
+        serializer_fields = (
+            fragment_cache.get(views_file_path, viewset_name, mode, digest)
+            if digest
+            else None
+        )
+        cacheable = digest is not None
+        CACHE_LOOKUPS.labels(
+            "viewset_fields",
+            "bypass" if not digest else "miss" if serializer_fields is None else "hit",
+        ).inc()
+
+        if serializer_fields is not None:
+            logger.debug("%s 필드 캐시 사용", viewset_name)
+            summary.count("cached")
+        elif static_analysis:
+            serializer_fields = static_extractor.viewset_fields(
+                views_file_path, viewset_name
+            )
+        elif introspection_pool is not None:
+            try:
+                serializer_fields = _viewset_fields_from_worker(
+                    introspection_pool, project_path, viewset_name, views_file_path
                 )
-            else:
-                print(f"[문서 자동화] {viewset_name} 클래스를 찾을 수 없습니다")
+            except Exception as e:
+                logger.warning("%s 워커 요청 실패: %s", viewset_name, e)
+                summary.count("worker_error", viewset_name)
+                serializer_fields, cacheable = None, False
         else:
-            print(
-                f"[문서 자동화] {viewset_name} 파일을 찾을 수 없습니다: {views_file_path}"
+            serializer_fields, imported = _viewset_fields_in_process(
+                viewset_name,
+                str(views_file_path),
+                module_cache=module_cache,
+                static_extractor=static_extractor,
+                schema_cache=schema_cache,
             )
+            # import 실패 후 정적 분석으로 대체한 결과는 캐시하지 않음
+            cacheable = cacheable and imported
 
-    print(f"[DEBUG] 생성된 엔드포인트 개수: {len(all_endpoints)}")
-
-    # OpenAPI 문서 생성
-    openapi_dict = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": f"{project_path.name} API Documentation",
-            "version": "1.0.0",
-            "description": project_path.name,
-            "framework": "django",
-            "project_path": str(project_path),
-            "total_endpoints": len(all_endpoints),
-        },
-        "servers": [{"url": base_url, "description": "API Server"}],
-        "paths": {},
-        "tags": [],
-    }
+        if cacheable and serializer_fields is not None:
+            fragment_cache.put(
+                views_file_path, viewset_name, mode, digest, serializer_fields
+            )
+        timer.add("extraction", time.perf_counter() - extraction_started)
+
+        # OpenAPI 엔드포인트 생성
+        with timer.span("render"):
+            endpoints = (
+                build_viewset_endpoints(
+                    viewset_name,
+                    actual_app_name,
+                    serializer_fields,
+                    components,
+                    app_label=viewset_info["app"],
+                )
+                if serializer_fields is not None
+                else []
+            )
 
-    # 엔드포인트를 OpenAPI 형식으로 변환
-    for endpoint in all_endpoints:
-        path_key = endpoint.path
-        method_key = endpoint.method.value.lower()
-
-        if path_key not in openapi_dict["paths"]:
-            openapi_dict["paths"][path_key] = {}
-
-        openapi_dict["paths"][path_key][method_key] = {
-            "summary": endpoint.summary,
-            "description": endpoint.description,
-            "tags": endpoint.tags,
-            "deprecated": endpoint.deprecated,
-            "parameters": [
-                {
-                    "name": param.name,
-                    "in": param.type.value,
-                    "required": param.required,
-                    "description": param.description,
-                    "schema": {"type": param.data_type},
-                    "example": param.example,
-                }
-                for param in endpoint.parameters
-            ],
-            "requestBody": endpoint.request_body,
-            "responses": endpoint.responses,
-        }
+        if serializer_fields is None:
+            summary.count("not_found", viewset_name)
+        elif not serializer_fields:
+            summary.count("default_schema", viewset_name)
+        all_endpoints.extend(endpoints)
+        progress_advance()
+        logger.debug("%s에서 %s개 엔드포인트 추출 완료", viewset_name, len(endpoints))
+
+    progress_phase("assemble")
 
     # 태그 정보 추가
     all_tags = set()
     for endpoint in all_endpoints:
         all_tags.update(endpoint.tags)
 
-    for tag in sorted(all_tags):
-        openapi_dict["tags"].append({"name": tag})
-
-    print(f"[DEBUG] OpenAPI dict keys: {list(openapi_dict.keys())}")
-    print(f"[DEBUG] OpenAPI paths keys: {list(openapi_dict['paths'].keys())}")
-
-    return ApiDocumentation(
-        title=f"{project_path.name} API Documentation",
-        version="1.0.0",
-        base_url=base_url,
-        description=project_path.name,
-        endpoints=all_endpoints,
-        tags=sorted(all_tags),
-        info={
-            "framework": "django",
-            "project_path": str(project_path),
-            "total_endpoints": len(all_endpoints),
-        },
+    info = {
+        "framework": "django",
+        "project_path": str(project_path),
+        "total_endpoints": len(all_endpoints),
+    }
+    if skipped_viewsets:
+        info.update(
+            {
+                "partial": True,
+                "stop_reason": stopped,
+                "skipped_viewsets": skipped_viewsets,
+            }
+        )
+
+    with timer.span("render"):
+        documentation = ApiDocumentation(
+            title=f"{project_path.name} API Documentation",
+            version="1.0.0",
+            base_url=base_url,
+            description=project_path.name,
+            endpoints=all_endpoints,
+            tags=sorted(all_tags),
+            info=info,
+            components=components.to_components(),
+        )
+
+    # views 모듈 import 시간은 추출 시간에서 분리해 기록
+    phases = {name: phase["seconds"] for name, phase in timer.to_dict().items()}
+    phases["import"] = module_cache.import_seconds
+    phases["extraction"] = max(
+        0.0, phases.get("extraction", 0.0) - module_cache.import_seconds
     )
+    for name, seconds in phases.items():
+        GENERATION_PHASE_SECONDS.labels(name).observe(seconds)
+    GENERATION_VIEWSETS.observe(len(viewsets))
+
+    if logger.enabled(INFO):
+        index_stats = default_viewset_index.last_scan_stats
+        details = {}
+        if mode == "in_process":
+            details = {
+                "module_loads": module_cache.loads,
+                "module_hits": module_cache.hits,
+                "module_failures": module_cache.failures,
+                "schema_misses": schema_cache.misses,
+                "schema_hits": schema_cache.hits,
+            }
+        summary.log(
+            project_path.name,
+            mode=mode,
+            viewsets=len(viewsets),
+            endpoints=len(all_endpoints),
+            skipped=len(skipped_viewsets),
+            index_files=index_stats.get("files", 0),
+            index_reparsed=index_stats.get("reparsed", 0),
+            fragment_hits=fragment_cache.hits - fragment_hits,
+            components_reused=components.reused,
+            seconds=sum(phases.values()),
+            **details,
+        )
+
+    return documentation
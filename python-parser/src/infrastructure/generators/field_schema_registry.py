@@ -0,0 +1,171 @@
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from ..observability.logs import get_logger
+
+logger = get_logger(__name__)
+
+# builder(field, schemas) -> OpenAPI 스키마
+# field는 런타임 DRF 필드 인스턴스(정적 분석에서는 None), schemas는 중첩 serializer를
+# 재귀적으로 해석하는 SerializerSchemaCache(정적 분석에서는 None)
+SchemaBuilder = Callable[[Any, Optional["SerializerSchemaCache"]], Dict[str, Any]]
+
+
+def _constant(schema: Dict[str, Any]) -> SchemaBuilder:
+    return lambda field, schemas: dict(schema)
+
+
+class FieldSchemaRegistry:
+    """DRF 필드 클래스 이름 -> 스키마 빌더 레지스트리
+
+    클래스 이름으로 등록하므로 rest_framework를 import하지 않고도 정적 분석에서 쓸 수 있다.
+    런타임 필드는 클래스 MRO를 따라 가장 가까운 등록 이름의 빌더를 찾고, 그 결과를
+    클래스별로 캐시한다.
+    """
+
+    def __init__(self, default: Optional[SchemaBuilder] = None):
+        self._builders: Dict[str, SchemaBuilder] = {}
+        self._class_builders: Dict[type, SchemaBuilder] = {}
+        self._default = default or _constant({"type": "string"})
+
+    def register(self, name: str, builder: Optional[SchemaBuilder] = None):
+        """빌더 등록 (builder를 생략하면 데코레이터로 사용)"""
+
+        def decorator(func: SchemaBuilder) -> SchemaBuilder:
+            self._builders[name] = func
+            self._class_builders.clear()
+            return func
+
+        return decorator(builder) if builder else decorator
+
+    def register_schema(self, name: str, schema: Dict[str, Any]) -> None:
+        """고정 스키마 등록"""
+        self.register(name, _constant(schema))
+
+    def builder_for_class(self, field_class: type) -> SchemaBuilder:
+        """MRO에서 가장 가까운 등록 클래스의 빌더 (클래스별 캐시)"""
+        builder = self._class_builders.get(field_class)
+        if builder is None:
+            builder = self.builder_for_names(k.__name__ for k in field_class.__mro__)
+            self._class_builders[field_class] = builder
+        return builder
+
+    def builder_for_names(self, names: Iterable[str]) -> SchemaBuilder:
+        """이름 목록(가까운 클래스 순)에서 처음 등록된 빌더"""
+        for name in names:
+            builder = self._builders.get(name)
+            if builder is not None:
+                return builder
+        return self._default
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._builders
+
+    def schema_for_field(
+        self, field: Any, schemas: Optional["SerializerSchemaCache"] = None
+    ) -> Dict[str, Any]:
+        """런타임 DRF 필드 인스턴스의 스키마"""
+        return self.builder_for_class(type(field))(field, schemas)
+
+    def schema_for_names(self, names: Iterable[str]) -> Dict[str, Any]:
+        """정적 분석용: 필드 클래스 이름(과 상위 클래스 이름)으로 스키마 조회"""
+        return self.builder_for_names(names)(None, None)
+
+
+default_field_registry = FieldSchemaRegistry()
+
+for _name, _schema in {
+    "IntegerField": {"type": "integer"},
+    "DecimalField": {"type": "number", "format": "decimal"},
+    "FloatField": {"type": "number", "format": "float"},
+    "BooleanField": {"type": "boolean"},
+    "NullBooleanField": {"type": "boolean"},
+    "DateTimeField": {"type": "string", "format": "date-time"},
+    "DateField": {"type": "string", "format": "date"},
+    "CharField": {"type": "string"},
+    "SerializerMethodField": {"type": "string"},
+    "DictField": {"type": "object"},
+    "HStoreField": {"type": "object"},
+}.items():
+    default_field_registry.register_schema(_name, _schema)
+
+
+def _child_schema(field, schemas, default: Dict[str, Any]) -> Dict[str, Any]:
+    child = getattr(field, "child", None)
+    if child is None:
+        return dict(default)
+    registry = schemas.registry if schemas else default_field_registry
+    return registry.schema_for_field(child, schemas)
+
+
+@default_field_registry.register("ListField")
+def _list_field_schema(field, schemas):
+    return {"type": "array", "items": _child_schema(field, schemas, {"type": "string"})}
+
+
+@default_field_registry.register("Serializer")
+def _nested_serializer_schema(field, schemas):
+    if field is None or schemas is None:
+        return {"type": "object"}
+    try:
+        properties = schemas.fields(type(field))
+    except Exception as e:
+        logger.debug("중첩 serializer 필드 추출 실패: %s (%s)", type(field).__name__, e)
+        return {"type": "object"}
+    return {"type": "object", "properties": properties}
+
+
+@default_field_registry.register("ListSerializer")
+def _list_serializer_schema(field, schemas):
+    return {"type": "array", "items": _child_schema(field, schemas, {"type": "object"})}
+
+
+class SerializerSchemaCache:
+    """serializer 클래스별 필드 스키마 캐시
+
+    생성 1회 동안 공유해 여러 ViewSet이 같은 serializer를 쓰더라도 한 번만
+    인스턴스화한다. 중첩 serializer와 ListSerializer는 재귀적으로 해석하며,
+    순환 참조는 빈 객체로 끊는다.
+    """
+
+    def __init__(self, registry: FieldSchemaRegistry = default_field_registry):
+        self.registry = registry
+        self._schemas: Dict[type, Dict[str, dict]] = {}
+        self._in_progress: set = set()
+        self.hits = 0
+        self.misses = 0
+
+    def fields(self, serializer_class: type) -> Dict[str, dict]:
+        """serializer 클래스의 필드별 스키마 (required/nullable/readOnly/description 포함)"""
+        cached = self._schemas.get(serializer_class)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        if serializer_class in self._in_progress:
+            return {}
+
+        self.misses += 1
+        self._in_progress.add(serializer_class)
+        try:
+            fields = getattr(serializer_class(), "fields", None)
+            result = {}
+            if fields is not None and hasattr(fields, "items"):
+                for name, field in fields.items():
+                    result[name] = self.field_schema(field)
+        finally:
+            self._in_progress.discard(serializer_class)
+
+        self._schemas[serializer_class] = result
+        return result
+
+    def field_schema(self, field: Any) -> Dict[str, Any]:
+        """필드 하나의 스키마와 공통 속성"""
+        schema = self.registry.schema_for_field(field, self)
+        if getattr(field, "required", False):
+            schema["required"] = True
+        if getattr(field, "allow_null", False):
+            schema["nullable"] = True
+        if getattr(field, "read_only", False):
+            schema["readOnly"] = True
+        if getattr(field, "help_text", None):
+            schema["description"] = str(field.help_text)
+        return schema
@@ -0,0 +1,153 @@
+import hashlib
+import json
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ...domain.entities.api_documentation import ApiParameter
+
+
+def structural_hash(value: Any) -> str:
+    """키 순서와 무관한 구조 해시"""
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Component:
+    """구조와 이름이 같은 등록을 모은 컴포넌트"""
+
+    value: Dict[str, Any]
+    qualifiers: Set[str] = field(default_factory=set)
+    # 발급한 $ref 객체 (dict 또는 ApiParameter), 이름이 정해지면 채운다
+    holders: List[Any] = field(default_factory=list)
+
+
+class ComponentRegistry:
+    """공유 components(schemas/parameters/responses)를 모으고 $ref를 발급하는 레지스트리
+
+    이름과 구조가 모두 같은 객체를 하나의 컴포넌트로 합친다. 이름이 같고 구조가
+    다르면 충돌한 컴포넌트 모두에 qualifier(앱 경로)를 붙이고, 그래도 겹치면 구조
+    해시를 붙인다. 최종 이름은 to_components()에서 등록 순서와 무관하게 정하고
+    그때까지 발급한 $ref도 그 이름으로 채운다.
+    """
+
+    SECTIONS = ("schemas", "parameters", "responses")
+
+    def __init__(self):
+        # 섹션 -> (이름, 구조 해시) -> 컴포넌트
+        self._components: Dict[str, Dict[Tuple[str, str], _Component]] = {
+            s: {} for s in self.SECTIONS
+        }
+        self.reused = 0
+
+    def schema(
+        self, name: str, schema: Dict[str, Any], qualifier: Optional[str] = None
+    ) -> Dict[str, str]:
+        """스키마 등록 후 $ref 반환"""
+        return self._register("schemas", name, schema, qualifier)
+
+    def response(
+        self, name: str, response: Dict[str, Any], qualifier: Optional[str] = None
+    ) -> Dict[str, str]:
+        """응답 등록 후 $ref 반환"""
+        return self._register("responses", name, response, qualifier)
+
+    def parameter(
+        self, parameter: ApiParameter, qualifier: Optional[str] = None
+    ) -> ApiParameter:
+        """파라미터 등록 후 ref가 설정된 복사본 반환"""
+        component, ref = self._add(
+            "parameters", parameter.name, parameter.to_openapi_dict(), qualifier
+        )
+        registered = replace(parameter, ref=ref)
+        component.holders.append(registered)
+        return registered
+
+    def to_components(self) -> Dict[str, Any]:
+        """OpenAPI components 객체 (빈 섹션 제외, 이름순)"""
+        result = {}
+        for section, components in self._components.items():
+            if not components:
+                continue
+            names = self._final_names(components)
+            for key, component in components.items():
+                ref = self._ref(section, names[key])
+                for holder in component.holders:
+                    if isinstance(holder, ApiParameter):
+                        holder.ref = ref
+                    else:
+                        holder["$ref"] = ref
+            result[section] = {
+                names[key]: components[key].value
+                for key in sorted(components, key=names.get)
+            }
+        return result
+
+    def _register(
+        self,
+        section: str,
+        name: str,
+        value: Dict[str, Any],
+        qualifier: Optional[str],
+    ) -> Dict[str, str]:
+        component, ref = self._add(section, name, value, qualifier)
+        holder = {"$ref": ref}
+        component.holders.append(holder)
+        return holder
+
+    def _add(
+        self,
+        section: str,
+        name: str,
+        value: Dict[str, Any],
+        qualifier: Optional[str],
+    ) -> Tuple[_Component, str]:
+        key = (self._sanitize(name), structural_hash(value))
+        components = self._components[section]
+        component = components.get(key)
+        if component is None:
+            component = components[key] = _Component(value)
+        else:
+            self.reused += 1
+        if qualifier:
+            component.qualifiers.add(qualifier)
+        # 이름이 정해지기 전 임시 참조 (구조 해시를 포함해 서로 구분됨)
+        return component, self._ref(section, f"{key[0]}~{key[1][:12]}")
+
+    def _final_names(
+        self, components: Dict[Tuple[str, str], _Component]
+    ) -> Dict[Tuple[str, str], str]:
+        """등록 순서와 무관한 컴포넌트 이름"""
+        name_counts = Counter(name for name, _ in components)
+        names = {
+            key: (
+                key[0]
+                if name_counts[key[0]] == 1
+                else self._qualified(key[0], components[key].qualifiers)
+            )
+            for key in components
+        }
+
+        # 한정해도 겹치면 (같은 앱, qualifier 없음 등) 구조 해시로 구분
+        final_counts = Counter(names.values())
+        for key, name in names.items():
+            if final_counts[name] > 1:
+                names[key] = f"{name}_{key[1][:8]}"
+        return names
+
+    def _qualified(self, name: str, qualifiers: Set[str]) -> str:
+        if not qualifiers:
+            return name
+        return self._sanitize(f"{min(qualifiers).replace('/', '.')}.{name}")
+
+    @staticmethod
+    def _sanitize(name: str) -> str:
+        return (
+            "".join(ch if ch.isalnum() or ch in "._-" else "_" for ch in name)
+            or "Component"
+        )
+
+    @staticmethod
+    def _ref(section: str, name: str) -> str:
+        return f"#/components/{section}/{name}"
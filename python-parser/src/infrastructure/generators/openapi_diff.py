@@ -0,0 +1,250 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set
+
+from .openapi_components import structural_hash
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# $ref로 참조될 수 있는 최상위 섹션 (OpenAPI 3 + Swagger 2)
+REFERENCEABLE_SECTIONS = ("components", "definitions", "parameters", "responses")
+
+# 응답/요청 스키마 필드를 펼칠 최대 깊이
+MAX_FIELD_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class OperationFingerprint:
+    """오퍼레이션 하나의 구조 해시와 호환성 판단용 요약
+
+    해시는 $ref를 펼친 결과로 계산하므로 공유 스키마가 바뀌어도 변경으로 잡힌다.
+    """
+
+    hash: str
+    parameters: Dict[str, bool] = field(default_factory=dict)
+    request_fields: Dict[str, bool] = field(default_factory=dict)
+    request_body_required: bool = False
+    responses: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def referenceable_hash(spec: Dict[str, Any]) -> str:
+    """$ref 대상 섹션들의 해시 (지문 재사용 여부 판단용)"""
+    return structural_hash({key: spec.get(key) for key in REFERENCEABLE_SECTIONS})
+
+
+def fingerprint_path_item(
+    spec: Dict[str, Any], path_item: Dict[str, Any]
+) -> Dict[str, OperationFingerprint]:
+    """경로 하나의 메서드별 지문 계산"""
+    resolver = _RefResolver(spec)
+    path_item = resolver.resolve(path_item)
+    shared_parameters = path_item.get("parameters") or []
+
+    fingerprints = {}
+    for method in HTTP_METHODS:
+        operation = path_item.get(method)
+        if not isinstance(operation, dict):
+            continue
+        fingerprints[method.upper()] = _fingerprint_operation(
+            resolver, operation, shared_parameters
+        )
+    return fingerprints
+
+
+def diff_operations(
+    base: Dict[str, OperationFingerprint], head: Dict[str, OperationFingerprint]
+) -> Dict[str, Any]:
+    """두 버전의 오퍼레이션 지문 비교 (추가/삭제/변경 + 호환성 깨짐 여부)"""
+    added = [{"operation": key, "breaking": False} for key in head if key not in base]
+    removed = [{"operation": key, "breaking": True} for key in base if key not in head]
+
+    changed = []
+    unchanged = 0
+    for key, before in base.items():
+        after = head.get(key)
+        if after is None:
+            continue
+        if after.hash == before.hash:
+            unchanged += 1
+            continue
+        changes, breaking = _describe_changes(before, after)
+        changed.append({"operation": key, "breaking": breaking, "changes": changes})
+
+    return {
+        "summary": {
+            "added": len(added),
+            "removed": len(removed),
+            "changed": len(changed),
+            "unchanged": unchanged,
+            "breaking": len(removed) + sum(1 for c in changed if c["breaking"]),
+        },
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+    }
+
+
+def _fingerprint_operation(
+    resolver: "_RefResolver",
+    operation: Dict[str, Any],
+    shared_parameters: List[Dict[str, Any]],
+) -> OperationFingerprint:
+    resolved = resolver.resolve(operation)
+
+    # 경로 공통 파라미터 + 오퍼레이션 파라미터 (같은 in/name이면 오퍼레이션 우선)
+    parameters: Dict[str, Dict[str, Any]] = {}
+    for parameter in list(shared_parameters) + list(resolved.get("parameters") or []):
+        if isinstance(parameter, dict) and "name" in parameter:
+            parameters[f"{parameter.get('in')}:{parameter['name']}"] = parameter
+
+    body_schema = None
+    body_required = False
+    if isinstance(resolved.get("requestBody"), dict):
+        request_body = resolved["requestBody"]
+        body_schema = _content_schema(request_body)
+        body_required = bool(request_body.get("required"))
+    for key in [k for k, p in parameters.items() if p.get("in") == "body"]:
+        body_parameter = parameters.pop(key)
+        body_schema = body_parameter.get("schema")
+        body_required = bool(body_parameter.get("required"))
+
+    responses = {}
+    for status, response in (resolved.get("responses") or {}).items():
+        schema = None
+        if isinstance(response, dict):
+            schema = response.get("schema") or _content_schema(response)
+        responses[str(status)] = sorted(_schema_fields(schema))
+
+    return OperationFingerprint(
+        hash=structural_hash({"operation": resolved, "shared": shared_parameters}),
+        parameters={
+            key: bool(p.get("required")) or p.get("in") == "path"
+            for key, p in parameters.items()
+        },
+        request_fields=_required_fields(body_schema),
+        request_body_required=body_required,
+        responses=responses,
+    )
+
+
+def _describe_changes(before: OperationFingerprint, after: OperationFingerprint):
+    changes = []
+    breaking = False
+
+    for key, required in after.parameters.items():
+        if key not in before.parameters:
+            changes.append(
+                f"parameter added: {key}" + (" (required)" if required else "")
+            )
+            breaking |= required
+        elif required and not before.parameters[key]:
+            changes.append(f"parameter became required: {key}")
+            breaking = True
+    for key in before.parameters:
+        if key not in after.parameters:
+            changes.append(f"parameter removed: {key}")
+
+    if after.request_body_required and not before.request_body_required:
+        changes.append("request body became required")
+        breaking = True
+    for name, required in after.request_fields.items():
+        if name not in before.request_fields:
+            changes.append(
+                f"request field added: {name}" + (" (required)" if required else "")
+            )
+            breaking |= required
+        elif required and not before.request_fields[name]:
+            changes.append(f"request field became required: {name}")
+            breaking = True
+    for name in before.request_fields:
+        if name not in after.request_fields:
+            changes.append(f"request field removed: {name}")
+
+    for status, fields in before.responses.items():
+        if status not in after.responses:
+            changes.append(f"response removed: {status}")
+            breaking |= status.startswith("2")
+            continue
+        missing = sorted(set(fields) - set(after.responses[status]))
+        for name in missing:
+            changes.append(f"response field removed: {status} {name}")
+        breaking |= bool(missing)
+    for status, fields in after.responses.items():
+        if status not in before.responses:
+            changes.append(f"response added: {status}")
+            continue
+        for name in sorted(set(fields) - set(before.responses[status])):
+            changes.append(f"response field added: {status} {name}")
+
+    if not changes:
+        # 설명/예시/타입 등 요약에 드러나지 않는 변경
+        changes.append("schema or metadata changed")
+    return changes, breaking
+
+
+def _content_schema(container: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    for media in (container.get("content") or {}).values():
+        if isinstance(media, dict) and media.get("schema"):
+            return media["schema"]
+    return None
+
+
+def _required_fields(schema: Optional[Dict[str, Any]]) -> Dict[str, bool]:
+    if not isinstance(schema, dict):
+        return {}
+    if schema.get("type") == "array" and isinstance(schema.get("items"), dict):
+        schema = schema["items"]
+    required = set(schema.get("required") or [])
+    return {
+        name: name in required or bool((prop or {}).get("required") is True)
+        for name, prop in (schema.get("properties") or {}).items()
+        if not (isinstance(prop, dict) and prop.get("readOnly"))
+    }
+
+
+def _schema_fields(
+    schema: Optional[Dict[str, Any]], prefix: str = "", depth: int = 0
+) -> Set[str]:
+    if not isinstance(schema, dict) or depth >= MAX_FIELD_DEPTH:
+        return set()
+    if schema.get("type") == "array" and isinstance(schema.get("items"), dict):
+        return _schema_fields(schema["items"], f"{prefix}[]", depth)
+
+    fields = set()
+    for name, prop in (schema.get("properties") or {}).items():
+        dotted = f"{prefix}.{name}" if prefix else name
+        fields.add(dotted)
+        fields |= _schema_fields(prop, dotted, depth + 1)
+    return fields
+
+
+class _RefResolver:
+    """스펙 내부 $ref(#/...)를 펼치는 리졸버 (순환 참조는 $ref로 남김)"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self._cache: Dict[str, Any] = {}
+
+    def resolve(self, node: Any, stack: tuple = ()) -> Any:
+        if isinstance(node, list):
+            return [self.resolve(item, stack) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/"):
+            if ref in stack:
+                return {"$ref": ref}
+            if ref not in self._cache:
+                self._cache[ref] = self.resolve(self._lookup(ref), stack + (ref,))
+            return self._cache[ref]
+
+        return {key: self.resolve(value, stack) for key, value in node.items()}
+
+    def _lookup(self, ref: str) -> Any:
+        target: Any = self.spec
+        for token in ref[2:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or token not in target:
+                return {"$ref": ref}
+            target = target[token]
+        return target
@@ -0,0 +1,130 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Any, Set, Tuple
+from urllib.parse import quote
+
+from .openapi_components import structural_hash
+from .openapi_diff import HTTP_METHODS
+
+# 태그가 없는 오퍼레이션을 모으는 조각 이름
+UNTAGGED = "default"
+
+_REF_PATTERN = re.compile(r"^#/components/([^/]+)/(.+)$")
+
+
+@dataclass
+class SpecSplit:
+    """태그별로 나눈 스펙 조각과 인덱스"""
+
+    index: Dict[str, Any]
+    fragments: Dict[str, Dict[str, Any]]
+
+
+def split_spec_by_tag(spec: Dict[str, Any], fragment_url: str = "") -> SpecSplit:
+    """OpenAPI 스펙을 태그별 독립 스펙으로 분할
+
+    각 조각은 해당 태그의 오퍼레이션과 거기서 (전이적으로) 참조하는 components만
+    담은 완전한 OpenAPI 문서다. 태그가 여러 개인 오퍼레이션은 각 조각에 모두 들어간다.
+    인덱스는 조각 목록(오퍼레이션/경로 수, 해시, URL)과 Swagger UI `urls` 설정을
+    담는다. fragment_url은 `{tag}` 자리표시자를 가진 조각 URL 템플릿이다.
+    """
+    operations: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for path, path_item in (spec.get("paths") or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        shared = {k: v for k, v in path_item.items() if k not in HTTP_METHODS}
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if not isinstance(operation, dict):
+                continue
+            for tag in operation.get("tags") or [UNTAGGED]:
+                paths = operations.setdefault(tag, {})
+                paths.setdefault(path, dict(shared))[method] = operation
+
+    declared = {
+        t["name"]: t
+        for t in spec.get("tags") or []
+        if isinstance(t, dict) and "name" in t
+    }
+    order = [name for name in declared if name in operations]
+    order += sorted(name for name in operations if name not in declared)
+
+    components = spec.get("components") or {}
+    base = {
+        key: value
+        for key, value in spec.items()
+        if key not in ("paths", "tags", "components")
+    }
+
+    fragments: Dict[str, Dict[str, Any]] = {}
+    entries: List[Dict[str, Any]] = []
+    for tag in order:
+        paths = operations[tag]
+        fragment = dict(base)
+        fragment["paths"] = paths
+        fragment["tags"] = [declared.get(tag, {"name": tag})]
+        used = referenced_components(paths, components)
+        if used:
+            fragment["components"] = used
+        fragments[tag] = fragment
+
+        url = fragment_url.replace("{tag}", quote(tag, safe=""))
+        entries.append(
+            {
+                "name": tag,
+                "description": declared.get(tag, {}).get("description"),
+                "operations": sum(
+                    1 for item in paths.values() for m in item if m in HTTP_METHODS
+                ),
+                "paths": len(paths),
+                "hash": structural_hash(fragment),
+                "url": url,
+            }
+        )
+
+    index = {
+        "openapi": spec.get("openapi"),
+        "info": spec.get("info"),
+        "servers": spec.get("servers"),
+        "tags": entries,
+        # Swagger UI의 `urls` 옵션에 그대로 넘길 수 있는 목록
+        "urls": [{"name": e["name"], "url": e["url"]} for e in entries],
+    }
+    return SpecSplit(index=index, fragments=fragments)
+
+
+def referenced_components(
+    node: Any, components: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """node에서 전이적으로 참조하는 components만 추린 사본"""
+    used: Dict[str, Dict[str, Any]] = {}
+    seen: Set[Tuple[str, str]] = set()
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, list):
+            pending.extend(current)
+            continue
+        if not isinstance(current, dict):
+            continue
+        ref = current.get("$ref")
+        match = _REF_PATTERN.match(ref) if isinstance(ref, str) else None
+        if match:
+            section, name = match.group(1), match.group(2)
+            name = name.replace("~1", "/").replace("~0", "~")
+            target = (components.get(section) or {}).get(name)
+            if (section, name) not in seen and target is not None:
+                seen.add((section, name))
+                used.setdefault(section, {})[name] = target
+                pending.append(target)
+        pending.extend(v for k, v in current.items() if k != "$ref")
+    # 원본 스펙과 같은 순서로 정렬
+    return {
+        section: {
+            name: value
+            for name, value in components[section].items()
+            if name in used[section]
+        }
+        for section in components
+        if section in used
+    }
@@ -0,0 +1,614 @@
+import ast
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Any
+
+from .field_schema_registry import default_field_registry
+
+# Django 모델 필드 -> DRF serializer 필드 (ModelSerializer.serializer_field_mapping)
+MODEL_TO_DRF_FIELD = {
+    "AutoField": "IntegerField",
+    "BigAutoField": "IntegerField",
+    "SmallAutoField": "IntegerField",
+    "BigIntegerField": "IntegerField",
+    "IntegerField": "IntegerField",
+    "PositiveIntegerField": "IntegerField",
+    "PositiveBigIntegerField": "IntegerField",
+    "PositiveSmallIntegerField": "IntegerField",
+    "SmallIntegerField": "IntegerField",
+    "BooleanField": "BooleanField",
+    "NullBooleanField": "BooleanField",
+    "CharField": "CharField",
+    "TextField": "CharField",
+    "DateField": "DateField",
+    "DateTimeField": "DateTimeField",
+    "DecimalField": "DecimalField",
+    "FloatField": "FloatField",
+    "EmailField": "EmailField",
+    "URLField": "URLField",
+    "SlugField": "SlugField",
+    "ForeignKey": "PrimaryKeyRelatedField",
+    "OneToOneField": "PrimaryKeyRelatedField",
+    "ManyToManyField": "ManyRelatedField",
+}
+
+RELATION_FIELDS = {"ForeignKey", "OneToOneField", "ManyToManyField"}
+AUTO_FIELDS = {"AutoField", "BigAutoField", "SmallAutoField"}
+READ_ONLY_FIELDS = {"SerializerMethodField", "ReadOnlyField", "HiddenField"}
+
+
+@dataclass
+class _ModuleInfo:
+    """정적으로 분석한 모듈"""
+
+    path: Path
+    source: str = ""
+    tree: Optional[ast.Module] = None
+    classes: Dict[str, ast.ClassDef] = field(default_factory=dict)
+    # 로컬 이름 -> (모듈 이름, 원래 이름 또는 None(모듈 자체))
+    imports: Dict[str, Tuple[str, Optional[str]]] = field(default_factory=dict)
+    # import 문이 가리킬 수 있는 모듈 이름 (의존성 분석용)
+    imported_modules: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _ModelField:
+    """정적으로 분석한 모델 필드"""
+
+    name: str
+    field_type: str
+    kwargs: Dict[str, Any]
+
+
+def _call_name(node: ast.expr) -> Optional[str]:
+    """serializers.CharField(...) / CharField(...) 호출에서 클래스 이름 추출"""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+# 정적으로 값을 알 수 없는 표현식 (read_only=SOME_FLAG, required=settings.X 등)
+UNKNOWN = object()
+
+
+def _literal(node: ast.expr) -> Any:
+    """리터럴이면 값을, 아니면 UNKNOWN을 반환 (dict는 값마다 따로 해석)"""
+    if isinstance(node, ast.Dict) and all(key is not None for key in node.keys):
+        keys = [_literal(key) for key in node.keys]
+        if not any(key is UNKNOWN or isinstance(key, (dict, list)) for key in keys):
+            return {key: _literal(value) for key, value in zip(keys, node.values)}
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, SyntaxError, TypeError):
+        return UNKNOWN
+
+
+def _call_kwargs(node: ast.Call) -> Dict[str, Any]:
+    return {kw.arg: _literal(kw.value) for kw in node.keywords if kw.arg}
+
+
+def _option(kwargs: Dict[str, Any], name: str, default: Any) -> Any:
+    """인자 값 (없거나 알 수 없으면 DRF 기본값)"""
+    value = kwargs.get(name, default)
+    return default if value is UNKNOWN else value
+
+
+class StaticSerializerExtractor:
+    """import 없이 ast만으로 ViewSet의 serializer 스키마를 추출하는 분석기
+
+    serializer_class, Meta.model/fields/exclude, 명시적 필드 선언, 중첩 serializer를
+    해석하며 모델은 models.py를 정적으로 읽어 해석한다.
+    """
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path).resolve()
+        app_dir = self.project_path / "app"
+        self.search_roots = (
+            [app_dir, self.project_path] if app_dir.exists() else [self.project_path]
+        )
+        self._modules: Dict[Path, Optional[_ModuleInfo]] = {}
+        self._schemas: Dict[Tuple[Path, str], Dict[str, dict]] = {}
+
+    def viewset_fields(
+        self, views_file: Path, viewset_name: str
+    ) -> Optional[Dict[str, dict]]:
+        """ViewSet의 serializer 필드 스키마 (ViewSet을 찾지 못하면 None)"""
+        module = self._load_module(Path(views_file))
+        if module is None or viewset_name not in module.classes:
+            return None
+
+        serializer = self._find_viewset_serializer(module, viewset_name, set())
+        if serializer is None:
+            return {}
+        serializer_module, serializer_name = serializer
+        return self.serializer_fields(serializer_module.path, serializer_name)
+
+    def serializer_fields(self, module_file: Path, class_name: str) -> Dict[str, dict]:
+        """serializer 클래스의 필드 스키마"""
+        module = self._load_module(Path(module_file))
+        if module is None or class_name not in module.classes:
+            return {}
+        return self._serializer_schema(module, class_name, ())
+
+    def local_dependencies(self, module_file: Path) -> List[Path]:
+        """모듈이 직접/간접적으로 import하는 프로젝트 내부 모듈 파일 (자기 자신 제외)"""
+        start = Path(module_file).resolve()
+        seen = {start}
+        queue = [start]
+        while queue:
+            module = self._load_module(queue.pop())
+            if module is None:
+                continue
+            for module_name in module.imported_modules:
+                path = self._module_file(module_name)
+                if path is None:
+                    continue
+                path = path.resolve()
+                if path not in seen:
+                    seen.add(path)
+                    queue.append(path)
+        seen.discard(start)
+        return sorted(seen)
+
+    def class_source(self, module_file: Path, class_name: str) -> Optional[str]:
+        """클래스와 그 클래스가 의존하는 모듈 내 코드의 소스
+
+        같은 파일의 다른 클래스는 빼고, 모듈 최상위 코드(import/상수/함수)와
+        같은 파일에 정의된 상위 클래스는 포함한다. 클래스가 없으면 None.
+        """
+        module = self._load_module(Path(module_file))
+        if module is None or class_name not in module.classes:
+            return None
+
+        related = set()
+        pending = [class_name]
+        while pending:
+            name = pending.pop()
+            if name in related or name not in module.classes:
+                continue
+            related.add(name)
+            pending.extend(_call_name(base) for base in module.classes[name].bases)
+
+        segments = [
+            ast.get_source_segment(module.source, node) or ""
+            for node in module.tree.body
+            if not isinstance(node, ast.ClassDef) or node.name in related
+        ]
+        return "\n".join(segments)
+
+    # ------------------------------------------------------------------
+    # 모듈 로드 및 이름 해석
+    # ------------------------------------------------------------------
+
+    def _load_module(self, path: Path) -> Optional[_ModuleInfo]:
+        path = path.resolve()
+        if path in self._modules:
+            return self._modules[path]
+
+        info = None
+        try:
+            source = path.read_text(encoding="utf-8")
+            tree = ast.parse(source)
+            info = _ModuleInfo(path, source=source, tree=tree)
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    info.classes[node.name] = node
+                elif isinstance(node, ast.ImportFrom):
+                    base = self._absolute_module(path, node.module, node.level)
+                    info.imported_modules.append(base)
+                    for alias in node.names:
+                        info.imports[alias.asname or alias.name] = (base, alias.name)
+                        # from package import submodule
+                        info.imported_modules.append(
+                            f"{base}.{alias.name}" if base else alias.name
+                        )
+                elif isinstance(node, ast.Import):
+                    for alias in node.names:
+                        info.imported_modules.append(alias.name)
+                        if alias.asname:
+                            info.imports[alias.asname] = (alias.name, None)
+                        else:
+                            top = alias.name.split(".")[0]
+                            info.imports[top] = (top, None)
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+            info = None
+
+        self._modules[path] = info
+        return info
+
+    def _absolute_module(self, path: Path, module: Optional[str], level: int) -> str:
+        """상대 import를 검색 루트 기준의 절대 모듈 이름으로 변환"""
+        if level == 0:
+            return module or ""
+
+        package_dir = path.parent
+        for _ in range(level - 1):
+            package_dir = package_dir.parent
+
+        for root in self.search_roots:
+            try:
+                parts = list(package_dir.relative_to(root).parts)
+                break
+            except ValueError:
+                continue
+        else:
+            parts = []
+
+        if module:
+            parts.extend(module.split("."))
+        return ".".join(parts)
+
+    def _module_file(self, module_name: str) -> Optional[Path]:
+        parts = module_name.split(".") if module_name else []
+        if not parts:
+            return None
+        for root in self.search_roots:
+            candidate = root.joinpath(*parts)
+            for path in (candidate.with_suffix(".py"), candidate / "__init__.py"):
+                if path.exists():
+                    return path
+        return None
+
+    def _resolve_class(
+        self, module: _ModuleInfo, node: ast.expr, depth: int = 0
+    ) -> Optional[Tuple[_ModuleInfo, str]]:
+        """클래스 참조 표현식을 (정의 모듈, 클래스 이름)으로 해석"""
+        if depth > 5:
+            return None
+
+        if isinstance(node, ast.Name):
+            if node.id in module.classes:
+                return module, node.id
+            if node.id not in module.imports:
+                return None
+            module_name, original = module.imports[node.id]
+            if original is None:
+                return None
+            target = self._load_from_name(module_name)
+            if target is None:
+                # from package import submodule 형태는 이름 자체가 모듈
+                return None
+            return self._resolve_class(target, ast.Name(id=original), depth + 1)
+
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            alias = module.imports.get(node.value.id)
+            if alias is None:
+                return None
+            module_name, original = alias
+            if original is not None:
+                module_name = f"{module_name}.{original}" if module_name else original
+            target = self._load_from_name(module_name)
+            if target is None:
+                return None
+            return self._resolve_class(target, ast.Name(id=node.attr), depth + 1)
+
+        return None
+
+    def _load_from_name(self, module_name: str) -> Optional[_ModuleInfo]:
+        path = self._module_file(module_name)
+        return self._load_module(path) if path else None
+
+    # ------------------------------------------------------------------
+    # ViewSet -> serializer
+    # ------------------------------------------------------------------
+
+    def _find_viewset_serializer(
+        self, module: _ModuleInfo, class_name: str, visited: set
+    ) -> Optional[Tuple[_ModuleInfo, str]]:
+        key = (module.path, class_name)
+        if key in visited:
+            return None
+        visited.add(key)
+        class_node = module.classes[class_name]
+
+        # 1. serializer_class 속성
+        for statement in class_node.body:
+            if isinstance(statement, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == "serializer_class"
+                for t in statement.targets
+            ):
+                resolved = self._resolve_class(module, statement.value)
+                if resolved:
+                    return resolved
+
+        # 2. get_serializer_class / 메서드 본문에서 사용하는 *Serializer
+        for statement in class_node.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                for node in ast.walk(statement):
+                    if isinstance(node, ast.Name) and node.id.endswith("Serializer"):
+                        resolved = self._resolve_class(module, node)
+                        if resolved:
+                            return resolved
+
+        # 3. 프로젝트 내 베이스 클래스에서 상속
+        for base in class_node.bases:
+            resolved = self._resolve_class(module, base)
+            if resolved:
+                found = self._find_viewset_serializer(*resolved, visited)
+                if found:
+                    return found
+
+        return None
+
+    # ------------------------------------------------------------------
+    # serializer -> 스키마
+    # ------------------------------------------------------------------
+
+    def _serializer_schema(
+        self, module: _ModuleInfo, class_name: str, stack: tuple
+    ) -> Dict[str, dict]:
+        key = (module.path, class_name)
+        if key in self._schemas:
+            return self._schemas[key]
+        if key in stack:
+            # 순환 중첩 serializer
+            return {}
+        stack = stack + (key,)
+
+        declared, meta = self._declared_fields(module, class_name, stack)
+
+        if meta is None:
+            schema = declared
+        else:
+            schema = self._model_serializer_schema(module, meta, declared, stack)
+
+        self._schemas[key] = schema
+        return schema
+
+    def _meta(self, class_node: ast.ClassDef) -> Optional[ast.ClassDef]:
+        for statement in class_node.body:
+            if isinstance(statement, ast.ClassDef) and statement.name == "Meta":
+                return statement
+        return None
+
+    def _declared_fields(
+        self, module: _ModuleInfo, class_name: str, stack: tuple, depth: int = 0
+    ) -> Tuple[Dict[str, dict], Optional[ast.ClassDef]]:
+        """선언 필드와 Meta (프로젝트 내 베이스 serializer에서 상속 포함)"""
+        class_node = module.classes[class_name]
+        fields: Dict[str, dict] = {}
+        meta: Optional[ast.ClassDef] = None
+
+        if depth < 5:
+            for base in reversed(class_node.bases):
+                resolved = self._resolve_class(module, base)
+                if resolved:
+                    base_fields, base_meta = self._declared_fields(
+                        *resolved, stack, depth + 1
+                    )
+                    fields.update(base_fields)
+                    meta = base_meta or meta
+
+        for statement in class_node.body:
+            if (
+                isinstance(statement, ast.Assign)
+                and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+                and isinstance(statement.value, ast.Call)
+            ):
+                schema = self._declared_field_schema(module, statement.value, stack)
+                if schema is not None:
+                    fields[statement.targets[0].id] = schema
+
+        return fields, self._meta(class_node) or meta
+
+    def _declared_field_schema(
+        self, module: _ModuleInfo, call: ast.Call, stack: tuple
+    ) -> Optional[dict]:
+        field_name = _call_name(call)
+        if field_name is None:
+            return None
+        kwargs = _call_kwargs(call)
+
+        nested = None
+        if field_name.endswith("Serializer"):
+            resolved = self._resolve_class(module, call.func)
+            if resolved:
+                nested = self._serializer_schema(*resolved, stack)
+        elif not field_name.endswith("Field"):
+            return None
+
+        if nested is not None:
+            schema = {"type": "object", "properties": nested}
+            if kwargs.get("many") is True:
+                schema = {"type": "array", "items": schema}
+        elif field_name == "ListField":
+            child = next((kw.value for kw in call.keywords if kw.arg == "child"), None)
+            items = (
+                self._declared_field_schema(module, child, stack)
+                if isinstance(child, ast.Call)
+                else None
+            )
+            schema = {"type": "array", "items": items or {"type": "string"}}
+            # 자식 필드의 플래그는 items에 포함하지 않음
+            for flag in ("required", "readOnly", "nullable"):
+                schema["items"].pop(flag, None)
+        else:
+            schema = default_field_registry.schema_for_names(
+                self._field_class_names(module, call.func)
+            )
+
+        read_only = kwargs.get("read_only") is True or field_name in READ_ONLY_FIELDS
+        required = _option(
+            kwargs, "required", not read_only and "default" not in kwargs
+        )
+        return self._apply_flags(
+            schema,
+            required=required is True,
+            nullable=kwargs.get("allow_null") is True,
+            read_only=read_only,
+            help_text=kwargs.get("help_text"),
+        )
+
+    def _model_serializer_schema(
+        self,
+        module: _ModuleInfo,
+        meta: ast.ClassDef,
+        declared: Dict[str, dict],
+        stack: tuple,
+    ) -> Dict[str, dict]:
+        options = {}
+        model_ref = None
+        for statement in meta.body:
+            if isinstance(statement, ast.Assign) and isinstance(
+                statement.targets[0], ast.Name
+            ):
+                name = statement.targets[0].id
+                if name == "model":
+                    model_ref = statement.value
+                else:
+                    options[name] = _literal(statement.value)
+
+        model_fields = self._model_fields(module, model_ref) if model_ref else []
+        model_by_name = {f.name: f for f in model_fields}
+        pk_name = next(
+            (f.name for f in model_fields if f.kwargs.get("primary_key") is True),
+            "id",
+        )
+
+        fields_option = options.get("fields")
+        if isinstance(fields_option, (list, tuple)):
+            names = list(fields_option)
+        else:
+            # "__all__" 또는 exclude만 지정된 경우 (DRF get_default_field_names 순서)
+            names = [pk_name] + list(declared) + [f.name for f in model_fields]
+            exclude = options.get("exclude")
+            if isinstance(exclude, (list, tuple)):
+                names = [n for n in names if n not in exclude]
+
+        read_only_fields = options.get("read_only_fields")
+        read_only_fields = (
+            set(read_only_fields)
+            if isinstance(read_only_fields, (list, tuple))
+            else set()
+        )
+        extra_kwargs = options.get("extra_kwargs")
+        extra_kwargs = extra_kwargs if isinstance(extra_kwargs, dict) else {}
+
+        result = {}
+        for name in names:
+            if name in result:
+                continue
+            if name in declared:
+                result[name] = declared[name]
+                continue
+            if name == pk_name and name not in model_by_name:
+                result[name] = self._apply_flags({"type": "integer"}, read_only=True)
+                continue
+            model_field = model_by_name.get(name)
+            if model_field is None:
+                # 프로퍼티 등 정적으로 해석할 수 없는 필드
+                result[name] = self._apply_flags({"type": "string"}, read_only=True)
+                continue
+            overrides = dict(extra_kwargs.get(name) or {})
+            if name in read_only_fields:
+                overrides["read_only"] = True
+            result[name] = self._model_field_schema(model_field, overrides)
+
+        return result
+
+    def _field_class_names(self, module: _ModuleInfo, node: ast.expr) -> List[str]:
+        """필드 클래스 이름과 프로젝트에 정의된 상위 클래스 이름 (MRO와 같은 순서)"""
+        names = [_call_name(node)]
+        resolved = self._resolve_class(module, node)
+        depth = 0
+        while resolved and depth < 5:
+            class_module, class_name = resolved
+            bases = class_module.classes[class_name].bases
+            if not bases:
+                break
+            names.append(_call_name(bases[0]))
+            resolved = self._resolve_class(class_module, bases[0])
+            depth += 1
+        return [name for name in names if name]
+
+    def _model_field_schema(self, model_field: _ModelField, overrides: dict) -> dict:
+        kwargs = model_field.kwargs
+        drf_field = MODEL_TO_DRF_FIELD.get(model_field.field_type, "CharField")
+        schema = default_field_registry.schema_for_names([drf_field])
+
+        read_only = (
+            model_field.field_type in AUTO_FIELDS
+            or kwargs.get("editable") is False
+            or kwargs.get("auto_now") is True
+            or kwargs.get("auto_now_add") is True
+        )
+        read_only = _option(overrides, "read_only", read_only) is True
+        optional = (
+            "default" in kwargs
+            or kwargs.get("blank") is True
+            or kwargs.get("null") is True
+            or model_field.field_type == "ManyToManyField"
+        )
+        required = _option(overrides, "required", not (read_only or optional)) is True
+
+        return self._apply_flags(
+            schema,
+            required=required,
+            nullable=kwargs.get("null") is True
+            and model_field.field_type != "ManyToManyField",
+            read_only=read_only,
+            help_text=kwargs.get("help_text"),
+        )
+
+    def _apply_flags(
+        self,
+        schema: dict,
+        required: bool = False,
+        nullable: bool = False,
+        read_only: bool = False,
+        help_text: Any = None,
+    ) -> dict:
+        if required:
+            schema["required"] = True
+        if nullable:
+            schema["nullable"] = True
+        if read_only:
+            schema["readOnly"] = True
+        if isinstance(help_text, str) and help_text:
+            schema["description"] = help_text
+        return schema
+
+    # ------------------------------------------------------------------
+    # 모델
+    # ------------------------------------------------------------------
+
+    def _model_fields(
+        self, module: _ModuleInfo, model_ref: ast.expr, depth: int = 0
+    ) -> List[_ModelField]:
+        resolved = self._resolve_class(module, model_ref)
+        if resolved is None or depth > 5:
+            return []
+        model_module, model_name = resolved
+        class_node = model_module.classes[model_name]
+
+        fields: Dict[str, _ModelField] = {}
+        # 추상 베이스 모델 필드 상속
+        for base in class_node.bases:
+            for base_field in self._model_fields(model_module, base, depth + 1):
+                fields[base_field.name] = base_field
+
+        for statement in class_node.body:
+            if (
+                isinstance(statement, ast.Assign)
+                and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+                and isinstance(statement.value, ast.Call)
+            ):
+                field_type = _call_name(statement.value)
+                if field_type and (
+                    field_type.endswith("Field") or field_type in RELATION_FIELDS
+                ):
+                    name = statement.targets[0].id
+                    fields[name] = _ModelField(
+                        name, field_type, _call_kwargs(statement.value)
+                    )
+
+        # DRF는 일반 필드 뒤에 관계 필드를 둔다
+        ordered = [f for f in fields.values() if f.field_type not in RELATION_FIELDS]
+        ordered += [f for f in fields.values() if f.field_type in RELATION_FIELDS]
+        return ordered
@@ -0,0 +1,459 @@
+import ast
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Set
+
+# DRF가 제공하는 ViewSet 루트 클래스
+DRF_VIEWSET_BASES = {
+    "ViewSetMixin",
+    "ViewSet",
+    "GenericViewSet",
+    "ModelViewSet",
+    "ReadOnlyModelViewSet",
+}
+
+# 스캔 대상에서 제외할 디렉토리
+EXCLUDED_DIRS = {
+    ".git",
+    "__pycache__",
+    "node_modules",
+    "venv",
+    ".venv",
+    "env",
+    "migrations",
+    "site-packages",
+}
+
+
+# ViewSet을 정의하는 모듈로 보는 파일/패키지 이름 (views.py, views/ 패키지 등)
+VIEW_MODULE_NAMES = {"views", "viewsets", "api"}
+
+# 클래스 본문에 하나라도 있으면 엔드포인트를 직접 제공하는 구체 ViewSet으로 봄
+CONCRETE_VIEWSET_ATTRIBUTES = {
+    "queryset",
+    "serializer_class",
+    "get_queryset",
+    "get_serializer_class",
+}
+
+# 같은 이름을 다시 내보내는 모듈을 따라갈 최대 깊이
+MAX_REEXPORT_DEPTH = 5
+
+# 로컬 이름 -> (모듈 이름, 원래 이름 또는 None(모듈 자체), 상대 import 수준)
+ImportTable = Dict[str, Tuple[Optional[str], Optional[str], int]]
+
+
+@dataclass(frozen=True)
+class ClassDefinition:
+    """모듈 최상위 클래스 정의 (베이스는 `viewsets.ModelViewSet` 같은 점 표기)"""
+
+    name: str
+    bases: Tuple[str, ...]
+    lineno: int
+    abstract: bool = False
+    concrete: bool = False
+
+
+@dataclass
+class _FileEntry:
+    """파일별 캐시 항목"""
+
+    stat_key: Tuple[int, int]
+    content_hash: str
+    classes: List[ClassDefinition] = field(default_factory=list)
+    imports: ImportTable = field(default_factory=dict)
+
+
+def _base_name(node: ast.expr) -> Optional[str]:
+    """베이스 클래스 표현식의 점 표기 이름 (Generic[T] 형태는 T를 뺀 이름)"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _base_name(node.value)
+        return f"{value}.{node.attr}" if value else None
+    if isinstance(node, ast.Subscript):
+        return _base_name(node.value)
+    return None
+
+
+def _is_abstract(node: ast.ClassDef) -> bool:
+    """`class Meta: abstract = True`로 추상 클래스임을 표시했는지"""
+    for statement in node.body:
+        if not (isinstance(statement, ast.ClassDef) and statement.name == "Meta"):
+            continue
+        for item in statement.body:
+            if (
+                isinstance(item, ast.Assign)
+                and any(
+                    isinstance(t, ast.Name) and t.id == "abstract" for t in item.targets
+                )
+                and isinstance(item.value, ast.Constant)
+                and item.value.value is True
+            ):
+                return True
+    return False
+
+
+def _is_concrete(node: ast.ClassDef) -> bool:
+    """queryset/serializer_class나 get_queryset 등을 직접 정의하는지"""
+    for statement in node.body:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            names = [statement.name]
+        elif isinstance(statement, ast.Assign):
+            names = [t.id for t in statement.targets if isinstance(t, ast.Name)]
+        elif isinstance(statement, ast.AnnAssign) and isinstance(
+            statement.target, ast.Name
+        ):
+            names = [statement.target.id]
+        else:
+            continue
+        if CONCRETE_VIEWSET_ATTRIBUTES.intersection(names):
+            return True
+    return False
+
+
+def parse_class_definitions(
+    source: str,
+) -> Tuple[List[ClassDefinition], ImportTable]:
+    """소스에서 최상위 클래스 정의와 import 표를 추출"""
+    tree = ast.parse(source)
+    classes = []
+    imports: ImportTable = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            bases = tuple(name for name in (_base_name(b) for b in node.bases) if name)
+            classes.append(
+                ClassDefinition(
+                    node.name,
+                    bases,
+                    node.lineno,
+                    _is_abstract(node),
+                    _is_concrete(node),
+                )
+            )
+        elif isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name != "*":
+                    imports[alias.asname or alias.name] = (
+                        node.module,
+                        alias.name,
+                        node.level,
+                    )
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    imports[alias.asname] = (alias.name, None, 0)
+                else:
+                    top = alias.name.split(".")[0]
+                    imports[top] = (top, None, 0)
+
+    return classes, imports
+
+
+def _is_views_module(relative: Path) -> bool:
+    """views.py, viewsets.py, views/ 패키지 아래 파일 등 ViewSet을 두는 모듈인지"""
+    stem = relative.stem
+    if stem in VIEW_MODULE_NAMES or any(
+        stem.endswith(f"_{name}") or stem.startswith(f"{name}_")
+        for name in VIEW_MODULE_NAMES
+    ):
+        return True
+    return any(part in VIEW_MODULE_NAMES for part in relative.parts[:-1])
+
+
+# 해석한 클래스 (파일 경로, 클래스 이름), DRF 베이스는 _DRF_BASE
+ClassKey = Tuple[str, str]
+_DRF_BASE: ClassKey = ("rest_framework", "ViewSet")
+
+
+def _to_plural(singular):
+    """단수형을 복수형으로 변환"""
+    if singular.endswith("y"):
+        return singular[:-1] + "ies"
+    elif (
+        singular.endswith("s")
+        or singular.endswith("sh")
+        or singular.endswith("ch")
+        or singular.endswith("x")
+        or singular.endswith("z")
+    ):
+        return singular + "es"
+    else:
+        return singular + "s"
+
+
+class ViewSetIndex:
+    """AST 기반 ViewSet 발견 인덱스
+
+    파일별로 (mtime, size)와 내용 해시를 캐시하여 변경된 파일만 다시 파싱한다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+        self._entries: Dict[str, _FileEntry] = {}
+        self._lock = threading.Lock()
+        self.last_scan_stats: Dict[str, int] = {}
+
+    def discover(self, project_path: Path) -> List[Dict[str, str]]:
+        """프로젝트에서 구체 ViewSet 클래스 발견
+
+        베이스 클래스는 각 모듈의 import를 따라 정의 위치로 해석한다.
+        `Meta.abstract`인 클래스, 이름이 Mixin으로 끝나는 클래스, views 모듈 밖의
+        클래스는 보고하지 않는다. 다른 클래스의 베이스로 쓰이는 클래스는
+        queryset/serializer_class 등을 직접 정의하지 않으면 공통 베이스로 본다.
+        """
+        files = self._collect_python_files(project_path)
+        entries = self._load_entries(files)
+
+        source_root = project_path / "app"
+        if not source_root.exists():
+            source_root = project_path
+        search_roots = [source_root, project_path]
+        resolver = _BaseResolver(entries, search_roots)
+        viewsets, used_as_base = resolver.resolve()
+
+        discovered = []
+        for file_path in files:
+            entry = entries.get(str(file_path))
+            if entry is None:
+                continue
+            relative = _relative(file_path, search_roots)
+            for class_def in entry.classes:
+                key = (str(file_path), class_def.name)
+                if (
+                    key not in viewsets
+                    or (key in used_as_base and not class_def.concrete)
+                    or class_def.abstract
+                    or class_def.name.endswith("Mixin")
+                    or not _is_views_module(relative)
+                ):
+                    continue
+                discovered.append(self._describe(class_def, file_path, source_root))
+
+        return discovered
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        with self._lock:
+            self._entries.clear()
+
+    def _collect_python_files(self, project_path: Path) -> List[Path]:
+        """제외 디렉토리를 건너뛰며 .py 파일 수집"""
+        files = []
+        for root, dirs, filenames in os.walk(project_path):
+            dirs[:] = sorted(
+                d for d in dirs if d not in EXCLUDED_DIRS and not d.startswith(".")
+            )
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    files.append(Path(root) / filename)
+        return files
+
+    def _load_entries(self, files: List[Path]) -> Dict[str, _FileEntry]:
+        """캐시를 확인하고 변경된 파일만 병렬로 파싱"""
+        entries = {}
+        stale = []
+
+        with self._lock:
+            for file_path in files:
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+                cached = self._entries.get(str(file_path))
+                if cached is not None and cached.stat_key == stat_key:
+                    entries[str(file_path)] = cached
+                else:
+                    stale.append((file_path, stat_key, cached))
+
+        parsed = 0
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(lambda item: self._scan_file(*item), stale))
+            with self._lock:
+                for (file_path, _, cached), entry in zip(stale, results):
+                    if entry is None:
+                        self._entries.pop(str(file_path), None)
+                        continue
+                    if entry is not cached:
+                        parsed += 1
+                    self._entries[str(file_path)] = entry
+                    entries[str(file_path)] = entry
+
+        self.last_scan_stats = {
+            "files": len(files),
+            "cache_hits": len(files) - len(stale),
+            "reparsed": parsed,
+        }
+        return entries
+
+    def _scan_file(
+        self, file_path: Path, stat_key: Tuple[int, int], cached: Optional[_FileEntry]
+    ) -> Optional[_FileEntry]:
+        """파일 하나를 읽어 해시가 바뀐 경우에만 파싱"""
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return None
+
+        content_hash = hashlib.sha1(data).hexdigest()
+        if cached is not None and cached.content_hash == content_hash:
+            # touch 등으로 mtime만 바뀐 경우
+            cached.stat_key = stat_key
+            return cached
+
+        try:
+            classes, imports = parse_class_definitions(data.decode("utf-8"))
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            classes, imports = [], {}
+
+        return _FileEntry(stat_key, content_hash, classes, imports)
+
+    def _describe(
+        self, class_def: ClassDefinition, file_path: Path, source_root: Path
+    ) -> Dict[str, str]:
+        """발견된 ViewSet 정보를 기존 discover_viewsets 형식으로 변환"""
+        try:
+            relative = file_path.relative_to(source_root)
+        except ValueError:
+            relative = Path(file_path.name)
+
+        parts = relative.with_suffix("").parts
+        app_name = parts[0] if len(parts) > 1 else file_path.parent.name
+        app_label = app_name if relative.name == "views.py" else "/".join(parts)
+
+        viewset_name = class_def.name
+        model_name = (
+            viewset_name[:-7] if viewset_name.endswith("ViewSet") else viewset_name
+        )
+        url_path = f"/api/v1/{_to_plural(model_name.lower())}/"
+
+        return {
+            "app": app_label,
+            "app_name": app_name,
+            "viewset": viewset_name,
+            "url": url_path,
+            "file_path": str(file_path),
+        }
+
+
+def _relative(file_path: Path, search_roots: List[Path]) -> Path:
+    for root in search_roots:
+        try:
+            return file_path.relative_to(root)
+        except ValueError:
+            continue
+    return Path(file_path.name)
+
+
+def _module_names(relative: Path) -> List[str]:
+    parts = list(relative.with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return [".".join(parts)] if parts else []
+
+
+class _BaseResolver:
+    """모듈별 import 표로 베이스 클래스를 정의 위치까지 해석"""
+
+    def __init__(self, entries: Dict[str, _FileEntry], search_roots: List[Path]):
+        self.entries = entries
+        self.search_roots = search_roots
+        # 모듈 이름(검색 루트마다) -> 파일 경로
+        self.modules: Dict[str, str] = {}
+        for path in entries:
+            for root in search_roots:
+                try:
+                    relative = Path(path).relative_to(root)
+                except ValueError:
+                    continue
+                for name in _module_names(relative):
+                    self.modules.setdefault(name, path)
+        self.classes = {
+            path: {class_def.name: class_def for class_def in entry.classes}
+            for path, entry in entries.items()
+        }
+
+    def resolve(self) -> Tuple[Set[ClassKey], Set[ClassKey]]:
+        """(ViewSet 클래스, 다른 클래스의 베이스로 쓰인 클래스)"""
+        bases: Dict[ClassKey, Set[ClassKey]] = {}
+        used_as_base: Set[ClassKey] = set()
+        for path, classes in self.classes.items():
+            for class_def in classes.values():
+                resolved = {
+                    target
+                    for target in (
+                        self._resolve(path, base) for base in class_def.bases
+                    )
+                    if target is not None
+                }
+                bases[(path, class_def.name)] = resolved
+                used_as_base.update(resolved)
+
+        viewsets: Set[ClassKey] = set()
+        changed = True
+        while changed:
+            changed = False
+            for key, targets in bases.items():
+                if key in viewsets:
+                    continue
+                if _DRF_BASE in targets or targets & viewsets:
+                    viewsets.add(key)
+                    changed = True
+        return viewsets, used_as_base
+
+    def _resolve(self, path: str, base: str, depth: int = 0) -> Optional[ClassKey]:
+        head, *rest = base.split(".")
+        if not rest and head in self.classes.get(path, {}):
+            return path, head
+
+        imported = self.entries[path].imports.get(head)
+        if imported is None:
+            # `from rest_framework.viewsets import *` 등 출처를 알 수 없는 DRF 이름
+            return _DRF_BASE if base in DRF_VIEWSET_BASES else None
+
+        module, original, level = imported
+        module = self._absolute(path, module, level)
+        if original is not None:
+            if not rest:
+                return self._lookup(module, original, depth)
+            module = f"{module}.{original}" if module else original
+        if not rest:
+            return None
+        *submodules, name = rest
+        return self._lookup(".".join([module, *submodules]), name, depth)
+
+    def _lookup(self, module: str, name: str, depth: int) -> Optional[ClassKey]:
+        path = self.modules.get(module)
+        if path is None:
+            # 프로젝트 밖 모듈 (rest_framework 등)
+            return _DRF_BASE if name in DRF_VIEWSET_BASES else None
+        if name in self.classes[path]:
+            return path, name
+        if depth < MAX_REEXPORT_DEPTH and name in self.entries[path].imports:
+            # 패키지 __init__ 등에서 다시 내보낸 이름
+            return self._resolve(path, name, depth + 1)
+        return None
+
+    def _absolute(self, path: str, module: Optional[str], level: int) -> str:
+        """상대 import를 검색 루트 기준 모듈 이름으로 변환"""
+        if level == 0:
+            return module or ""
+        package = _relative(Path(path), self.search_roots).parent
+        parts = list(package.parts)
+        for _ in range(level - 1):
+            if parts:
+                parts.pop()
+        if module:
+            parts.extend(module.split("."))
+        return ".".join(parts)
+
+
+# 프로세스 전역 인덱스 (문서 재생성 시 캐시 재사용)
+default_viewset_index = ViewSetIndex()
@@ -0,0 +1 @@
+# Introspection Package
@@ -0,0 +1,179 @@
+"""프로젝트별 Django 인트로스펙션 워커
+
+사용법: python -m src.infrastructure.introspection.django_worker <project_path>
+
+stdin으로 한 줄에 하나씩 JSON 요청을 받고 stdout으로 JSON 응답을 돌려준다.
+    요청: {"id": 1, "op": "viewset_fields", "params": {...}}
+    응답: {"id": 1, "ok": true, "result": {...}} 또는 {"id": 1, "ok": false, "error": "..."}
+워커가 준비되면 id 0 응답을 먼저 보낸다. 사용자 코드의 print 출력은 stderr로 보낸다.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+
+class DjangoIntrospectionWorker:
+    """Django를 한 번만 부팅하고 요청을 처리하는 워커"""
+
+    def __init__(self, project_path: Path):
+        from ..generators.api_documentation_generator import (
+            setup_django_environment,
+            ViewModuleCache,
+        )
+        from ..generators.field_schema_registry import SerializerSchemaCache
+
+        self.project_path = project_path.resolve()
+        self.django_ready = setup_django_environment(self.project_path)
+        self.module_cache = ViewModuleCache()
+        self.schema_cache = SerializerSchemaCache()
+        self._module_mtimes = {}
+        self._remember_project_modules()
+
+    def handle(self, op: str, params: dict):
+        """요청 처리 (요청 중 새로 import된 프로젝트 모듈의 mtime을 기록)"""
+        try:
+            return self._handle(op, params)
+        finally:
+            self._remember_project_modules()
+
+    def _handle(self, op: str, params: dict):
+        if op == "ping":
+            return {"pid": os.getpid(), "django_ready": self.django_ready}
+        if op == "begin_generation":
+            return {"purged": self._begin_generation()}
+        if op == "viewset_fields":
+            return self._viewset_fields(params["file_path"], params["viewset_name"])
+        if op == "serializer_fields":
+            return self._serializer_fields(params["module"], params["class_name"])
+        raise ValueError(f"지원하지 않는 요청: {op}")
+
+    def _viewset_fields(self, file_path: str, viewset_name: str) -> dict:
+        from ..generators.api_documentation_generator import (
+            import_viewset_class,
+            extract_serializer_from_viewset,
+        )
+
+        viewset_class = import_viewset_class(file_path, viewset_name, self.module_cache)
+        if not viewset_class:
+            return {"found": False, "fields": {}}
+
+        fields = extract_serializer_from_viewset(
+            viewset_class, viewset_name, self.schema_cache
+        )
+        return {"found": True, "fields": fields}
+
+    def _serializer_fields(self, module_name: str, class_name: str) -> dict:
+        import importlib
+
+        from ..generators.api_documentation_generator import extract_serializer_fields
+
+        module = importlib.import_module(module_name)
+        serializer_class = getattr(module, class_name)
+        return {
+            "fields": extract_serializer_fields(serializer_class, self.schema_cache)
+        }
+
+    def _begin_generation(self) -> int:
+        """새 생성 작업 시작: views 캐시를 비우고 파일이 바뀐 프로젝트 모듈만 제거"""
+        from ..generators.api_documentation_generator import ViewModuleCache
+        from ..generators.field_schema_registry import SerializerSchemaCache
+
+        self.module_cache = ViewModuleCache()
+        self.schema_cache = SerializerSchemaCache()
+        purged = 0
+
+        for name, module in list(sys.modules.items()):
+            module_file = self._project_file(module)
+            if module_file is None or module_file.name == "models.py":
+                # 모델은 Django 앱 레지스트리 때문에 다시 로드할 수 없다 (워커 재시작 대상)
+                continue
+            if name not in self._module_mtimes:
+                # import 시점의 mtime을 모르면 지금 값을 기준으로 삼는다
+                continue
+            try:
+                mtime = module_file.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if self._module_mtimes[name] != mtime:
+                del sys.modules[name]
+                del self._module_mtimes[name]
+                purged += 1
+
+        return purged
+
+    def _remember_project_modules(self):
+        """처음 본 프로젝트 모듈의 mtime 기록 (사라진 모듈의 기록은 제거)"""
+        for name in [name for name in self._module_mtimes if name not in sys.modules]:
+            del self._module_mtimes[name]
+        for name, module in list(sys.modules.items()):
+            module_file = self._project_file(module)
+            if module_file is not None and name not in self._module_mtimes:
+                try:
+                    self._module_mtimes[name] = module_file.stat().st_mtime_ns
+                except OSError:
+                    pass
+
+    def _project_file(self, module):
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            return None
+        path = Path(module_file)
+        try:
+            path.resolve().relative_to(self.project_path)
+        except ValueError:
+            return None
+        return path
+
+
+def main(argv=None) -> int:
+    argv = argv if argv is not None else sys.argv[1:]
+    if not argv:
+        print("usage: django_worker <project_path>", file=sys.stderr)
+        return 2
+
+    # 프로토콜 전용 stdout 확보 후, 나머지 출력은 모두 stderr로 보냄
+    protocol_out = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    def respond(message: dict):
+        protocol_out.write(json.dumps(message, ensure_ascii=False, default=str) + "\n")
+        protocol_out.flush()
+
+    try:
+        worker = DjangoIntrospectionWorker(Path(argv[0]))
+    except Exception as e:
+        respond({"id": 0, "ok": False, "error": f"워커 초기화 실패: {e}"})
+        return 1
+
+    respond({"id": 0, "ok": True, "result": worker.handle("ping", {})})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            respond({"id": None, "ok": False, "error": f"잘못된 요청: {e}"})
+            continue
+
+        request_id = request.get("id")
+        op = request.get("op")
+        if op == "shutdown":
+            respond({"id": request_id, "ok": True, "result": {}})
+            break
+
+        try:
+            result = worker.handle(op, request.get("params") or {})
+            respond({"id": request_id, "ok": True, "result": result})
+        except Exception as e:
+            respond({"id": request_id, "ok": False, "error": str(e)})
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+from ..observability.logs import get_logger
+
+logger = get_logger(__name__)
+
+# python-parser 루트 (워커를 `python -m src...`로 실행하기 위해 필요)
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+
+WORKER_MODULE = "src.infrastructure.introspection.django_worker"
+
+# 변경 시 워커를 재시작해야 하는 파일 (settings, 의존성, 모델)
+FINGERPRINT_PATTERNS = [
+    "app/settings.py",
+    "app/settings/*.py",
+    "*/settings.py",
+    "requirements*.txt",
+    "requirements/*.txt",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "Pipfile.lock",
+    "poetry.lock",
+    "app/*/models.py",
+    "app/*/models/*.py",
+]
+
+
+class WorkerError(RuntimeError):
+    """워커 실행/응답 오류"""
+
+
+class WorkerTimeoutError(WorkerError, TimeoutError):
+    """워커 요청 시간 초과"""
+
+
+def project_fingerprint(project_path: Path) -> str:
+    """settings/requirements/models 파일의 (경로, mtime, 크기)로 지문 생성"""
+    digest = hashlib.sha1()
+    seen = set()
+    for pattern in FINGERPRINT_PATTERNS:
+        for path in sorted(project_path.glob(pattern)):
+            if path in seen or not path.is_file():
+                continue
+            seen.add(path)
+            stat = path.stat()
+            digest.update(
+                f"{path.relative_to(project_path)}:{stat.st_mtime_ns}:{stat.st_size};".encode()
+            )
+    return digest.hexdigest()
+
+
+class DjangoWorker:
+    """프로젝트 하나를 담당하는 장기 실행 서브프로세스"""
+
+    def __init__(
+        self,
+        project_path: Path,
+        fingerprint: str,
+        python_executable: str,
+        boot_timeout: float,
+    ):
+        self.project_path = project_path
+        self.fingerprint = fingerprint
+        self.python_executable = python_executable
+        self.boot_timeout = boot_timeout
+        self.started_at: Optional[float] = None
+        self.last_used = time.monotonic()
+        self.requests_served = 0
+        self.django_ready = False
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def start(self) -> None:
+        """워커 실행 후 준비 메시지 대기"""
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in [str(PACKAGE_ROOT), env.get("PYTHONPATH")] if p
+        )
+        env["PYTHONUNBUFFERED"] = "1"
+        env.pop("DJANGO_SETTINGS_MODULE", None)
+
+        self._process = subprocess.Popen(
+            [self.python_executable, "-m", WORKER_MODULE, str(self.project_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None,
+            cwd=str(self.project_path),
+            env=env,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        threading.Thread(
+            target=self._read_responses,
+            name=f"django-worker-{self.project_path.name}",
+            daemon=True,
+        ).start()
+        self.started_at = time.time()
+
+        ready = self._wait_for(0, self.boot_timeout)
+        self.django_ready = bool(ready.get("django_ready"))
+
+    def request(
+        self, op: str, params: Optional[Dict[str, Any]], timeout: float
+    ) -> Dict[str, Any]:
+        """요청 1건 처리 (워커당 직렬 처리)"""
+        with self._lock:
+            if not self.is_alive():
+                raise WorkerError(f"워커가 종료되었습니다: {self.project_path}")
+
+            self._next_id += 1
+            request_id = self._next_id
+            message = {"id": request_id, "op": op, "params": params or {}}
+            try:
+                self._process.stdin.write(
+                    json.dumps(message, ensure_ascii=False) + "\n"
+                )
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                raise WorkerError(f"워커 요청 전송 실패: {e}")
+
+            try:
+                result = self._wait_for(request_id, timeout)
+            finally:
+                self.last_used = time.monotonic()
+            self.requests_served += 1
+            return result
+
+    @property
+    def busy(self) -> bool:
+        """요청 처리 중인지"""
+        return self._lock.locked()
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def stop(self, grace_period: float = 2.0) -> None:
+        """워커 종료 (응답이 없으면 강제 종료)"""
+        if self._process is None:
+            return
+        if self.is_alive():
+            try:
+                self._process.stdin.write(
+                    json.dumps({"id": -1, "op": "shutdown"}) + "\n"
+                )
+                self._process.stdin.flush()
+                self._process.wait(timeout=grace_period)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+
+    def _read_responses(self) -> None:
+        for line in self._process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    def _wait_for(self, request_id: int, timeout: float) -> Dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WorkerTimeoutError(
+                    f"워커 응답 시간 초과 ({timeout:.1f}s): {self.project_path}"
+                )
+            try:
+                line = self._responses.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                raise WorkerError(
+                    f"워커가 예기치 않게 종료되었습니다: {self.project_path}"
+                )
+
+            response = json.loads(line)
+            if response.get("id") != request_id:
+                # 이전에 시간 초과된 요청의 늦은 응답
+                continue
+            if not response.get("ok"):
+                raise WorkerError(response.get("error", "알 수 없는 워커 오류"))
+            return response.get("result") or {}
+
+
+class DjangoWorkerPool:
+    """프로젝트별로 Django를 미리 부팅해 두는 워커 풀
+
+    settings/requirements/models 파일이 바뀌면 해당 프로젝트의 워커를 재시작하고,
+    idle_timeout초 동안 요청이 없던 워커는 종료한다 (0이면 유지).
+    """
+
+    def __init__(
+        self,
+        python_executable: Optional[str] = None,
+        request_timeout: float = 30.0,
+        boot_timeout: float = 60.0,
+        idle_timeout: float = 0.0,
+    ):
+        self.python_executable = python_executable or sys.executable
+        self.request_timeout = request_timeout
+        self.boot_timeout = boot_timeout
+        self.idle_timeout = idle_timeout
+        self._workers: Dict[Path, DjangoWorker] = {}
+        # 부팅 중인 프로젝트 -> 부팅 결과 (같은 프로젝트 요청은 이 결과를 기다림)
+        self._booting: Dict[Path, "Future[DjangoWorker]"] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self.recycled = 0
+        self.reaped = 0
+
+    def get_worker(self, project_path: Path) -> DjangoWorker:
+        """프로젝트 워커 조회 (없거나 지문이 바뀌었으면 새로 실행)
+
+        부팅은 풀 잠금 밖에서 하므로 한 프로젝트의 부팅이 다른 프로젝트 요청을 막지
+        않는다. 같은 프로젝트를 동시에 요청하면 한 번만 부팅하고 결과를 공유한다.
+        """
+        project_path = Path(project_path).resolve()
+        fingerprint = project_fingerprint(project_path)
+
+        with self._lock:
+            worker = self._workers.get(project_path)
+            if worker and worker.is_alive() and worker.fingerprint == fingerprint:
+                return worker
+
+            booting = self._booting.get(project_path)
+            owner = booting is None
+            if owner:
+                booting = Future()
+                self._booting[project_path] = booting
+                stale = self._workers.pop(project_path, None)
+
+        if not owner:
+            # 다른 요청이 같은 프로젝트를 부팅 중
+            return self._wait_for_boot(booting)
+
+        try:
+            worker = self._boot(project_path, fingerprint, stale)
+        except BaseException as e:
+            with self._lock:
+                self._booting.pop(project_path, None)
+            booting.set_exception(e)
+            raise
+
+        with self._lock:
+            self._booting.pop(project_path, None)
+            self._workers[project_path] = worker
+        booting.set_result(worker)
+        self._start_reaper()
+        return worker
+
+    def _wait_for_boot(self, booting: "Future[DjangoWorker]") -> DjangoWorker:
+        try:
+            return booting.result(timeout=self.boot_timeout)
+        except WorkerError:
+            raise
+        except TimeoutError:
+            raise WorkerTimeoutError("다른 요청의 워커 부팅 대기 시간 초과")
+
+    def _boot(
+        self, project_path: Path, fingerprint: str, stale: Optional[DjangoWorker]
+    ) -> DjangoWorker:
+        if stale:
+            logger.info("Django 워커 재시작: %s", project_path.name)
+            stale.stop()
+            self.recycled += 1
+
+        worker = DjangoWorker(
+            project_path, fingerprint, self.python_executable, self.boot_timeout
+        )
+        try:
+            worker.start()
+        except WorkerError:
+            worker.stop(grace_period=0)
+            raise
+        logger.info("Django 워커 시작: %s (pid: %s)", project_path.name, worker.pid)
+        return worker
+
+    def reap_idle(self, now: Optional[float] = None) -> int:
+        """idle_timeout보다 오래 쓰이지 않은 워커 종료 (종료한 워커 수)"""
+        if self.idle_timeout <= 0:
+            return 0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            idle = [
+                worker
+                for worker in self._workers.values()
+                if now - worker.last_used > self.idle_timeout and not worker.busy
+            ]
+            for worker in idle:
+                del self._workers[worker.project_path]
+            self.reaped += len(idle)
+        for worker in idle:
+            logger.info("유휴 Django 워커 종료: %s", worker.project_path.name)
+            worker.stop()
+        return len(idle)
+
+    def _start_reaper(self) -> None:
+        if self.idle_timeout <= 0 or self._reaper is not None:
+            return
+        with self._lock:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(
+                target=self._reap_loop, name="django-worker-reaper", daemon=True
+            )
+        self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        interval = max(1.0, self.idle_timeout / 4)
+        while not self._closed.wait(interval):
+            try:
+                self.reap_idle()
+            except Exception:
+                logger.exception("유휴 워커 정리 실패")
+
+    def request(
+        self,
+        project_path: Path,
+        op: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """프로젝트 워커에 요청 전달 (시간 초과 시 워커 폐기)"""
+        worker = self.get_worker(project_path)
+        try:
+            return worker.request(op, params, timeout or self.request_timeout)
+        except WorkerTimeoutError:
+            self._discard(worker)
+            raise
+        except WorkerError:
+            if not worker.is_alive():
+                self._discard(worker)
+            raise
+
+    def shutdown(self) -> None:
+        """모든 워커 종료"""
+        self._closed.set()
+        with self._lock:
+            workers = list(self._workers.values())
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """워커 상태 조회"""
+        with self._lock:
+            workers = list(self._workers.values())
+        return [
+            {
+                "project": worker.project_path.name,
+                "pid": worker.pid,
+                "alive": worker.is_alive(),
+                "django_ready": worker.django_ready,
+                "requests_served": worker.requests_served,
+                "idle_seconds": time.monotonic() - worker.last_used,
+                "uptime": time.time() - worker.started_at if worker.started_at else 0,
+            }
+            for worker in workers
+        ]
+
+    def _discard(self, worker: DjangoWorker) -> None:
+        with self._lock:
+            if self._workers.get(worker.project_path) is worker:
+                del self._workers[worker.project_path]
+        worker.stop(grace_period=0)
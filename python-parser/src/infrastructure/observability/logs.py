@@ -0,0 +1,265 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 텍스트 형식 로그 줄 앞에 붙이는 서비스 표시
+PREFIX = "[문서 자동화]"
+
+# 서비스 로거는 모두 이 이름 아래에 둔다 (docs.<모듈 이름>)
+ROOT_LOGGER = "docs"
+
+# 같은 메시지 템플릿은 구간(초)마다 처음 burst개만 기록
+SAMPLE_BURST = 5
+SAMPLE_WINDOW = 60.0
+
+# 실행 요약에 남길 항목 예시 수
+SUMMARY_EXAMPLES = 3
+
+DEBUG, INFO, WARNING, ERROR = (
+    logging.DEBUG,
+    logging.INFO,
+    logging.WARNING,
+    logging.ERROR,
+)
+
+
+class StructuredLogger:
+    """레벨이 꺼져 있으면 메시지/필드를 만들지 않는 구조화 로거
+
+    메시지는 % 형식 인자로 받아 실제로 기록될 때만 포맷하고,
+    키워드 인자는 텍스트/JSON 출력에 필드로 붙는다.
+    """
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    @property
+    def name(self) -> str:
+        return self._logger.name
+
+    def enabled(self, level: int) -> bool:
+        """비싼 필드를 계산하기 전에 확인할 레벨 활성 여부"""
+        return self._logger.isEnabledFor(level)
+
+    def log(self, level: int, msg: str, *args, **fields) -> None:
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, msg, *args, extra={"fields": fields}, stacklevel=2)
+
+    def debug(self, msg: str, *args, **fields) -> None:
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.log(DEBUG, msg, *args, extra={"fields": fields}, stacklevel=2)
+
+    def info(self, msg: str, *args, **fields) -> None:
+        if self._logger.isEnabledFor(INFO):
+            self._logger.log(INFO, msg, *args, extra={"fields": fields}, stacklevel=2)
+
+    def warning(self, msg: str, *args, **fields) -> None:
+        if self._logger.isEnabledFor(WARNING):
+            self._logger.log(
+                WARNING, msg, *args, extra={"fields": fields}, stacklevel=2
+            )
+
+    def error(self, msg: str, *args, **fields) -> None:
+        if self._logger.isEnabledFor(ERROR):
+            self._logger.log(ERROR, msg, *args, extra={"fields": fields}, stacklevel=2)
+
+    def exception(self, msg: str, *args, **fields) -> None:
+        """처리 중인 예외의 traceback을 붙여 ERROR로 기록"""
+        if self._logger.isEnabledFor(ERROR):
+            self._logger.log(
+                ERROR,
+                msg,
+                *args,
+                exc_info=True,
+                extra={"fields": fields},
+                stacklevel=2,
+            )
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """모듈 이름(__name__)에 해당하는 서비스 로거 (docs.<마지막 이름>)"""
+    return StructuredLogger(
+        logging.getLogger(f"{ROOT_LOGGER}.{name.rsplit('.', 1)[-1]}")
+    )
+
+
+class SamplingFilter(logging.Filter):
+    """같은 로거/메시지 템플릿의 반복 기록을 구간마다 burst개로 제한
+
+    생략한 개수는 다음 구간의 첫 기록에 suppressed 필드로 붙는다.
+    """
+
+    def __init__(
+        self,
+        burst: int = SAMPLE_BURST,
+        window: float = SAMPLE_WINDOW,
+        max_keys: int = 1024,
+    ):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self.max_keys = max_keys
+        self.suppressed = 0
+        self._lock = threading.Lock()
+        # (로거, 템플릿) -> [구간 시작, 기록 수, 생략 수]
+        self._windows: Dict[Tuple[str, str], List[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0:
+            return True
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            state = self._windows.get(key)
+            if state is None or now - state[0] >= self.window:
+                if state is None and len(self._windows) >= self.max_keys:
+                    self._expire(now)
+                if state is not None and state[2]:
+                    record.suppressed = int(state[2])
+                state = self._windows[key] = [now, 0, 0]
+            state[1] += 1
+            if state[1] > self.burst:
+                state[2] += 1
+                self.suppressed += 1
+                return False
+        return True
+
+    def _expire(self, now: float) -> None:
+        for key in [k for k, s in self._windows.items() if now - s[0] >= self.window]:
+            del self._windows[key]
+        if len(self._windows) >= self.max_keys:
+            self._windows.clear()
+
+
+class StructuredFormatter(logging.Formatter):
+    """text: `시각 레벨 [문서 자동화] 메시지 key=value`, json: 한 줄 JSON 객체"""
+
+    def __init__(self, fmt: str = "text"):
+        super().__init__(datefmt="%Y-%m-%dT%H:%M:%S")
+        self.json = fmt == "json"
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields: Dict[str, Any] = dict(getattr(record, "fields", None) or {})
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            fields["suppressed"] = suppressed
+        exception = self.formatException(record.exc_info) if record.exc_info else None
+
+        if self.json:
+            payload = {
+                "time": self.formatTime(record, self.datefmt),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            }
+            if exception:
+                payload["exception"] = exception
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        line = (
+            f"{self.formatTime(record, self.datefmt)} {record.levelname:<7} "
+            f"{PREFIX} {record.getMessage()}"
+        )
+        if fields:
+            line += " " + " ".join(
+                f"{key}={_text_value(value)}" for key, value in fields.items()
+            )
+        if exception:
+            line += "\n" + exception
+        return line
+
+
+def _text_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(str(item) for item in value) + "]"
+    text = str(value)
+    return f'"{text}"' if " " in text else text
+
+
+def _parse_levels(spec: str) -> Dict[str, int]:
+    """`generator=DEBUG,admission=WARNING` 형식의 로거별 레벨"""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return levels
+
+
+_configured: Optional[logging.Handler] = None
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    stream=None,
+    sampling: Optional[SamplingFilter] = None,
+) -> logging.Handler:
+    """서비스 로거 설정 (여러 번 호출해도 핸들러는 하나)
+
+    환경 변수: LOG_LEVEL(기본 INFO), LOG_FORMAT(text|json),
+    LOG_LEVELS(`모듈=레벨,...` 로거별 레벨), LOG_SAMPLE_BURST/LOG_SAMPLE_WINDOW
+    (반복 메시지 제한, burst 0이면 끔).
+    """
+    global _configured
+    root = logging.getLogger(ROOT_LOGGER)
+    if _configured is not None:
+        root.removeHandler(_configured)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(
+        StructuredFormatter(fmt or os.environ.get("LOG_FORMAT", "text"))
+    )
+    handler.addFilter(
+        sampling
+        or SamplingFilter(
+            int(os.environ.get("LOG_SAMPLE_BURST", SAMPLE_BURST)),
+            float(os.environ.get("LOG_SAMPLE_WINDOW", SAMPLE_WINDOW)),
+        )
+    )
+    root.addHandler(handler)
+    root.setLevel((level or os.environ.get("LOG_LEVEL", "INFO")).upper())
+    root.propagate = False
+    for name, module_level in _parse_levels(os.environ.get("LOG_LEVELS", "")).items():
+        logging.getLogger(f"{ROOT_LOGGER}.{name}").setLevel(module_level)
+
+    _configured = handler
+    return handler
+
+
+class RunSummary:
+    """실행 한 번 동안 항목별 결과를 세어 끝에 한 줄로 기록
+
+    항목마다 줄을 남기는 대신 결과별 개수와 처음 몇 개의 예시만 남긴다.
+    """
+
+    def __init__(self, logger: StructuredLogger, message: str):
+        self.logger = logger
+        self.message = message
+        self.counts: Dict[str, int] = {}
+        self.examples: Dict[str, List[str]] = {}
+
+    def count(self, outcome: str, item: Optional[str] = None, amount: int = 1) -> None:
+        self.counts[outcome] = self.counts.get(outcome, 0) + amount
+        if item is not None:
+            examples = self.examples.setdefault(outcome, [])
+            if len(examples) < SUMMARY_EXAMPLES:
+                examples.append(item)
+
+    def log(self, *args, level: int = INFO, **fields) -> None:
+        """요약 한 줄 기록 (args는 메시지 포맷 인자, fields 뒤에 결과별 개수가 붙음)"""
+        if not self.logger.enabled(level):
+            return
+        fields.update(self.counts)
+        for outcome, examples in self.examples.items():
+            fields[f"{outcome}_examples"] = examples
+        self.logger.log(level, self.message, *args, **fields)
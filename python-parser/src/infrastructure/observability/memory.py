@@ -0,0 +1,134 @@
+import enum
+import os
+import random
+import sys
+import types
+from typing import Any, Dict, Iterable, Optional, Set
+
+# 컨테이너 크기 추정 시 깊이 측정할 최대 항목 수 (넘으면 표본 평균 × 항목 수)
+SAMPLE_SIZE = 200
+
+# 다른 객체와 공유되는 전역 객체는 크기에 포함하지 않음
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    enum.Enum,
+)
+
+
+def _referents(obj: Any) -> Iterable[Any]:
+    # 다른 스레드가 바꾸는 중일 수 있으므로 목록을 먼저 복사
+    if isinstance(obj, dict):
+        for key, value in list(obj.items()):
+            yield key
+            yield value
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from list(obj)
+    elif isinstance(obj, (str, bytes, bytearray, int, float, complex, bool)):
+        return
+    else:
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is not None:
+            yield attributes
+        for cls in type(obj).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name != "__dict__" and hasattr(obj, name):
+                    yield getattr(obj, name)
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """obj와 obj가 참조하는 객체들의 크기 합 (seen에 있는 객체는 한 번만)"""
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, _SHARED_TYPES):
+            continue
+        marker = id(current)
+        if marker in seen:
+            continue
+        seen.add(marker)
+        total += sys.getsizeof(current)
+        stack.extend(_referents(current))
+    return total
+
+
+def estimate_size(obj: Any, sample: int = SAMPLE_SIZE, seed: int = 0) -> int:
+    """obj의 깊은 크기 추정
+
+    항목이 sample개보다 많은 list/tuple/set/dict는 컨테이너 자체 크기에
+    무작위 표본 항목의 평균 크기 × 항목 수를 더한다. 표본 항목끼리 공유하는
+    객체는 한 번만 세므로 전체를 측정한 값과 다를 수 있다.
+    """
+    if not isinstance(obj, (list, tuple, set, frozenset, dict)) or len(obj) <= sample:
+        return deep_sizeof(obj)
+    items = list(obj.items()) if isinstance(obj, dict) else list(obj)
+    seen: Set[int] = set()
+    sampled = 0
+    for item in random.Random(seed).sample(items, sample):
+        # dict 항목은 (키, 값) 튜플 자체가 아니라 키와 값만 센다
+        parts = item if isinstance(obj, dict) else (item,)
+        sampled += sum(deep_sizeof(part, seen) for part in parts)
+    return sys.getsizeof(obj) + int(sampled / sample * len(items))
+
+
+def shallow_sizeof(*containers: Any) -> int:
+    """인덱스 컨테이너 크기 (값 목록은 항목을 공유하므로 목록 자체 크기만)"""
+    total = 0
+    for container in containers:
+        total += sys.getsizeof(container)
+        values = container.values() if isinstance(container, dict) else ()
+        total += sum(sys.getsizeof(value) for value in values)
+    return total
+
+
+def usage(items: int, size: int, sample: int, **extra) -> Dict[str, Any]:
+    """저장소 하나의 메모리 사용량 (items개, bytes, 표본 추정 여부)"""
+    return {"items": items, "bytes": size, "sampled": items > sample, **extra}
+
+
+def process_memory() -> Dict[str, Optional[int]]:
+    """프로세스 RSS와 최대 RSS (바이트, 알 수 없으면 None)"""
+    rss = peak = None
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트
+        peak = maxrss if sys.platform == "darwin" else maxrss * 1024
+    except (ImportError, OSError):
+        pass
+    return {"rss_bytes": rss, "peak_rss_bytes": peak}
+
+
+def tracemalloc_report(top: int = 20) -> Dict[str, Any]:
+    """tracemalloc이 켜져 있으면 파일별 할당 상위 목록 (PYTHONTRACEMALLOC로 시작)"""
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+    current, peak = tracemalloc.get_traced_memory()
+    statistics = tracemalloc.take_snapshot().statistics("filename")
+    return {
+        "tracing": True,
+        "traced_bytes": current,
+        "peak_traced_bytes": peak,
+        "top_files": [
+            {
+                "file": stat.traceback[0].filename,
+                "bytes": stat.size,
+                "blocks": stat.count,
+            }
+            for stat in statistics[:top]
+        ],
+    }
@@ -0,0 +1,305 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 지연 시간 히스토그램 기본 구간 (초)
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# 크기 히스토그램 구간 (바이트, 1KB ~ 1GB)
+SIZE_BUCKETS = tuple(1024 * 4**i for i in range(11))
+
+# 개수 히스토그램 구간 (파일/ViewSet 수 등)
+COUNT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(v))}"' for name, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """라벨 조합별 값을 가진 메트릭 (라벨 조합 객체는 미리 받아 두면 조회 비용도 없음)"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[LabelValues, object] = {}
+
+    def labels(self, *values: str):
+        """라벨 값 조합의 자식 메트릭 (처음 요청할 때 생성)"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class _Value:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    """누적 카운터"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def samples(self):
+        for key, child in sorted(self._children.items()):
+            yield "", _format_labels(self.labelnames, key), child.value
+
+
+class Gauge(Counter):
+    """현재 값 게이지"""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class CallbackGauge(_Metric):
+    """스크레이프할 때 callback()이 돌려주는 (라벨 값들, 값) 목록을 내보내는 게이지"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def samples(self):
+        for key, value in self.callback():
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_upper_bounds", "counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    """구간별 누적 관측 수와 합계"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.upper_bounds = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.upper_bounds)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def samples(self):
+        for key, child in sorted(self._children.items()):
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.upper_bounds + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(bound),)
+                )
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, total
+            yield "_count", labels, count
+
+
+class MetricsRegistry:
+    """프로세스 안 메트릭 모음 (Prometheus 텍스트 형식으로 출력)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """메트릭 등록 (같은 이름이 이미 있으면 기존 메트릭 반환)"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # 수집 콜백 하나가 실패해도 나머지 메트릭은 내보낸다
+                lines.append(f"# {metric.name} collection failed: {e}")
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전체에서 공유하는 기본 레지스트리
+default_registry = MetricsRegistry()
+
+# --- 서비스 메트릭 ---------------------------------------------------------
+
+PARSER_FILES = default_registry.counter(
+    "parser_files_parsed_total", "Python files parsed by result", ("result",)
+)
+PARSER_BYTES = default_registry.counter(
+    "parser_bytes_read_total", "Bytes of Python source read by the parser"
+)
+PARSER_SECONDS = default_registry.histogram(
+    "parser_parse_seconds", "Per-file parse latency (read to chunks)"
+)
+PARSER_FILE_BYTES = default_registry.histogram(
+    "parser_file_bytes", "Size of parsed files", buckets=SIZE_BUCKETS
+)
+PARSER_OUTPUTS = default_registry.counter(
+    "parser_outputs_total", "Symbols, calls and chunks produced", ("kind",)
+)
+
+ANALYSIS_SECONDS = default_registry.histogram(
+    "analysis_duration_seconds", "Project analysis duration", ("result",)
+)
+ANALYSIS_PROJECT_FILES = default_registry.histogram(
+    "analysis_project_files", "Files analyzed per project", buckets=COUNT_BUCKETS
+)
+ANALYSIS_PROJECT_BYTES = default_registry.histogram(
+    "analysis_project_bytes", "Source bytes analyzed per project", buckets=SIZE_BUCKETS
+)
+ANALYSIS_REPOSITORY_ITEMS = default_registry.gauge(
+    "analysis_repository_items", "Items held by the analysis repositories", ("kind",)
+)
+
+GENERATION_PHASE_SECONDS = default_registry.histogram(
+    "docs_generation_phase_seconds",
+    "Documentation generation time per phase and run",
+    ("phase",),
+)
+GENERATION_VIEWSETS = default_registry.histogram(
+    "docs_generation_viewsets", "ViewSets per generation run", buckets=COUNT_BUCKETS
+)
+VIEW_MODULE_IMPORT_SECONDS = default_registry.histogram(
+    "docs_view_module_import_seconds", "Time to import one views module"
+)
+CACHE_LOOKUPS = default_registry.counter(
+    "cache_lookups_total", "Cache lookups by cache and result", ("cache", "result")
+)
+
+HTTP_REQUEST_SECONDS = default_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route", "status"),
+)
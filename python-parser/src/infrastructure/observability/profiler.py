@@ -0,0 +1,280 @@
+import functools
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+# 프레임 이름에서 잘라 낼 경로 (python-parser 루트, 표준 라이브러리)
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+_PATH_PREFIXES = sorted(
+    {str(PACKAGE_ROOT) + os.sep}
+    | {str(Path(p).resolve()) + os.sep for p in sys.path if p and Path(p).is_dir()},
+    key=len,
+    reverse=True,
+)
+
+# 기본 샘플링 간격 (초)과 한 번에 허용하는 최대 측정 시간
+DEFAULT_INTERVAL = 0.005
+MAX_SECONDS = 60.0
+
+# 스택 깊이와 서로 다른 스택 수 상한 (넘으면 잘라 내거나 [other]로 합침)
+MAX_DEPTH = 128
+MAX_STACKS = 20000
+
+# 맨 위 프레임이 이 파일들에 있으면 대기 중인 스레드로 보고 제외
+_IDLE_FILES = {"threading.py", "selectors.py", "queue.py", "connection.py"}
+
+# 예약한 실행 종류 (AnalyzeCodeUseCase.execute, generate_api_documentation)
+KINDS = ("analysis", "generation")
+
+
+class ProfilerBusy(Exception):
+    """이미 다른 프로파일링이 진행 중"""
+
+
+def _short_path(filename: str) -> str:
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix) :]
+    return filename
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{_short_path(code.co_filename)}:{code.co_name}"
+
+
+def _collapse(frame) -> str:
+    """바깥 프레임부터 `파일:함수`를 ;로 이은 스택 (flamegraph collapsed 형식)"""
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+def _is_idle(frame) -> bool:
+    return os.path.basename(frame.f_code.co_filename) in _IDLE_FILES
+
+
+class SamplingProfiler:
+    """별도 스레드에서 주기적으로 sys._current_frames()를 읽는 샘플링 프로파일러
+
+    threads가 주어지면 해당 스레드만, 아니면 프로파일러 자신을 뺀 모든 스레드를
+    샘플링한다. 대기(lock/queue/select) 중인 스레드는 include_idle이 아니면 뺀다.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        threads: Optional[Iterable[int]] = None,
+        include_idle: bool = False,
+    ):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started: Optional[float] = None
+        self.ended: Optional[float] = None
+        self._threads: Optional[Set[int]] = set(threads) if threads else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.ended = time.perf_counter()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own or (
+                self._threads is not None and ident not in self._threads
+            ):
+                continue
+            if not self.include_idle and _is_idle(frame):
+                continue
+            stack = f"{names.get(ident, ident)};{_collapse(frame)}"
+            if stack not in self.stacks and len(self.stacks) >= MAX_STACKS:
+                stack = f"{names.get(ident, ident)};[other]"
+            self.stacks[stack] += 1
+            self.samples += 1
+
+    @property
+    def duration(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.ended or time.perf_counter()) - self.started
+
+    def collapsed(self) -> str:
+        """`스레드;바깥;...;안쪽 샘플수` 줄 목록 (flamegraph.pl/speedscope 입력)"""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def summary(self, top: int = 20) -> Dict[str, Any]:
+        """샘플 수와 가장 많이 잡힌 스택/함수 (자기 시간 기준)"""
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return {
+            "mode": "sample",
+            "samples": self.samples,
+            "duration": round(self.duration, 3),
+            "interval": self.interval,
+            "distinct_stacks": len(self.stacks),
+            "top_functions": [
+                {"function": name, "samples": count}
+                for name, count in leaves.most_common(top)
+            ],
+            "top_stacks": [
+                {"stack": stack, "samples": count}
+                for stack, count in self.stacks.most_common(top)
+            ],
+        }
+
+
+def cprofile_report(profile, top: int = 30) -> Dict[str, Any]:
+    """cProfile 결과를 누적 시간 순 상위 함수 목록과 pstats 텍스트로 변환"""
+    import pstats
+
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, name), (cc, nc, tt, ct, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{_short_path(filename)}:{line}({name})",
+                "calls": nc,
+                "primitive_calls": cc,
+                "self_seconds": round(tt, 6),
+                "cumulative_seconds": round(ct, 6),
+            }
+        )
+    rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+    text = io.StringIO()
+    pstats.Stats(profile, stream=text).sort_stats("cumulative").print_stats(top)
+    return {
+        "mode": "cprofile",
+        "total_seconds": round(stats.total_tt, 6),
+        "functions": rows[:top],
+        "text": text.getvalue(),
+    }
+
+
+class ProfileCapture:
+    """다음 분석/생성 실행 한 번을 프로파일링하도록 예약한 캡처"""
+
+    def __init__(
+        self,
+        kind: str,
+        mode: str,
+        interval: float = DEFAULT_INTERVAL,
+        top: int = 30,
+    ):
+        self.kind = kind
+        self.mode = mode
+        self.interval = interval
+        self.top = top
+        self.profiler: Optional[SamplingProfiler] = None
+        self.report: Optional[Dict[str, Any]] = None
+        self.done = threading.Event()
+
+    def run(self, fn: Callable, *args, **kwargs):
+        """현재 스레드에서 fn 실행을 프로파일링"""
+        try:
+            if self.mode == "cprofile":
+                import cProfile
+
+                profile = cProfile.Profile()
+                profile.enable()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    profile.disable()
+                    self.report = cprofile_report(profile, self.top)
+            self.profiler = SamplingProfiler(
+                self.interval, threads=[threading.get_ident()]
+            ).start()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.profiler.stop()
+        finally:
+            self.done.set()
+
+
+class ProfilingControl:
+    """프로세스당 한 번에 하나의 프로파일링만 허용하고 다음 실행 예약을 관리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._busy = False
+        self._armed: Dict[str, ProfileCapture] = {}
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._busy:
+                raise ProfilerBusy("profiling already in progress")
+            self._busy = True
+
+    def release(self) -> None:
+        with self._lock:
+            self._busy = False
+            self._armed.clear()
+
+    def arm(
+        self, kind: str, mode: str, interval: float, top: int = 30
+    ) -> ProfileCapture:
+        """kind의 다음 실행을 프로파일링하도록 예약 (acquire 후 호출)"""
+        capture = ProfileCapture(kind, mode, interval, top)
+        with self._lock:
+            self._armed[kind] = capture
+        return capture
+
+    def take(self, kind: str) -> Optional[ProfileCapture]:
+        if not self._armed:
+            return None
+        with self._lock:
+            return self._armed.pop(kind, None)
+
+
+default_profiling = ProfilingControl()
+
+
+def profiled(kind: str):
+    """예약된 캡처가 있으면 다음 호출 한 번을 프로파일링하는 데코레이터
+
+    예약이 없을 때는 dict 하나를 확인하는 비용만 든다.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            capture = default_profiling.take(kind)
+            if capture is None:
+                return fn(*args, **kwargs)
+            return capture.run(fn, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
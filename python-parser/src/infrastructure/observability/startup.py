@@ -0,0 +1,102 @@
+import re
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+# python-parser 루트 (import 시간 측정 서브프로세스의 작업 디렉토리)
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+class StartupTimeline:
+    """프로세스 시작부터 첫 요청 처리까지의 구간 기록"""
+
+    def __init__(self, started_at: Optional[float] = None):
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, name: str) -> None:
+        """구간 기록 (같은 이름은 처음 한 번만)"""
+        with self._lock:
+            self._marks.setdefault(name, time.perf_counter())
+
+    def has(self, name: str) -> bool:
+        return name in self._marks
+
+    def to_dict(self) -> Dict[str, float]:
+        """시작 시점 기준 경과 시간 (ms)"""
+        with self._lock:
+            return {
+                name: round((moment - self.started_at) * 1000, 1)
+                for name, moment in sorted(self._marks.items(), key=lambda x: x[1])
+            }
+
+
+def import_time_report(
+    module: str = "main", top: int = 30, timeout: float = 60.0
+) -> Dict[str, Any]:
+    """새 인터프리터에서 `-X importtime`으로 모듈 import 비용 측정
+
+    현재 프로세스는 이미 import가 끝났으므로 별도 프로세스에서 측정한다.
+    누적 시간 기준 상위 모듈과 최상위 패키지별 합계를 반환한다.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(PACKAGE_ROOT),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+    entries: List[Dict[str, Any]] = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append(
+            {
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            }
+        )
+
+    # 최상위 패키지별 self 시간 합계
+    packages: Dict[str, float] = {}
+    for entry in entries:
+        package = entry["module"].split(".")[0]
+        packages[package] = packages.get(package, 0.0) + entry["self_ms"]
+
+    root = next((e for e in entries if e["module"] == module), None)
+    return {
+        "module": module,
+        "ok": completed.returncode == 0,
+        "error": (
+            completed.stderr.strip().splitlines()[-1] if completed.returncode else None
+        ),
+        "total_ms": root["cumulative_ms"] if root else None,
+        "modules_imported": len(entries),
+        "top_modules": sorted(entries, key=lambda e: -e["cumulative_ms"])[:top],
+        "top_packages": [
+            {"package": name, "self_ms": round(ms, 1)}
+            for name, ms in sorted(packages.items(), key=lambda x: -x[1])[:top]
+        ],
+    }
+
+
+if __name__ == "__main__":
+    # 사용법: python -m src.infrastructure.observability.startup [module] [top]
+    import json
+
+    report = import_time_report(
+        sys.argv[1] if len(sys.argv) > 1 else "main",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 30,
+    )
+    print(json.dumps(report, indent=2, ensure_ascii=False))
@@ -0,0 +1,103 @@
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# 파일별 소요 시간 요약에 포함할 백분위
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """정렬된 값의 q 백분위 (선형 보간)"""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    lower, upper = math.floor(position), math.ceil(position)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class PhaseTimer:
+    """단계별 소요 시간 누적 (같은 이름의 단계는 합산)"""
+
+    def __init__(self):
+        self._phases: Dict[str, Dict[str, float]] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float, count: int = 1) -> None:
+        phase = self._phases.setdefault(name, {"seconds": 0.0, "count": 0})
+        phase["seconds"] += seconds
+        phase["count"] += count
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """단계 이름 -> 소요 시간(초)/횟수/전체 대비 비율 (기록 순서)"""
+        total = time.perf_counter() - self._started
+        return {
+            name: {
+                "seconds": round(phase["seconds"], 6),
+                "count": int(phase["count"]),
+                "share": round(phase["seconds"] / total, 4) if total > 0 else 0.0,
+            }
+            for name, phase in self._phases.items()
+        }
+
+
+class FileTimings:
+    """파일별 소요 시간 기록과 요약 (백분위, 가장 느린 파일)"""
+
+    def __init__(self):
+        self._files: List[Dict[str, Any]] = []
+
+    def record(
+        self,
+        path: str,
+        seconds: float,
+        size: Optional[int] = None,
+        phases: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._files.append(
+            {"path": path, "seconds": seconds, "size": size, "phases": phases or {}}
+        )
+
+    def phase_totals(self) -> Dict[str, float]:
+        """파일 안 세부 단계(read/parse 등)별 합계"""
+        totals: Dict[str, float] = {}
+        for entry in self._files:
+            for name, seconds in entry["phases"].items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        return totals
+
+    def summary(self, slowest: int = 10) -> Dict[str, Any]:
+        durations = sorted(entry["seconds"] for entry in self._files)
+        ranked = sorted(self._files, key=lambda entry: entry["seconds"], reverse=True)
+        return {
+            "count": len(durations),
+            "total_seconds": round(sum(durations), 6),
+            "total_bytes": sum(entry["size"] or 0 for entry in self._files),
+            "mean_seconds": (
+                round(sum(durations) / len(durations), 6) if durations else 0.0
+            ),
+            "percentiles": {
+                f"p{q}": round(percentile(durations, q), 6) for q in PERCENTILES
+            },
+            "max_seconds": round(durations[-1], 6) if durations else 0.0,
+            "slowest": [
+                {
+                    "path": entry["path"],
+                    "size": entry["size"],
+                    "seconds": round(entry["seconds"], 6),
+                    "phases": {
+                        name: round(seconds, 6)
+                        for name, seconds in entry["phases"].items()
+                    },
+                }
+                for entry in ranked[:slowest]
+            ],
+        }
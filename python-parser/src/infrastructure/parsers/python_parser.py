@@ -1,4 +1,6 @@
 import ast
+import os
+import time
 from typing import List, Tuple, Optional, Dict
 from pathlib import Path
 
@@ -10,6 +12,21 @@ from ...domain.entities.call_relationship import (
     CallArgument,
 )
 from ...domain.entities.code_chunk import CodeChunk, ChunkType
+from ..observability.metrics import (
+    PARSER_BYTES,
+    PARSER_FILE_BYTES,
+    PARSER_FILES,
+    PARSER_OUTPUTS,
+    PARSER_SECONDS,
+)
+
+# 파일마다 라벨 조회를 하지 않도록 미리 받아 둔 메트릭
+_PARSED = PARSER_FILES.labels("ok")
+_READ_ERRORS = PARSER_FILES.labels("read_error")
+_SYNTAX_ERRORS = PARSER_FILES.labels("syntax_error")
+_SYMBOLS = PARSER_OUTPUTS.labels("symbols")
+_CALLS = PARSER_OUTPUTS.labels("calls")
+_CHUNKS = PARSER_OUTPUTS.labels("chunks")
 
 
 class PythonParser:
@@ -21,19 +38,37 @@ class PythonParser:
         self.import_map: Dict[str, str] = {}
 
     def parse_file(
-        self, file_path: Path
+        self, file_path: Path, timings: Optional[Dict[str, float]] = None
     ) -> Tuple[List[CodeSymbol], List[CallRelationship], List[CodeChunk]]:
-        """파일 파싱"""
+        """파일 파싱 (timings가 주어지면 read/parse/symbols/calls/chunks 단계별 초 기록)"""
+        clock = started = time.perf_counter()
+
+        def lap(name: str) -> None:
+            nonlocal clock
+            now = time.perf_counter()
+            if timings is not None:
+                timings[name] = timings.get(name, 0.0) + (now - clock)
+            clock = now
+
         try:
             with open(file_path, "r", encoding="utf-8") as f:
+                size = os.fstat(f.fileno()).st_size
                 source = f.read()
         except (UnicodeDecodeError, FileNotFoundError):
+            _READ_ERRORS.inc()
             return [], [], []
+        finally:
+            lap("read")
+        PARSER_BYTES.inc(size)
+        PARSER_FILE_BYTES.observe(size)
 
         try:
             tree = ast.parse(source)
         except SyntaxError:
+            _SYNTAX_ERRORS.inc()
             return [], [], []
+        finally:
+            lap("parse")
 
         module_path = self._get_module_path(file_path)
         source_lines = source.splitlines()
@@ -43,15 +78,23 @@ class PythonParser:
 
         # 2. 심볼 추출
         symbols = self._extract_symbols(tree, file_path, module_path)
+        lap("symbols")
 
         # 3. 호출 관계 분석
         calls = self._extract_calls(tree, file_path, module_path)
+        lap("calls")
 
         # 4. 코드 청킹
         chunks = self._create_chunks(
             tree, source_lines, file_path, module_path, symbols
         )
+        lap("chunks")
 
+        _PARSED.inc()
+        _SYMBOLS.inc(len(symbols))
+        _CALLS.inc(len(calls))
+        _CHUNKS.inc(len(chunks))
+        PARSER_SECONDS.observe(clock - started)
         return symbols, calls, chunks
 
     def _get_module_path(self, file_path: Path) -> str:
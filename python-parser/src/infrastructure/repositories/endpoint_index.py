@@ -0,0 +1,197 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+from ..generators.openapi_diff import HTTP_METHODS
+
+_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+_PARAM_PATTERN = re.compile(r"^(?:\{([^}]+)\}|<(?:[^:>]+:)?([^>]+)>)$")
+
+
+def _segments(path: str) -> List[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def _param_name(segment: str) -> Optional[str]:
+    # OpenAPI `{id}`와 Django `<int:pk>` 형식 모두 경로 변수로 취급
+    match = _PARAM_PATTERN.match(segment)
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def _tokens(text: Optional[str]) -> Set[str]:
+    return {token.lower() for token in _TOKEN_PATTERN.findall(text or "")}
+
+
+@dataclass
+class IndexedOperation:
+    """인덱스에 등록된 오퍼레이션 하나"""
+
+    path: str
+    method: str
+    operation: Dict[str, Any]
+
+    @property
+    def summary(self) -> Optional[str]:
+        return self.operation.get("summary")
+
+    @property
+    def tags(self) -> List[str]:
+        return list(self.operation.get("tags") or [])
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "method": self.method,
+            "summary": self.summary,
+            "tags": self.tags,
+            "deprecated": bool(self.operation.get("deprecated")),
+        }
+
+
+@dataclass
+class _TrieNode:
+    literals: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    # 경로 변수 자식 (변수 이름이 달라도 한 노드로 합침)
+    param: Optional["_TrieNode"] = None
+    # 이 노드에서 끝나는 경로 템플릿의 오퍼레이션 id
+    operations: List[int] = field(default_factory=list)
+
+
+class EndpointIndex:
+    """생성된 문서의 오퍼레이션 인덱스
+
+    경로는 세그먼트 트라이로 저장해 실제 요청 경로(`/revenues/12/`)나 템플릿
+    (`/revenues/{id}/`)으로 해당 오퍼레이션을 찾는다. 리터럴 세그먼트가 경로 변수보다
+    우선한다. 메서드/태그/summary 토큰은 역색인으로 필터링한다.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.operations: List[IndexedOperation] = []
+        self._root = _TrieNode()
+        self._by_method: Dict[str, Set[int]] = {}
+        self._by_tag: Dict[str, Set[int]] = {}
+        self._by_token: Dict[str, Set[int]] = {}
+
+        for path, path_item in (spec.get("paths") or {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if isinstance(operation, dict):
+                    self._add(IndexedOperation(path, method.upper(), operation))
+
+    def _add(self, entry: IndexedOperation) -> None:
+        op_id = len(self.operations)
+        self.operations.append(entry)
+
+        node = self._root
+        for segment in _segments(entry.path):
+            if _param_name(segment) is None:
+                node = node.literals.setdefault(segment, _TrieNode())
+            else:
+                if node.param is None:
+                    node.param = _TrieNode()
+                node = node.param
+        node.operations.append(op_id)
+
+        self._by_method.setdefault(entry.method, set()).add(op_id)
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag.lower(), set()).add(op_id)
+        text = " ".join(
+            [
+                entry.path,
+                entry.summary or "",
+                entry.operation.get("description") or "",
+                entry.operation.get("operationId") or "",
+            ]
+        )
+        for token in _tokens(text):
+            self._by_token.setdefault(token, set()).add(op_id)
+
+    def match(
+        self, path: str, method: Optional[str] = None
+    ) -> List[Tuple[IndexedOperation, Dict[str, str]]]:
+        """요청 경로(또는 템플릿)에 맞는 오퍼레이션과 경로 변수 값 (구체적인 경로 우선)"""
+        results = []
+        for template_ops, values in self._walk(self._root, _segments(path), 0, []):
+            for op_id in template_ops:
+                entry = self.operations[op_id]
+                if method and entry.method != method.upper():
+                    continue
+                names = [_param_name(s) for s in _segments(entry.path)]
+                names = [name for name in names if name]
+                results.append((entry, dict(zip(names, values))))
+        return results
+
+    def _walk(self, node: _TrieNode, segments: List[str], position: int, values):
+        # 깊이 우선: 리터럴 자식을 먼저 따라가므로 결과가 구체적인 순서로 나온다
+        if position == len(segments):
+            if node.operations:
+                yield node.operations, list(values)
+            return
+        segment = segments[position]
+        child = node.literals.get(segment)
+        if child is not None:
+            yield from self._walk(child, segments, position + 1, values)
+        if node.param is not None:
+            yield from self._walk(
+                node.param, segments, position + 1, values + [segment]
+            )
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[IndexedOperation]:
+        """조건을 모두 만족하는 오퍼레이션 (query는 모든 토큰을 포함해야 함)"""
+        candidates: Optional[Set[int]] = None
+
+        def narrow(ids: Set[int]) -> None:
+            nonlocal candidates
+            candidates = set(ids) if candidates is None else candidates & ids
+
+        if method:
+            narrow(self._by_method.get(method.upper(), set()))
+        if tag:
+            narrow(self._by_tag.get(tag.lower(), set()))
+        for token in _tokens(query):
+            narrow(self._by_token.get(token, set()))
+        if path_prefix:
+            narrow(self._prefix_ids(path_prefix))
+
+        ids = range(len(self.operations)) if candidates is None else sorted(candidates)
+        results = [self.operations[op_id] for op_id in ids]
+        return results[:limit] if limit else results
+
+    def _prefix_ids(self, prefix: str) -> Set[int]:
+        nodes = [self._root]
+        for segment in _segments(prefix):
+            next_nodes = []
+            for node in nodes:
+                if segment in node.literals:
+                    next_nodes.append(node.literals[segment])
+                if node.param is not None and (
+                    _param_name(segment) is not None or segment not in node.literals
+                ):
+                    next_nodes.append(node.param)
+            nodes = next_nodes
+
+        ids: Set[int] = set()
+        while nodes:
+            node = nodes.pop()
+            ids.update(node.operations)
+            nodes.extend(node.literals.values())
+            if node.param is not None:
+                nodes.append(node.param)
+        return ids
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "operations": len(self.operations),
+            "methods": {m: len(ids) for m, ids in sorted(self._by_method.items())},
+            "tags": len(self._by_tag),
+            "tokens": len(self._by_token),
+        }
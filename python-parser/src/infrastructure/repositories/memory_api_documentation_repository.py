@@ -1,43 +1,168 @@
-import json
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any, Tuple
+from urllib.parse import quote
 
 from ...domain.repositories.api_documentation_repository import (
     ApiDocumentationRepository,
 )
 from ...domain.entities.api_documentation import ApiDocumentation
+from ..generators.openapi_split import (
+    SpecSplit,
+    referenced_components,
+    split_spec_by_tag,
+)
+from .endpoint_index import EndpointIndex
+from .spec_file_writer import TEMP_SUFFIX, SpecFileWriter
+from ..observability.logs import get_logger
+from ..observability.memory import SAMPLE_SIZE, estimate_size, usage
+
+logger = get_logger(__name__)
 
 
 class MemoryApiDocumentationRepository(ApiDocumentationRepository):
     """메모리 기반 API 문서 리포지토리"""
 
-    def __init__(self):
+    def __init__(self, writer: Optional[SpecFileWriter] = None):
+        self.writer = writer or SpecFileWriter()
         self._documentations: Dict[str, ApiDocumentation] = {}
+        # 문서에서 파생된 조회용 구조 (문서 저장 시 무효화)
+        self._specs: Dict[str, Dict[str, Any]] = {}
+        # 프로젝트 -> (조각 URL 템플릿, 태그별 분할 결과)
+        self._splits: Dict[str, Tuple[str, SpecSplit]] = {}
+        self._endpoint_indexes: Dict[str, EndpointIndex] = {}
 
     def save(self, documentation: ApiDocumentation) -> None:
         """API 문서 저장"""
         project_name = documentation.title.replace(" API Documentation", "")
         self._documentations[project_name] = documentation
+        self._invalidate(project_name)
 
     def save_to_file(self, documentation: ApiDocumentation, file_path: Path) -> None:
         """API 문서를 파일로 저장"""
-        # OpenAPI JSON 형식으로 저장
-        openapi_dict = documentation.to_openapi_dict()
+        # 메모리에 저장 (OpenAPI 변환 결과를 조회용 구조와 공유)
+        self.save(documentation)
+        project_name = documentation.title.replace(" API Documentation", "")
+        openapi_dict = self._spec(project_name)
 
-        # 디렉토리 생성
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 완성된 파일만 본다
+        result = self.writer.write(openapi_dict, file_path)
 
-        # JSON 파일로 저장
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(openapi_dict, f, indent=2, ensure_ascii=False)
+        # 태그별 조각과 인덱스 (<stem>.tags/<tag>.json, <stem>.index.json)
+        self._save_fragments(openapi_dict, file_path)
 
-        # 메모리에도 저장
-        self.save(documentation)
+        logger.info(
+            "스펙 파일 저장: %s (%s bytes, %.3fs)",
+            file_path,
+            result["bytes"],
+            result["duration"],
+        )
 
     def find_by_project(self, project_name: str) -> Optional[ApiDocumentation]:
         """프로젝트별 API 문서 조회"""
         return self._documentations.get(project_name)
 
+    def get_spec_index(
+        self, project_name: str, fragment_url: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """태그별 스펙 조각 목록(인덱스) 조회"""
+        split = self._split(project_name, fragment_url)
+        return split.index if split else None
+
+    def get_tag_spec(self, project_name: str, tag: str) -> Optional[Dict[str, Any]]:
+        """태그 하나의 스펙 조각 조회"""
+        split = self._split(project_name)
+        return split.fragments.get(tag) if split else None
+
+    def match_endpoints(
+        self, project_name: str, path: str, method: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """요청 경로에 맞는 오퍼레이션 (구체적인 경로 우선, 참조 components 포함)"""
+        index = self._endpoint_index(project_name)
+        if index is None:
+            return None
+        components = self._spec(project_name).get("components") or {}
+        return [
+            {
+                **entry.to_summary_dict(),
+                "path_params": path_params,
+                "operation": entry.operation,
+                "components": referenced_components(entry.operation, components),
+            }
+            for entry, path_params in index.match(path, method)
+        ]
+
+    def search_endpoints(
+        self,
+        project_name: str,
+        query: Optional[str] = None,
+        method: Optional[str] = None,
+        tag: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """메서드/태그/경로 접두사/summary 토큰으로 오퍼레이션 검색"""
+        index = self._endpoint_index(project_name)
+        if index is None:
+            return None
+        return [
+            entry.to_summary_dict()
+            for entry in index.search(query, method, tag, path_prefix, limit)
+        ]
+
+    def _spec(self, project_name: str) -> Optional[Dict[str, Any]]:
+        # OpenAPI 변환은 문서당 한 번만 (분할/인덱스가 공유하므로 읽기 전용)
+        if project_name not in self._specs:
+            documentation = self._documentations.get(project_name)
+            if documentation is None:
+                return None
+            self._specs[project_name] = documentation.to_openapi_dict()
+        return self._specs[project_name]
+
+    def _split(self, project_name: str, fragment_url: Optional[str] = None):
+        # 분할은 첫 조회 때 한 번만 계산 (조각 조회는 URL 템플릿과 무관)
+        spec = self._spec(project_name)
+        if spec is None:
+            return None
+        cached = self._splits.get(project_name)
+        if cached and (fragment_url is None or cached[0] == fragment_url):
+            return cached[1]
+        url = fragment_url or ""
+        split = split_spec_by_tag(spec, url)
+        self._splits[project_name] = (url, split)
+        return split
+
+    def _endpoint_index(self, project_name: str) -> Optional[EndpointIndex]:
+        if project_name not in self._endpoint_indexes:
+            spec = self._spec(project_name)
+            if spec is None:
+                return None
+            self._endpoint_indexes[project_name] = EndpointIndex(spec)
+        return self._endpoint_indexes[project_name]
+
+    def _invalidate(self, project_name: str) -> None:
+        self._specs.pop(project_name, None)
+        self._splits.pop(project_name, None)
+        self._endpoint_indexes.pop(project_name, None)
+
+    def _save_fragments(self, openapi_dict: Dict[str, Any], file_path: Path) -> None:
+        fragment_dir = file_path.with_name(f"{file_path.stem}.tags")
+        split = split_spec_by_tag(openapi_dict, f"{fragment_dir.name}/{{tag}}.json")
+
+        fragment_dir.mkdir(parents=True, exist_ok=True)
+        written = set()
+        for tag, fragment in split.fragments.items():
+            fragment_file = fragment_dir / f"{quote(tag, safe='')}.json"
+            self.writer.write(fragment, fragment_file)
+            written.update({fragment_file.name, f"{fragment_file.name}.gz"})
+        # 더 이상 없는 태그의 조각 삭제 (동시에 쓰는 중인 임시 파일은 남김)
+        for stale in fragment_dir.glob("*.json*"):
+            if stale.name not in written and not stale.name.endswith(TEMP_SUFFIX):
+                stale.unlink(missing_ok=True)
+
+        self.writer.write(
+            split.index, file_path.with_name(f"{file_path.stem}.index.json")
+        )
+
     def get_all(self) -> List[ApiDocumentation]:
         """모든 API 문서 조회"""
         return list(self._documentations.values())
@@ -46,10 +171,53 @@ class MemoryApiDocumentationRepository(ApiDocumentationRepository):
         """API 문서 삭제"""
         if project_name in self._documentations:
             del self._documentations[project_name]
+        self._invalidate(project_name)
 
     def clear(self) -> None:
         """모든 API 문서 삭제"""
         self._documentations.clear()
+        self._specs.clear()
+        self._splits.clear()
+        self._endpoint_indexes.clear()
+
+    def memory_usage(self, sample: int = SAMPLE_SIZE) -> Dict[str, Any]:
+        """프로젝트별 문서와 파생 구조(OpenAPI 변환 결과)의 메모리 사용량 추정
+
+        분할 결과/엔드포인트 인덱스는 변환 결과의 오퍼레이션을 공유하므로
+        변환 결과 크기에 포함된 것으로 본다.
+        """
+        projects: Dict[str, int] = {}
+        derived = 0
+        for project_name, documentation in list(self._documentations.items()):
+            size = estimate_size(documentation.endpoints, sample) + estimate_size(
+                documentation.components, sample
+            )
+            spec = self._specs.get(project_name)
+            if spec is not None:
+                spec_size = estimate_size(spec.get("paths", {}), sample)
+                spec_size += estimate_size(spec.get("components", {}), sample)
+                derived += spec_size
+                size += spec_size
+            projects[project_name] = size
+        return usage(
+            len(projects),
+            sum(projects.values()),
+            sample,
+            derived_bytes=derived,
+            projects=projects,
+        )
+
+    def spill(self) -> int:
+        """다시 계산할 수 있는 파생 구조 해제 (해제한 프로젝트 수)
+
+        문서 자체는 조회에 필요하므로 남기고, 변환 결과/분할/인덱스는 다음
+        조회 때 다시 만든다.
+        """
+        released = len(self._specs)
+        self._specs.clear()
+        self._splits.clear()
+        self._endpoint_indexes.clear()
+        return released
 
     def get_statistics(self) -> Dict[str, any]:
         """통계 정보 조회"""
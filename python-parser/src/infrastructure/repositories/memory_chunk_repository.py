@@ -1,15 +1,19 @@
+import sys
+import threading
 from typing import List, Dict
 from pathlib import Path
 from collections import defaultdict
 
 from ...domain.repositories.chunk_repository import ChunkRepository
 from ...domain.entities.code_chunk import CodeChunk, ChunkType
+from ..observability.memory import SAMPLE_SIZE, estimate_size, shallow_sizeof, usage
 
 
 class MemoryChunkRepository(ChunkRepository):
     """메모리 기반 청크 리포지토리"""
 
     def __init__(self):
+        self._lock = threading.RLock()
         self.chunks: List[CodeChunk] = []
         self.chunks_by_type: Dict[ChunkType, List[CodeChunk]] = defaultdict(list)
         self.chunks_by_file: Dict[Path, List[CodeChunk]] = defaultdict(list)
@@ -19,109 +23,142 @@ class MemoryChunkRepository(ChunkRepository):
 
     def save(self, chunk: CodeChunk) -> CodeChunk:
         """청크 저장"""
-        self.chunks.append(chunk)
-        self._add_to_indexes(chunk)
-        return chunk
+        with self._lock:
+            self.chunks.append(chunk)
+            self._add_to_indexes(chunk)
+            return chunk
 
     def find_by_type(self, chunk_type: ChunkType) -> List[CodeChunk]:
         """타입으로 청크 조회"""
-        return self.chunks_by_type[chunk_type].copy()
+        with self._lock:
+            return self.chunks_by_type[chunk_type].copy()
 
     def find_by_file(self, file_path: Path) -> List[CodeChunk]:
         """파일로 청크 조회"""
-        return self.chunks_by_file[file_path].copy()
+        with self._lock:
+            return self.chunks_by_file[file_path].copy()
 
     def find_by_module(self, module_path: str) -> List[CodeChunk]:
         """모듈로 청크 조회"""
-        return self.chunks_by_module[module_path].copy()
+        with self._lock:
+            return self.chunks_by_module[module_path].copy()
 
     def find_by_symbol(self, symbol_name: str) -> List[CodeChunk]:
         """심볼로 청크 조회"""
-        return self.chunks_by_symbol[symbol_name].copy()
+        with self._lock:
+            return self.chunks_by_symbol[symbol_name].copy()
 
     def find_by_complexity_range(
         self, min_complexity: int, max_complexity: int
     ) -> List[CodeChunk]:
         """복잡도 범위로 청크 조회"""
-        result = []
-        for complexity in range(min_complexity, max_complexity + 1):
-            result.extend(self.chunks_by_complexity.get(complexity, []))
-        return result
+        with self._lock:
+            result = []
+            for complexity in range(min_complexity, max_complexity + 1):
+                result.extend(self.chunks_by_complexity.get(complexity, []))
+            return result
 
     def find_large_chunks(self, min_lines: int) -> List[CodeChunk]:
         """큰 청크 조회"""
-        return [chunk for chunk in self.chunks if chunk.lines_count >= min_lines]
+        with self._lock:
+            return [chunk for chunk in self.chunks if chunk.lines_count >= min_lines]
 
     def get_all(self) -> List[CodeChunk]:
         """모든 청크 조회"""
-        return self.chunks.copy()
+        with self._lock:
+            return self.chunks.copy()
 
     def delete(self, chunk: CodeChunk) -> bool:
         """청크 삭제"""
-        if chunk in self.chunks:
-            self.chunks.remove(chunk)
-            self._remove_from_indexes(chunk)
-            return True
-        return False
+        with self._lock:
+            if chunk in self.chunks:
+                self.chunks.remove(chunk)
+                self._remove_from_indexes(chunk)
+                return True
+            return False
 
     def clear(self) -> None:
         """모든 청크 삭제"""
-        self.chunks.clear()
-        self.chunks_by_type.clear()
-        self.chunks_by_file.clear()
-        self.chunks_by_module.clear()
-        self.chunks_by_symbol.clear()
-        self.chunks_by_complexity.clear()
+        with self._lock:
+            self.chunks.clear()
+            self.chunks_by_type.clear()
+            self.chunks_by_file.clear()
+            self.chunks_by_module.clear()
+            self.chunks_by_symbol.clear()
+            self.chunks_by_complexity.clear()
+
+    def memory_usage(self, sample: int = SAMPLE_SIZE) -> Dict[str, any]:
+        """청크와 인덱스의 메모리 사용량 추정 (청크 내용 문자열 크기는 전체 합계)"""
+        with self._lock:
+            chunks = list(self.chunks)
+            size = estimate_size(chunks, sample) + shallow_sizeof(
+                self.chunks_by_type,
+                self.chunks_by_file,
+                self.chunks_by_module,
+                self.chunks_by_symbol,
+                self.chunks_by_complexity,
+            )
+            content_bytes = sum(sys.getsizeof(chunk.content) for chunk in chunks)
+            return usage(len(chunks), size, sample, content_bytes=content_bytes)
 
     def get_statistics(self) -> Dict[str, any]:
         """통계 정보 조회"""
-        total_chunks = len(self.chunks)
-        chunks_by_type = {
-            t.value: len(chunks) for t, chunks in self.chunks_by_type.items()
-        }
-        chunks_by_file = {
-            str(f): len(chunks) for f, chunks in self.chunks_by_file.items()
-        }
-        chunks_by_module = {
-            m: len(chunks) for m, chunks in self.chunks_by_module.items()
-        }
-
-        # 복잡도 통계
-        complexities = [
-            chunk.complexity for chunk in self.chunks if chunk.complexity is not None
-        ]
-        avg_complexity = sum(complexities) / len(complexities) if complexities else 0
-        max_complexity = max(complexities) if complexities else 0
-        min_complexity = min(complexities) if complexities else 0
-
-        # 라인 수 통계
-        line_counts = [chunk.lines_count for chunk in self.chunks]
-        avg_lines = sum(line_counts) / len(line_counts) if line_counts else 0
-        max_lines = max(line_counts) if line_counts else 0
-        min_lines = min(line_counts) if line_counts else 0
-
-        # 문자 수 통계
-        char_counts = [chunk.characters_count for chunk in self.chunks]
-        avg_chars = sum(char_counts) / len(char_counts) if char_counts else 0
-        max_chars = max(char_counts) if char_counts else 0
-        min_chars = min(char_counts) if char_counts else 0
-
-        return {
-            "total_chunks": total_chunks,
-            "chunks_by_type": chunks_by_type,
-            "chunks_by_file": chunks_by_file,
-            "chunks_by_module": chunks_by_module,
-            "complexity": {
-                "average": avg_complexity,
-                "max": max_complexity,
-                "min": min_complexity,
-                "distribution": {
-                    str(k): len(v) for k, v in self.chunks_by_complexity.items()
+        with self._lock:
+            total_chunks = len(self.chunks)
+            chunks_by_type = {
+                t.value: len(chunks) for t, chunks in self.chunks_by_type.items()
+            }
+            chunks_by_file = {
+                str(f): len(chunks) for f, chunks in self.chunks_by_file.items()
+            }
+            chunks_by_module = {
+                m: len(chunks) for m, chunks in self.chunks_by_module.items()
+            }
+
+            # 복잡도 통계
+            complexities = [
+                chunk.complexity
+                for chunk in self.chunks
+                if chunk.complexity is not None
+            ]
+            avg_complexity = (
+                sum(complexities) / len(complexities) if complexities else 0
+            )
+            max_complexity = max(complexities) if complexities else 0
+            min_complexity = min(complexities) if complexities else 0
+
+            # 라인 수 통계
+            line_counts = [chunk.lines_count for chunk in self.chunks]
+            avg_lines = sum(line_counts) / len(line_counts) if line_counts else 0
+            max_lines = max(line_counts) if line_counts else 0
+            min_lines = min(line_counts) if line_counts else 0
+
+            # 문자 수 통계
+            char_counts = [chunk.characters_count for chunk in self.chunks]
+            avg_chars = sum(char_counts) / len(char_counts) if char_counts else 0
+            max_chars = max(char_counts) if char_counts else 0
+            min_chars = min(char_counts) if char_counts else 0
+
+            return {
+                "total_chunks": total_chunks,
+                "chunks_by_type": chunks_by_type,
+                "chunks_by_file": chunks_by_file,
+                "chunks_by_module": chunks_by_module,
+                "complexity": {
+                    "average": avg_complexity,
+                    "max": max_complexity,
+                    "min": min_complexity,
+                    "distribution": {
+                        str(k): len(v) for k, v in self.chunks_by_complexity.items()
+                    },
                 },
-            },
-            "lines": {"average": avg_lines, "max": max_lines, "min": min_lines},
-            "characters": {"average": avg_chars, "max": max_chars, "min": min_chars},
-        }
+                "lines": {"average": avg_lines, "max": max_lines, "min": min_lines},
+                "characters": {
+                    "average": avg_chars,
+                    "max": max_chars,
+                    "min": min_chars,
+                },
+            }
 
     def _add_to_indexes(self, chunk: CodeChunk):
         """인덱스에 청크 추가"""
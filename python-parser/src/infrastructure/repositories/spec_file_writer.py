@@ -0,0 +1,154 @@
+import gzip
+import json
+import os
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Any, Iterator, List
+
+# 서빙용 파일이므로 mkstemp 기본 권한(0600) 대신 읽기 허용
+FILE_MODE = 0o644
+
+# 교체 전 임시 파일 접미사 (같은 디렉토리를 정리하는 쪽이 건너뛰도록 공개)
+TEMP_SUFFIX = ".tmp"
+
+# compact 모드에서 나눠 인코딩할 dict 깊이 (최상위 -> paths/components 항목)
+SPLIT_DEPTH = 2
+
+
+def _sync(f) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class SpecFileWriter:
+    """스펙 JSON 파일 writer
+
+    스펙을 조각 단위로 인코딩해 같은 디렉토리의 임시 파일에 쓰고
+    os.replace로 교체하므로, 파일을 읽는 쪽(Spring 서버 등)은 항상 이전 파일 또는
+    완성된 새 파일만 본다. gzip_copy면 같은 인코딩 결과를 `.json.gz`에도 동시에 쓴다.
+    """
+
+    def __init__(
+        self,
+        pretty: bool = False,
+        gzip_copy: bool = False,
+        buffer_size: int = 256 * 1024,
+        compress_level: int = 6,
+    ):
+        self.pretty = pretty
+        self.gzip_copy = gzip_copy
+        self.buffer_size = buffer_size
+        self.compress_level = compress_level
+
+    def _encoder(self) -> json.JSONEncoder:
+        if self.pretty:
+            return json.JSONEncoder(ensure_ascii=False, indent=2)
+        return json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def write(self, value: Any, file_path: Path) -> Dict[str, Any]:
+        """value를 file_path에 원자적으로 기록하고 기록 결과 요약 반환"""
+        started = time.perf_counter()
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        gzip_path = file_path.with_name(file_path.name + ".gz")
+
+        temp_paths: List[str] = []
+        try:
+            with ExitStack() as stack:
+                raw = stack.enter_context(self._temp_file(file_path, temp_paths))
+                stack.callback(_sync, raw)
+                compressed = None
+                if self.gzip_copy:
+                    gzip_raw = stack.enter_context(
+                        self._temp_file(gzip_path, temp_paths)
+                    )
+                    stack.callback(_sync, gzip_raw)
+                    compressed = stack.enter_context(
+                        gzip.GzipFile(
+                            filename=file_path.name,
+                            mode="wb",
+                            fileobj=gzip_raw,
+                            compresslevel=self.compress_level,
+                            mtime=0,
+                        )
+                    )
+                size = self._encode(value, raw, compressed)
+
+            os.replace(temp_paths[0], file_path)
+            if self.gzip_copy:
+                os.replace(temp_paths[1], gzip_path)
+            elif gzip_path.exists():
+                # 이전 설정에서 남은 압축본은 내용이 달라질 수 있으므로 삭제
+                gzip_path.unlink()
+        except BaseException:
+            for temp in temp_paths:
+                if os.path.exists(temp):
+                    os.unlink(temp)
+            raise
+
+        return {
+            "path": str(file_path),
+            "bytes": size,
+            "gzip_path": str(gzip_path) if self.gzip_copy else None,
+            "gzip_bytes": gzip_path.stat().st_size if self.gzip_copy else None,
+            "duration": time.perf_counter() - started,
+        }
+
+    @staticmethod
+    def _temp_file(target: Path, temp_paths: List[str]):
+        # 같은 디렉토리에 만들어야 os.replace가 원자적이다
+        fd, temp_path = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=TEMP_SUFFIX
+        )
+        temp_paths.append(temp_path)
+        os.fchmod(fd, FILE_MODE)
+        return os.fdopen(fd, "wb")
+
+    def _encode(self, value: Any, raw, compressed) -> int:
+        size = 0
+        buffer: List[str] = []
+        buffered = 0
+        for chunk in self._chunks(value):
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= self.buffer_size:
+                size += self._flush(buffer, raw, compressed)
+                buffer.clear()
+                buffered = 0
+        return size + self._flush(buffer, raw, compressed)
+
+    def _chunks(self, value: Any) -> Iterator[str]:
+        encoder = self._encoder()
+        if self.pretty:
+            # indent 지정 시 C 인코더를 쓸 수 없으므로 iterencode로 조각 단위 인코딩
+            return encoder.iterencode(value)
+        # compact는 iterencode(순수 Python, 수 배 느림) 대신 path item 단위로
+        # C 인코더(encode)를 호출해 메모리는 조각 크기로 묶고 속도는 유지한다
+        return self._compact_chunks(encoder, value, SPLIT_DEPTH)
+
+    def _compact_chunks(
+        self, encoder: json.JSONEncoder, value: Any, depth: int
+    ) -> Iterator[str]:
+        if (
+            depth > 0
+            and isinstance(value, dict)
+            and value
+            and all(isinstance(key, str) for key in value)
+        ):
+            yield "{"
+            for i, (key, item) in enumerate(value.items()):
+                yield ("," if i else "") + encoder.encode(key) + ":"
+                yield from self._compact_chunks(encoder, item, depth - 1)
+            yield "}"
+        else:
+            yield encoder.encode(value)
+
+    @staticmethod
+    def _flush(buffer: List[str], raw, compressed) -> int:
+        data = "".join(buffer).encode("utf-8")
+        raw.write(data)
+        if compressed:
+            compressed.write(data)
+        return len(data)
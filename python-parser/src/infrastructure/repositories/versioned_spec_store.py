@@ -0,0 +1,265 @@
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+from ..generators.openapi_components import structural_hash
+from ..generators.openapi_diff import (
+    OperationFingerprint,
+    diff_operations,
+    fingerprint_path_item,
+    referenceable_hash,
+)
+from ..observability.logs import get_logger
+from ..observability.memory import SAMPLE_SIZE, estimate_size, usage
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SpecVersion:
+    """프로젝트의 스펙 버전 하나 (본문은 저장소의 blob을 해시로 참조)"""
+
+    project: str
+    label: str
+    spec_hash: str
+    base_hash: str
+    path_hashes: Dict[str, str]
+    operations: Dict[str, OperationFingerprint]
+    created_at: str
+    source: str = "generated"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "project": self.project,
+            "version": self.label,
+            "spec_hash": self.spec_hash,
+            "total_paths": len(self.path_hashes),
+            "total_operations": len(self.operations),
+            "created_at": self.created_at,
+            "source": self.source,
+        }
+
+
+class VersionedSpecStore:
+    """버전별 OpenAPI 스펙 저장소
+
+    스펙을 공통부(paths 제외)와 경로별 path item으로 나눠 구조 해시로 저장하므로,
+    버전 사이에 바뀌지 않은 path item은 한 번만 보관된다. 버전마다 오퍼레이션 지문을
+    미리 계산해 두고 diff는 지문만 비교한다.
+    """
+
+    SNAPSHOT_FILE = "openapi.json"
+
+    def __init__(
+        self,
+        snapshot_root: Optional[Path] = None,
+        max_versions_per_project: int = 50,
+    ):
+        # `<snapshot_root>/<project>/<branch>/openapi.json` 형식의 기존 스냅샷
+        self.snapshot_root = Path(snapshot_root) if snapshot_root else None
+        self.max_versions_per_project = max_versions_per_project
+        self._blobs: Dict[str, Any] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._versions: Dict[str, Dict[str, SpecVersion]] = {}
+        self._fingerprints: Dict[Tuple[str, str], Dict[str, OperationFingerprint]] = {}
+        self._snapshots_loaded: set = set()
+        self._lock = threading.RLock()
+
+    def put(
+        self,
+        project: str,
+        label: str,
+        spec: Dict[str, Any],
+        source: str = "generated",
+        created_at: Optional[str] = None,
+    ) -> SpecVersion:
+        """스펙을 버전으로 저장 (같은 라벨이면 교체, 내용이 같으면 그대로 유지)"""
+        self._ensure_snapshots(project)
+
+        base = {key: value for key, value in spec.items() if key != "paths"}
+        base_hash = structural_hash(base)
+        refs_hash = referenceable_hash(spec)
+
+        path_hashes: Dict[str, str] = {}
+        path_items: Dict[str, Any] = {}
+        for path, item in (spec.get("paths") or {}).items():
+            digest = structural_hash(item)
+            path_hashes[path] = digest
+            path_items[digest] = item
+
+        spec_hash = structural_hash(
+            {"base": base_hash, "paths": list(path_hashes.items())}
+        )
+
+        with self._lock:
+            versions = self._versions.setdefault(project, {})
+            existing = versions.get(label)
+            if existing and existing.spec_hash == spec_hash:
+                return existing
+
+            operations: Dict[str, OperationFingerprint] = {}
+            for path, digest in path_hashes.items():
+                key = (digest, refs_hash)
+                if key not in self._fingerprints:
+                    self._fingerprints[key] = fingerprint_path_item(
+                        spec, path_items[digest]
+                    )
+                for method, fingerprint in self._fingerprints[key].items():
+                    operations[f"{method} {path}"] = fingerprint
+
+            self._retain(base_hash, base)
+            for digest, item in path_items.items():
+                self._retain(digest, item)
+
+            version = SpecVersion(
+                project=project,
+                label=label,
+                spec_hash=spec_hash,
+                base_hash=base_hash,
+                path_hashes=path_hashes,
+                operations=operations,
+                created_at=created_at or datetime.now().isoformat(),
+                source=source,
+            )
+            if existing:
+                self._drop(existing)
+            versions.pop(label, None)
+            versions[label] = version
+
+            while len(versions) > self.max_versions_per_project:
+                oldest = next(iter(versions))
+                self._drop(versions.pop(oldest))
+
+            return version
+
+    def get_version(self, project: str, label: str) -> Optional[SpecVersion]:
+        """버전 메타데이터 조회"""
+        self._ensure_snapshots(project)
+        with self._lock:
+            return self._versions.get(project, {}).get(label)
+
+    def get_spec(self, project: str, label: str) -> Optional[Dict[str, Any]]:
+        """저장된 blob으로 스펙 재조립 (공유 객체이므로 읽기 전용으로 사용)"""
+        version = self.get_version(project, label)
+        if version is None:
+            return None
+        with self._lock:
+            spec = dict(self._blobs[version.base_hash])
+            spec["paths"] = {
+                path: self._blobs[digest]
+                for path, digest in version.path_hashes.items()
+            }
+        return spec
+
+    def list_versions(self, project: str) -> List[Dict[str, Any]]:
+        """프로젝트의 버전 목록 (저장 순서)"""
+        self._ensure_snapshots(project)
+        with self._lock:
+            return [v.summary() for v in self._versions.get(project, {}).values()]
+
+    def diff(self, project: str, base: str, head: str) -> Optional[Dict[str, Any]]:
+        """두 버전의 구조 diff (버전이 없으면 None)"""
+        base_version = self.get_version(project, base)
+        head_version = self.get_version(project, head)
+        if base_version is None or head_version is None:
+            return None
+
+        result = diff_operations(base_version.operations, head_version.operations)
+        return {
+            "project": project,
+            "base": base_version.summary(),
+            "head": head_version.summary(),
+            "identical": base_version.spec_hash == head_version.spec_hash,
+            "metadata_changed": base_version.base_hash != head_version.base_hash,
+            **result,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계 (path item 참조 수 대비 실제 보관 blob 수)"""
+        with self._lock:
+            versions = [v for vs in self._versions.values() for v in vs.values()]
+            path_refs = sum(len(v.path_hashes) for v in versions)
+            return {
+                "projects": len(self._versions),
+                "versions": len(versions),
+                "blobs": len(self._blobs),
+                "path_item_refs": path_refs,
+                "dedup_ratio": (
+                    round(1 - len(self._blobs) / (path_refs + len(versions)), 3)
+                    if versions
+                    else 0.0
+                ),
+            }
+
+    def memory_usage(self, sample: int = SAMPLE_SIZE) -> Dict[str, Any]:
+        """blob(공통부/path item)과 오퍼레이션 지문의 메모리 사용량 추정
+
+        blob은 버전/프로젝트 사이에 공유되므로 프로젝트별로는 버전 수만 보고한다.
+        """
+        with self._lock:
+            blobs = list(self._blobs.values())
+            fingerprints = list(self._fingerprints.values())
+            versions = {
+                project: len(project_versions)
+                for project, project_versions in self._versions.items()
+            }
+        size = estimate_size(blobs, sample) + estimate_size(fingerprints, sample)
+        return usage(len(blobs), size, sample, versions=versions)
+
+    def _ensure_snapshots(self, project: str) -> None:
+        # 디스크 스냅샷은 프로젝트를 처음 조회할 때 한 번만 읽는다
+        if self.snapshot_root is None or project in self._snapshots_loaded:
+            return
+        with self._lock:
+            if project in self._snapshots_loaded:
+                return
+            self._snapshots_loaded.add(project)
+
+            project_dir = self.snapshot_root / project
+            if not project_dir.is_dir():
+                return
+            for spec_file in sorted(project_dir.rglob(self.SNAPSHOT_FILE)):
+                label = spec_file.parent.relative_to(project_dir).as_posix()
+                try:
+                    with open(spec_file, "r", encoding="utf-8") as f:
+                        spec = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning("스냅샷 로드 실패: %s (%s)", spec_file, e)
+                    continue
+                self.put(
+                    project,
+                    label,
+                    spec,
+                    source="snapshot",
+                    created_at=datetime.fromtimestamp(
+                        spec_file.stat().st_mtime
+                    ).isoformat(),
+                )
+            logger.info(
+                "스펙 스냅샷 로드: %s (%s개 버전)",
+                project,
+                len(self._versions.get(project, {})),
+            )
+
+    def _retain(self, digest: str, value: Any) -> None:
+        if digest not in self._blobs:
+            self._blobs[digest] = value
+        self._refcounts[digest] = self._refcounts.get(digest, 0) + 1
+
+    def _release(self, digest: str) -> None:
+        count = self._refcounts.get(digest, 0) - 1
+        if count > 0:
+            self._refcounts[digest] = count
+            return
+        self._refcounts.pop(digest, None)
+        self._blobs.pop(digest, None)
+        for key in [k for k in self._fingerprints if k[0] == digest]:
+            del self._fingerprints[key]
+
+    def _drop(self, version: SpecVersion) -> None:
+        self._release(version.base_hash)
+        for digest in set(version.path_hashes.values()):
+            self._release(digest)
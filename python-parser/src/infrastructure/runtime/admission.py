@@ -0,0 +1,267 @@
+import asyncio
+import math
+import os
+import time
+import zipfile
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Awaitable, Callable, Deque, Dict, Any, Mapping, Optional, TypeVar
+
+from ..observability.logs import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 비용 단위 (소스/압축 해제 크기 1MB = 1)
+COST_UNIT_BYTES = 1024 * 1024
+
+# 이름 -> (동시 실행 수, 대기열 길이, 동시 비용 상한, 클라이언트별 대기 수, 최대 대기 초)
+DEFAULT_LIMITS: Dict[str, tuple] = {
+    "analysis": (1, 8, 256, 2, 120.0),
+    "upload": (1, 4, 256, 1, 60.0),
+    "generation": (1, 8, 256, 2, 300.0),
+}
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과돼 작업을 받지 않음"""
+
+    def __init__(self, name: str, reason: str, retry_after: int):
+        super().__init__(f"{name} is busy: {reason}")
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def cost_from_bytes(size: int) -> float:
+    """바이트 크기를 비용 단위로 변환 (최소 1)"""
+    return max(1.0, size / COST_UNIT_BYTES)
+
+
+def estimate_directory_cost(project_path: Path) -> float:
+    """디렉토리의 .py 파일 총 크기 기반 비용"""
+    # 스케줄러/생성기 모듈은 서버 시작 시 import하지 않는다
+    from .project_scheduler import estimate_project_size
+
+    return cost_from_bytes(estimate_project_size(Path(project_path)))
+
+
+def estimate_zip_cost(zip_file) -> float:
+    """zip 중앙 디렉토리만 읽어 압축 해제 후 크기로 비용 추정"""
+    try:
+        with zipfile.ZipFile(zip_file) as z:
+            return cost_from_bytes(sum(info.file_size for info in z.infolist()))
+    except zipfile.BadZipFile:
+        return 1.0
+
+
+class _Waiter:
+    __slots__ = ("client", "cost", "future")
+
+    def __init__(self, client: str, cost: float, future: asyncio.Future):
+        self.client = client
+        self.cost = cost
+        self.future = future
+
+
+class AdmissionController:
+    """엔드포인트 그룹 하나의 입장 제어
+
+    동시 실행 수와 동시 비용(추정 크기 합) 상한 안에서만 작업을 시작하고, 나머지는
+    제한된 대기열에 둔다. 대기열은 클라이언트별로 나눠 라운드 로빈으로 꺼내므로 한
+    클라이언트가 요청을 몰아 보내도 다른 클라이언트가 밀리지 않는다. 상한보다 큰
+    작업은 아무것도 실행 중이지 않을 때 단독으로 실행한다. 대기열이 가득 차거나
+    대기 시간이 초과되면 예상 대기 시간(Retry-After)과 함께 AdmissionRejected를 던진다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 1,
+        max_queue: int = 8,
+        max_cost: float = 256,
+        max_queue_per_client: int = 2,
+        max_wait: float = 120.0,
+    ):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.max_cost = max_cost
+        self.max_queue_per_client = max(1, max_queue_per_client)
+        self.max_wait = max_wait
+
+        self._running = 0
+        self._running_cost = 0.0
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._waiting = 0
+        self._durations: Deque[float] = deque(maxlen=20)
+        self.admitted = 0
+        self.rejected = 0
+
+    async def run(
+        self, client: str, cost: float, factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """입장 후 factory() 실행 (끝나면 자리를 다음 대기자에게 넘김)"""
+        await self._acquire(client, cost)
+        started = time.monotonic()
+        try:
+            return await factory()
+        finally:
+            self._durations.append(time.monotonic() - started)
+            self._release(cost)
+
+    async def _acquire(self, client: str, cost: float) -> None:
+        if not self._waiting and self._fits(cost):
+            self._start(cost)
+            return
+
+        if self._waiting >= self.max_queue:
+            self._reject("queue is full")
+        queue = self._queues.get(client)
+        if queue is not None and len(queue) >= self.max_queue_per_client:
+            self._reject(f"too many queued requests from {client}")
+
+        waiter = _Waiter(client, cost, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(client, deque()).append(waiter)
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.max_wait)
+        except asyncio.TimeoutError:
+            if not self._remove(waiter):
+                return  # 시간 초과와 동시에 입장 허가됨
+            self._reject(f"waited longer than {self.max_wait:.0f}s")
+        except asyncio.CancelledError:
+            if not self._remove(waiter):
+                # 허가 직후 취소되면 받은 자리를 반납
+                self._release(cost)
+            raise
+
+    def _fits(self, cost: float) -> bool:
+        if self._running >= self.max_concurrency:
+            return False
+        return self._running == 0 or self._running_cost + cost <= self.max_cost
+
+    def _start(self, cost: float) -> None:
+        self._running += 1
+        self._running_cost += cost
+        self.admitted += 1
+
+    def _release(self, cost: float) -> None:
+        self._running -= 1
+        self._running_cost = max(0.0, self._running_cost - cost)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        # 라운드 로빈: 맨 앞 클라이언트의 첫 대기자가 들어갈 수 없으면 멈춘다
+        # (작은 작업이 큰 작업을 계속 앞지르지 않도록)
+        while self._queues:
+            client, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+            if not self._fits(waiter.cost):
+                return
+            queue.popleft()
+            self._waiting -= 1
+            self._queues.pop(client)
+            if queue:
+                self._queues[client] = queue  # 다음 차례는 맨 뒤로
+            self._start(waiter.cost)
+            waiter.future.set_result(None)
+
+    def _remove(self, waiter: _Waiter) -> bool:
+        """대기열에서 제거 (이미 입장 허가됐으면 False)"""
+        if waiter.future.done():
+            return False
+        queue = self._queues.get(waiter.client)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self._waiting -= 1
+            if not queue:
+                del self._queues[waiter.client]
+        waiter.future.cancel()
+        # 맨 앞 대기자가 빠지면 뒤의 작업이 들어갈 수 있다
+        self._dispatch()
+        return True
+
+    def retry_after(self) -> int:
+        """최근 실행 시간으로 추정한 대기열 소진 시간 (초)"""
+        average = (
+            sum(self._durations) / len(self._durations) if self._durations else 1.0
+        )
+        rounds = math.ceil((self._waiting + 1) / self.max_concurrency)
+        return max(1, math.ceil(average * rounds))
+
+    def _reject(self, reason: str) -> None:
+        self.rejected += 1
+        retry_after = self.retry_after()
+        logger.warning(
+            "요청 거절 (%s): %s, Retry-After %ss", self.name, reason, retry_after
+        )
+        raise AdmissionRejected(self.name, reason, retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "running": self._running,
+            "running_cost": round(self._running_cost, 1),
+            "waiting": self._waiting,
+            "waiting_clients": len(self._queues),
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "max_cost": self.max_cost,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after(),
+        }
+
+
+class AdmissionControl:
+    """엔드포인트 그룹별 입장 제어 모음"""
+
+    def __init__(self, controllers: Mapping[str, AdmissionController]):
+        self._controllers = dict(controllers)
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "AdmissionControl":
+        """`ADMISSION_<NAME>_{CONCURRENCY,QUEUE,MAX_COST,PER_CLIENT,MAX_WAIT}`로 구성"""
+        controllers = {}
+        for name, defaults in DEFAULT_LIMITS.items():
+            prefix = f"ADMISSION_{name.upper()}"
+            concurrency, queue, max_cost, per_client, max_wait = defaults
+            controllers[name] = AdmissionController(
+                name,
+                max_concurrency=int(environ.get(f"{prefix}_CONCURRENCY", concurrency)),
+                max_queue=int(environ.get(f"{prefix}_QUEUE", queue)),
+                max_cost=float(environ.get(f"{prefix}_MAX_COST", max_cost)),
+                max_queue_per_client=int(
+                    environ.get(f"{prefix}_PER_CLIENT", per_client)
+                ),
+                max_wait=float(environ.get(f"{prefix}_MAX_WAIT", max_wait)),
+            )
+        return cls(controllers)
+
+    def controller(self, name: str) -> AdmissionController:
+        return self._controllers[name]
+
+    async def run(
+        self,
+        name: str,
+        client: str,
+        cost: float,
+        factory: Callable[[], Awaitable[T]],
+    ) -> T:
+        return await self._controllers[name].run(client, cost, factory)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: c.stats() for name, c in self._controllers.items()}
+
+
+_default_admission: Optional[AdmissionControl] = None
+
+
+def get_admission() -> AdmissionControl:
+    """프로세스 전체에서 공유하는 입장 제어 (이벤트 루프 스레드에서만 사용)"""
+    global _default_admission
+    if _default_admission is None:
+        _default_admission = AdmissionControl.from_env()
+    return _default_admission
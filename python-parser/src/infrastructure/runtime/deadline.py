@@ -0,0 +1,123 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class DeadlineExceeded(Exception):
+    """작업을 시작하기 전에 이미 기한이 지났거나 취소됨"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class Deadline:
+    """요청 기한과 협조적 취소 신호
+
+    HTTP 요청에서 만들어 contextvars로 전달하므로 분석/생성 풀의 스레드에서도
+    current_deadline()으로 볼 수 있다. 작업 루프는 파일/ViewSet 사이에서
+    expired()를 확인해 남은 항목을 건너뛰고 부분 결과를 돌려준다.
+
+    합쳐진(coalesced) 요청은 하나의 Deadline을 공유한다. 호출자마다 attach()로
+    기한을 늘리고, 모든 호출자가 detach()하면 (연결이 끊기면) 작업을 취소한다.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+        self._cancelled = threading.Event()
+        self._reason: Optional[str] = None
+        self._lock = threading.Lock()
+        self._holders = 0
+
+    def attach(self, timeout: Optional[float] = None) -> None:
+        """호출자 등록 (기한은 등록된 호출자 중 가장 늦은 기한)"""
+        with self._lock:
+            self._holders += 1
+            if self.expires_at is None:
+                return
+            if timeout is None:
+                self.expires_at = None
+            else:
+                self.expires_at = max(self.expires_at, time.monotonic() + timeout)
+
+    def detach(self, reason: str = "client disconnected") -> None:
+        """호출자 해제 (남은 호출자가 없으면 취소)"""
+        with self._lock:
+            self._holders = max(0, self._holders - 1)
+            if self._holders:
+                return
+        self.cancel(reason)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            if self._reason is None:
+                self._reason = reason
+        self._cancelled.set()
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초, 기한이 없으면 None)"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        if self._cancelled.is_set():
+            return True
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    @property
+    def reason(self) -> Optional[str]:
+        """중단 사유 (아직 유효하면 None)"""
+        if self._cancelled.is_set():
+            return self._reason
+        if self.expired():
+            return "deadline exceeded"
+        return None
+
+    def check(self) -> None:
+        """이미 중단됐으면 DeadlineExceeded"""
+        if self.expired():
+            raise DeadlineExceeded(self.reason)
+
+    def stats(self) -> Dict[str, Any]:
+        remaining = self.remaining()
+        return {
+            "remaining": None if remaining is None else round(remaining, 3),
+            "holders": self._holders,
+            "stopped": self.reason,
+        }
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 요청의 기한 (요청 밖에서 실행 중이면 None)"""
+    return _current_deadline.get()
+
+
+def stop_reason() -> Optional[str]:
+    """현재 요청을 중단해야 하면 그 사유, 아니면 None (루프 사이 확인용)"""
+    deadline = _current_deadline.get()
+    return deadline.reason if deadline is not None else None
+
+
+def check_deadline() -> None:
+    """현재 요청이 이미 중단됐으면 DeadlineExceeded (작업 시작 전 확인용)"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """블록 안에서 (그리고 그 안에서 제출한 풀 작업에서) deadline을 현재 기한으로 사용"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
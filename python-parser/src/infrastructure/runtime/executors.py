@@ -0,0 +1,151 @@
+import asyncio
+import atexit
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Mapping, Optional
+
+EXECUTOR_KINDS = ("thread", "process")
+
+# 풀 이름 -> (종류, 기본 크기)
+# analysis/generation은 메모리 리포지토리와 (워커 미사용 시) Django 전역 설정을 공유하므로
+# 기본 1개로 이벤트 루프에서 실행하던 때와 같은 직렬 실행을 유지한다
+DEFAULT_POOLS: Dict[str, tuple] = {
+    "analysis": ("thread", 1),
+    "generation": ("thread", 1),
+    "io": ("thread", 4),
+}
+
+
+class ExecutorPool:
+    """이름 있는 전용 실행기 (스레드 또는 프로세스)
+
+    실행기는 처음 제출할 때 만든다. 제출/완료 수로 실행 중·대기 중 작업 수를 센다.
+    프로세스 풀은 pickle 가능한 모듈 수준 함수와 인자만 실행할 수 있다.
+    """
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: int = 1):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=f"{self.name}-worker",
+                    )
+            return self._executor
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """작업 제출 (스레드 풀은 호출 시점의 contextvars를 이어받음)"""
+        if self.kind == "thread":
+            call = functools.partial(
+                contextvars.copy_context().run, func, *args, **kwargs
+            )
+        else:
+            call = functools.partial(func, *args, **kwargs)
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._get_executor().submit(call)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """작업을 풀에서 실행하고 결과를 기다림 (이벤트 루프는 막지 않음)"""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """실행 중/대기 중 작업 수와 누적 결과"""
+        with self._lock:
+            running = min(self._in_flight, self.max_workers)
+            return {
+                "name": self.name,
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "running": running,
+                "queued": self._in_flight - running,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class BlockingExecutors:
+    """async 엔드포인트의 블로킹 작업을 전용 풀로 보내는 실행기 모음"""
+
+    def __init__(self, pools: Mapping[str, ExecutorPool]):
+        self._pools = dict(pools)
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "BlockingExecutors":
+        """환경변수 `RUNTIME_<POOL>_WORKERS`/`RUNTIME_<POOL>_EXECUTOR`로 풀 구성"""
+        pools = {}
+        for name, (kind, size) in DEFAULT_POOLS.items():
+            prefix = f"RUNTIME_{name.upper()}"
+            pools[name] = ExecutorPool(
+                name,
+                kind=environ.get(f"{prefix}_EXECUTOR", kind).lower(),
+                max_workers=int(environ.get(f"{prefix}_WORKERS", size)),
+            )
+        return cls(pools)
+
+    def pool(self, name: str) -> ExecutorPool:
+        return self._pools[name]
+
+    async def run(self, pool: str, func: Callable, *args, **kwargs) -> Any:
+        """지정한 풀에서 블로킹 함수 실행"""
+        return await self._pools[pool].run(func, *args, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+    def shutdown(self, wait: bool = False) -> None:
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+
+
+_default_executors: Optional[BlockingExecutors] = None
+_default_lock = threading.Lock()
+
+
+def get_executors() -> BlockingExecutors:
+    """프로세스 전체에서 공유하는 기본 실행기 (처음 호출 시 환경변수로 구성)"""
+    global _default_executors
+    with _default_lock:
+        if _default_executors is None:
+            _default_executors = BlockingExecutors.from_env()
+            atexit.register(_default_executors.shutdown)
+        return _default_executors
@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..observability.logs import get_logger
+from ..observability.memory import SAMPLE_SIZE, process_memory
+
+logger = get_logger(__name__)
+
+# 분석 결과가 소스 크기의 몇 배를 차지하는지 아직 모를 때 쓰는 배수
+DEFAULT_ANALYSIS_FACTOR = 8.0
+
+# 수집한 사용량을 재사용하는 시간 (초, 예산 확인이 몰릴 때 반복 측정 방지)
+USAGE_TTL = 5.0
+
+POLICIES = ("reject", "spill")
+
+UsageFn = Callable[[int], Dict[str, Any]]
+SpillFn = Callable[[], int]
+
+
+class MemoryBudgetExceeded(Exception):
+    """정리 후에도 예상 메모리 사용량이 예산을 넘어 새 작업을 받지 않음"""
+
+    def __init__(self, projected: int, limit: int):
+        super().__init__(
+            f"memory budget exceeded: {projected / 2**20:.1f}MB projected, "
+            f"limit {limit / 2**20:.1f}MB"
+        )
+        self.projected = projected
+        self.limit = limit
+
+
+class MemoryAccounting:
+    """저장소별/프로젝트별 메모리 사용량 수집과 예산 확인
+
+    저장소는 register()로 사용량 함수(표본 크기 -> {items, bytes, projects?})와
+    선택적으로 정리 함수(다시 계산하거나 디스크에서 읽을 수 있는 메모리 해제)를
+    등록한다. 예산(limit_bytes)이 0이면 확인하지 않는다.
+    """
+
+    def __init__(
+        self,
+        limit_bytes: int = 0,
+        policy: str = "reject",
+        sample: int = SAMPLE_SIZE,
+        ttl: float = USAGE_TTL,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown memory budget policy: {policy}")
+        self.limit_bytes = limit_bytes
+        self.policy = policy
+        self.sample = sample
+        self.ttl = ttl
+        self.rejected = 0
+        self.spills = 0
+        self._sources: Dict[str, Tuple[UsageFn, Optional[SpillFn]]] = {}
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "MemoryAccounting":
+        """`MEMORY_BUDGET_MB`(0이면 끔), `MEMORY_BUDGET_POLICY`(reject|spill),
+        `MEMORY_SAMPLE_SIZE`로 구성"""
+        return cls(
+            limit_bytes=int(float(environ.get("MEMORY_BUDGET_MB", 0)) * 2**20),
+            policy=environ.get("MEMORY_BUDGET_POLICY", "reject").lower(),
+            sample=int(environ.get("MEMORY_SAMPLE_SIZE", SAMPLE_SIZE)),
+        )
+
+    def register(
+        self, name: str, usage_fn: UsageFn, spill_fn: Optional[SpillFn] = None
+    ) -> None:
+        """사용량을 집계할 저장소 등록 (같은 이름이면 교체)"""
+        with self._lock:
+            self._sources[name] = (usage_fn, spill_fn)
+            self._cached = None
+
+    def usage(self, refresh: bool = False) -> Dict[str, Any]:
+        """저장소별/프로젝트별 사용량과 예산, 프로세스 RSS"""
+        with self._lock:
+            cached = self._cached
+            sources = dict(self._sources)
+        if cached and not refresh and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        started = time.perf_counter()
+        collected: Dict[str, Dict[str, Any]] = {}
+        projects: Dict[str, int] = {}
+        for name, (usage_fn, _) in sources.items():
+            try:
+                collected[name] = usage_fn(self.sample)
+            except Exception as e:
+                collected[name] = {"items": 0, "bytes": 0, "error": str(e)}
+            for project, size in collected[name].get("projects", {}).items():
+                projects[project] = projects.get(project, 0) + size
+        result = {
+            "total_bytes": sum(source["bytes"] for source in collected.values()),
+            "sources": collected,
+            "projects": dict(sorted(projects.items(), key=lambda x: -x[1])),
+            "budget": {
+                "limit_bytes": self.limit_bytes,
+                "policy": self.policy,
+                "rejected": self.rejected,
+                "spills": self.spills,
+            },
+            "process": process_memory(),
+            "collection_seconds": round(time.perf_counter() - started, 4),
+        }
+        with self._lock:
+            self._cached = (time.monotonic(), result)
+        return result
+
+    def expected_analysis_bytes(self, source_bytes: int) -> int:
+        """새 분석이 차지할 메모리 추정 (직전 분석의 결과 크기 / 소스 크기 배수 사용)"""
+        analysis = self.usage()["sources"].get("analysis", {})
+        factor = DEFAULT_ANALYSIS_FACTOR
+        if analysis.get("source_bytes") and analysis.get("bytes"):
+            factor = analysis["bytes"] / analysis["source_bytes"]
+        return int(source_bytes * factor)
+
+    def check(self, expected_bytes: int = 0, replaces: Iterable[str] = ()) -> None:
+        """새 작업을 받아도 예산 안인지 확인
+
+        replaces의 저장소는 새 작업이 내용을 교체하므로 예상치에서 뺀다.
+        policy가 spill이면 넘을 때 정리 함수를 실행한 뒤 다시 확인한다 (이미
+        예상치에서 뺀 replaces 저장소는 정리해도 결과가 같으므로 건너뜀).
+        """
+        if self.limit_bytes <= 0:
+            return
+        replaces = tuple(replaces)
+        projected = self._projected(self.usage(), expected_bytes, replaces)
+        if projected <= self.limit_bytes:
+            return
+
+        if self.policy == "spill":
+            released = self.spill(skip=replaces)
+            projected = self._projected(
+                self.usage(refresh=True), expected_bytes, replaces
+            )
+            logger.warning(
+                "메모리 예산 초과로 정리: %s",
+                ", ".join(f"{name} {count}개" for name, count in released.items()),
+                projected_bytes=projected,
+                limit_bytes=self.limit_bytes,
+            )
+            if projected <= self.limit_bytes:
+                return
+
+        self.rejected += 1
+        raise MemoryBudgetExceeded(projected, self.limit_bytes)
+
+    def spill(self, skip: Iterable[str] = ()) -> Dict[str, int]:
+        """skip을 뺀 등록된 정리 함수 실행 (저장소 이름 -> 해제한 항목 수)"""
+        skip = set(skip)
+        with self._lock:
+            spillers = {
+                name: spill_fn
+                for name, (_, spill_fn) in self._sources.items()
+                if spill_fn is not None and name not in skip
+            }
+            self._cached = None
+        self.spills += 1
+        return {name: spill_fn() for name, spill_fn in spillers.items()}
+
+    @staticmethod
+    def _projected(usage: Dict[str, Any], expected: int, replaces) -> int:
+        replaced = sum(
+            usage["sources"].get(name, {}).get("bytes", 0) for name in replaces
+        )
+        return usage["total_bytes"] - replaced + expected
+
+
+_default_accounting: Optional[MemoryAccounting] = None
+
+
+def get_memory_accounting() -> MemoryAccounting:
+    """프로세스 전체에서 공유하는 메모리 집계/예산"""
+    global _default_accounting
+    if _default_accounting is None:
+        _default_accounting = MemoryAccounting.from_env()
+    return _default_accounting
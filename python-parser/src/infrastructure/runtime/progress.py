@@ -0,0 +1,286 @@
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class ProgressTracker:
+    """작업 하나의 진행 카운터
+
+    작업 스레드에서 단계 시작(phase)과 항목 완료(advance)를 기록하고, 이벤트 루프는
+    snapshot()으로 처리량/예상 남은 시간/단계별 소요 시간을 읽는다. 갱신마다
+    version이 올라가므로 스트림은 바뀐 경우에만 이벤트를 보낸다.
+    """
+
+    def __init__(self, kind: str, target: Optional[str] = None):
+        self.kind = kind
+        self.target = target
+        self.started = time.monotonic()
+        self.ended: Optional[float] = None
+        self.version = 0
+        self.finished = False
+        self._lock = threading.Lock()
+        self._phases: List[Dict[str, Any]] = []
+        self._current: Optional[str] = None
+        self._results: List[Dict[str, Any]] = []
+
+    def phase(self, name: str, total: Optional[int] = None) -> None:
+        """새 단계 시작 (이전 단계 소요 시간 확정)"""
+        with self._lock:
+            now = time.monotonic()
+            self._close_phase(now)
+            self._phases.append(
+                {
+                    "name": name,
+                    "started": now,
+                    "duration": None,
+                    "done": 0,
+                    "total": total,
+                }
+            )
+            self._current = None
+            self.version += 1
+
+    def advance(self, item: Optional[str] = None, count: int = 1) -> None:
+        """현재 단계의 항목 완료 (item은 다음에 처리할/처리 중인 항목 이름)"""
+        with self._lock:
+            if not self._phases:
+                return
+            self._phases[-1]["done"] += count
+            if item is not None:
+                self._current = item
+            self.version += 1
+
+    def current(self, item: str) -> None:
+        """처리 중인 항목 표시"""
+        with self._lock:
+            self._current = item
+            self.version += 1
+
+    def result(self, outcome: Dict[str, Any]) -> None:
+        """끝난 항목의 결과 기록 (작업 전체가 끝나기 전에 스트림으로 전달됨)"""
+        with self._lock:
+            self._results.append(outcome)
+            self.version += 1
+
+    def finish(self) -> None:
+        with self._lock:
+            self.ended = time.monotonic()
+            self._close_phase(self.ended)
+            self._current = None
+            self.finished = True
+            self.version += 1
+
+    def _close_phase(self, now: float) -> None:
+        if self._phases and self._phases[-1]["duration"] is None:
+            self._phases[-1]["duration"] = now - self._phases[-1]["started"]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 단계의 진행률/처리량/ETA와 단계별 소요 시간"""
+        with self._lock:
+            now = self.ended if self.finished else time.monotonic()
+            phases = [
+                {
+                    "name": p["name"],
+                    "done": p["done"],
+                    "total": p["total"],
+                    "duration": round(
+                        (
+                            (now - p["started"])
+                            if p["duration"] is None
+                            else p["duration"]
+                        ),
+                        3,
+                    ),
+                }
+                for p in self._phases
+            ]
+            snapshot: Dict[str, Any] = {
+                "kind": self.kind,
+                "target": self.target,
+                "elapsed": round(now - self.started, 3),
+                "finished": self.finished,
+                "phases": phases,
+            }
+            if self._results:
+                snapshot["results"] = list(self._results)
+            if self._phases and not self.finished:
+                phase = self._phases[-1]
+                elapsed = now - phase["started"]
+                throughput = phase["done"] / elapsed if elapsed > 0 else 0.0
+                remaining = (
+                    max(0, phase["total"] - phase["done"])
+                    if phase["total"] is not None
+                    else None
+                )
+                snapshot.update(
+                    {
+                        "phase": phase["name"],
+                        "done": phase["done"],
+                        "total": phase["total"],
+                        "current": self._current,
+                        "throughput": round(throughput, 2),
+                        "eta": (
+                            round(remaining / throughput, 1)
+                            if remaining is not None and throughput > 0
+                            else None
+                        ),
+                    }
+                )
+            return snapshot
+
+
+_current_progress: contextvars.ContextVar[Optional[ProgressTracker]] = (
+    contextvars.ContextVar("progress", default=None)
+)
+
+
+def current_progress() -> Optional[ProgressTracker]:
+    """현재 작업의 진행 카운터 (없으면 None)"""
+    return _current_progress.get()
+
+
+def progress_phase(name: str, total: Optional[int] = None) -> None:
+    """현재 작업의 새 단계 시작 (진행 카운터가 없으면 무시)"""
+    tracker = _current_progress.get()
+    if tracker is not None:
+        tracker.phase(name, total)
+
+
+def progress_advance(item: Optional[str] = None, count: int = 1) -> None:
+    """현재 단계의 항목 완료 (진행 카운터가 없으면 무시)"""
+    tracker = _current_progress.get()
+    if tracker is not None:
+        tracker.advance(item, count)
+
+
+def progress_result(outcome: Dict[str, Any]) -> None:
+    """끝난 항목의 결과 기록 (진행 카운터가 없으면 무시)"""
+    tracker = _current_progress.get()
+    if tracker is not None:
+        tracker.result(outcome)
+
+
+def progress_current(item: str) -> None:
+    """처리 중인 항목 표시 (진행 카운터가 없으면 무시)"""
+    tracker = _current_progress.get()
+    if tracker is not None:
+        tracker.current(item)
+
+
+@contextmanager
+def progress_scope(tracker: Optional[ProgressTracker]) -> Iterator[None]:
+    """블록 안에서 (그리고 그 안에서 제출한 풀 작업에서) tracker에 진행 상황 기록"""
+    token = _current_progress.set(tracker)
+    try:
+        yield
+    finally:
+        _current_progress.reset(token)
+
+
+class _Job:
+    def __init__(self, job_id: str, kind: str, target: Optional[str]):
+        self.job_id = job_id
+        self.kind = kind
+        self.target = target
+        self.started = time.monotonic()
+        self.ended: Optional[float] = None
+        self.status = "running"
+        self.error: Optional[str] = None
+        self.tracker: Optional[ProgressTracker] = None
+        # 한 요청이 여러 작업을 차례로 실행하면 (analyze-all) 끝난 작업 요약
+        self.steps: List[Dict[str, Any]] = []
+        self.version = 0
+
+
+class ProgressRegistry:
+    """요청(job id)별 진행 상황 목록
+
+    한 요청은 여러 작업을 차례로 실행할 수 있고, 합쳐진 요청들은 같은 작업의
+    카운터를 공유한다. 끝난 요청은 retention초 동안 조회할 수 있다.
+    이벤트 루프 스레드에서만 사용한다.
+    """
+
+    def __init__(self, retention: float = 300.0, max_finished: int = 50):
+        self.retention = retention
+        self.max_finished = max_finished
+        self._jobs: "OrderedDict[str, _Job]" = OrderedDict()
+
+    def open(self, job_id: str, kind: str, target: Optional[str] = None) -> bool:
+        """요청 등록 (이미 실행 중인 같은 id가 있으면 False)"""
+        self._expire()
+        job = self._jobs.get(job_id)
+        if job is not None and job.status == "running":
+            return False
+        self._jobs[job_id] = _Job(job_id, kind, target)
+        self._jobs.move_to_end(job_id)
+        return True
+
+    def attach(self, job_id: str, tracker: ProgressTracker) -> None:
+        """요청이 실행하는 작업의 카운터 연결 (이전 작업은 요약으로 보관)"""
+        job = self._jobs.get(job_id)
+        if job is None or job.tracker is tracker:
+            return
+        if job.tracker is not None:
+            job.steps.append(job.tracker.snapshot())
+        job.tracker = tracker
+        job.version += 1
+
+    def close(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        job.status = status
+        job.error = error
+        job.ended = time.monotonic()
+        job.version += 1
+
+    def version(self, job_id: str) -> Optional[Tuple[int, int]]:
+        """변경 감지용 버전 (요청 상태, 현재 작업 카운터)"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        return job.version, job.tracker.version if job.tracker is not None else 0
+
+    def snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        end = job.ended if job.ended is not None else time.monotonic()
+        return {
+            "job_id": job.job_id,
+            "kind": job.kind,
+            "target": job.target,
+            "status": job.status,
+            "error": job.error,
+            "elapsed": round(end - job.started, 3),
+            "progress": job.tracker.snapshot() if job.tracker is not None else None,
+            "steps": list(job.steps),
+        }
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        self._expire()
+        return [
+            {
+                "job_id": job.job_id,
+                "kind": job.kind,
+                "target": job.target,
+                "status": job.status,
+            }
+            for job in self._jobs.values()
+        ]
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        finished = [j for j in self._jobs.values() if j.ended is not None]
+        excess = len(finished) - self.max_finished
+        for job in finished:
+            if excess > 0 or now - job.ended > self.retention:
+                del self._jobs[job.job_id]
+                excess -= 1
+
+
+# 프로세스 전체에서 공유하는 진행 상황 목록
+default_progress = ProgressRegistry()
@@ -0,0 +1,195 @@
+import multiprocessing
+import os
+import time
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..generators.viewset_discovery import EXCLUDED_DIRS
+from .deadline import current_deadline
+from ..observability.logs import get_logger
+
+logger = get_logger(__name__)
+
+# 요청 기한이 있을 때 취소 여부를 확인하는 간격 (초)
+CANCEL_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class ProjectOutcome:
+    """프로젝트 하나의 처리 결과"""
+
+    project_path: Path
+    status: str  # success | failed | timeout | skipped | cancelled
+    result: Any = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+def estimate_project_size(project_path: Path) -> int:
+    """프로젝트 .py 파일 총 크기 (스케줄 순서 결정용)"""
+    total = 0
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        for name in files:
+            if name.endswith(".py"):
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+    return total
+
+
+def _run_in_child(connection, target: Callable, project_path: Path, kwargs) -> None:
+    try:
+        result = target(project_path, **kwargs)
+        connection.send(("ok", result))
+    except BaseException as e:
+        traceback.print_exc()
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+class _RunningJob:
+    def __init__(self, project_path: Path, process, connection, timeout: float):
+        self.project_path = project_path
+        self.process = process
+        self.connection = connection
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+
+    def finish(self, status: str, result=None, error=None) -> ProjectOutcome:
+        self.connection.close()
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(2)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        return ProjectOutcome(
+            project_path=self.project_path,
+            status=status,
+            result=result,
+            error=error,
+            duration=time.monotonic() - self.started,
+        )
+
+
+class ProjectScheduler:
+    """프로젝트별 작업을 격리된 프로세스에서 병렬 실행하는 스케줄러
+
+    동시 실행 수를 제한하고, 작은 프로젝트부터 시작하며, 제한 시간을 넘긴 프로세스는
+    종료시킨다. 결과는 끝나는 순서대로 내보낸다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        project_timeout: float = 300.0,
+        start_method: str = "spawn",
+    ):
+        self.max_concurrency = max_concurrency or min(4, os.cpu_count() or 1)
+        self.project_timeout = project_timeout
+        # 서버 스레드와 함께 fork하지 않도록 기본은 spawn
+        self._context = multiprocessing.get_context(start_method)
+
+    def order(self, project_paths: Iterable[Path]) -> List[Path]:
+        """작은 프로젝트 우선 순서"""
+        sized = [(estimate_project_size(p), p.name, p) for p in project_paths]
+        return [path for _, _, path in sorted(sized)]
+
+    def run(
+        self,
+        project_paths: Iterable[Path],
+        target: Callable,
+        kwargs: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+        project_timeout: Optional[float] = None,
+    ) -> Iterator[ProjectOutcome]:
+        """target(project_path, **kwargs)를 프로젝트마다 실행하고 완료 순으로 결과 반환
+
+        target과 kwargs, 반환값은 pickle 가능해야 한다. 호출 스레드에 요청 기한이
+        있으면 기한이 지나거나 취소될 때 실행 중인 프로세스를 종료하고(cancelled)
+        시작하지 않은 프로젝트는 건너뛴다(skipped).
+        """
+        pending = self.order(project_paths)
+        concurrency = max(1, max_concurrency or self.max_concurrency)
+        timeout = project_timeout or self.project_timeout
+        running: Dict[Any, _RunningJob] = {}
+        deadline = current_deadline()
+
+        try:
+            while pending or running:
+                if deadline is not None and deadline.expired():
+                    reason = deadline.reason
+                    logger.warning(
+                        "전체 생성 중단 (%s): 실행 중 %s개 종료, 대기 %s개 건너뜀",
+                        reason,
+                        len(running),
+                        len(pending),
+                    )
+                    for connection in list(running):
+                        yield running.pop(connection).finish("cancelled", error=reason)
+                    for project_path in pending:
+                        yield ProjectOutcome(project_path, "skipped", error=reason)
+                    return
+
+                while pending and len(running) < concurrency:
+                    job = self._start(pending.pop(0), target, kwargs or {}, timeout)
+                    running[job.connection] = job
+
+                now = time.monotonic()
+                wait_timeout = min(job.deadline for job in running.values()) - now
+                if deadline is not None:
+                    wait_timeout = min(wait_timeout, CANCEL_POLL_INTERVAL)
+                ready = wait(list(running), timeout=max(0.0, wait_timeout))
+
+                for connection in ready:
+                    job = running.pop(connection)
+                    try:
+                        status, payload = connection.recv()
+                    except (EOFError, OSError):
+                        job.process.join(5)
+                        exitcode = job.process.exitcode
+                        yield job.finish(
+                            "failed",
+                            error=f"프로세스 비정상 종료 (exit code: {exitcode})",
+                        )
+                        continue
+                    if status == "ok":
+                        yield job.finish("success", result=payload)
+                    else:
+                        yield job.finish("failed", error=payload)
+
+                now = time.monotonic()
+                for connection in [c for c, j in running.items() if j.deadline <= now]:
+                    job = running.pop(connection)
+                    logger.warning(
+                        "제한 시간 초과로 중단: %s (%.0fs)",
+                        job.project_path.name,
+                        timeout,
+                    )
+                    yield job.finish(
+                        "timeout", error=f"제한 시간 초과 ({timeout:.0f}s)"
+                    )
+        finally:
+            # 소비자가 중간에 멈추면 남은 프로세스 정리
+            for job in running.values():
+                job.finish("failed", error="취소됨")
+
+    def _start(
+        self, project_path: Path, target: Callable, kwargs: Dict[str, Any], timeout
+    ) -> _RunningJob:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_run_in_child,
+            args=(sender, target, project_path, kwargs),
+            name=f"docs-{project_path.name}",
+            daemon=True,
+        )
+        process.start()
+        sender.close()
+        return _RunningJob(project_path, process, receiver, timeout)
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Any, Hashable, TypeVar
+
+from ..observability.logs import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """같은 키의 동시 요청을 하나의 실행으로 합치는 coalescer
+
+    키가 같은 작업이 진행 중이면 새 호출자는 그 작업에 붙어 같은 결과(또는 예외)를
+    받는다. 작업은 shield로 감싸므로 한 호출자가 취소돼도 나머지 호출자의 작업은
+    계속된다. 작업이 끝나면 키를 지우므로 결과를 캐시하지는 않는다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """key로 진행 중인 작업이 있으면 합류, 없으면 factory()를 실행"""
+        future = self._calls.get(key)
+        if future is not None and not future.done():
+            self.coalesced += 1
+            logger.debug("진행 중인 요청에 합류: %s", key)
+        else:
+            self.started += 1
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # 모든 호출자가 취소돼 아무도 결과를 받지 않은 경우 경고 로그 방지
+        if not future.cancelled():
+            future.exception()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "keys": [repr(key) for key in self._calls],
+        }
+
+
+# 프로세스 전체에서 공유하는 기본 coalescer (키에 작업 종류를 포함해 사용)
+default_single_flight = SingleFlight()
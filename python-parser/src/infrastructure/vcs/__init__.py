@@ -0,0 +1 @@
+# VCS Package
@@ -0,0 +1,126 @@
+import hashlib
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class GitHead:
+    """현재 체크아웃 상태 (브랜치가 없으면 detached HEAD)"""
+
+    branch: Optional[str]
+    commit: Optional[str]
+
+    @property
+    def label(self) -> Optional[str]:
+        """버전 라벨 (브랜치 이름, detached면 짧은 커밋 해시)"""
+        if self.branch:
+            return self.branch
+        return self.commit[:12] if self.commit else None
+
+
+def find_git_dir(project_path: Path) -> Optional[Path]:
+    """프로젝트의 .git 디렉토리 (worktree의 `gitdir:` 파일 포함)"""
+    dot_git = Path(project_path) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        content = dot_git.read_text(encoding="utf-8").strip()
+        if content.startswith("gitdir:"):
+            git_dir = Path(content[len("gitdir:") :].strip())
+            if not git_dir.is_absolute():
+                git_dir = (dot_git.parent / git_dir).resolve()
+            return git_dir if git_dir.is_dir() else None
+    return None
+
+
+def read_head(project_path: Path) -> Optional[GitHead]:
+    """git 실행 없이 .git/HEAD와 refs에서 브랜치/커밋 읽기"""
+    git_dir = find_git_dir(project_path)
+    if git_dir is None:
+        return None
+
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref:"):
+        return GitHead(branch=None, commit=head or None)
+
+    ref = head[len("ref:") :].strip()
+    branch = ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else ref
+    return GitHead(branch=branch, commit=_resolve_ref(git_dir, ref))
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> Optional[str]:
+    # worktree는 refs를 공용 디렉토리(commondir)에 둔다
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (
+            git_dir / commondir_file.read_text(encoding="utf-8").strip()
+        ).resolve()
+
+    for base in dict.fromkeys([git_dir, common_dir]):
+        ref_file = base / ref
+        if ref_file.is_file():
+            return ref_file.read_text(encoding="utf-8").strip() or None
+
+    packed_refs = common_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            if line.startswith(("#", "^")):
+                continue
+            parts = line.split(" ", 1)
+            if len(parts) == 2 and parts[1] == ref:
+                return parts[0]
+    return None
+
+
+def working_tree_fingerprint(
+    project_path: Path, timeout: float = 10.0
+) -> Optional[str]:
+    """커밋되지 않은 변경 지문 (`git status` 결과 + 변경 파일의 mtime/크기)
+
+    같은 파일을 여러 번 수정해도 status 출력은 같으므로 파일 stat까지 포함한다.
+    git을 실행할 수 없으면 None.
+    """
+    try:
+        completed = subprocess.run(
+            [
+                "git",
+                # 다른 사용자가 clone한 공유 볼륨에서도 읽을 수 있도록
+                "-c",
+                "safe.directory=*",
+                "status",
+                "--porcelain=v1",
+                "-z",
+                "--untracked-files=all",
+            ],
+            cwd=str(project_path),
+            capture_output=True,
+            timeout=timeout,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    output = completed.stdout
+    digest = hashlib.sha1(output)
+    entries = iter(output.split(b"\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        status, path = entry[:2], entry[3:]
+        if status[:1] in (b"R", b"C"):
+            # rename/copy는 다음 항목이 원래 경로
+            next(entries, None)
+        try:
+            stat = os.stat(os.path.join(project_path, os.fsdecode(path)))
+        except OSError:
+            continue
+        digest.update(f"{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return digest.hexdigest()
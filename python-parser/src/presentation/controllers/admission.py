@@ -0,0 +1,59 @@
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException, Request
+
+from ...infrastructure.runtime.admission import (
+    COST_UNIT_BYTES,
+    AdmissionRejected,
+    get_admission,
+)
+from ...infrastructure.runtime.executors import get_executors
+from ...infrastructure.runtime.memory_budget import (
+    MemoryBudgetExceeded,
+    get_memory_accounting,
+)
+
+T = TypeVar("T")
+
+# MCP 세션 등 호출자가 직접 지정하는 클라이언트 식별 헤더
+CLIENT_ID_HEADER = "X-Client-Id"
+
+
+def client_id(request: Request) -> str:
+    """공정성 판단용 클라이언트 식별자 (헤더가 없으면 접속 주소)"""
+    header = request.headers.get(CLIENT_ID_HEADER)
+    if header:
+        return header
+    return request.client.host if request.client else "unknown"
+
+
+async def admitted(
+    name: str, request: Request, cost: float, factory: Callable[[], Awaitable[T]]
+) -> T:
+    """입장 제어를 거쳐 실행 (거절되면 429 + Retry-After)"""
+    try:
+        return await get_admission().run(name, client_id(request), cost, factory)
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
+async def within_memory_budget(cost: float, factory: Callable[[], Awaitable[T]]) -> T:
+    """새 분석 결과까지 메모리 예산 안이면 실행 (정리 후에도 넘으면 503)
+
+    분석은 기존 분석 저장소를 비우고 다시 채우므로 기존 분석 크기는 빼고,
+    소스 크기(cost)에 직전 분석의 결과/소스 배수를 곱한 값을 더해 확인한다.
+    """
+    accounting = get_memory_accounting()
+    if accounting.limit_bytes > 0:
+        expected = await get_executors().run(
+            "io", accounting.expected_analysis_bytes, int(cost * COST_UNIT_BYTES)
+        )
+        try:
+            await get_executors().run("io", accounting.check, expected, ("analysis",))
+        except MemoryBudgetExceeded as e:
+            raise HTTPException(status_code=503, detail=str(e))
+    return await factory()
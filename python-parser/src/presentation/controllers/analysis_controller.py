@@ -1,21 +1,28 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query, Request
 from fastapi.responses import JSONResponse
-from typing import Optional
+from typing import BinaryIO, Optional
+from functools import cached_property
 from pathlib import Path
+import shutil
 import tempfile
 import zipfile
 import os
 
-from ...application.use_cases.analyze_code_use_case import (
-    AnalyzeCodeUseCase,
-    AnalysisRequest,
-)
 from ...infrastructure.repositories.memory_symbol_repository import (
     MemorySymbolRepository,
 )
 from ...infrastructure.repositories.memory_call_repository import MemoryCallRepository
 from ...infrastructure.repositories.memory_chunk_repository import MemoryChunkRepository
-from ...infrastructure.parsers.python_parser import PythonParser
+from ...infrastructure.runtime.executors import get_executors
+from ...infrastructure.runtime.single_flight import default_single_flight
+from ...infrastructure.runtime.admission import (
+    estimate_directory_cost,
+    estimate_zip_cost,
+)
+from ...infrastructure.runtime.memory_budget import get_memory_accounting
+from ...infrastructure.observability.memory import SAMPLE_SIZE
+from .admission import admitted, within_memory_budget
+from .jobs import run_job, tracked
 
 router = APIRouter(prefix="/api/v1/analysis", tags=["analysis"])
 
@@ -29,66 +36,195 @@ REPOS_DIRECTORY = os.getenv(
 symbol_repository = MemorySymbolRepository()
 call_repository = MemoryCallRepository()
 chunk_repository = MemoryChunkRepository()
-parser = PythonParser()
-analyze_use_case = AnalyzeCodeUseCase(
-    symbol_repository=symbol_repository,
-    call_repository=call_repository,
-    chunk_repository=chunk_repository,
-)
+
+
+class AnalysisServices:
+    """분석 라우터 의존성 (파서/유스케이스 모듈은 첫 분석 요청 시 import)"""
+
+    @cached_property
+    def analyze_use_case(self):
+        from ...application.use_cases.analyze_code_use_case import (
+            AnalyzeCodeUseCase,
+        )
+
+        return AnalyzeCodeUseCase(
+            symbol_repository=symbol_repository,
+            call_repository=call_repository,
+            chunk_repository=chunk_repository,
+        )
+
+
+services = AnalysisServices()
+
+
+def _analysis_memory_usage(sample: int = SAMPLE_SIZE) -> dict:
+    """분석 저장소 세 개의 메모리 사용량 (직전 분석 프로젝트와 소스 크기 포함)"""
+    parts = {
+        "symbols": symbol_repository.memory_usage(sample),
+        "calls": call_repository.memory_usage(sample),
+        "chunks": chunk_repository.memory_usage(sample),
+    }
+    size = sum(part["bytes"] for part in parts.values())
+    # 유스케이스를 만들지 않았으면 아직 분석한 적이 없음
+    use_case = services.__dict__.get("analyze_use_case")
+    project = use_case.last_project if use_case else None
+    return {
+        "items": sum(part["items"] for part in parts.values()),
+        "bytes": size,
+        "parts": parts,
+        "source_bytes": use_case.last_source_bytes if use_case else 0,
+        "projects": {project.name: size} if project else {},
+    }
+
+
+# 분석 결과는 다시 읽을 곳이 없으므로 정리 함수를 등록하지 않는다. 새 분석은
+# 기존 결과를 교체하므로 예산 확인에서 이 저장소 크기는 빼고 계산한다.
+get_memory_accounting().register("analysis", _analysis_memory_usage)
+
+
+async def _run_analysis(http_request: Request, request):
+    """분석 풀에서 실행
+
+    같은 경로/옵션의 동시 요청은 한 번만 분석하고, 실제 실행은 소스 크기로 추정한
+    비용에 따라 입장 제어를 거친다. 요청 기한이 지나거나 연결이 끊기면 파일 사이에서
+    멈추고 부분 결과를 돌려준다.
+    """
+    key = (
+        "analyze",
+        str(Path(request.project_path).resolve()),
+        request.include_tests,
+        request.include_docs,
+        request.max_file_size,
+        tuple(request.exclude_patterns),
+        request.slowest_files,
+    )
+
+    async def analyze():
+        cost = await get_executors().run(
+            "io", estimate_directory_cost, request.project_path
+        )
+        return await admitted(
+            "analysis",
+            http_request,
+            cost,
+            lambda: within_memory_budget(
+                cost,
+                lambda: get_executors().run(
+                    "analysis", services.analyze_use_case.execute, request
+                ),
+            ),
+        )
+
+    return await run_job(
+        "analysis", http_request, analyze, key=key, target=str(request.project_path)
+    )
+
+
+def _analysis_summary(result, timings: bool = False) -> dict:
+    """분석 결과 응답 (기한 초과로 멈췄으면 건너뛴 파일, 요청 시 단계별 시간 포함)"""
+    summary = {
+        "symbols_count": len(result.symbols),
+        "calls_count": len(result.calls),
+        "chunks_count": len(result.chunks),
+        "statistics": result.statistics,
+        "duration": result.duration,
+        **result.completion_dict(),
+    }
+    if timings:
+        summary["timings"] = result.timings
+    return summary
 
 
 @router.post("/upload")
 async def analyze_uploaded_code(
+    http_request: Request,
     file: UploadFile = File(...),
     include_tests: bool = Form(True),
     include_docs: bool = Form(True),
     max_file_size: Optional[int] = Form(None),
+    timings: bool = Form(False),
 ):
     """업로드된 코드 분석"""
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # 파일 압축 해제
-            zip_path = Path(tmpdir) / file.filename
-            with open(zip_path, "wb") as f:
-                f.write(await file.read())
-
-            with zipfile.ZipFile(zip_path) as z:
-                z.extractall(tmpdir)
-
-            # 분석 요청 생성
-            request = AnalysisRequest(
-                project_path=Path(tmpdir),
-                include_tests=include_tests,
-                include_docs=include_docs,
-                max_file_size=max_file_size,
-            )
+        # 압축 해제 전 zip 목록만 읽어 크기 추정 (업로드 내용은 메모리에 올리지 않음)
+        cost = await get_executors().run("io", estimate_zip_cost, file.file)
+        result = await run_job(
+            "upload",
+            http_request,
+            target=file.filename,
+            factory=lambda: admitted(
+                "upload",
+                http_request,
+                cost,
+                lambda: within_memory_budget(
+                    cost,
+                    lambda: get_executors().run(
+                        "analysis",
+                        _analyze_uploaded_zip,
+                        file.filename,
+                        file.file,
+                        include_tests,
+                        include_docs,
+                        max_file_size,
+                    ),
+                ),
+            ),
+        )
 
-            # 분석 실행
-            result = analyze_use_case.execute(request)
-
-            return JSONResponse(
-                content={
-                    "status": "success",
-                    "data": {
-                        "symbols_count": len(result.symbols),
-                        "calls_count": len(result.calls),
-                        "chunks_count": len(result.chunks),
-                        "statistics": result.statistics,
-                        "duration": result.duration,
-                    },
-                }
-            )
+        return JSONResponse(
+            content={
+                "status": "success",
+                "data": _analysis_summary(result, timings),
+            }
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _analyze_uploaded_zip(
+    filename: str,
+    content: BinaryIO,
+    include_tests: bool,
+    include_docs: bool,
+    max_file_size: Optional[int],
+):
+    """업로드된 zip을 임시 디렉토리에 풀고 분석 (분석 풀에서 실행)"""
+    from ...application.use_cases.analyze_code_use_case import AnalysisRequest
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # 파일 압축 해제
+        zip_path = Path(tmpdir) / filename
+        content.seek(0)
+        with open(zip_path, "wb") as f:
+            shutil.copyfileobj(content, f)
+
+        with zipfile.ZipFile(zip_path) as z:
+            z.extractall(tmpdir)
+
+        # 분석 요청 생성
+        request = AnalysisRequest(
+            project_path=Path(tmpdir),
+            include_tests=include_tests,
+            include_docs=include_docs,
+            max_file_size=max_file_size,
+        )
+
+        # 분석 실행
+        return services.analyze_use_case.execute(request)
+
+
 @router.post("/directory")
 async def analyze_directory(
+    http_request: Request,
     directory_path: str,
     include_tests: bool = True,
     include_docs: bool = True,
     max_file_size: Optional[int] = None,
+    timings: bool = Query(False, description="Include per-phase/per-file timings"),
+    slowest: int = Query(10, ge=0, le=100, description="Slowest files to report"),
 ):
     """디렉토리 분석"""
     try:
@@ -96,28 +232,27 @@ async def analyze_directory(
         if not project_path.exists():
             raise HTTPException(status_code=404, detail="Directory not found")
 
+        from ...application.use_cases.analyze_code_use_case import AnalysisRequest
+
         request = AnalysisRequest(
             project_path=project_path,
             include_tests=include_tests,
             include_docs=include_docs,
             max_file_size=max_file_size,
+            slowest_files=slowest,
         )
 
-        result = analyze_use_case.execute(request)
+        result = await _run_analysis(http_request, request)
 
         return JSONResponse(
             content={
                 "status": "success",
-                "data": {
-                    "symbols_count": len(result.symbols),
-                    "calls_count": len(result.calls),
-                    "chunks_count": len(result.chunks),
-                    "statistics": result.statistics,
-                    "duration": result.duration,
-                },
+                "data": _analysis_summary(result, timings),
             }
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -254,6 +389,7 @@ async def health_check():
         "repos_directory_exists": os.path.exists(REPOS_DIRECTORY),
         "current_working_dir": os.getcwd(),
         "script_location": __file__,
+        "executors": get_executors().stats(),
     }
 
 
@@ -287,7 +423,11 @@ async def list_repositories():
 
 
 @router.post("/analyze/{repo_name}")
-async def analyze_repository(repo_name: str):
+async def analyze_repository(
+    http_request: Request,
+    repo_name: str,
+    timings: bool = Query(False, description="Include per-phase/per-file timings"),
+):
     """특정 레포지토리 분석"""
     try:
         repo_path = os.path.join(REPOS_DIRECTORY, repo_name)
@@ -297,6 +437,8 @@ async def analyze_repository(repo_name: str):
             )
 
         # AnalysisRequest 생성
+        from ...application.use_cases.analyze_code_use_case import AnalysisRequest
+
         request = AnalysisRequest(
             project_path=Path(repo_path),
             include_tests=True,
@@ -305,19 +447,15 @@ async def analyze_repository(repo_name: str):
         )
 
         # 레포지토리 분석 실행
-        result = analyze_use_case.execute(request)
+        result = await _run_analysis(http_request, request)
 
         return {
             "repository": repo_name,
             "path": repo_path,
-            "analysis": {
-                "symbols_count": len(result.symbols),
-                "calls_count": len(result.calls),
-                "chunks_count": len(result.chunks),
-                "statistics": result.statistics,
-                "duration": result.duration,
-            },
+            "analysis": _analysis_summary(result, timings),
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error analyzing repository: {str(e)}"
@@ -325,7 +463,10 @@ async def analyze_repository(repo_name: str):
 
 
 @router.get("/analyze-all")
-async def analyze_all_repositories():
+async def analyze_all_repositories(
+    http_request: Request,
+    timings: bool = Query(False, description="Include per-phase/per-file timings"),
+):
     """모든 레포지토리 분석"""
     try:
         if not os.path.exists(REPOS_DIRECTORY):
@@ -334,42 +475,45 @@ async def analyze_all_repositories():
                 "message": f"Directory {REPOS_DIRECTORY} does not exist",
             }
 
-        results = []
-        for item in os.listdir(REPOS_DIRECTORY):
-            item_path = os.path.join(REPOS_DIRECTORY, item)
-            if os.path.isdir(item_path) and os.path.exists(
-                os.path.join(item_path, ".git")
-            ):
-                try:
-                    request = AnalysisRequest(
-                        project_path=Path(item_path),
-                        include_tests=True,
-                        include_docs=True,
-                        exclude_patterns=[
-                            "__pycache__",
-                            ".git",
-                            "node_modules",
-                            "venv",
-                        ],
-                    )
-                    result = analyze_use_case.execute(request)
-                    results.append(
-                        {
-                            "repository": item,
-                            "path": item_path,
-                            "analysis": {
-                                "symbols_count": len(result.symbols),
-                                "calls_count": len(result.calls),
-                                "chunks_count": len(result.chunks),
-                                "statistics": result.statistics,
-                                "duration": result.duration,
-                            },
-                        }
-                    )
-                except Exception as e:
-                    results.append(
-                        {"repository": item, "path": item_path, "error": str(e)}
-                    )
+        async def analyze_each():
+            results = []
+            for item in os.listdir(REPOS_DIRECTORY):
+                item_path = os.path.join(REPOS_DIRECTORY, item)
+                if os.path.isdir(item_path) and os.path.exists(
+                    os.path.join(item_path, ".git")
+                ):
+                    try:
+                        from ...application.use_cases.analyze_code_use_case import (
+                            AnalysisRequest,
+                        )
+
+                        request = AnalysisRequest(
+                            project_path=Path(item_path),
+                            include_tests=True,
+                            include_docs=True,
+                            exclude_patterns=[
+                                "__pycache__",
+                                ".git",
+                                "node_modules",
+                                "venv",
+                            ],
+                        )
+                        result = await _run_analysis(http_request, request)
+                        results.append(
+                            {
+                                "repository": item,
+                                "path": item_path,
+                                "analysis": _analysis_summary(result, timings),
+                            }
+                        )
+                    except Exception as e:
+                        results.append(
+                            {"repository": item, "path": item_path, "error": str(e)}
+                        )
+            return results
+
+        # 레포지토리별 분석을 하나의 진행 상황 id로 묶음
+        results = await tracked("analysis", http_request, REPOS_DIRECTORY, analyze_each)
 
         return {
             "total_repositories": len(results),
@@ -392,7 +536,15 @@ async def analyze_file(
 ):
     """파일 분석 엔드포인트 - 하이브리드 파서 사용"""
     try:
-        result = analyze_use_case.execute_file(file_path, analysis_type)
+        result = await default_single_flight.run(
+            ("analyze-file", str(Path(file_path).resolve()), analysis_type),
+            lambda: get_executors().run(
+                "analysis",
+                services.analyze_use_case.execute_file,
+                file_path,
+                analysis_type,
+            ),
+        )
         return {
             "success": True,
             "file_path": file_path,
@@ -410,7 +562,9 @@ async def analyze_file(
 async def search_semantic(query: str, file_path: Optional[str] = None):
     """의미 기반 코드 검색 - 하이브리드 파서의 의미적 청킹 활용"""
     try:
-        result = analyze_use_case.search_semantic(query, file_path)
+        result = await get_executors().run(
+            "analysis", services.analyze_use_case.search_semantic, query, file_path
+        )
         return {
             "success": True,
             "query": query,
@@ -430,7 +584,9 @@ async def get_code_chunks(
 ):
     """코드 청킹 결과 조회"""
     try:
-        chunks = analyze_use_case.get_code_chunks(file_path, chunk_type)
+        chunks = await get_executors().run(
+            "analysis", services.analyze_use_case.get_code_chunks, file_path, chunk_type
+        )
         return {
             "success": True,
             "file_path": file_path,
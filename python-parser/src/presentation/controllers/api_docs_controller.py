@@ -1,16 +1,20 @@
+import atexit
 import os
+from functools import cached_property
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
-import traceback
 
-from ...application.use_cases.generate_api_docs_use_case import GenerateApiDocsUseCase
-from ...infrastructure.repositories.memory_symbol_repository import (
-    MemorySymbolRepository,
-)
-from ...infrastructure.repositories.memory_api_documentation_repository import (
-    MemoryApiDocumentationRepository,
-)
+from ...infrastructure.runtime.executors import get_executors
+from ...infrastructure.runtime.admission import estimate_directory_cost
+from ...infrastructure.runtime.memory_budget import get_memory_accounting
+from .admission import admitted
+from .debug_controller import require_debug_access
+from .jobs import run_job
+from ...infrastructure.observability.logs import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/docs", tags=["api-documentation"])
 
@@ -19,24 +23,164 @@ REPOS_DIRECTORY = os.getenv(
     "REPOS_DIRECTORY", os.path.join(os.path.dirname(os.getcwd()), "shared_repos")
 )
 
-# 의존성 주입
-symbol_repository = MemorySymbolRepository()
-api_documentation_repository = MemoryApiDocumentationRepository()
-generate_api_docs_use_case = GenerateApiDocsUseCase(
-    symbol_repository=symbol_repository,
-    api_documentation_repository=api_documentation_repository,
+# 브랜치별 OpenAPI 스냅샷 디렉토리 (<project>/<branch>/openapi.json)
+OPENAPI_VERSIONS_DIRECTORY = os.getenv(
+    "OPENAPI_VERSIONS_DIRECTORY",
+    os.path.join(os.path.dirname(os.getcwd()), "openapi-versions"),
 )
 
+# 프로젝트별 Django 워커 사용 여부 (false면 서버 프로세스에서 Django 설정)
+USE_DJANGO_WORKERS = os.getenv("DJANGO_WORKERS_ENABLED", "true").lower() == "true"
+
+# 전체 프로젝트 생성 시 동시 실행 수(0이면 순차 실행)와 프로젝트별 제한 시간(초)
+GENERATE_ALL_CONCURRENCY = int(os.getenv("DOCS_GENERATE_ALL_CONCURRENCY", "4"))
+GENERATE_ALL_PROJECT_TIMEOUT = float(os.getenv("DOCS_PROJECT_TIMEOUT", "300"))
+
+# git HEAD 기준 생성 캐시 (디스크에 유지)
+GENERATION_CACHE_ENABLED = os.getenv("DOCS_CACHE_ENABLED", "true").lower() == "true"
+GENERATION_CACHE_DIRECTORY = os.getenv(
+    "DOCS_CACHE_DIRECTORY", os.path.join(os.path.dirname(os.getcwd()), "docs-cache")
+)
+
+
+# 스펙 파일 출력 형식 (기본은 compact JSON, gzip 사본은 선택)
+OUTPUT_PRETTY = os.getenv("DOCS_OUTPUT_PRETTY", "false").lower() == "true"
+OUTPUT_GZIP = os.getenv("DOCS_OUTPUT_GZIP", "false").lower() == "true"
+
+
+class ApiDocsServices:
+    """API 문서 라우터 의존성
+
+    생성기/Django 워커/캐시 모듈은 import 비용이 있으므로 서버 시작 시가 아니라
+    처음 사용할 때 import하고 생성한다.
+    """
+
+    @cached_property
+    def symbol_repository(self):
+        from ...infrastructure.repositories.memory_symbol_repository import (
+            MemorySymbolRepository,
+        )
+
+        return MemorySymbolRepository()
+
+    @cached_property
+    def api_documentation_repository(self):
+        from ...infrastructure.repositories.memory_api_documentation_repository import (
+            MemoryApiDocumentationRepository,
+        )
+        from ...infrastructure.repositories.spec_file_writer import SpecFileWriter
+
+        repository = MemoryApiDocumentationRepository(
+            writer=SpecFileWriter(pretty=OUTPUT_PRETTY, gzip_copy=OUTPUT_GZIP)
+        )
+        get_memory_accounting().register(
+            "docs", repository.memory_usage, repository.spill
+        )
+        return repository
+
+    @cached_property
+    def spec_store(self):
+        from ...infrastructure.repositories.versioned_spec_store import (
+            VersionedSpecStore,
+        )
+
+        store = VersionedSpecStore(snapshot_root=Path(OPENAPI_VERSIONS_DIRECTORY))
+        get_memory_accounting().register("spec_store", store.memory_usage)
+        return store
+
+    @cached_property
+    def generation_cache(self):
+        if not GENERATION_CACHE_ENABLED:
+            return None
+        from ...infrastructure.cache.generation_cache import GenerationCache
+
+        cache = GenerationCache(Path(GENERATION_CACHE_DIRECTORY))
+        get_memory_accounting().register(
+            "generation_cache", cache.memory_usage, cache.spill
+        )
+        return cache
+
+    @cached_property
+    def django_worker_pool(self):
+        if not USE_DJANGO_WORKERS:
+            return None
+        from ...infrastructure.introspection.django_worker_pool import (
+            DjangoWorkerPool,
+        )
+
+        pool = DjangoWorkerPool(
+            python_executable=os.getenv("DJANGO_WORKER_PYTHON") or None,
+            request_timeout=float(os.getenv("DJANGO_WORKER_REQUEST_TIMEOUT", "30")),
+            boot_timeout=float(os.getenv("DJANGO_WORKER_BOOT_TIMEOUT", "60")),
+            idle_timeout=float(os.getenv("DJANGO_WORKER_IDLE_TIMEOUT", "600")),
+        )
+        atexit.register(pool.shutdown)
+        return pool
+
+    @cached_property
+    def project_scheduler(self):
+        if GENERATE_ALL_CONCURRENCY <= 0:
+            return None
+        from ...infrastructure.runtime.project_scheduler import ProjectScheduler
+
+        return ProjectScheduler(
+            max_concurrency=GENERATE_ALL_CONCURRENCY,
+            project_timeout=GENERATE_ALL_PROJECT_TIMEOUT,
+        )
+
+    @cached_property
+    def use_case(self):
+        from ...application.use_cases.generate_api_docs_use_case import (
+            GenerateApiDocsUseCase,
+        )
+
+        return GenerateApiDocsUseCase(
+            symbol_repository=self.symbol_repository,
+            api_documentation_repository=self.api_documentation_repository,
+            introspection_pool=self.django_worker_pool,
+            spec_store=self.spec_store,
+            project_scheduler=self.project_scheduler,
+            generation_cache=self.generation_cache,
+        )
+
+
+# 의존성 주입
+services = ApiDocsServices()
+
+
+async def _admitted_generation(
+    http_request: Request, project_path: Path, factory, cached=None
+):
+    """소스 크기로 비용을 추정해 생성 입장 제어를 거친 뒤 실행
+
+    cached가 주어지면 먼저 생성 캐시를 확인해, 적중하면 비용 추정과 입장 제어 없이
+    바로 반환한다 (생성이 슬롯을 모두 차지하고 있어도 기다리지 않음).
+    """
+    if cached is not None:
+        result = await cached()
+        if result is not None:
+            return result
+    cost = await get_executors().run("io", estimate_directory_cost, project_path)
+    return await admitted("generation", http_request, cost, factory)
+
 
 @router.post("/generate/{project_name}")
 async def generate_api_documentation(
+    http_request: Request,
     project_name: str,
     base_url: str = Query("http://localhost:8000", description="API base URL"),
     save_to_file: bool = Query(False, description="Save documentation to file"),
+    static: bool = Query(
+        False, description="Generate with import-free static analysis (no Django)"
+    ),
+    version: str = Query(
+        None, description="Version label to store the spec under (default: git branch)"
+    ),
+    refresh: bool = Query(False, description="Ignore the generation cache"),
 ):
     """특정 프로젝트의 API 문서 생성"""
     try:
-        print(f"REPOS_DIRECTORY : {REPOS_DIRECTORY}")
+        logger.debug("REPOS_DIRECTORY: %s", REPOS_DIRECTORY)
         project_path = Path(REPOS_DIRECTORY) / project_name
         if not project_path.exists():
             raise HTTPException(
@@ -51,8 +195,47 @@ async def generate_api_documentation(
             output_file = output_dir / f"{project_name}_api_docs.json"
 
         # API 문서 생성
-        result = generate_api_docs_use_case.execute(
-            project_path=project_path, base_url=base_url, output_file=output_file
+        # 같은 프로젝트/옵션의 동시 생성 요청은 하나의 생성 결과를 공유
+        result = await run_job(
+            "generation",
+            http_request,
+            target=project_name,
+            key=(
+                "generate",
+                str(project_path.resolve()),
+                base_url,
+                str(output_file),
+                static,
+                version,
+                refresh,
+            ),
+            factory=lambda: _admitted_generation(
+                http_request,
+                project_path,
+                lambda: get_executors().run(
+                    "generation",
+                    services.use_case.execute,
+                    project_path=project_path,
+                    base_url=base_url,
+                    output_file=output_file,
+                    static_analysis=static,
+                    version=version,
+                    refresh=refresh,
+                ),
+                cached=(
+                    None
+                    if refresh
+                    else lambda: get_executors().run(
+                        "io",
+                        services.use_case.execute_cached,
+                        project_path=project_path,
+                        base_url=base_url,
+                        output_file=output_file,
+                        static_analysis=static,
+                        version=version,
+                    )
+                ),
+            ),
         )
 
         return {
@@ -61,8 +244,10 @@ async def generate_api_documentation(
             "data": result,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error generating API documentation: {str(e)}"
         )
@@ -70,8 +255,16 @@ async def generate_api_documentation(
 
 @router.post("/generate-all")
 async def generate_all_api_documentations(
+    http_request: Request,
     base_url: str = Query("http://localhost:8000", description="API base URL"),
     save_to_files: bool = Query(False, description="Save documentation to files"),
+    static: bool = Query(
+        False, description="Generate with import-free static analysis (no Django)"
+    ),
+    concurrency: int = Query(
+        None, ge=1, description="Max projects generated at the same time"
+    ),
+    timeout: float = Query(None, gt=0, description="Per-project timeout in seconds"),
 ):
     """모든 프로젝트의 API 문서 생성"""
     try:
@@ -89,8 +282,33 @@ async def generate_all_api_documentations(
             output_dir.mkdir(exist_ok=True)
 
         # 모든 프로젝트 API 문서 생성
-        result = generate_api_docs_use_case.generate_for_all_projects(
-            projects_dir=projects_dir, base_url=base_url, output_dir=output_dir
+        result = await run_job(
+            "generation",
+            http_request,
+            target=str(projects_dir),
+            key=(
+                "generate-all",
+                str(projects_dir.resolve()),
+                base_url,
+                str(output_dir),
+                static,
+                concurrency,
+                timeout,
+            ),
+            factory=lambda: _admitted_generation(
+                http_request,
+                projects_dir,
+                lambda: get_executors().run(
+                    "generation",
+                    services.use_case.generate_for_all_projects,
+                    projects_dir=projects_dir,
+                    base_url=base_url,
+                    output_dir=output_dir,
+                    static_analysis=static,
+                    max_concurrency=concurrency,
+                    project_timeout=timeout,
+                ),
+            ),
         )
 
         return {
@@ -99,23 +317,75 @@ async def generate_all_api_documentations(
             "data": result,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error generating API documentation: {str(e)}"
         )
 
 
+@router.get("/workers")
+async def list_django_workers():
+    """프로젝트별 Django 워커 상태 조회"""
+    if services.django_worker_pool is None:
+        return {"status": "success", "data": {"enabled": False, "workers": []}}
+
+    return {
+        "status": "success",
+        "data": {
+            "enabled": True,
+            "recycled": services.django_worker_pool.recycled,
+            "workers": services.django_worker_pool.status(),
+        },
+    }
+
+
+@router.get("/cache")
+async def get_generation_cache_stats():
+    """생성 캐시 통계 조회"""
+    if services.generation_cache is None:
+        return {"status": "success", "data": {"enabled": False}}
+
+    return {
+        "status": "success",
+        "data": {
+            "enabled": True,
+            **await get_executors().run("io", services.generation_cache.stats),
+        },
+    }
+
+
+@router.delete("/cache")
+async def clear_generation_cache(
+    http_request: Request,
+    project_name: str = Query(None, description="Only clear this project"),
+):
+    """생성 캐시 삭제 (디버그 엔드포인트와 같은 접근 확인)"""
+    require_debug_access(http_request)
+    if services.generation_cache is None:
+        return {"status": "success", "removed": 0}
+
+    try:
+        removed = await get_executors().run(
+            "io", services.generation_cache.clear, project_name
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", "removed": removed}
+
+
 @router.get("/list")
 async def list_api_documentations():
     """생성된 API 문서 목록 조회"""
     try:
-        result = generate_api_docs_use_case.get_all_documentations()
+        result = services.use_case.get_all_documentations()
 
         return {"status": "success", "data": result}
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error listing API documentation: {str(e)}"
         )
@@ -125,7 +395,7 @@ async def list_api_documentations():
 async def get_api_documentation(project_name: str):
     """특정 프로젝트의 API 문서 조회"""
     try:
-        documentation = generate_api_docs_use_case.get_documentation(project_name)
+        documentation = services.use_case.get_documentation(project_name)
 
         if not documentation:
             raise HTTPException(
@@ -152,12 +422,14 @@ async def get_api_documentation(project_name: str):
                     }
                     for endpoint in documentation.endpoints
                 ],
-                "openapi_spec": documentation.to_openapi_dict(),
+                "openapi_spec": await get_executors().run(
+                    "io", documentation.to_openapi_dict
+                ),
             },
         }
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error retrieving API documentation: {str(e)}"
         )
@@ -167,7 +439,7 @@ async def get_api_documentation(project_name: str):
 async def get_openapi_spec(project_name: str):
     """특정 프로젝트의 OpenAPI 스펙 조회"""
     try:
-        documentation = generate_api_docs_use_case.get_documentation(project_name)
+        documentation = services.use_case.get_documentation(project_name)
 
         if not documentation:
             raise HTTPException(
@@ -175,22 +447,175 @@ async def get_openapi_spec(project_name: str):
                 detail=f"API documentation for {project_name} not found",
             )
 
-        return JSONResponse(
-            content=documentation.to_openapi_dict(), media_type="application/json"
-        )
+        spec = await get_executors().run("io", documentation.to_openapi_dict)
+        return JSONResponse(content=spec, media_type="application/json")
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error retrieving OpenAPI spec: {str(e)}"
         )
 
 
+@router.get("/{project_name}/openapi/index")
+async def get_openapi_index(project_name: str):
+    """태그별 OpenAPI 스펙 조각 목록 (Swagger UI `urls` 포함)"""
+    index = await get_executors().run(
+        "io",
+        services.use_case.get_spec_index,
+        project_name,
+        f"{router.prefix}/{project_name}/openapi/tags/{{tag}}",
+    )
+    if index is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"API documentation for {project_name} not found",
+        )
+
+    return JSONResponse(content=index, media_type="application/json")
+
+
+@router.get("/{project_name}/openapi/tags/{tag}")
+async def get_openapi_tag_spec(project_name: str, tag: str):
+    """태그 하나의 OpenAPI 스펙 조각 (해당 태그가 참조하는 components만 포함)"""
+    fragment = await get_executors().run(
+        "io", services.use_case.get_tag_spec, project_name, tag
+    )
+    if fragment is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Tag {tag} of {project_name} not found",
+        )
+
+    return JSONResponse(content=fragment, media_type="application/json")
+
+
+@router.get("/{project_name}/endpoints")
+async def search_endpoints(
+    project_name: str,
+    q: Optional[str] = Query(None, description="Summary/description/path tokens"),
+    method: Optional[str] = Query(None),
+    tag: Optional[str] = Query(None),
+    path_prefix: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=1000),
+):
+    """조건에 맞는 오퍼레이션 목록 (전체 스펙 없이 요약만)"""
+    results = await get_executors().run(
+        "io",
+        services.use_case.search_endpoints,
+        project_name,
+        query=q,
+        method=method,
+        tag=tag,
+        path_prefix=path_prefix,
+        limit=limit,
+    )
+    if results is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"API documentation for {project_name} not found",
+        )
+
+    return {"status": "success", "data": {"total": len(results), "endpoints": results}}
+
+
+@router.get("/{project_name}/endpoints/match")
+async def match_endpoint(
+    project_name: str,
+    path: str = Query(..., description="Request path or path template"),
+    method: Optional[str] = Query(None),
+):
+    """요청 경로를 처리하는 오퍼레이션 (예: GET /api/v1/revenues/12/)"""
+    matches = await get_executors().run(
+        "io", services.use_case.match_endpoints, project_name, path, method
+    )
+    if matches is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"API documentation for {project_name} not found",
+        )
+    if not matches:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No operation matches {' '.join(filter(None, [method, path]))}",
+        )
+
+    return {
+        "status": "success",
+        "data": {
+            "match": matches[0],
+            "alternatives": [
+                {key: m[key] for key in ("path", "method", "summary", "path_params")}
+                for m in matches[1:]
+            ],
+        },
+    }
+
+
+@router.get("/{project_name}/versions")
+async def list_spec_versions(project_name: str):
+    """프로젝트의 스펙 버전 목록 조회"""
+    try:
+        return {
+            "status": "success",
+            "data": {
+                "project": project_name,
+                "versions": await get_executors().run(
+                    "io", services.use_case.list_versions, project_name
+                ),
+                "store": services.spec_store.stats(),
+            },
+        }
+
+    except Exception as e:
+        logger.exception("요청 처리 실패")
+        raise HTTPException(
+            status_code=500, detail=f"Error listing spec versions: {str(e)}"
+        )
+
+
+@router.get("/{project_name}/versions/openapi")
+async def get_versioned_openapi_spec(
+    project_name: str,
+    version: str = Query(..., description="Version label (e.g. branch name)"),
+):
+    """특정 버전의 OpenAPI 스펙 조회"""
+    spec = await get_executors().run(
+        "io", services.use_case.get_versioned_spec, project_name, version
+    )
+    if spec is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Version {version} of {project_name} not found",
+        )
+
+    return JSONResponse(content=spec, media_type="application/json")
+
+
+@router.get("/{project_name}/diff")
+async def diff_spec_versions(
+    project_name: str,
+    base: str = Query(..., description="Base version label"),
+    head: str = Query(..., description="Head version label"),
+):
+    """두 버전 사이의 API 변경 사항 (추가/삭제/변경 오퍼레이션, 호환성 깨짐 여부)"""
+    result = await get_executors().run(
+        "io", services.use_case.diff_versions, project_name, base, head
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Version {base} or {head} of {project_name} not found",
+        )
+
+    return {"status": "success", "data": result}
+
+
 @router.delete("/{project_name}")
 async def delete_api_documentation(project_name: str):
     """특정 프로젝트의 API 문서 삭제"""
     try:
-        api_documentation_repository.delete(project_name)
+        services.api_documentation_repository.delete(project_name)
 
         return {
             "status": "success",
@@ -198,7 +623,7 @@ async def delete_api_documentation(project_name: str):
         }
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error deleting API documentation: {str(e)}"
         )
@@ -208,12 +633,12 @@ async def delete_api_documentation(project_name: str):
 async def clear_all_api_documentations():
     """모든 API 문서 삭제"""
     try:
-        api_documentation_repository.clear()
+        services.api_documentation_repository.clear()
 
         return {"status": "success", "message": "All API documentation cleared"}
 
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("요청 처리 실패")
         raise HTTPException(
             status_code=500, detail=f"Error clearing API documentation: {str(e)}"
         )
@@ -0,0 +1,173 @@
+import asyncio
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+
+router = APIRouter(prefix="/api/v1/debug", tags=["debug"])
+
+# 프로파일링 엔드포인트 보호 (기본 비활성, 토큰이 설정되면 헤더로 확인)
+PROFILING_ENV = "DEBUG_PROFILING_ENABLED"
+TOKEN_ENV = "DEBUG_TOKEN"
+TOKEN_HEADER = "X-Debug-Token"
+
+# 다음 실행을 기다리는 동안 완료 여부를 확인하는 간격 (초)
+CAPTURE_POLL_INTERVAL = 0.1
+
+
+def require_debug_access(request: Request) -> None:
+    """디버그/관리 엔드포인트 접근 확인 (꺼져 있으면 404, 토큰이 틀리면 403)"""
+    if os.environ.get(PROFILING_ENV, "").lower() not in ("1", "true", "yes"):
+        raise HTTPException(status_code=404, detail="Debug endpoints are disabled")
+    token = os.environ.get(TOKEN_ENV)
+    if token and not hmac.compare_digest(request.headers.get(TOKEN_HEADER, ""), token):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+
+
+@router.get("/startup")
+async def get_startup_timeline(
+    request: Request,
+    imports: bool = Query(False, description="새 프로세스에서 import 시간 측정"),
+    top: int = Query(30, ge=1, le=200),
+):
+    """서버 시작 구간별 시간 (선택적으로 모듈별 import 시간)
+
+    import 시간 측정은 새 인터프리터를 띄우므로 io 풀에서 실행한다.
+    """
+    require_debug_access(request)
+    timeline = getattr(request.app.state, "startup_timeline", None)
+    result = {"timeline_ms": timeline.to_dict() if timeline else {}}
+
+    if imports:
+        from ...infrastructure.observability.startup import import_time_report
+        from ...infrastructure.runtime.executors import get_executors
+
+        try:
+            result["imports"] = await get_executors().run(
+                "io", import_time_report, top=top
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error measuring import time: {str(e)}"
+            )
+    return result
+
+
+@router.get("/executors")
+async def get_executor_stats(request: Request):
+    """실행 풀별 작업 수, 요청 합치기와 입장 제어 현황"""
+    require_debug_access(request)
+    from ...infrastructure.runtime.executors import get_executors
+    from ...infrastructure.runtime.admission import get_admission
+    from ...infrastructure.runtime.single_flight import default_single_flight
+
+    return {
+        "status": "success",
+        "data": {
+            "pools": get_executors().stats(),
+            "coalescing": default_single_flight.stats(),
+            "admission": get_admission().stats(),
+        },
+    }
+
+
+@router.get("/memory")
+async def get_memory_usage(
+    request: Request,
+    refresh: bool = Query(False, description="캐시된 집계 대신 지금 다시 측정"),
+    tracemalloc: bool = Query(
+        False, description="파일별 할당 상위 목록 (PYTHONTRACEMALLOC로 시작한 경우)"
+    ),
+    top: int = Query(20, ge=1, le=200),
+):
+    """저장소별/프로젝트별 메모리 사용량, 예산과 프로세스 RSS"""
+    require_debug_access(request)
+    from ...infrastructure.runtime.executors import get_executors
+    from ...infrastructure.runtime.memory_budget import get_memory_accounting
+
+    def collect():
+        data = dict(get_memory_accounting().usage(refresh))
+        if tracemalloc:
+            from ...infrastructure.observability.memory import tracemalloc_report
+
+            data["tracemalloc"] = tracemalloc_report(top)
+        return data
+
+    return {"status": "success", "data": await get_executors().run("io", collect)}
+
+
+@router.post("/profile")
+async def profile(
+    request: Request,
+    seconds: float = Query(
+        10.0,
+        gt=0,
+        le=60,
+        description="측정 시간 (target이 있으면 다음 실행을 기다리는 최대 시간)",
+    ),
+    target: Optional[str] = Query(
+        None,
+        pattern="^(analysis|generation)$",
+        description="다음 분석(execute)/문서 생성 실행 한 번만 측정",
+    ),
+    mode: str = Query(
+        "sample", pattern="^(sample|cprofile)$", description="cprofile은 target 필요"
+    ),
+    interval_ms: float = Query(5.0, ge=1, le=100, description="샘플링 간격"),
+    idle: bool = Query(False, description="대기 중인 스레드도 샘플에 포함"),
+    format: str = Query("collapsed", pattern="^(collapsed|json)$"),
+    top: int = Query(20, ge=1, le=200),
+):
+    """샘플링 프로파일러로 다음 N초 또는 다음 실행 한 번을 측정
+
+    collapsed 형식은 flamegraph.pl/speedscope에 그대로 넣을 수 있는
+    `스레드;바깥;...;안쪽 샘플수` 줄이다. cprofile 모드는 다음 실행 한 번을
+    결정적으로 측정해 누적 시간 순 함수 목록을 JSON으로 돌려준다.
+    """
+    require_debug_access(request)
+    if mode == "cprofile" and target is None:
+        raise HTTPException(
+            status_code=400, detail="cprofile mode requires a target run"
+        )
+
+    from ...infrastructure.observability.profiler import (
+        ProfilerBusy,
+        SamplingProfiler,
+        default_profiling,
+    )
+
+    try:
+        default_profiling.acquire()
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    interval = interval_ms / 1000
+    try:
+        if target is None:
+            profiler = SamplingProfiler(interval, include_idle=idle).start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.stop()
+        else:
+            capture = default_profiling.arm(target, mode, interval, top)
+            loop = asyncio.get_running_loop()
+            waited_until = loop.time() + seconds
+            while not capture.done.is_set():
+                if loop.time() >= waited_until:
+                    raise HTTPException(
+                        status_code=504,
+                        detail=f"No {target} run finished within {seconds:g}s",
+                    )
+                await asyncio.sleep(CAPTURE_POLL_INTERVAL)
+            if capture.report is not None:
+                return {"status": "success", "data": capture.report}
+            profiler = capture.profiler
+    finally:
+        default_profiling.release()
+
+    if format == "collapsed":
+        return PlainTextResponse(profiler.collapsed())
+    return {"status": "success", "data": profiler.summary(top=top)}
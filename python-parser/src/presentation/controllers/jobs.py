@@ -0,0 +1,163 @@
+import asyncio
+import os
+import uuid
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from fastapi import HTTPException, Request
+
+from ...infrastructure.runtime.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    deadline_scope,
+)
+from ...infrastructure.runtime.progress import (
+    ProgressTracker,
+    default_progress,
+    progress_scope,
+)
+from ...infrastructure.runtime.single_flight import default_single_flight
+
+T = TypeVar("T")
+
+# 호출자(프록시 등)가 지정하는 요청 기한 (초)
+DEADLINE_HEADER = "X-Request-Timeout"
+
+# 진행 상황 스트림(/api/v1/progress/{job_id}/events)을 구독할 때 쓰는 요청 id
+JOB_ID_HEADER = "X-Job-Id"
+
+# 그룹별 기본 기한 (초, `REQUEST_DEADLINE_<GROUP>`로 변경, 0이면 기한 없음)
+DEFAULT_DEADLINES: Dict[str, float] = {
+    "analysis": 300.0,
+    "upload": 300.0,
+    "generation": 600.0,
+}
+
+# 클라이언트 연결 끊김 확인 간격 (초)
+DISCONNECT_POLL_INTERVAL = 1.0
+
+
+class _SharedJob:
+    """합쳐진 요청이 공유하는 기한과 진행 카운터"""
+
+    def __init__(self, deadline: Deadline, tracker: ProgressTracker):
+        self.deadline = deadline
+        self.tracker = tracker
+
+
+# single-flight 키 -> 진행 중인 작업
+_shared_jobs: Dict[Hashable, _SharedJob] = {}
+
+
+def request_timeout(request: Request, group: str) -> Optional[float]:
+    """요청 헤더 또는 그룹 기본값으로 정한 기한 (없으면 None)"""
+    value = request.headers.get(DEADLINE_HEADER) or os.getenv(
+        f"REQUEST_DEADLINE_{group.upper()}", str(DEFAULT_DEADLINES.get(group, 0))
+    )
+    try:
+        timeout = float(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid {DEADLINE_HEADER}: {value}"
+        )
+    return timeout if timeout > 0 else None
+
+
+def job_id(request: Request) -> str:
+    """요청의 진행 상황 id (헤더가 없으면 생성해 요청 안에서 재사용)"""
+    value = getattr(request.state, "job_id", None)
+    if value is None:
+        value = request.headers.get(JOB_ID_HEADER) or uuid.uuid4().hex[:12]
+        request.state.job_id = value
+    return value
+
+
+async def tracked(
+    kind: str,
+    request: Request,
+    target: Optional[str],
+    factory: Callable[[], Awaitable[T]],
+) -> T:
+    """요청 전체를 진행 상황 목록에 등록하고 끝나면 상태 기록
+
+    analyze-all처럼 여러 작업을 차례로 실행하는 요청을 한 id로 묶는다. 이미 등록된
+    요청 안에서 호출되면 바깥 호출이 상태를 기록한다.
+    """
+    current = job_id(request)
+    if not default_progress.open(current, kind, target):
+        return await factory()
+    try:
+        result = await factory()
+    except HTTPException as e:
+        default_progress.close(current, "failed", str(e.detail))
+        raise
+    except BaseException as e:
+        default_progress.close(current, "failed", str(e) or type(e).__name__)
+        raise
+    default_progress.close(current, "completed")
+    return result
+
+
+async def _watch_disconnect(request: Request, on_disconnect: Callable[[], None]):
+    try:
+        while not await request.is_disconnected():
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+    except RuntimeError:
+        return  # receive 채널이 없는 요청 (내부 호출)
+    on_disconnect()
+
+
+async def run_job(
+    group: str,
+    request: Request,
+    factory: Callable[[], Awaitable[T]],
+    key: Optional[Hashable] = None,
+    target: Optional[str] = None,
+) -> T:
+    """요청 기한과 진행 카운터를 붙여 factory() 실행
+
+    기한과 카운터는 contextvars로 분석/생성 풀까지 전달된다. 작업 루프는 카운터에
+    진행 상황을 기록하고, 기한이 지나거나 클라이언트 연결이 끊기면 남은 항목을
+    건너뛰어 부분 결과를 돌려준다. key가 있으면 같은 키의 동시 요청을 합치고
+    기한과 카운터를 공유한다 (가장 늦은 기한을 따르며, 모든 호출자의 연결이
+    끊겼을 때만 취소).
+    """
+    timeout = request_timeout(request, group)
+    shared = _shared_jobs.get(key) if key is not None else None
+    if shared is None:
+        shared = _SharedJob(Deadline(timeout), ProgressTracker(group, target))
+        if key is not None:
+            _shared_jobs[key] = shared
+    deadline = shared.deadline
+    deadline.attach(timeout)
+
+    detached = False
+
+    def detach() -> None:
+        nonlocal detached
+        if not detached:
+            detached = True
+            deadline.detach()
+
+    async def run() -> T:
+        try:
+            with deadline_scope(deadline), progress_scope(shared.tracker):
+                return await factory()
+        finally:
+            shared.tracker.finish()
+            if key is not None and _shared_jobs.get(key) is shared:
+                del _shared_jobs[key]
+
+    async def run_tracked() -> T:
+        default_progress.attach(job_id(request), shared.tracker)
+        if key is None:
+            return await run()
+        return await default_single_flight.run(key, run)
+
+    watcher = asyncio.ensure_future(_watch_disconnect(request, detach))
+    try:
+        return await tracked(group, request, target, run_tracked)
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=f"Request stopped: {e.reason}")
+    finally:
+        watcher.cancel()
+        detach()
@@ -0,0 +1,107 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ...infrastructure.observability.metrics import CallbackGauge, default_registry
+
+router = APIRouter(tags=["metrics"])
+
+# Prometheus 텍스트 노출 형식
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _executor_jobs():
+    from ...infrastructure.runtime.executors import get_executors
+
+    for name, stats in get_executors().stats().items():
+        yield (name, "running"), stats["running"]
+        yield (name, "queued"), stats["queued"]
+
+
+def _admission_jobs():
+    from ...infrastructure.runtime.admission import get_admission
+
+    for name, stats in get_admission().stats().items():
+        yield (name, "running"), stats["running"]
+        yield (name, "waiting"), stats["waiting"]
+
+
+def _coalesced_jobs():
+    from ...infrastructure.runtime.single_flight import default_single_flight
+
+    yield (), default_single_flight.in_flight()
+
+
+def _tracked_jobs():
+    from ...infrastructure.runtime.progress import default_progress
+
+    counts = {}
+    for job in default_progress.list_jobs():
+        counts[(job["kind"], job["status"])] = (
+            counts.get((job["kind"], job["status"]), 0) + 1
+        )
+    return counts.items()
+
+
+def _memory_bytes():
+    from ...infrastructure.runtime.memory_budget import get_memory_accounting
+
+    # 집계는 TTL 동안 재사용하므로 스크레이프마다 다시 측정하지 않음
+    usage = get_memory_accounting().usage()
+    for name, source in usage["sources"].items():
+        yield (name,), source["bytes"]
+
+
+def _process_memory():
+    from ...infrastructure.observability.memory import process_memory
+
+    for kind, value in process_memory().items():
+        if value is not None:
+            yield (kind.replace("_bytes", ""),), value
+
+
+# 진행 중 작업 수는 스크레이프할 때 실행 풀/입장 제어/요청 목록에서 읽는다
+for _gauge in (
+    CallbackGauge(
+        "runtime_executor_jobs",
+        "Jobs running or queued per executor pool",
+        ("pool", "state"),
+        _executor_jobs,
+    ),
+    CallbackGauge(
+        "runtime_admission_jobs",
+        "Jobs running or waiting per admission group",
+        ("group", "state"),
+        _admission_jobs,
+    ),
+    CallbackGauge(
+        "runtime_coalesced_jobs_in_flight",
+        "Distinct in-flight jobs shared by coalesced requests",
+        (),
+        _coalesced_jobs,
+    ),
+    CallbackGauge(
+        "runtime_tracked_jobs",
+        "Recent analysis/generation requests by kind and status",
+        ("kind", "status"),
+        _tracked_jobs,
+    ),
+    CallbackGauge(
+        "memory_accounted_bytes",
+        "Estimated bytes held by each in-memory store",
+        ("source",),
+        _memory_bytes,
+    ),
+    CallbackGauge(
+        "process_memory_bytes",
+        "Process resident memory (rss, peak_rss)",
+        ("kind",),
+        _process_memory,
+    ),
+):
+    default_registry.register(_gauge)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 형식 메트릭 (외부 서비스 없이 프로세스 안 카운터에서 생성)"""
+    return PlainTextResponse(default_registry.render(), media_type=CONTENT_TYPE)
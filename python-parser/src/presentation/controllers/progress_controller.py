@@ -0,0 +1,86 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from ...infrastructure.runtime.progress import default_progress
+
+router = APIRouter(prefix="/api/v1/progress", tags=["progress"])
+
+# 변경이 없어도 경과 시간/처리량을 갱신해 보내는 간격 (초)
+HEARTBEAT_INTERVAL = 5.0
+
+
+def _sse(event: str, data: Dict[str, Any], event_id: int) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+async def _event_stream(
+    request: Request, job_id: str, interval: float, wait: float
+) -> AsyncIterator[str]:
+    """진행 상황이 바뀔 때마다 progress 이벤트, 끝나면 done 이벤트 후 종료"""
+    # 분석 요청보다 먼저 구독을 시작할 수 있도록 wait초까지 등록을 기다림
+    waited_until = time.monotonic() + wait
+    while default_progress.snapshot(job_id) is None:
+        if time.monotonic() >= waited_until or await request.is_disconnected():
+            yield _sse("error", {"job_id": job_id, "error": "job not found"}, 0)
+            return
+        await asyncio.sleep(interval)
+
+    event_id = 0
+    last_version = None
+    last_sent = 0.0
+    while not await request.is_disconnected():
+        version = default_progress.version(job_id)
+        snapshot = default_progress.snapshot(job_id)
+        if snapshot is None:
+            yield _sse("error", {"job_id": job_id, "error": "job expired"}, event_id)
+            return
+        now = time.monotonic()
+        if version != last_version or now - last_sent >= HEARTBEAT_INTERVAL:
+            event_id += 1
+            last_version, last_sent = version, now
+            if snapshot["status"] != "running":
+                yield _sse("done", snapshot, event_id)
+                return
+            yield _sse("progress", snapshot, event_id)
+        await asyncio.sleep(interval)
+
+
+@router.get("")
+async def list_jobs():
+    """진행 중이거나 최근 끝난 분석/생성 요청 목록"""
+    return {"status": "success", "data": default_progress.list_jobs()}
+
+
+@router.get("/{job_id}")
+async def get_job_progress(job_id: str):
+    """요청 하나의 현재 진행 상황"""
+    snapshot = default_progress.snapshot(job_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return {"status": "success", "data": snapshot}
+
+
+@router.get("/{job_id}/events")
+async def stream_job_progress(
+    request: Request,
+    job_id: str,
+    interval: float = Query(0.5, ge=0.1, le=10, description="Polling interval"),
+    wait: float = Query(10, ge=0, le=60, description="Seconds to wait for the job"),
+):
+    """진행 상황 Server-Sent Events 스트림
+
+    분석/생성 요청에 `X-Job-Id` 헤더로 id를 지정하고 같은 id로 구독한다.
+    처리한 파일/ViewSet 수, 현재 항목, 초당 처리량, 예상 남은 시간, 단계별 소요
+    시간을 progress 이벤트로 보내고, 요청이 끝나면 done 이벤트를 보낸다.
+    """
+    return StreamingResponse(
+        _event_stream(request, job_id, interval, wait),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
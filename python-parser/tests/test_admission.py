@@ -0,0 +1,132 @@
+import asyncio
+import io
+import zipfile
+
+import pytest
+
+from src.infrastructure.runtime.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    estimate_zip_cost,
+)
+
+
+async def hold(event: asyncio.Event, order: list, label: str):
+    order.append(label)
+    await event.wait()
+    return label
+
+
+class TestAdmissionController:
+    """입장 제어 테스트"""
+
+    def test_queue_full_rejects_with_retry_after(self):
+        """대기열이 가득 차면 Retry-After와 함께 거절"""
+        controller = AdmissionController("analysis", max_queue=1)
+
+        async def scenario():
+            release = asyncio.Event()
+            order = []
+            running = asyncio.create_task(
+                controller.run("a", 1, lambda: hold(release, order, "a1"))
+            )
+            queued = asyncio.create_task(
+                controller.run("b", 1, lambda: hold(release, order, "b1"))
+            )
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejected) as rejected:
+                await controller.run("c", 1, lambda: hold(release, order, "c1"))
+            release.set()
+            await asyncio.gather(running, queued)
+            return rejected.value, order
+
+        rejected, order = asyncio.run(scenario())
+
+        assert rejected.retry_after >= 1
+        assert order == ["a1", "b1"]
+        assert (controller.admitted, controller.rejected) == (2, 1)
+
+    def test_round_robin_between_clients(self):
+        """한 클라이언트가 몰아 보내도 다른 클라이언트가 번갈아 입장"""
+        controller = AdmissionController(
+            "analysis", max_queue=10, max_queue_per_client=5
+        )
+        order = []
+
+        async def job(label):
+            order.append(label)
+            await asyncio.sleep(0)
+
+        async def scenario():
+            tasks = [
+                asyncio.create_task(controller.run(c, 1, lambda l=l: job(l)))
+                for c, l in [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")]
+            ]
+            await asyncio.gather(*tasks)
+
+        asyncio.run(scenario())
+
+        assert order == ["a1", "a2", "b1", "a3"]
+
+    def test_per_client_limit_and_cost(self):
+        """클라이언트별 대기 수 제한과 비용 상한"""
+        controller = AdmissionController(
+            "upload", max_concurrency=3, max_cost=10, max_queue_per_client=1
+        )
+
+        async def scenario():
+            release = asyncio.Event()
+            order = []
+            big = asyncio.create_task(
+                controller.run("a", 8, lambda: hold(release, order, "big"))
+            )
+            await asyncio.sleep(0)
+            # 비용 상한(10)을 넘으므로 동시 실행 수가 남아도 대기
+            waiting = asyncio.create_task(
+                controller.run("b", 5, lambda: hold(release, order, "b"))
+            )
+            await asyncio.sleep(0)
+            stats = controller.stats()
+            with pytest.raises(AdmissionRejected):
+                await controller.run("b", 1, lambda: hold(release, order, "b2"))
+            release.set()
+            await asyncio.gather(big, waiting)
+            return stats, order
+
+        stats, order = asyncio.run(scenario())
+
+        assert (stats["running"], stats["waiting"]) == (1, 1)
+        assert order == ["big", "b"]
+
+    def test_wait_timeout(self):
+        """최대 대기 시간을 넘으면 거절하고 대기열에서 빠짐"""
+        controller = AdmissionController("generation", max_wait=0.05)
+
+        async def scenario():
+            release = asyncio.Event()
+            running = asyncio.create_task(
+                controller.run("a", 1, lambda: hold(release, [], "a"))
+            )
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejected):
+                await controller.run("b", 1, lambda: hold(release, [], "b"))
+            waiting = controller.stats()["waiting"]
+            release.set()
+            await running
+            return waiting
+
+        assert asyncio.run(scenario()) == 0
+        assert controller.stats()["running"] == 0
+
+
+class TestCostEstimate:
+    """입장 비용 추정 테스트"""
+
+    def test_zip_cost(self):
+        """zip 목록의 압축 해제 크기로 비용 추정"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("a.py", "x" * (3 * 1024 * 1024))
+
+        assert estimate_zip_cost(buffer) == pytest.approx(3.0)
+        assert estimate_zip_cost(io.BytesIO(b"not a zip")) == 1.0
@@ -0,0 +1,173 @@
+import ast
+import copy
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.suite import (
+    SCHEMA_VERSION,
+    Benchmark,
+    compare,
+    measure,
+    run_suite,
+    select,
+)
+from benchmarks.synthetic_project import PRESETS, ProjectSpec, generate_project
+
+
+def make_report(spec=PRESETS["tiny"], **medians):
+    """벤치마크별 중앙값만 가진 보고서"""
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": {"python": "3.11"},
+        "project": {"spec": vars(spec).copy(), "stats": {}},
+        "results": {name: {"median_seconds": value} for name, value in medians.items()},
+    }
+
+
+class TestSyntheticProject:
+    """합성 Django 프로젝트 생성기 테스트"""
+
+    def test_generated_files_parse_and_match_spec(self):
+        """생성한 파일이 모두 파싱되고 통계가 규모와 맞는지 테스트"""
+        spec = ProjectSpec(apps=2, modules_per_app=3, viewsets_per_app=2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            stats = generate_project(root, spec)
+
+            files = list(root.rglob("*.py"))
+            for file_path in files:
+                ast.parse(file_path.read_text(encoding="utf-8"))
+
+            assert stats["files"] == len(files)
+            assert stats["bytes"] == sum(len(f.read_bytes()) for f in files)
+            assert stats["viewsets"] == 4
+            assert len(list(root.glob("app/*/services/module_*.py"))) == 6
+
+    def test_same_seed_same_code(self):
+        """같은 seed는 같은 코드, 다른 seed는 다른 호출 구조"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            generate_project(root / "a", ProjectSpec(seed=1))
+            generate_project(root / "b", ProjectSpec(seed=1))
+            generate_project(root / "c", ProjectSpec(seed=2))
+
+            module = Path("app/billing/services/module_1.py")
+            assert (root / "a" / module).read_text() == (
+                root / "b" / module
+            ).read_text()
+            assert (root / "a" / module).read_text() != (
+                root / "c" / module
+            ).read_text()
+
+    def test_viewsets_discovered(self):
+        """생성한 ViewSet을 문서 생성기가 모두 발견하는지 테스트"""
+        from src.infrastructure.generators.viewset_discovery import ViewSetIndex
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            stats = generate_project(root, PRESETS["small"])
+
+            names = {v["viewset"] for v in ViewSetIndex().discover(root)}
+
+            assert len(names) == stats["viewsets"]
+            assert "InvoiceViewSet" in names
+
+
+class TestBenchmarkSuite:
+    """벤치마크 측정과 기준 비교 테스트"""
+
+    def test_measure_excludes_setup_and_warmup(self):
+        """setup은 매번 실행하고 warmup 결과는 버림"""
+        calls = []
+        benchmark = Benchmark(
+            "demo",
+            "demo",
+            lambda state: calls.append(state),
+            setup=lambda: len(calls),
+            items=lambda: 10,
+        )
+
+        result = measure(benchmark, repeat=3, warmup=2)
+
+        assert calls == [0, 1, 2, 3, 4]
+        assert result["runs"] == 3
+        assert result["files_per_second"] > 0
+
+    def test_select_by_pattern(self):
+        """이름 패턴으로 벤치마크 선택"""
+        benchmarks = [
+            Benchmark(name, name, lambda _: None)
+            for name in ("parser.python", "parser.hybrid", "analysis.execute")
+        ]
+
+        assert [b.name for b in select(benchmarks, ["parser.*"])] == [
+            "parser.python",
+            "parser.hybrid",
+        ]
+        assert len(select(benchmarks, [])) == 3
+
+    def test_run_suite_covers_all_benchmarks(self):
+        """작은 프로젝트로 전체 벤치마크 한 번씩 실행"""
+        spec = PRESETS["tiny"]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project = Path(tmpdir)
+            stats = generate_project(project, spec)
+
+            report = run_suite(project, spec, stats, repeat=1, warmup=0)
+
+        assert set(report["results"]) == {
+            "parser.python",
+            "parser.hybrid",
+            "analysis.execute",
+            "repository.point_queries",
+            "repository.scans",
+            "generation.static_cold",
+            "generation.static_warm",
+        }
+        assert report["results"]["generation.static_cold"]["viewsets_per_second"] > 0
+        assert report["project"]["stats"] == stats
+        json.dumps(report)
+
+    def test_compare_statuses(self):
+        """회귀/개선/잡음/추가/누락 판정"""
+        baseline = make_report(a=1.0, b=1.0, c=1.0, tiny=0.001, gone=1.0)
+        current = make_report(a=1.5, b=0.5, c=1.1, tiny=0.002, added=1.0)
+
+        rows = {row["name"]: row for row in compare(current, baseline, 0.25)}
+
+        assert rows["a"]["status"] == "regression"
+        assert rows["a"]["change"] == 0.5
+        assert rows["b"]["status"] == "improvement"
+        assert rows["c"]["status"] == "ok"
+        # 비율은 크지만 절대 차이가 측정 잡음 수준
+        assert rows["tiny"]["status"] == "ok"
+        assert rows["added"]["status"] == "new"
+        assert rows["gone"]["status"] == "missing"
+
+    def test_compare_rejects_different_spec(self):
+        """합성 프로젝트 규모가 다르면 비교하지 않음"""
+        with pytest.raises(ValueError):
+            compare(make_report(PRESETS["tiny"]), make_report(PRESETS["small"]))
+
+    def test_cli_exit_code_on_regression(self, capsys):
+        """기준보다 느려지면 종료 코드 1"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            baseline = Path(tmpdir) / "baseline.json"
+            args = ["run", "--preset", "tiny", "--repeat", "1", "--warmup", "0"]
+            args += ["--only", "repository.scans"]
+
+            assert main(args + ["--save-baseline", str(baseline)]) == 0
+            assert main(args + ["--compare", str(baseline)]) == 0
+
+            # 기준을 터무니없이 빠르게 바꾸면 회귀로 판정
+            report = json.loads(baseline.read_text())
+            fast = copy.deepcopy(report)
+            fast["results"]["repository.scans"]["median_seconds"] = 1e-6
+            baseline.write_text(json.dumps(fast))
+            assert main(args + ["--compare", str(baseline), "--min-delta", "0"]) == 1
+
+        assert "regressions: repository.scans" in capsys.readouterr().err
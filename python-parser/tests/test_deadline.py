@@ -0,0 +1,128 @@
+import time
+
+import pytest
+from pathlib import Path
+import tempfile
+
+from src.application.use_cases.analyze_code_use_case import (
+    AnalysisRequest,
+    AnalyzeCodeUseCase,
+)
+from src.infrastructure.runtime.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    stop_reason,
+)
+from src.infrastructure.runtime.executors import ExecutorPool
+from src.infrastructure.runtime.project_scheduler import ProjectScheduler
+from tests.test_project_scheduler import describe_project
+
+
+class TestDeadline:
+    """요청 기한/취소 신호 테스트"""
+
+    def test_timeout_expires(self):
+        """기한이 지나면 중단 사유가 생기는지 테스트"""
+        deadline = Deadline(0.05)
+        assert not deadline.expired()
+        time.sleep(0.06)
+
+        assert deadline.expired()
+        assert deadline.reason == "deadline exceeded"
+        with pytest.raises(DeadlineExceeded):
+            deadline.check()
+
+    def test_shared_deadline_cancelled_by_last_holder(self):
+        """합쳐진 요청은 모든 호출자가 떠났을 때만 취소되는지 테스트"""
+        deadline = Deadline(10)
+        deadline.attach(10)
+        deadline.attach(60)
+        assert deadline.remaining() > 50
+
+        deadline.detach()
+        assert not deadline.expired()
+        deadline.detach()
+        assert deadline.reason == "client disconnected"
+
+    def test_propagates_to_pool_threads(self):
+        """풀에 제출한 작업에서 요청 기한을 볼 수 있는지 테스트"""
+        pool = ExecutorPool("analysis")
+        deadline = Deadline(10)
+        try:
+            with deadline_scope(deadline):
+                future = pool.submit(current_deadline)
+            assert future.result(5) is deadline
+            assert pool.submit(current_deadline).result(5) is None
+        finally:
+            pool.shutdown()
+
+
+class TestCooperativeCancellation:
+    """작업 루프의 협조적 취소 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        """파일 여러 개짜리 테스트용 프로젝트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for i in range(5):
+                (root / f"module_{i}.py").write_text(f"def func_{i}():\n    pass\n")
+            yield root
+
+    def test_analysis_returns_partial_result(self, project, monkeypatch):
+        """기한이 지나면 남은 파일을 건너뛰고 부분 결과를 표시하는지 테스트"""
+        use_case = AnalyzeCodeUseCase()
+        deadline = Deadline()
+        analyze_file = use_case._analyze_file
+
+        def analyze_then_cancel(file_path, request, timings=None):
+            result = analyze_file(file_path, request, timings)
+            if len(analyzed) == 1:
+                deadline.cancel("client disconnected")
+            analyzed.append(file_path)
+            return result
+
+        analyzed = []
+        monkeypatch.setattr(use_case, "_analyze_file", analyze_then_cancel)
+        with deadline_scope(deadline):
+            result = use_case.execute(AnalysisRequest(project_path=project))
+
+        assert len(analyzed) == 2
+        assert result.partial
+        assert result.stop_reason == "client disconnected"
+        assert len(result.skipped_files) == 3
+        assert result.statistics["total_symbols"] == 2
+
+    def test_analysis_not_started_after_deadline(self, project):
+        """대기 중 기한이 지나면 기존 결과를 지우지 않고 중단하는지 테스트"""
+        use_case = AnalyzeCodeUseCase()
+        use_case.execute(AnalysisRequest(project_path=project))
+        deadline = Deadline()
+        deadline.cancel("deadline exceeded")
+
+        with deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            use_case.execute(AnalysisRequest(project_path=project))
+        assert len(use_case.symbol_repository.get_all()) == 5
+
+    def test_scheduler_skips_remaining_projects(self, project):
+        """기한이 지나면 실행 중 프로세스를 종료하고 나머지를 건너뛰는지 테스트"""
+        for name in ("slow", "small"):
+            (project / name).mkdir()
+        scheduler = ProjectScheduler(max_concurrency=1, start_method="fork")
+        deadline = Deadline(0.5)
+
+        started = time.monotonic()
+        with deadline_scope(deadline):
+            outcomes = {
+                o.project_path.name: o
+                for o in scheduler.run(
+                    [project / "slow", project / "small"], describe_project
+                )
+            }
+
+        assert time.monotonic() - started < 5
+        assert stop_reason() is None
+        assert outcomes["slow"].status == "cancelled"
+        assert outcomes["small"].status == "skipped"
@@ -0,0 +1,195 @@
+import os
+import signal
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.cache.fragment_cache import ViewSetFragmentCache
+from src.infrastructure.generators.api_documentation_generator import (
+    generate_api_documentation,
+)
+from src.infrastructure.introspection.django_worker_pool import (
+    DjangoWorker,
+    DjangoWorkerPool,
+    WorkerError,
+)
+
+
+def make_project(root: Path, name: str) -> Path:
+    """views.py가 같은 앱의 helpers.py를 import하는 프로젝트"""
+    app_dir = root / name / "app" / "demo"
+    app_dir.mkdir(parents=True)
+    (app_dir / "helpers.py").write_text("VALUE = 1\n")
+    (app_dir / "views.py").write_text(
+        "from app.demo import helpers\n\n" "class DemoViewSet:\n    pass\n"
+    )
+    return root / name
+
+
+def touch(path: Path) -> None:
+    """mtime을 1초 뒤로 옮김"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestDjangoWorkerPool:
+    """프로젝트별 Django 워커 풀 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield make_project(Path(tmpdir), "demo")
+
+    @pytest.fixture
+    def pool(self):
+        pool = DjangoWorkerPool(request_timeout=30, boot_timeout=30)
+        yield pool
+        pool.shutdown()
+
+    def test_boot_and_requests(self, pool, project):
+        """부팅 후 같은 워커가 요청을 차례로 처리"""
+        ping = pool.request(project, "ping")
+        views_file = str(project / "app" / "demo" / "views.py")
+
+        found = pool.request(
+            project,
+            "viewset_fields",
+            {"file_path": views_file, "viewset_name": "DemoViewSet"},
+        )
+        missing = pool.request(
+            project,
+            "viewset_fields",
+            {"file_path": views_file, "viewset_name": "MissingViewSet"},
+        )
+
+        assert ping["pid"] == pool.get_worker(project).pid
+        assert found["found"] is True
+        assert missing == {"found": False, "fields": {}}
+        assert pool.status()[0]["requests_served"] == 3
+
+    def test_error_response_keeps_worker(self, pool, project):
+        """요청 오류는 예외로 전달하고 워커는 유지"""
+        pid = pool.get_worker(project).pid
+
+        with pytest.raises(WorkerError, match="unknown_op"):
+            pool.request(project, "unknown_op")
+
+        assert pool.get_worker(project).pid == pid
+
+    def test_crashed_worker_respawned(self, pool, project):
+        """워커 프로세스가 죽으면 다음 요청에서 새로 실행"""
+        worker = pool.get_worker(project)
+        os.kill(worker.pid, signal.SIGKILL)
+        worker._process.wait(timeout=10)
+
+        assert pool.request(project, "ping")["pid"] != worker.pid
+        assert pool.recycled == 1
+
+    def test_settings_change_restarts_worker(self, pool, project):
+        """settings 파일이 바뀌면 워커 재시작"""
+        settings = project / "app" / "settings.py"
+        settings.write_text("DEBUG = True\n")
+        pid = pool.get_worker(project).pid
+
+        assert pool.get_worker(project).pid == pid
+        touch(settings)
+        assert pool.get_worker(project).pid != pid
+
+    def test_idle_worker_reaped(self, project):
+        """idle_timeout 동안 쓰이지 않은 워커만 종료"""
+        pool = DjangoWorkerPool(idle_timeout=60)
+        try:
+            worker = pool.get_worker(project)
+
+            assert pool.reap_idle() == 0
+            assert pool.reap_idle(now=time.monotonic() + 120) == 1
+            assert not worker.is_alive()
+            assert pool.status() == []
+            assert pool.request(project, "ping")["pid"] != worker.pid
+        finally:
+            pool.shutdown()
+
+    def test_begin_generation_purges_only_changed_modules(self, pool, project):
+        """mtime이 바뀐 프로젝트 모듈만 다시 로드 대상으로 제거"""
+        views_file = project / "app" / "demo" / "views.py"
+        params = {"file_path": str(views_file), "viewset_name": "DemoViewSet"}
+        pool.request(project, "viewset_fields", params)
+
+        assert pool.request(project, "begin_generation")["purged"] == 0
+
+        touch(project / "app" / "demo" / "helpers.py")
+        assert pool.request(project, "begin_generation")["purged"] == 1
+        assert pool.request(project, "begin_generation")["purged"] == 0
+
+    def test_generation_falls_back_when_worker_fails_to_start(self, project):
+        """워커가 부팅하지 못하면 생성 전체를 실패시키지 않고 정적 분석으로 대체"""
+        (project / "app" / "demo" / "views.py").write_text(
+            "from rest_framework.viewsets import ModelViewSet\n\n"
+            "class DemoViewSet(ModelViewSet):\n    pass\n"
+        )
+        pool = DjangoWorkerPool(python_executable="/bin/false", boot_timeout=10)
+        try:
+            with pytest.raises(WorkerError):
+                pool.get_worker(project)
+
+            documentation = generate_api_documentation(
+                project,
+                "http://localhost",
+                introspection_pool=pool,
+                fragment_cache=ViewSetFragmentCache(),
+            )
+        finally:
+            pool.shutdown()
+
+        assert documentation.endpoints
+        assert {endpoint.tags[0] for endpoint in documentation.endpoints} == {"demo"}
+
+
+class TestWorkerBootConcurrency:
+    """워커 부팅 동시성 테스트"""
+
+    def test_boot_does_not_block_other_projects(self, monkeypatch):
+        """느린 부팅 중에도 다른 프로젝트 워커를 얻고, 같은 프로젝트는 한 번만 부팅"""
+        release = threading.Event()
+        boots = []
+        start = DjangoWorker.start
+
+        def slow_start(worker):
+            boots.append(worker.project_path.name)
+            if worker.project_path.name == "slow":
+                release.wait(30)
+            start(worker)
+
+        monkeypatch.setattr(DjangoWorker, "start", slow_start)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            slow = make_project(Path(tmpdir), "slow")
+            fast = make_project(Path(tmpdir), "fast")
+            pool = DjangoWorkerPool(boot_timeout=30)
+            try:
+                results = []
+                threads = [
+                    threading.Thread(
+                        target=lambda: results.append(pool.get_worker(slow))
+                    )
+                    for _ in range(2)
+                ]
+                for thread in threads:
+                    thread.start()
+                while boots.count("slow") == 0:
+                    time.sleep(0.01)
+
+                assert pool.get_worker(fast).is_alive()
+
+                release.set()
+                for thread in threads:
+                    thread.join(30)
+                assert len(results) == 2
+                assert results[0] is results[1]
+                assert boots.count("slow") == 1
+            finally:
+                release.set()
+                pool.shutdown()
@@ -0,0 +1,78 @@
+from src.infrastructure.repositories.endpoint_index import EndpointIndex
+
+
+def make_spec():
+    """리터럴/경로 변수 경로가 섞인 스펙"""
+
+    def operation(summary, tag):
+        return {"summary": summary, "tags": [tag], "responses": {}}
+
+    return {
+        "paths": {
+            "/api/v1/revenues/": {
+                "get": operation("List revenues", "revenues"),
+                "post": operation("Create revenue", "revenues"),
+            },
+            "/api/v1/revenues/{id}/": {
+                "get": operation("Retrieve revenue", "revenues"),
+                "delete": operation("Delete revenue", "revenues"),
+            },
+            "/api/v1/revenues/summary/": {
+                "get": operation("Revenue summary report", "revenues"),
+            },
+            "/api/v1/bills/{bill_id}/items/{id}/": {
+                "get": operation("Retrieve bill item", "bills"),
+            },
+        }
+    }
+
+
+class TestEndpointIndex:
+    """오퍼레이션 인덱스 조회 테스트"""
+
+    def test_match_concrete_path(self):
+        """실제 요청 경로로 템플릿을 찾고 경로 변수 값을 추출"""
+        index = EndpointIndex(make_spec())
+
+        matches = index.match("/api/v1/bills/7/items/3", "get")
+
+        assert len(matches) == 1
+        entry, params = matches[0]
+        assert entry.path == "/api/v1/bills/{bill_id}/items/{id}/"
+        assert params == {"bill_id": "7", "id": "3"}
+
+    def test_literal_preferred_over_param(self):
+        """리터럴 세그먼트가 경로 변수보다 먼저 매칭"""
+        index = EndpointIndex(make_spec())
+
+        matches = index.match("/api/v1/revenues/summary/", "GET")
+
+        assert [entry.path for entry, _ in matches] == [
+            "/api/v1/revenues/summary/",
+            "/api/v1/revenues/{id}/",
+        ]
+
+    def test_match_template_and_method(self):
+        """템플릿으로도 조회되고 메서드로 걸러지는지 테스트"""
+        index = EndpointIndex(make_spec())
+
+        matches = index.match("/api/v1/revenues/{pk}/", "DELETE")
+
+        assert [(e.method, e.summary) for e, _ in matches] == [
+            ("DELETE", "Delete revenue")
+        ]
+        assert index.match("/api/v1/unknown/") == []
+
+    def test_search_filters(self):
+        """메서드/태그/검색어/경로 접두사 조건의 교집합"""
+        index = EndpointIndex(make_spec())
+
+        assert [e.summary for e in index.search(query="revenue report")] == [
+            "Revenue summary report"
+        ]
+        assert len(index.search(method="get", tag="REVENUES")) == 3
+        assert [e.path for e in index.search(path_prefix="/api/v1/bills")] == [
+            "/api/v1/bills/{bill_id}/items/{id}/"
+        ]
+        assert len(index.search(limit=2)) == 2
+        assert index.search(query="nothing") == []
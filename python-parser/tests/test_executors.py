@@ -0,0 +1,153 @@
+import asyncio
+import contextvars
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.call_relationship import (
+    CallContext,
+    CallRelationship,
+    CallType,
+)
+from src.domain.entities.code_symbol import CodeSymbol, SymbolType
+from src.infrastructure.repositories.memory_call_repository import (
+    MemoryCallRepository,
+)
+from src.infrastructure.repositories.memory_symbol_repository import (
+    MemorySymbolRepository,
+)
+from src.infrastructure.runtime.executors import BlockingExecutors, ExecutorPool
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class TestBlockingExecutors:
+    """블로킹 작업 전용 풀 테스트"""
+
+    def test_event_loop_stays_responsive(self):
+        """블로킹 작업 중에도 이벤트 루프가 다른 요청을 처리하는지 테스트"""
+        executors = BlockingExecutors({"analysis": ExecutorPool("analysis")})
+
+        async def scenario():
+            started = time.perf_counter()
+            task = asyncio.create_task(executors.run("analysis", time.sleep, 0.3))
+            await asyncio.sleep(0.01)
+            tick = time.perf_counter() - started
+            await task
+            return tick
+
+        try:
+            assert asyncio.run(scenario()) < 0.2
+        finally:
+            executors.shutdown()
+
+    def test_queue_depth(self):
+        """풀 크기를 넘는 작업은 대기 중으로 집계"""
+        pool = ExecutorPool("generation", max_workers=1)
+        release = threading.Event()
+        try:
+            futures = [pool.submit(release.wait, 5) for _ in range(3)]
+            stats = pool.stats()
+            assert (stats["running"], stats["queued"]) == (1, 2)
+
+            release.set()
+            for future in futures:
+                future.result(5)
+            stats = pool.stats()
+            assert (stats["running"], stats["queued"], stats["completed"]) == (
+                0,
+                0,
+                3,
+            )
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_context_and_errors(self):
+        """스레드 풀은 contextvars를 이어받고 예외는 호출자에게 전달"""
+        pool = ExecutorPool("io", max_workers=2)
+
+        async def scenario():
+            request_id.set("abc")
+            value = await pool.run(request_id.get)
+            with pytest.raises(ZeroDivisionError):
+                await pool.run(lambda: 1 / 0)
+            return value
+
+        try:
+            assert asyncio.run(scenario()) == "abc"
+            assert pool.stats()["failed"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_from_env(self):
+        """환경변수로 풀 크기/종류 설정"""
+        executors = BlockingExecutors.from_env(
+            {"RUNTIME_IO_WORKERS": "8", "RUNTIME_ANALYSIS_EXECUTOR": "process"}
+        )
+
+        stats = executors.stats()
+        assert stats["io"]["max_workers"] == 8
+        assert stats["analysis"]["kind"] == "process"
+        assert stats["generation"] == {
+            "name": "generation",
+            "kind": "thread",
+            "max_workers": 1,
+            "running": 0,
+            "queued": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+
+
+class TestRepositoryConcurrency:
+    """분석 풀에서 저장하는 동안 이벤트 루프에서 조회하는 저장소 테스트"""
+
+    def test_reads_during_analysis_writes(self):
+        """저장 중에 통계/조회를 반복해도 순회 중 변경 오류가 없음"""
+        symbols = MemorySymbolRepository()
+        calls = MemoryCallRepository()
+        errors = []
+        done = threading.Event()
+
+        def analyze():
+            for _ in range(20):
+                symbols.clear()
+                calls.clear()
+                for i in range(500):
+                    name = f"f{i}"
+                    symbols.save(
+                        CodeSymbol(
+                            name, SymbolType.FUNCTION, Path(f"m{i}.py"), f"m{i}", 1, 2
+                        )
+                    )
+                    calls.save(
+                        CallRelationship(
+                            f"m{i}.{name}",
+                            f"m{i + 1}.f{i + 1}",
+                            CallType.FUNCTION_CALL,
+                            Path(f"m{i}.py"),
+                            1,
+                            0,
+                            CallContext.FUNCTION_CALL,
+                        )
+                    )
+            done.set()
+
+        writer = threading.Thread(target=analyze)
+        writer.start()
+        while not done.is_set():
+            try:
+                symbols.get_statistics()
+                symbols.find_unused_symbols()
+                calls.get_statistics()
+                calls.get_reverse_call_graph()
+                symbols.memory_usage()
+            except RuntimeError as e:
+                errors.append(e)
+                break
+        writer.join(30)
+
+        assert errors == []
@@ -0,0 +1,125 @@
+from src.infrastructure.generators.field_schema_registry import (
+    FieldSchemaRegistry,
+    SerializerSchemaCache,
+    default_field_registry,
+)
+
+
+# DRF 없이 이름과 상속 구조만 흉내 낸 필드/serializer 클래스
+class Field:
+    def __init__(self, required=False, read_only=False, help_text=None, child=None):
+        self.required = required
+        self.read_only = read_only
+        self.help_text = help_text
+        self.child = child
+
+
+class CharField(Field):
+    pass
+
+
+class EmailField(CharField):
+    pass
+
+
+class IntegerField(Field):
+    pass
+
+
+class ListField(Field):
+    pass
+
+
+class Serializer(Field):
+    declared = {}
+    instances = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        type(self).instances += 1
+
+    @property
+    def fields(self):
+        return {name: factory() for name, factory in self.declared.items()}
+
+
+class ListSerializer(Field):
+    pass
+
+
+class AuthorSerializer(Serializer):
+    declared = {"id": lambda: IntegerField(read_only=True)}
+
+
+class RevenueSerializer(Serializer):
+    declared = {
+        "email": lambda: EmailField(required=True, help_text="메일"),
+        "tags": lambda: ListField(child=CharField()),
+        "author": lambda: AuthorSerializer(read_only=True),
+        "authors": lambda: ListSerializer(child=AuthorSerializer()),
+    }
+
+
+class TestFieldSchemaRegistry:
+    """필드 타입 디스패치 레지스트리 테스트"""
+
+    def test_resolves_through_mro(self):
+        """등록되지 않은 하위 클래스는 MRO의 가장 가까운 등록 클래스로 해석"""
+        assert default_field_registry.schema_for_field(EmailField()) == {
+            "type": "string"
+        }
+        assert default_field_registry.schema_for_field(Field()) == {"type": "string"}
+
+    def test_class_lookup_is_cached(self):
+        """클래스별 해석 결과를 캐시하고 등록 시 무효화하는지 테스트"""
+        registry = FieldSchemaRegistry()
+        registry.register_schema("CharField", {"type": "string"})
+
+        assert registry.schema_for_field(EmailField()) == {"type": "string"}
+        registry.register_schema("EmailField", {"type": "string", "format": "email"})
+        assert registry.schema_for_field(EmailField())["format"] == "email"
+
+    def test_static_names(self):
+        """정적 분석용 이름 조회 (상위 클래스 이름으로 대체)"""
+        assert default_field_registry.schema_for_names(
+            ["MoneyField", "DecimalField"]
+        ) == {"type": "number", "format": "decimal"}
+        assert default_field_registry.schema_for_names(["Unknown"]) == {
+            "type": "string"
+        }
+
+
+class TestSerializerSchemaCache:
+    """serializer 스키마 캐시 테스트"""
+
+    def test_nested_and_list_serializers(self):
+        """중첩 serializer와 ListSerializer를 재귀적으로 해석하는지 테스트"""
+        fields = SerializerSchemaCache().fields(RevenueSerializer)
+
+        assert fields["email"] == {
+            "type": "string",
+            "required": True,
+            "description": "메일",
+        }
+        assert fields["tags"] == {"type": "array", "items": {"type": "string"}}
+        assert fields["author"] == {
+            "type": "object",
+            "properties": {"id": {"type": "integer", "readOnly": True}},
+            "readOnly": True,
+        }
+        assert (
+            fields["authors"]["items"]["properties"] == fields["author"]["properties"]
+        )
+
+    def test_serializer_instantiated_once(self):
+        """같은 serializer는 생성 작업 동안 한 번만 계산하는지 테스트"""
+        cache = SerializerSchemaCache()
+        RevenueSerializer.instances = 0
+
+        first = cache.fields(RevenueSerializer)
+        second = cache.fields(RevenueSerializer)
+
+        assert first is second
+        assert RevenueSerializer.instances == 1
+        assert cache.misses == 2
+        assert cache.hits >= 2
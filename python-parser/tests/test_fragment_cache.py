@@ -0,0 +1,150 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pathlib import Path
+import tempfile
+
+from src.infrastructure.cache.fragment_cache import ViewSetFragmentCache
+from src.infrastructure.generators.static_serializer_extractor import (
+    StaticSerializerExtractor,
+)
+
+
+def touch(path: Path, content: str):
+    """내용을 바꾸고 mtime을 확실히 갱신"""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestViewSetFragmentCache:
+    """ViewSet별 필드 캐시의 의존성 추적 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        """serializer를 따로 가진 두 앱과 공유 모델"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for app in ("revenue", "billing"):
+                app_dir = root / "app" / app
+                app_dir.mkdir(parents=True)
+                (app_dir / "__init__.py").write_text("")
+                (app_dir / "serializers.py").write_text(
+                    "from rest_framework import serializers\n"
+                    "from core.models import Revenue\n\n"
+                    "class RevenueSerializer(serializers.ModelSerializer):\n"
+                    "    class Meta:\n"
+                    "        model = Revenue\n"
+                    "        fields = '__all__'\n"
+                )
+                (app_dir / "views.py").write_text(
+                    "from rest_framework import viewsets\n"
+                    "from .serializers import RevenueSerializer\n\n"
+                    "class BaseViewSet(viewsets.ModelViewSet):\n"
+                    "    pass\n\n"
+                    "class RevenueViewSet(BaseViewSet):\n"
+                    "    serializer_class = RevenueSerializer\n\n"
+                    "class OtherViewSet(viewsets.ViewSet):\n"
+                    "    pass\n"
+                )
+            core = root / "app" / "core"
+            core.mkdir()
+            (core / "__init__.py").write_text("")
+            (core / "models.py").write_text(
+                "from django.db import models\n\n"
+                "class Revenue(models.Model):\n"
+                "    title = models.CharField(max_length=100)\n"
+            )
+            yield root
+
+    def digests(self, project, cache):
+        """앱별 RevenueViewSet 의존성 해시"""
+        extractor = StaticSerializerExtractor(project)
+        return {
+            app: cache.dependency_digest(
+                project / "app" / app / "views.py", "RevenueViewSet", extractor
+            )
+            for app in ("revenue", "billing")
+        }
+
+    def test_local_dependencies(self, project):
+        """정적 import 분석으로 serializer/model 모듈을 찾는지 테스트"""
+        extractor = StaticSerializerExtractor(project)
+
+        dependencies = extractor.local_dependencies(
+            project / "app" / "revenue" / "views.py"
+        )
+
+        assert [p.relative_to(project.resolve()).as_posix() for p in dependencies] == [
+            "app/core/models.py",
+            "app/revenue/serializers.py",
+        ]
+
+    def test_serializer_edit_invalidates_only_dependents(self, project):
+        """serializer 수정 시 그 serializer를 쓰는 ViewSet만 키가 바뀌는지 테스트"""
+        cache = ViewSetFragmentCache()
+        before = self.digests(project, cache)
+
+        serializers = project / "app" / "billing" / "serializers.py"
+        touch(serializers, serializers.read_text() + "# edit\n")
+        after = self.digests(project, cache)
+
+        assert after["revenue"] == before["revenue"]
+        assert after["billing"] != before["billing"]
+
+    def test_shared_model_and_unrelated_class(self, project):
+        """공유 모델 수정은 모두, 같은 파일의 다른 클래스 수정은 영향 없음"""
+        cache = ViewSetFragmentCache()
+        before = self.digests(project, cache)
+
+        views = project / "app" / "revenue" / "views.py"
+        source = views.read_text()
+        touch(views, source + "\nclass ExtraViewSet(viewsets.ViewSet):\n    pass\n")
+        assert self.digests(project, cache)["revenue"] == before["revenue"]
+
+        # 같은 파일의 상위 클래스 수정은 반영
+        touch(views, source.replace("    pass\n", "    lookup_field = 'pk'\n", 1))
+        edited = self.digests(project, cache)
+        assert edited["revenue"] != before["revenue"]
+
+        models = project / "app" / "core" / "models.py"
+        touch(models, models.read_text() + "# edit\n")
+        after = self.digests(project, cache)
+        assert after["revenue"] != edited["revenue"]
+        assert after["billing"] != edited["billing"]
+
+    def test_get_put(self, project):
+        """의존성 해시가 같을 때만 캐시 적중"""
+        cache = ViewSetFragmentCache()
+        views = project / "app" / "revenue" / "views.py"
+
+        cache.put(views, "RevenueViewSet", "static", "abc", {"id": {}})
+
+        assert cache.get(views, "RevenueViewSet", "static", "abc") == {"id": {}}
+        assert cache.get(views, "RevenueViewSet", "static", "def") is None
+        assert cache.get(views, "RevenueViewSet", "worker", "abc") is None
+
+    def test_shared_across_threads(self, project):
+        """여러 생성 스레드가 함께 쓰고 지워도 같은 해시를 계산"""
+        cache = ViewSetFragmentCache()
+        expected = self.digests(project, ViewSetFragmentCache())
+        done = threading.Event()
+
+        def clear_repeatedly():
+            while not done.is_set():
+                cache.clear()
+
+        clearer = threading.Thread(target=clear_repeatedly)
+        clearer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(
+                    executor.map(lambda _: self.digests(project, cache), range(64))
+                )
+        finally:
+            done.set()
+            clearer.join(10)
+
+        assert all(result == expected for result in results)
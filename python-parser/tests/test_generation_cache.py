@@ -0,0 +1,217 @@
+import asyncio
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+from pathlib import Path
+import tempfile
+
+from src.domain.entities.api_documentation import (
+    ApiDocumentation,
+    ApiEndpoint,
+    ApiParameter,
+    HttpMethod,
+    ParameterType,
+)
+from src.application.use_cases.generate_api_docs_use_case import (
+    GenerateApiDocsUseCase,
+)
+from src.infrastructure.cache.generation_cache import (
+    GenerationCache,
+    documentation_from_dict,
+    documentation_to_dict,
+)
+from src.infrastructure.repositories.memory_api_documentation_repository import (
+    MemoryApiDocumentationRepository,
+)
+from src.infrastructure.runtime import admission
+from src.presentation.controllers import api_docs_controller
+
+
+def make_documentation():
+    """테스트용 API 문서"""
+    return ApiDocumentation(
+        title="revenue API Documentation",
+        version="1.0.0",
+        base_url="http://localhost:8000",
+        endpoints=[
+            ApiEndpoint(
+                path="/api/v1/revenue/{id}/",
+                method=HttpMethod.GET,
+                summary="조회",
+                parameters=[
+                    ApiParameter(
+                        name="id",
+                        type=ParameterType.PATH,
+                        data_type="integer",
+                        required=True,
+                    )
+                ],
+                responses={"200": {"description": "OK"}},
+                tags=["revenue"],
+            )
+        ],
+        info={"framework": "django"},
+    )
+
+
+@pytest.fixture
+def repo():
+    """커밋 하나가 있는 git 저장소"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "revenue"
+        root.mkdir()
+        (root / "views.py").write_text("class RevenueViewSet: pass\n")
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@test"]
+        subprocess.run(git + ["init", "-q"], cwd=root, check=True)
+        subprocess.run(git + ["add", "."], cwd=root, check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], cwd=root, check=True)
+        yield root
+
+
+def make_request():
+    """헤더 없는 HTTP 요청"""
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "headers": []}, receive)
+
+
+class TestGenerationCache:
+    """git HEAD 기준 생성 캐시 테스트"""
+
+    def test_documentation_round_trip(self):
+        """문서 직렬화/역직렬화 결과가 같은지 테스트"""
+        documentation = make_documentation()
+
+        restored = documentation_from_dict(documentation_to_dict(documentation))
+
+        assert restored == documentation
+
+    def test_hit_survives_restart(self, repo):
+        """디스크에 저장된 항목을 새 인스턴스에서도 읽는지 테스트"""
+        cache_dir = repo.parent / "cache"
+        cache = GenerationCache(cache_dir)
+        key = cache.key_for(repo, "http://localhost:8000")
+
+        assert cache.get(key) is None
+        cache.put(key, make_documentation())
+
+        restarted = GenerationCache(cache_dir)
+        assert restarted.get(key) == make_documentation()
+        assert restarted.hits == 1
+
+    def test_key_changes_with_working_tree(self, repo):
+        """작업 트리나 base_url이 바뀌면 키가 달라지는지 테스트"""
+        cache = GenerationCache(repo.parent / "cache")
+        clean = cache.key_for(repo, "http://localhost:8000")
+
+        assert cache.key_for(repo, "http://localhost:8000") == clean
+        assert cache.key_for(repo, "http://example.com") != clean
+
+        (repo / "views.py").write_text("class RevenueViewSet: x = 1\n")
+        dirty = cache.key_for(repo, "http://localhost:8000")
+        assert dirty.head_commit == clean.head_commit
+        assert dirty.dirty_fingerprint != clean.dirty_fingerprint
+
+    def test_no_git_no_key(self):
+        """git 저장소가 아니면 캐시를 쓰지 않는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = GenerationCache(Path(tmpdir) / "cache")
+
+            assert cache.key_for(Path(tmpdir), "http://localhost:8000") is None
+
+    def test_clear_rejects_paths_outside_cache(self, repo):
+        """project 이름에 경로가 들어 있으면 캐시 밖 파일을 지우지 않음"""
+        cache_dir = repo.parent / "cache"
+        cache = GenerationCache(cache_dir)
+        cache.put(cache.key_for(repo, "http://localhost:8000"), make_documentation())
+        outside = repo.parent / "api-docs"
+        outside.mkdir()
+        (outside / "revenue.json").write_text("{}")
+
+        for name in ("../api-docs", str(outside), "..", "revenue/../../api-docs"):
+            with pytest.raises(ValueError):
+                cache.clear(name)
+
+        assert (outside / "revenue.json").exists()
+        assert cache.clear("revenue") == 1
+
+    def test_clear_endpoint_requires_debug_access(self, monkeypatch):
+        """캐시 삭제 엔드포인트는 디버그 엔드포인트와 같은 접근 확인"""
+        monkeypatch.delenv("DEBUG_PROFILING_ENABLED", raising=False)
+
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(
+                api_docs_controller.clear_generation_cache(make_request(), "revenue")
+            )
+
+        assert error.value.status_code == 404
+
+
+class TestCachedGenerationAdmission:
+    """생성 캐시 적중 요청의 입장 제어 우회 테스트"""
+
+    def test_cache_hit_served_while_generation_holds_slot(self, repo, monkeypatch):
+        """생성이 슬롯을 차지하고 있어도 캐시 적중은 비용 추정/입장 없이 응답"""
+        cache = GenerationCache(repo.parent / "cache")
+        cache.put(cache.key_for(repo, "http://localhost:8000"), make_documentation())
+        use_case = GenerateApiDocsUseCase(
+            symbol_repository=None,
+            api_documentation_repository=MemoryApiDocumentationRepository(),
+            generation_cache=cache,
+        )
+        generation = admission.AdmissionController(
+            "generation", max_concurrency=1, max_queue=0
+        )
+        estimated = []
+        monkeypatch.setattr(
+            api_docs_controller, "services", SimpleNamespace(use_case=use_case)
+        )
+        monkeypatch.setattr(api_docs_controller, "REPOS_DIRECTORY", str(repo.parent))
+        monkeypatch.setattr(
+            api_docs_controller,
+            "estimate_directory_cost",
+            lambda path: estimated.append(path) or 1,
+        )
+        monkeypatch.setattr(
+            admission,
+            "_default_admission",
+            admission.AdmissionControl({"generation": generation}),
+        )
+
+        def generate(refresh):
+            return api_docs_controller.generate_api_documentation(
+                make_request(),
+                "revenue",
+                base_url="http://localhost:8000",
+                save_to_file=False,
+                static=False,
+                version=None,
+                refresh=refresh,
+            )
+
+        async def scenario():
+            release = asyncio.Event()
+            running = asyncio.create_task(generation.run("other", 1, release.wait))
+            await asyncio.sleep(0)
+            try:
+                hit = await generate(refresh=False)
+                with pytest.raises(HTTPException) as rejected:
+                    await generate(refresh=True)
+                return hit, rejected.value
+            finally:
+                release.set()
+                await running
+
+        hit, rejected = asyncio.run(scenario())
+
+        assert hit["data"]["cache"] == "hit"
+        assert hit["data"]["project_name"] == "revenue"
+        # 캐시를 건너뛰는 요청은 비용을 추정하고 입장 제어에서 거절됨
+        assert rejected.status_code == 429
+        assert estimated == [repo]
+        assert generation.admitted == 1
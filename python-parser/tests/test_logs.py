@@ -0,0 +1,119 @@
+import io
+import json
+import logging
+
+from src.infrastructure.observability.logs import (
+    RunSummary,
+    SamplingFilter,
+    StructuredFormatter,
+    StructuredLogger,
+)
+
+
+def _logger(name, level=logging.INFO, fmt="text", sampling=None):
+    """버퍼에 기록하는 테스트용 로거"""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter(fmt))
+    if sampling is not None:
+        handler.addFilter(sampling)
+    base = logging.getLogger(f"docs.test_{name}")
+    base.handlers = [handler]
+    base.setLevel(level)
+    base.propagate = False
+    return StructuredLogger(base), stream
+
+
+class _Expensive:
+    """문자열로 바뀐 횟수를 세는 인자"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "expensive"
+
+
+class TestStructuredLogger:
+    """구조화 로거 테스트"""
+
+    def test_disabled_level_skips_formatting(self):
+        """꺼진 레벨의 메시지는 인자를 포맷하지 않는지 테스트"""
+        logger, stream = _logger("lazy")
+        argument = _Expensive()
+
+        logger.debug("값: %s", argument)
+        logger.info("값: %s", argument)
+
+        assert argument.formatted == 1
+        assert stream.getvalue().count("값: expensive") == 1
+
+    def test_text_format_appends_fields(self):
+        """텍스트 형식은 서비스 표시와 key=value 필드를 붙이는지 테스트"""
+        logger, stream = _logger("text")
+
+        logger.warning("생성 중단 (%s)", "deadline", skipped=3, seconds=1.5)
+
+        line = stream.getvalue().strip()
+        assert "WARNING [문서 자동화] 생성 중단 (deadline)" in line
+        assert line.endswith("skipped=3 seconds=1.500")
+
+    def test_json_format(self):
+        """JSON 형식은 한 줄 객체에 필드를 담는지 테스트"""
+        logger, stream = _logger("json", fmt="json")
+
+        logger.info("프로젝트 완료: %s", "shop", viewsets=4)
+
+        record = json.loads(stream.getvalue())
+        assert record["message"] == "프로젝트 완료: shop"
+        assert record["level"] == "INFO"
+        assert record["viewsets"] == 4
+
+
+class TestSamplingFilter:
+    """반복 메시지 제한 테스트"""
+
+    def test_repeated_template_is_limited(self):
+        """같은 템플릿은 burst개만 기록하고 다른 템플릿은 따로 세는지 테스트"""
+        sampling = SamplingFilter(burst=2, window=60)
+        logger, stream = _logger("sampling", sampling=sampling)
+
+        for i in range(10):
+            logger.warning("파일 분석 중 오류 발생: %s", f"f{i}.py")
+        logger.warning("다른 메시지")
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 3
+        assert sampling.suppressed == 8
+
+    def test_next_window_reports_suppressed(self):
+        """구간이 바뀐 뒤 첫 기록에 생략한 개수가 붙는지 테스트"""
+        sampling = SamplingFilter(burst=1, window=0)
+        sampling.window = 60
+        logger, stream = _logger("window", sampling=sampling)
+        for _ in range(3):
+            logger.warning("반복")
+
+        sampling.window = 0
+        logger.warning("반복")
+
+        assert stream.getvalue().splitlines()[-1].endswith("suppressed=2")
+
+
+class TestRunSummary:
+    """실행 요약 테스트"""
+
+    def test_counts_and_examples(self):
+        """결과별 개수와 처음 몇 개의 예시를 한 줄로 남기는지 테스트"""
+        logger, stream = _logger("summary")
+        summary = RunSummary(logger, "분석 완료: %s")
+        for i in range(5):
+            summary.count("failed", f"f{i}.py")
+
+        summary.log("shop", files=10)
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        assert "분석 완료: shop files=10 failed=5" in lines[0]
+        assert lines[0].endswith("failed_examples=[f0.py,f1.py,f2.py]")
@@ -0,0 +1,332 @@
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.domain.entities.api_documentation import (
+    ApiDocumentation,
+    ApiEndpoint,
+    HttpMethod,
+)
+from src.infrastructure.cache.generation_cache import GenerationCache, GenerationKey
+from src.infrastructure.observability.memory import (
+    deep_sizeof,
+    estimate_size,
+    process_memory,
+    tracemalloc_report,
+)
+from src.infrastructure.repositories.memory_api_documentation_repository import (
+    MemoryApiDocumentationRepository,
+)
+from src.infrastructure.repositories.memory_chunk_repository import (
+    MemoryChunkRepository,
+)
+from src.infrastructure.runtime.memory_budget import (
+    MemoryAccounting,
+    MemoryBudgetExceeded,
+)
+from src.presentation.controllers import debug_controller
+
+
+def make_documentation(project="demo", count=3):
+    """엔드포인트 count개를 가진 API 문서"""
+    return ApiDocumentation(
+        title=f"{project} API Documentation",
+        version="1.0.0",
+        base_url="http://localhost",
+        endpoints=[
+            ApiEndpoint(f"/items/{i}/", HttpMethod.GET, f"item {i}", tags=["items"])
+            for i in range(count)
+        ],
+        tags=["items"],
+    )
+
+
+def make_request():
+    """디버그 토큰 헤더가 없는 요청"""
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "headers": []}, receive)
+
+
+def fixed_source(size):
+    """항상 size 바이트를 보고하는 사용량 함수"""
+    return lambda sample: {"items": 1, "bytes": size}
+
+
+class TestSizeEstimation:
+    """깊은 크기 측정과 표본 추정 테스트"""
+
+    def test_deep_sizeof_counts_shared_objects_once(self):
+        """같은 객체를 여러 번 참조해도 한 번만 센다"""
+        text = "x" * 1000
+        single = deep_sizeof([text])
+        double = deep_sizeof([text, text])
+
+        assert single > sys.getsizeof(text)
+        assert double - single < sys.getsizeof(text)
+
+    def test_deep_sizeof_follows_attributes(self):
+        """객체 속성이 참조하는 값까지 포함"""
+
+        class Holder:
+            def __init__(self):
+                self.payload = "y" * 5000
+
+        assert deep_sizeof(Holder()) > 5000
+
+    def test_estimate_matches_full_measurement(self):
+        """표본 추정이 전체 측정과 크게 다르지 않음"""
+        values = [{"name": f"item-{i}", "value": "z" * (i % 50)} for i in range(5000)]
+
+        exact = deep_sizeof(values)
+        estimated = estimate_size(values, sample=200)
+
+        assert abs(estimated - exact) / exact < 0.1
+
+    def test_small_containers_measured_exactly(self):
+        """sample개 이하면 표본 없이 전체 측정"""
+        values = {i: str(i) for i in range(50)}
+
+        assert estimate_size(values, sample=200) == deep_sizeof(values)
+
+    def test_process_memory(self):
+        """RSS는 알 수 없으면 None, 알면 양수"""
+        memory = process_memory()
+
+        assert set(memory) == {"rss_bytes", "peak_rss_bytes"}
+        assert all(value is None or value > 0 for value in memory.values())
+
+    def test_tracemalloc_report_without_tracing(self):
+        """tracemalloc이 꺼져 있으면 tracing만 보고"""
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already tracing")
+        assert tracemalloc_report() == {"tracing": False}
+
+
+class TestRepositoryUsage:
+    """저장소별 메모리 사용량 테스트"""
+
+    def test_chunk_repository_usage_grows_with_content(self):
+        """청크 내용이 커지면 사용량도 커짐"""
+        from src.domain.entities.code_chunk import ChunkType, CodeChunk
+
+        repository = MemoryChunkRepository()
+        empty = repository.memory_usage()
+
+        for i in range(10):
+            repository.save(
+                CodeChunk(
+                    content=f"print({i})\n" * 150,
+                    chunk_type=ChunkType.FUNCTION,
+                    file_path=Path("app.py"),
+                    module_path="app",
+                    start_line=i,
+                    end_line=i + 150,
+                )
+            )
+        filled = repository.memory_usage()
+
+        assert filled["items"] == 10
+        assert filled["content_bytes"] > 10 * 1200
+        assert filled["bytes"] > empty["bytes"] + filled["content_bytes"] // 2
+
+    def test_docs_usage_per_project_and_spill(self):
+        """프로젝트별 크기를 보고하고 정리하면 파생 구조만 해제"""
+        repository = MemoryApiDocumentationRepository()
+        repository.save(make_documentation("small", 1))
+        repository.save(make_documentation("large", 50))
+        repository.get_tag_spec("large", "items")
+
+        before = repository.memory_usage()
+        assert before["projects"]["large"] > before["projects"]["small"]
+        assert before["derived_bytes"] > 0
+
+        assert repository.spill() == 1
+        after = repository.memory_usage()
+        assert after["derived_bytes"] == 0
+        assert after["bytes"] < before["bytes"]
+        # 문서는 남아 있어 다시 조회하면 파생 구조를 새로 만든다
+        assert repository.get_tag_spec("large", "items") is not None
+
+    def test_generation_cache_spill_keeps_disk_entries(self):
+        """생성 캐시를 정리해도 디스크 항목에서 다시 읽음"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = GenerationCache(Path(tmpdir))
+            key = GenerationKey(
+                project="demo",
+                head_commit="abc",
+                dirty_fingerprint="clean",
+                generator_version="1",
+                base_url="http://localhost",
+                static_analysis=False,
+            )
+            cache.put(key, make_documentation("demo", 5))
+            assert cache.memory_usage()["projects"]["demo"] > 0
+
+            assert cache.spill() == 1
+            assert cache.memory_usage()["items"] == 0
+            assert cache.get(key) is not None
+
+
+class TestDebugMemoryEndpoints:
+    """메모리/실행 풀 디버그 엔드포인트 보호 테스트"""
+
+    def test_disabled_without_profiling(self, monkeypatch):
+        """프로파일링을 켜지 않으면 404, 토큰이 틀리면 403"""
+        monkeypatch.delenv(debug_controller.PROFILING_ENV, raising=False)
+        for endpoint in (
+            debug_controller.get_memory_usage,
+            debug_controller.get_executor_stats,
+        ):
+            with pytest.raises(HTTPException) as error:
+                asyncio.run(endpoint(make_request()))
+            assert error.value.status_code == 404
+
+        monkeypatch.setenv(debug_controller.PROFILING_ENV, "true")
+        monkeypatch.setenv(debug_controller.TOKEN_ENV, "secret")
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(debug_controller.get_memory_usage(make_request()))
+        assert error.value.status_code == 403
+
+    def test_memory_usage_when_enabled(self, monkeypatch):
+        """프로파일링을 켜면 사용량을 돌려줌"""
+        monkeypatch.setenv(debug_controller.PROFILING_ENV, "true")
+        monkeypatch.delenv(debug_controller.TOKEN_ENV, raising=False)
+
+        result = asyncio.run(
+            debug_controller.get_memory_usage(
+                make_request(), refresh=True, tracemalloc=False, top=5
+            )
+        )
+
+        assert "total_bytes" in result["data"]
+
+
+class TestMemoryAccounting:
+    """메모리 집계와 예산 테스트"""
+
+    def test_usage_aggregates_sources_and_projects(self):
+        """저장소 합계와 프로젝트별 합계"""
+        accounting = MemoryAccounting()
+        accounting.register(
+            "a", lambda sample: {"items": 1, "bytes": 100, "projects": {"p": 100}}
+        )
+        accounting.register(
+            "b", lambda sample: {"items": 2, "bytes": 50, "projects": {"p": 30}}
+        )
+
+        usage = accounting.usage()
+
+        assert usage["total_bytes"] == 150
+        assert usage["projects"] == {"p": 130}
+        assert usage["budget"]["limit_bytes"] == 0
+
+    def test_failing_source_reported(self):
+        """사용량 함수 실패는 집계를 막지 않음"""
+        accounting = MemoryAccounting()
+
+        def broken(sample):
+            raise RuntimeError("boom")
+
+        accounting.register("broken", broken)
+        accounting.register("ok", fixed_source(10))
+
+        usage = accounting.usage()
+        assert usage["total_bytes"] == 10
+        assert usage["sources"]["broken"]["error"] == "boom"
+
+    def test_disabled_budget_never_rejects(self):
+        """예산이 0이면 확인하지 않음"""
+        accounting = MemoryAccounting(limit_bytes=0)
+        accounting.register("big", fixed_source(10**12))
+
+        accounting.check(10**12)
+
+    def test_reject_policy_raises(self):
+        """예상치가 예산을 넘으면 거절"""
+        accounting = MemoryAccounting(limit_bytes=1000)
+        accounting.register("docs", fixed_source(800))
+
+        accounting.check(100)
+        with pytest.raises(MemoryBudgetExceeded):
+            accounting.check(300)
+        assert accounting.rejected == 1
+
+    def test_replaced_source_not_counted(self):
+        """교체될 저장소 크기는 예상치에서 뺌"""
+        accounting = MemoryAccounting(limit_bytes=1000)
+        accounting.register("analysis", fixed_source(800))
+
+        accounting.check(900, replaces=("analysis",))
+
+    def test_spill_policy_releases_then_admits(self):
+        """spill이면 정리 후 다시 확인해 예산 안이면 받음"""
+        held = {"bytes": 800}
+
+        def spill():
+            held["bytes"] = 0
+            return 3
+
+        accounting = MemoryAccounting(limit_bytes=1000, policy="spill")
+        accounting.register("cache", lambda sample: {"items": 1, **held}, spill)
+
+        accounting.check(500)
+
+        assert accounting.spills == 1
+        assert accounting.usage()["total_bytes"] == 0
+
+    def test_spill_skips_replaced_sources(self):
+        """교체될 저장소는 예상치에서 이미 빠지므로 정리하지 않음"""
+        spilled = []
+        accounting = MemoryAccounting(limit_bytes=1000, policy="spill")
+        accounting.register(
+            "analysis", fixed_source(1000), lambda: spilled.append("analysis") or 1
+        )
+        accounting.register(
+            "cache", fixed_source(100), lambda: spilled.append("cache") or 1
+        )
+
+        with pytest.raises(MemoryBudgetExceeded):
+            accounting.check(1000, replaces=("analysis",))
+
+        assert spilled == ["cache"]
+
+    def test_spill_policy_rejects_when_not_enough(self):
+        """정리해도 넘으면 거절"""
+        accounting = MemoryAccounting(limit_bytes=1000, policy="spill")
+        accounting.register("analysis", fixed_source(900))
+        accounting.register("cache", fixed_source(100), lambda: 0)
+
+        with pytest.raises(MemoryBudgetExceeded):
+            accounting.check(500)
+
+    def test_expected_analysis_bytes_uses_last_ratio(self):
+        """직전 분석의 결과/소스 배수로 새 분석 크기 추정"""
+        accounting = MemoryAccounting()
+        assert accounting.expected_analysis_bytes(100) == 800
+
+        accounting.register(
+            "analysis",
+            lambda sample: {"items": 1, "bytes": 3000, "source_bytes": 1000},
+        )
+        assert accounting.expected_analysis_bytes(100) == 300
+
+    def test_from_env(self):
+        """환경 변수 설정"""
+        accounting = MemoryAccounting.from_env(
+            {"MEMORY_BUDGET_MB": "2", "MEMORY_BUDGET_POLICY": "SPILL"}
+        )
+
+        assert accounting.limit_bytes == 2 * 2**20
+        assert accounting.policy == "spill"
+        with pytest.raises(ValueError):
+            MemoryAccounting.from_env({"MEMORY_BUDGET_POLICY": "drop"})
@@ -0,0 +1,152 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+from src.infrastructure.observability.metrics import (
+    HTTP_REQUEST_SECONDS,
+    PARSER_FILES,
+    CallbackGauge,
+    MetricsRegistry,
+)
+from src.infrastructure.parsers.python_parser import PythonParser
+
+
+async def call_asgi(app, path: str) -> int:
+    """GET 요청을 ASGI 앱에 보내고 응답 상태 코드 반환 (앱 밖으로 나온 예외는 무시)"""
+    statuses = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    try:
+        await app(scope, receive, send)
+    except RuntimeError:
+        pass
+    return statuses[0]
+
+
+class TestMetricsRegistry:
+    """Prometheus 텍스트 형식 메트릭 테스트"""
+
+    def test_counter_with_labels(self):
+        """라벨별 카운터 값과 HELP/TYPE 줄이 출력되는지 테스트"""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("result",))
+        counter.labels("ok").inc()
+        counter.labels("ok").inc(2)
+        counter.labels("error").inc()
+
+        text = registry.render()
+
+        assert "# HELP jobs_total Jobs\n# TYPE jobs_total counter\n" in text
+        assert 'jobs_total{result="ok"} 3\n' in text
+        assert 'jobs_total{result="error"} 1\n' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """히스토그램 구간이 누적으로 출력되고 합계/개수가 맞는지 테스트"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 5):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2\n' in text
+        assert 'latency_seconds_bucket{le="1"} 3\n' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "latency_seconds_sum 5.65\n" in text
+        assert "latency_seconds_count 4\n" in text
+
+    def test_register_returns_existing_metric(self):
+        """같은 이름으로 다시 등록하면 기존 메트릭을 돌려주는지 테스트"""
+        registry = MetricsRegistry()
+
+        first = registry.counter("jobs_total", "Jobs")
+
+        assert registry.counter("jobs_total", "Jobs") is first
+
+    def test_label_values_are_escaped(self):
+        """라벨 값의 따옴표/역슬래시/줄바꿈이 이스케이프되는지 테스트"""
+        registry = MetricsRegistry()
+        registry.counter("paths_total", "Paths", ("path",)).labels('a"b\\c\n').inc()
+
+        assert 'paths_total{path="a\\"b\\\\c\\n"} 1' in registry.render()
+
+    def test_callback_gauge_and_failure(self):
+        """콜백 게이지는 스크레이프 시점 값을 내보내고 실패해도 나머지는 출력되는지 테스트"""
+        registry = MetricsRegistry()
+        registry.register(
+            CallbackGauge("queue_jobs", "Queued", ("pool",), lambda: [(("io",), 2)])
+        )
+
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.register(CallbackGauge("broken_jobs", "Broken", (), broken))
+
+        text = registry.render()
+
+        assert 'queue_jobs{pool="io"} 2\n' in text
+        assert "# broken_jobs collection failed: boom" in text
+
+
+class TestServiceMetrics:
+    """서비스 메트릭 기록 테스트"""
+
+    def test_parser_counts_files(self):
+        """파일을 파싱하면 결과별 파일 수가 늘어나는지 테스트"""
+        parsed = PARSER_FILES.labels("ok")
+        syntax_error = PARSER_FILES.labels("syntax_error")
+        before = (parsed.value, syntax_error.value)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            good, bad = Path(tmpdir) / "good.py", Path(tmpdir) / "bad.py"
+            good.write_text("def f():\n    return 1\n")
+            bad.write_text("def f(:\n")
+            parser = PythonParser()
+            parser.parse_file(good)
+            parser.parse_file(bad)
+
+        assert parsed.value == before[0] + 1
+        assert syntax_error.value == before[1] + 1
+
+    def test_http_requests_recorded_even_on_exception(self):
+        """처리되지 않은 예외로 끝난 요청도 500으로 지연 시간과 개수를 기록"""
+        from main import create_app
+
+        app = create_app()
+
+        @app.get("/metrics-test/{item_id}")
+        async def fail(item_id: int):
+            raise RuntimeError("boom")
+
+        @app.get("/metrics-test-ok")
+        async def ok():
+            return {}
+
+        failed = HTTP_REQUEST_SECONDS.labels("GET", "/metrics-test/{item_id}", 500)
+        succeeded = HTTP_REQUEST_SECONDS.labels("GET", "/metrics-test-ok", 200)
+        before = (failed.count, succeeded.count)
+
+        assert asyncio.run(call_asgi(app, "/metrics-test/1")) == 500
+        assert asyncio.run(call_asgi(app, "/metrics-test-ok")) == 200
+
+        assert (failed.count, succeeded.count) == (before[0] + 1, before[1] + 1)
+        assert failed.sum > 0
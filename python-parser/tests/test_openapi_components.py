@@ -0,0 +1,113 @@
+import json
+
+from src.infrastructure.generators.api_documentation_generator import (
+    build_viewset_endpoints,
+)
+from src.infrastructure.generators.openapi_components import ComponentRegistry
+from src.domain.entities.api_documentation import (
+    ApiDocumentation,
+    ApiParameter,
+    ParameterType,
+)
+
+
+def build_spec(viewsets):
+    """(ViewSet, 모델, 앱, 필드) 순서대로 엔드포인트를 만든 OpenAPI 스펙"""
+    registry = ComponentRegistry()
+    endpoints = []
+    for viewset_name, model_name, app_label, fields in viewsets:
+        endpoints.extend(
+            build_viewset_endpoints(
+                viewset_name, model_name, fields, registry, app_label=app_label
+            )
+        )
+    return ApiDocumentation(
+        title="demo",
+        version="1.0.0",
+        base_url="http://localhost",
+        endpoints=endpoints,
+        components=registry.to_components(),
+    ).to_openapi_dict()
+
+
+class TestComponentRegistry:
+    """OpenAPI components 중복 제거 테스트"""
+
+    def test_same_name_and_structure_share_component(self):
+        """이름과 구조가 같은 스키마는 하나의 컴포넌트로 합쳐지는지 테스트"""
+        registry = ComponentRegistry()
+
+        first = registry.schema("Revenue", {"type": "object", "properties": {}})
+        second = registry.schema("Revenue", {"properties": {}, "type": "object"})
+        other = registry.schema("Other", {"type": "object", "properties": {}})
+        registry.to_components()
+
+        assert first == second == {"$ref": "#/components/schemas/Revenue"}
+        assert other == {"$ref": "#/components/schemas/Other"}
+        assert registry.reused == 1
+        assert list(registry.to_components()["schemas"]) == ["Other", "Revenue"]
+
+    def test_name_collision_qualified_by_app(self):
+        """이름이 같고 구조가 다르면 모두 앱 경로로 구분하는지 테스트"""
+        registry = ComponentRegistry()
+
+        first = registry.schema("Revenue", {"type": "object"}, "billing")
+        second = registry.schema("Revenue", {"type": "array"}, "revenue/views/share")
+        schemas = registry.to_components()["schemas"]
+
+        assert first == {"$ref": "#/components/schemas/billing.Revenue"}
+        assert second == {"$ref": "#/components/schemas/revenue.views.share.Revenue"}
+        assert schemas["billing.Revenue"] == {"type": "object"}
+
+    def test_unqualified_collision_uses_structure_hash(self):
+        """qualifier가 없으면 구조 해시로 구분"""
+        registry = ComponentRegistry()
+
+        registry.schema("Revenue", {"type": "object"})
+        registry.schema("Revenue", {"type": "array"})
+        names = list(registry.to_components()["schemas"])
+
+        assert len(names) == 2
+        assert all(name.startswith("Revenue_") for name in names)
+
+    def test_names_independent_of_viewset_order(self):
+        """ViewSet 처리 순서가 바뀌어도 컴포넌트 이름과 $ref가 같은지 테스트"""
+        viewsets = [
+            ("RevenueViewSet", "invoices", "billing", {"amount": {"type": "number"}}),
+            ("RevenueViewSet", "revenues", "revenue", {"title": {"type": "string"}}),
+            ("RevenueShareViewSet", "shares", "revenue", {"title": {"type": "string"}}),
+            ("AuthorViewSet", "authors", "authors", {}),
+        ]
+
+        forward = build_spec(viewsets)
+        backward = build_spec(list(reversed(viewsets)))
+
+        assert json.dumps(forward, sort_keys=True) == json.dumps(
+            backward, sort_keys=True
+        )
+        schemas = forward["components"]["schemas"]
+        assert "billing.Revenue" in schemas
+        assert "revenue.Revenue" in schemas
+        # 구조가 같아도 이름이 다르면 각자의 이름을 유지
+        assert "RevenueShare" in schemas
+        assert list(schemas) == sorted(schemas)
+
+    def test_parameter_ref(self):
+        """파라미터 등록 시 ref가 설정된 복사본을 반환하는지 테스트"""
+        registry = ComponentRegistry()
+        parameter = ApiParameter(
+            name="Authorization",
+            type=ParameterType.HEADER,
+            data_type="string",
+            required=True,
+        )
+
+        registered = registry.parameter(parameter)
+        components = registry.to_components()
+
+        assert parameter.ref is None
+        assert registered.to_openapi_dict() == {
+            "$ref": "#/components/parameters/Authorization"
+        }
+        assert components["parameters"]["Authorization"]["in"] == "header"
+        assert "responses" not in components
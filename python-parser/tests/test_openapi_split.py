@@ -0,0 +1,186 @@
+import json
+import tempfile
+from pathlib import Path
+
+from src.domain.entities.api_documentation import (
+    ApiDocumentation,
+    ApiEndpoint,
+    HttpMethod,
+)
+from src.infrastructure.generators.openapi_split import split_spec_by_tag
+from src.infrastructure.repositories.memory_api_documentation_repository import (
+    MemoryApiDocumentationRepository,
+)
+
+
+def make_spec():
+    """태그 두 개와 공유/개별 스키마를 가진 스펙"""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "demo", "version": "1.0.0"},
+        "paths": {
+            "/revenue/": {
+                "get": {
+                    "tags": ["Revenue"],
+                    "responses": {
+                        "200": {"$ref": "#/components/responses/RevenueList"}
+                    },
+                }
+            },
+            "/billing/": {
+                "get": {
+                    "tags": ["Billing"],
+                    "responses": {
+                        "200": {
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Bill"}
+                                }
+                            }
+                        }
+                    },
+                },
+                "post": {"tags": ["Billing", "Revenue"], "responses": {}},
+            },
+            "/health/": {"get": {"responses": {}}},
+        },
+        "tags": [{"name": "Revenue"}, {"name": "Billing"}],
+        "components": {
+            "schemas": {
+                "Money": {"type": "number"},
+                "Revenue": {
+                    "type": "object",
+                    "properties": {"amount": {"$ref": "#/components/schemas/Money"}},
+                },
+                "Bill": {"type": "object"},
+            },
+            "responses": {
+                "RevenueList": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Revenue"}
+                        }
+                    }
+                }
+            },
+        },
+    }
+
+
+class TestSplitSpecByTag:
+    """태그별 스펙 분할 테스트"""
+
+    def test_fragments_contain_only_tag_operations(self):
+        """조각에는 해당 태그 오퍼레이션만, 여러 태그 오퍼레이션은 양쪽에 포함"""
+        split = split_spec_by_tag(make_spec())
+
+        assert list(split.fragments) == ["Revenue", "Billing", "default"]
+        revenue = split.fragments["Revenue"]["paths"]
+        assert set(revenue) == {"/revenue/", "/billing/"}
+        assert set(revenue["/billing/"]) == {"post"}
+        assert set(split.fragments["Billing"]["paths"]["/billing/"]) == {"get", "post"}
+        assert set(split.fragments["default"]["paths"]) == {"/health/"}
+
+    def test_components_pruned_transitively(self):
+        """조각은 전이적으로 참조되는 components만 포함"""
+        split = split_spec_by_tag(make_spec())
+
+        revenue = split.fragments["Revenue"]["components"]
+        assert list(revenue["schemas"]) == ["Money", "Revenue"]
+        assert list(revenue["responses"]) == ["RevenueList"]
+        assert split.fragments["Billing"]["components"] == {
+            "schemas": {"Bill": {"type": "object"}}
+        }
+        assert "components" not in split.fragments["default"]
+
+    def test_index(self):
+        """인덱스에 조각별 오퍼레이션 수와 URL 포함"""
+        split = split_spec_by_tag(make_spec(), "/docs/demo/tags/{tag}")
+
+        tags = {entry["name"]: entry for entry in split.index["tags"]}
+        assert tags["Billing"]["operations"] == 2
+        assert tags["Revenue"]["url"] == "/docs/demo/tags/Revenue"
+        assert split.index["urls"][0] == {
+            "name": "Revenue",
+            "url": "/docs/demo/tags/Revenue",
+        }
+
+
+class TestRepositoryFragments:
+    """리포지토리의 태그별 조각 조회/저장 테스트"""
+
+    def documentation(self, endpoints):
+        return ApiDocumentation(
+            title="demo API Documentation",
+            version="1.0.0",
+            base_url="http://localhost",
+            endpoints=endpoints,
+            tags=sorted({t for e in endpoints for t in e.tags}),
+        )
+
+    def test_split_invalidated_on_save(self):
+        """문서를 다시 저장하면 조각도 새로 계산"""
+        repository = MemoryApiDocumentationRepository()
+        repository.save(
+            self.documentation([ApiEndpoint("/a/", HttpMethod.GET, "a", tags=["A"])])
+        )
+        assert repository.get_tag_spec("demo", "A") is not None
+        assert repository.get_tag_spec("demo", "B") is None
+
+        repository.save(
+            self.documentation([ApiEndpoint("/b/", HttpMethod.GET, "b", tags=["B"])])
+        )
+        assert repository.get_tag_spec("demo", "A") is None
+        assert repository.get_spec_index("demo")["urls"][0]["name"] == "B"
+        assert repository.get_tag_spec("missing", "B") is None
+
+    def test_save_to_file_writes_fragments(self):
+        """파일 저장 시 태그별 조각과 인덱스도 기록하고 없어진 태그 조각은 삭제"""
+        repository = MemoryApiDocumentationRepository()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "demo.json"
+            repository.save_to_file(
+                self.documentation(
+                    [
+                        ApiEndpoint("/a/", HttpMethod.GET, "a", tags=["A"]),
+                        ApiEndpoint("/b/", HttpMethod.GET, "b", tags=["B b"]),
+                    ]
+                ),
+                output,
+            )
+            assert sorted(p.name for p in (Path(tmpdir) / "demo.tags").iterdir()) == [
+                "A.json",
+                "B%20b.json",
+            ]
+            index = json.loads((Path(tmpdir) / "demo.index.json").read_text())
+            assert index["urls"][1]["url"] == "demo.tags/B%20b.json"
+
+            repository.save_to_file(
+                self.documentation(
+                    [ApiEndpoint("/a/", HttpMethod.GET, "a", tags=["A"])]
+                ),
+                output,
+            )
+            assert [p.name for p in (Path(tmpdir) / "demo.tags").iterdir()] == [
+                "A.json"
+            ]
+
+    def test_stale_cleanup_keeps_in_flight_temp_files(self):
+        """동시에 쓰는 중인 조각 임시 파일은 오래된 조각으로 보고 지우지 않음"""
+        repository = MemoryApiDocumentationRepository()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fragment_dir = Path(tmpdir) / "demo.tags"
+            fragment_dir.mkdir()
+            in_flight = fragment_dir / ".B.json.x1y2z3.tmp"
+            in_flight.write_text("{}")
+            (fragment_dir / "B.json").write_text("{}")
+
+            repository.save_to_file(
+                self.documentation(
+                    [ApiEndpoint("/a/", HttpMethod.GET, "a", tags=["A"])]
+                ),
+                Path(tmpdir) / "demo.json",
+            )
+
+            assert in_flight.exists()
+            assert not (fragment_dir / "B.json").exists()
@@ -0,0 +1,149 @@
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.application.use_cases.analyze_code_use_case import (
+    AnalysisRequest,
+    AnalyzeCodeUseCase,
+)
+from src.infrastructure.observability.profiler import (
+    ProfilerBusy,
+    ProfilingControl,
+    SamplingProfiler,
+    default_profiling,
+)
+from src.presentation.controllers import debug_controller
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+def _request(headers=()):
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    return Request({"type": "http", "headers": list(headers)}, receive)
+
+
+class TestSamplingProfiler:
+    """샘플링 프로파일러 테스트"""
+
+    def test_collapsed_stacks_include_busy_function(self):
+        """다른 스레드에서 실행 중인 함수가 collapsed 스택에 잡히는지 테스트"""
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy")
+        worker.start()
+        try:
+            profiler = SamplingProfiler(0.001, threads=[worker.ident]).start()
+            time.sleep(0.2)
+            profiler.stop()
+        finally:
+            stop.set()
+            worker.join()
+
+        lines = profiler.collapsed().splitlines()
+        assert profiler.samples > 0
+        assert all(line.startswith("busy;") for line in lines)
+        assert any("_busy_loop" in line for line in lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert profiler.summary()["top_functions"]
+
+    def test_only_one_session(self):
+        """한 번에 하나의 프로파일링만 허용하는지 테스트"""
+        control = ProfilingControl()
+        control.acquire()
+
+        with pytest.raises(ProfilerBusy):
+            control.acquire()
+        control.release()
+        control.acquire()
+
+
+class TestNextRunCapture:
+    """다음 실행 한 번 측정 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "module.py").write_text("def f():\n    return 1\n")
+            yield Path(tmpdir)
+
+    def test_cprofile_captures_one_execute(self, project):
+        """예약한 cprofile 캡처가 다음 execute 한 번만 측정하는지 테스트"""
+        default_profiling.acquire()
+        try:
+            capture = default_profiling.arm("analysis", "cprofile", 0.005)
+            AnalyzeCodeUseCase().execute(AnalysisRequest(project_path=project))
+            assert default_profiling.take("analysis") is None
+        finally:
+            default_profiling.release()
+
+        assert capture.done.is_set()
+        functions = [row["function"] for row in capture.report["functions"]]
+        assert any("(execute)" in name for name in functions)
+        assert any("(parse_file)" in name for name in functions)
+
+
+class TestProfileEndpoint:
+    """프로파일링 엔드포인트 테스트"""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """환경 변수로 켜지 않으면 404인지 테스트"""
+        monkeypatch.delenv(debug_controller.PROFILING_ENV, raising=False)
+
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(debug_controller.profile(_request(), seconds=0.01))
+        assert error.value.status_code == 404
+
+    def test_token_required(self, monkeypatch):
+        """토큰이 설정되면 헤더가 맞아야 하는지 테스트"""
+        monkeypatch.setenv(debug_controller.PROFILING_ENV, "true")
+        monkeypatch.setenv(debug_controller.TOKEN_ENV, "secret")
+
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(debug_controller.profile(_request(), seconds=0.01))
+        assert error.value.status_code == 403
+
+        response = asyncio.run(
+            debug_controller.profile(
+                _request([(b"x-debug-token", b"secret")]),
+                seconds=0.05,
+                target=None,
+                mode="sample",
+                interval_ms=1,
+                idle=True,
+                format="collapsed",
+                top=20,
+            )
+        )
+        assert response.media_type.startswith("text/plain")
+
+    def test_next_run_timeout(self, monkeypatch):
+        """기다리는 동안 실행이 없으면 504이고 예약이 해제되는지 테스트"""
+        monkeypatch.setenv(debug_controller.PROFILING_ENV, "1")
+        monkeypatch.delenv(debug_controller.TOKEN_ENV, raising=False)
+
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(
+                debug_controller.profile(
+                    _request(),
+                    seconds=0.05,
+                    target="generation",
+                    mode="cprofile",
+                    interval_ms=5,
+                    idle=False,
+                    format="json",
+                    top=20,
+                )
+            )
+        assert error.value.status_code == 504
+        assert default_profiling.take("generation") is None
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import time
+
+from starlette.requests import Request
+
+from src.infrastructure.runtime.executors import ExecutorPool
+from src.infrastructure.runtime.progress import (
+    ProgressRegistry,
+    ProgressTracker,
+    progress_advance,
+    progress_phase,
+    progress_scope,
+)
+from src.presentation.controllers import progress_controller
+
+
+def _parse_events(chunks):
+    events = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestProgressTracker:
+    """진행 카운터 테스트"""
+
+    def test_snapshot_reports_throughput_and_eta(self):
+        """현재 단계의 진행률/처리량/ETA와 이전 단계 시간을 보고하는지 테스트"""
+        tracker = ProgressTracker("analysis", "/tmp/project")
+        tracker.phase("scan")
+        tracker.advance(count=4)
+        tracker.phase("parse", total=4)
+        time.sleep(0.05)
+        tracker.advance("b.py")
+
+        snapshot = tracker.snapshot()
+
+        assert (snapshot["phase"], snapshot["done"], snapshot["total"]) == (
+            "parse",
+            1,
+            4,
+        )
+        assert snapshot["current"] == "b.py"
+        assert snapshot["throughput"] > 0
+        assert snapshot["eta"] > 0
+        assert [p["name"] for p in snapshot["phases"]] == ["scan", "parse"]
+        assert snapshot["phases"][0]["done"] == 4
+
+    def test_counters_follow_pool_threads(self):
+        """풀에서 실행한 작업의 카운터 갱신이 요청 카운터에 기록되는지 테스트"""
+        tracker = ProgressTracker("generation")
+        pool = ExecutorPool("generation")
+
+        def work():
+            progress_phase("viewsets", total=2)
+            progress_advance("A")
+            progress_advance("B")
+
+        try:
+            with progress_scope(tracker):
+                pool.submit(work).result(5)
+            pool.submit(work).result(5)
+        finally:
+            pool.shutdown()
+
+        assert tracker.snapshot()["done"] == 2
+
+
+class TestProgressRegistry:
+    """요청별 진행 상황 목록 테스트"""
+
+    def test_steps_and_close(self):
+        """한 요청이 여러 작업을 차례로 실행하면 끝난 작업이 요약으로 남는지 테스트"""
+        registry = ProgressRegistry()
+        assert registry.open("job", "analysis")
+        assert not registry.open("job", "analysis")
+
+        first, second = ProgressTracker("analysis", "a"), ProgressTracker("analysis")
+        registry.attach("job", first)
+        registry.attach("job", second)
+        registry.close("job", "completed")
+
+        snapshot = registry.snapshot("job")
+        assert snapshot["status"] == "completed"
+        assert [step["target"] for step in snapshot["steps"]] == ["a"]
+
+    def test_finished_jobs_expire(self):
+        """끝난 요청은 보관 개수를 넘으면 오래된 것부터 지워지는지 테스트"""
+        registry = ProgressRegistry(max_finished=1)
+        for name in ("old", "new"):
+            registry.open(name, "generation")
+            registry.close(name, "completed")
+
+        assert [job["job_id"] for job in registry.list_jobs()] == ["new"]
+
+
+class TestProgressStream:
+    """진행 상황 SSE 스트림 테스트"""
+
+    def test_streams_progress_until_done(self, monkeypatch):
+        """진행 중에는 progress, 끝나면 done 이벤트를 보내고 종료하는지 테스트"""
+        registry = ProgressRegistry()
+        monkeypatch.setattr(progress_controller, "default_progress", registry)
+
+        async def receive():
+            await asyncio.sleep(3600)
+
+        request = Request({"type": "http", "headers": []}, receive)
+
+        async def scenario():
+            tracker = ProgressTracker("analysis")
+
+            async def job():
+                await asyncio.sleep(0.05)
+                registry.open("job", "analysis")
+                registry.attach("job", tracker)
+                tracker.phase("parse", total=2)
+                await asyncio.sleep(0.05)
+                tracker.advance("a.py")
+                await asyncio.sleep(0.05)
+                registry.close("job", "completed")
+
+            task = asyncio.create_task(job())
+            chunks = [
+                chunk
+                async for chunk in progress_controller._event_stream(
+                    request, "job", interval=0.01, wait=1
+                )
+            ]
+            await task
+            return _parse_events(chunks)
+
+        events = asyncio.run(scenario())
+
+        assert events[0][0] == "progress"
+        assert any(data["progress"].get("done") == 1 for _, data in events[:-1])
+        assert events[-1][0] == "done"
+        assert events[-1][1]["status"] == "completed"
+
+    def test_unknown_job(self):
+        """등록되지 않은 id는 error 이벤트 후 종료하는지 테스트"""
+
+        async def receive():
+            await asyncio.sleep(3600)
+
+        request = Request({"type": "http", "headers": []}, receive)
+
+        async def scenario():
+            return [
+                chunk
+                async for chunk in progress_controller._event_stream(
+                    request, "missing", interval=0.01, wait=0.05
+                )
+            ]
+
+        assert _parse_events(asyncio.run(scenario()))[0][0] == "error"
@@ -0,0 +1,163 @@
+import time
+
+import pytest
+from pathlib import Path
+import tempfile
+
+from src.application.use_cases.generate_api_docs_use_case import (
+    GenerateApiDocsUseCase,
+)
+from src.domain.entities.api_documentation import ApiDocumentation
+from src.infrastructure.repositories.memory_api_documentation_repository import (
+    MemoryApiDocumentationRepository,
+)
+from src.infrastructure.runtime.progress import ProgressTracker, progress_scope
+from src.infrastructure.runtime.project_scheduler import (
+    ProjectOutcome,
+    ProjectScheduler,
+)
+
+
+def describe_project(project_path: Path, suffix: str = "") -> str:
+    """자식 프로세스에서 실행할 작업"""
+    if project_path.name == "broken":
+        raise ValueError("broken project")
+    if project_path.name == "slow":
+        time.sleep(30)
+    return project_path.name + suffix
+
+
+class TestProjectScheduler:
+    """프로젝트 병렬 스케줄러 테스트"""
+
+    @pytest.fixture
+    def projects(self):
+        """크기가 다른 테스트용 프로젝트들"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name, size in [("large", 300), ("small", 10), ("broken", 100)]:
+                (root / name).mkdir()
+                (root / name / "views.py").write_text("#" * size)
+            yield root
+
+    def test_smallest_project_first(self, projects):
+        """작은 프로젝트부터 실행 순서가 정해지는지 테스트"""
+        scheduler = ProjectScheduler(start_method="fork")
+
+        ordered = scheduler.order(sorted(projects.iterdir()))
+
+        assert [p.name for p in ordered] == ["small", "broken", "large"]
+
+    def test_results_and_failures(self, projects):
+        """성공/실패 결과를 모두 반환하는지 테스트"""
+        scheduler = ProjectScheduler(max_concurrency=2, start_method="fork")
+
+        outcomes = {
+            o.project_path.name: o
+            for o in scheduler.run(
+                projects.iterdir(), describe_project, kwargs={"suffix": "!"}
+            )
+        }
+
+        assert outcomes["small"].status == "success"
+        assert outcomes["small"].result == "small!"
+        assert outcomes["large"].result == "large!"
+        assert outcomes["broken"].status == "failed"
+        assert "broken project" in outcomes["broken"].error
+
+    def test_spawn_start_method(self, projects):
+        """기본 시작 방식(spawn)으로도 결과와 실패를 반환하는지 테스트"""
+        scheduler = ProjectScheduler(max_concurrency=3, start_method="spawn")
+
+        outcomes = {
+            o.project_path.name: o
+            for o in scheduler.run(
+                projects.iterdir(), describe_project, kwargs={"suffix": "?"}
+            )
+        }
+
+        assert outcomes["small"].result == "small?"
+        assert outcomes["large"].status == "success"
+        assert outcomes["broken"].status == "failed"
+        assert "broken project" in outcomes["broken"].error
+
+    def test_timeout_does_not_block_others(self, projects):
+        """제한 시간을 넘긴 프로젝트만 중단되는지 테스트"""
+        (projects / "slow").mkdir()
+        scheduler = ProjectScheduler(
+            max_concurrency=2, project_timeout=0.5, start_method="fork"
+        )
+
+        started = time.monotonic()
+        outcomes = list(scheduler.run(projects.iterdir(), describe_project))
+
+        assert time.monotonic() - started < 10
+        statuses = {o.project_path.name: o.status for o in outcomes}
+        assert statuses["slow"] == "timeout"
+        assert statuses["small"] == "success"
+        assert statuses["large"] == "success"
+
+
+class SteppedScheduler:
+    """프로젝트 결과를 하나씩 내보내고, 다음 결과 전에 보고된 결과를 기록하는 스케줄러"""
+
+    def __init__(self, tracker: ProgressTracker):
+        self.tracker = tracker
+        self.reported = []
+
+    def run(self, project_paths, target, kwargs=None, **options):
+        for project_path in project_paths:
+            if project_path.name == "broken":
+                yield ProjectOutcome(project_path, "failed", error="boom")
+            else:
+                yield ProjectOutcome(
+                    project_path,
+                    "success",
+                    result=ApiDocumentation(
+                        title=f"{project_path.name} API Documentation",
+                        version="1.0.0",
+                        base_url="http://localhost",
+                        endpoints=[],
+                    ),
+                    duration=0.1,
+                )
+            results = self.tracker.snapshot().get("results", [])
+            self.reported.append([r["project_name"] for r in results])
+
+
+class TestGenerateAllProjects:
+    """전체 프로젝트 생성 결과 보고 테스트"""
+
+    def test_outcomes_reported_as_projects_complete(self):
+        """배치가 끝나기 전에 프로젝트마다 결과가 진행 상황에 기록되는지 테스트"""
+        tracker = ProgressTracker("generation")
+        scheduler = SteppedScheduler(tracker)
+        use_case = GenerateApiDocsUseCase(
+            symbol_repository=None,
+            api_documentation_repository=MemoryApiDocumentationRepository(),
+            project_scheduler=scheduler,
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ("alpha", "broken"):
+                (root / name / ".git").mkdir(parents=True)
+
+            with progress_scope(tracker):
+                summary = use_case.generate_for_all_projects(root)
+
+        # 두 번째 결과를 내보내기 전에 첫 번째 결과가 이미 보고됨
+        assert [len(reported) for reported in scheduler.reported] == [1, 2]
+        assert sorted(scheduler.reported[-1]) == ["alpha", "broken"]
+        results = {r["project_name"]: r for r in tracker.snapshot()["results"]}
+        assert results["alpha"]["status"] == "success"
+        assert results["alpha"]["total_endpoints"] == 0
+        assert results["broken"] == {
+            "project_name": "broken",
+            "status": "failed",
+            "error": "boom",
+            "duration": 0.0,
+        }
+        assert "documentation" not in results["alpha"]
+        assert summary["successful"] == 1
+        assert summary["failed"] == 1
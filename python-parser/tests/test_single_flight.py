@@ -0,0 +1,73 @@
+import asyncio
+
+
+from src.infrastructure.runtime.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """동시 요청 합치기 테스트"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """같은 키의 동시 호출은 한 번만 실행되고 같은 결과를 받음"""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": len(calls)}
+
+        async def scenario():
+            return await asyncio.gather(
+                *[flight.run(("analyze", "repo"), work) for _ in range(5)],
+                flight.run(("analyze", "other"), work),
+            )
+
+        results = asyncio.run(scenario())
+
+        assert len(calls) == 2
+        assert results[0] is results[4]
+        assert (flight.started, flight.coalesced, flight.in_flight()) == (2, 4, 0)
+
+    def test_sequential_calls_run_again(self):
+        """끝난 작업의 결과는 캐시하지 않음"""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        async def scenario():
+            return [await flight.run("key", work) for _ in range(2)]
+
+        assert asyncio.run(scenario()) == [1, 2]
+
+    def test_error_and_cancellation(self):
+        """예외는 모든 호출자에게 전달되고, 한 호출자의 취소는 다른 호출자에 영향 없음"""
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def scenario():
+            errors = await asyncio.gather(
+                flight.run("fail", failing),
+                flight.run("fail", failing),
+                return_exceptions=True,
+            )
+            first = asyncio.create_task(flight.run("slow", slow))
+            second = asyncio.create_task(flight.run("slow", slow))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return errors, await second
+
+        errors, result = asyncio.run(scenario())
+
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert result == "done"
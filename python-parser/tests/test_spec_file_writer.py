@@ -0,0 +1,57 @@
+import gzip
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.repositories.spec_file_writer import SpecFileWriter
+
+SPEC = {"openapi": "3.0.0", "info": {"title": "데모"}, "paths": {"/a/": {}}}
+
+
+class TestSpecFileWriter:
+    """원자적 스펙 파일 기록 테스트"""
+
+    def test_compact_and_pretty(self):
+        """compact/pretty 모드 모두 같은 JSON으로 읽히는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            compact = Path(tmpdir) / "compact.json"
+            pretty = Path(tmpdir) / "pretty.json"
+
+            result = SpecFileWriter(buffer_size=8).write(SPEC, compact)
+            SpecFileWriter(pretty=True).write(SPEC, pretty)
+
+            assert json.loads(compact.read_text("utf-8")) == SPEC
+            assert json.loads(pretty.read_text("utf-8")) == SPEC
+            assert compact.read_text("utf-8") == json.dumps(
+                SPEC, ensure_ascii=False, separators=(",", ":")
+            )
+            assert "데모" in compact.read_text("utf-8")
+            assert result["bytes"] == compact.stat().st_size
+            assert compact.stat().st_mode & 0o777 == 0o644
+
+    def test_gzip_copy(self):
+        """gzip 사본을 같이 쓰고, 끄면 남은 사본을 삭제"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "spec.json"
+
+            SpecFileWriter(gzip_copy=True).write(SPEC, target)
+            gz = Path(tmpdir) / "spec.json.gz"
+            assert json.loads(gzip.decompress(gz.read_bytes())) == SPEC
+
+            SpecFileWriter().write(SPEC, target)
+            assert not gz.exists()
+
+    def test_failure_keeps_previous_file(self):
+        """인코딩 실패 시 기존 파일을 유지하고 임시 파일을 남기지 않음"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "spec.json"
+            SpecFileWriter().write(SPEC, target)
+
+            with pytest.raises(TypeError):
+                SpecFileWriter(gzip_copy=True).write({"bad": object()}, target)
+
+            assert json.loads(target.read_text("utf-8")) == SPEC
+            assert sorted(os.listdir(tmpdir)) == ["spec.json"]
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.infrastructure.observability import startup
+from src.infrastructure.observability.startup import (
+    StartupTimeline,
+    import_time_report,
+)
+from src.presentation.controllers import debug_controller
+
+
+def make_request():
+    """앱 상태가 없는 요청"""
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    app = SimpleNamespace(state=SimpleNamespace())
+    return Request({"type": "http", "headers": [], "app": app}, receive)
+
+
+class TestStartupTimeline:
+    """시작 구간 기록 테스트"""
+
+    def test_marks_in_order_once(self):
+        """구간은 처음 기록한 시점만 유지하고 시간순으로 반환"""
+        timeline = StartupTimeline(started_at=time.perf_counter())
+        timeline.mark("imports_done")
+        timeline.mark("app_created")
+        first = timeline.to_dict()["imports_done"]
+        timeline.mark("imports_done")
+
+        result = timeline.to_dict()
+        assert list(result) == ["imports_done", "app_created"]
+        assert result["imports_done"] == first
+        assert timeline.has("app_created")
+        assert not timeline.has("first_request")
+
+
+class TestImportTimeReport:
+    """-X importtime 측정 테스트"""
+
+    def test_report_for_module(self):
+        """별도 프로세스에서 측정한 모듈별/패키지별 시간"""
+        report = import_time_report("json", top=5)
+
+        assert report["ok"]
+        assert report["total_ms"] > 0
+        assert len(report["top_modules"]) <= 5
+        assert report["modules_imported"] >= len(report["top_modules"])
+
+    def test_lazy_controllers_skip_generators(self):
+        """서버 import 시 문서 생성기/Django 관련 모듈을 불러오지 않는지 테스트"""
+        report = import_time_report("main", top=1000)
+
+        assert report["ok"], report["error"]
+        modules = {m["module"] for m in report["top_modules"]}
+        assert "src.presentation.controllers.api_docs_controller" in modules
+        assert not any(
+            m.startswith(("src.infrastructure.generators", "django", "rest_framework"))
+            for m in modules
+        )
+
+
+class TestStartupEndpoint:
+    """시작 시간 디버그 엔드포인트 테스트"""
+
+    def test_requires_profiling(self, monkeypatch):
+        """프로파일링을 켜지 않으면 404, 토큰이 틀리면 403"""
+        monkeypatch.delenv(debug_controller.PROFILING_ENV, raising=False)
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(debug_controller.get_startup_timeline(make_request()))
+        assert error.value.status_code == 404
+
+        monkeypatch.setenv(debug_controller.PROFILING_ENV, "true")
+        monkeypatch.setenv(debug_controller.TOKEN_ENV, "secret")
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(debug_controller.get_startup_timeline(make_request()))
+        assert error.value.status_code == 403
+
+    def test_import_report_runs_in_io_pool(self, monkeypatch):
+        """import 시간 측정을 이벤트 루프가 아닌 io 풀에서 실행"""
+        monkeypatch.setenv(debug_controller.PROFILING_ENV, "true")
+        monkeypatch.delenv(debug_controller.TOKEN_ENV, raising=False)
+        threads = []
+
+        def fake_report(top):
+            threads.append(threading.current_thread().name)
+            return {"ok": True, "top": top}
+
+        monkeypatch.setattr(startup, "import_time_report", fake_report)
+
+        result = asyncio.run(
+            debug_controller.get_startup_timeline(make_request(), imports=True, top=3)
+        )
+
+        assert result["imports"] == {"ok": True, "top": 3}
+        assert threads[0].startswith("io")
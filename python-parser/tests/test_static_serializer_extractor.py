@@ -0,0 +1,148 @@
+import pytest
+from pathlib import Path
+import tempfile
+
+from src.infrastructure.generators.static_serializer_extractor import (
+    StaticSerializerExtractor,
+)
+
+
+class TestStaticSerializerExtractor:
+    """import 없는 정적 serializer 스키마 추출 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        """테스트용 Django 앱 구조"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            app = root / "app" / "revenue"
+            app.mkdir(parents=True)
+            (app / "__init__.py").write_text("")
+            (app / "models.py").write_text(
+                "from django.db import models\n\n"
+                "class TimeStamped(models.Model):\n"
+                "    created_at = models.DateTimeField(auto_now_add=True)\n\n"
+                "    class Meta:\n"
+                "        abstract = True\n\n"
+                "class Author(models.Model):\n"
+                "    name = models.CharField(max_length=100)\n\n"
+                "class Revenue(TimeStamped):\n"
+                "    title = models.CharField(max_length=100, help_text='제목')\n"
+                "    amount = models.DecimalField(max_digits=10, decimal_places=2)\n"
+                "    memo = models.TextField(blank=True, null=True)\n"
+                "    author = models.ForeignKey(Author, on_delete=models.CASCADE)\n"
+            )
+            (app / "serializers.py").write_text(
+                "from rest_framework import serializers\n"
+                "from .models import Revenue, Author\n\n"
+                "class AuthorSerializer(serializers.ModelSerializer):\n"
+                "    class Meta:\n"
+                "        model = Author\n"
+                "        fields = ['id', 'name']\n\n"
+                "class RevenueSerializer(serializers.ModelSerializer):\n"
+                "    authors = AuthorSerializer(many=True, read_only=True)\n"
+                "    tags = serializers.ListField(child=serializers.CharField())\n"
+                "    label = serializers.SerializerMethodField()\n\n"
+                "    class Meta:\n"
+                "        model = Revenue\n"
+                "        fields = '__all__'\n"
+                "        read_only_fields = ['amount']\n"
+            )
+            (app / "views.py").write_text(
+                "from rest_framework import viewsets\n"
+                "from . import serializers\n\n"
+                "class RevenueViewSet(viewsets.ModelViewSet):\n"
+                "    serializer_class = serializers.RevenueSerializer\n\n"
+                "class PlainViewSet(viewsets.ViewSet):\n"
+                "    pass\n"
+            )
+            yield root
+
+    def test_model_serializer_fields(self, project):
+        """ModelSerializer의 Meta/모델/선언 필드 해석 테스트"""
+        extractor = StaticSerializerExtractor(project)
+        views_file = project / "app" / "revenue" / "views.py"
+
+        fields = extractor.viewset_fields(views_file, "RevenueViewSet")
+
+        assert list(fields) == [
+            "id",
+            "authors",
+            "tags",
+            "label",
+            "created_at",
+            "title",
+            "amount",
+            "memo",
+            "author",
+        ]
+        assert fields["id"] == {"type": "integer", "readOnly": True}
+        assert fields["title"] == {
+            "type": "string",
+            "required": True,
+            "description": "제목",
+        }
+        assert fields["amount"] == {
+            "type": "number",
+            "format": "decimal",
+            "readOnly": True,
+        }
+        assert fields["memo"] == {"type": "string", "nullable": True}
+        assert fields["created_at"]["readOnly"] is True
+        assert fields["tags"] == {
+            "type": "array",
+            "items": {"type": "string"},
+            "required": True,
+        }
+        assert fields["label"] == {"type": "string", "readOnly": True}
+
+    def test_nested_serializer(self, project):
+        """중첩 serializer 해석 테스트"""
+        extractor = StaticSerializerExtractor(project)
+        views_file = project / "app" / "revenue" / "views.py"
+
+        authors = extractor.viewset_fields(views_file, "RevenueViewSet")["authors"]
+
+        assert authors["type"] == "array"
+        assert authors["readOnly"] is True
+        assert authors["items"]["properties"] == {
+            "id": {"type": "integer", "readOnly": True},
+            "name": {"type": "string", "required": True},
+        }
+
+    def test_unknown_viewset_and_missing_serializer(self, project):
+        """ViewSet이 없거나 serializer가 없는 경우 테스트"""
+        extractor = StaticSerializerExtractor(project)
+        views_file = project / "app" / "revenue" / "views.py"
+
+        assert extractor.viewset_fields(views_file, "MissingViewSet") is None
+        assert extractor.viewset_fields(views_file, "PlainViewSet") == {}
+
+    def test_non_literal_flags_keep_drf_defaults(self, project):
+        """값을 알 수 없는 인자는 지정하지 않은 것처럼 DRF 기본값 적용"""
+        app = project / "app" / "revenue"
+        (app / "flags.py").write_text(
+            "from django.conf import settings\n"
+            "from rest_framework import serializers\n"
+            "from .models import Author\n\n"
+            "SOME_FLAG = settings.DEBUG\n\n"
+            "class FlagSerializer(serializers.ModelSerializer):\n"
+            "    code = serializers.CharField(read_only=SOME_FLAG)\n"
+            "    note = serializers.CharField(required=settings.X)\n"
+            "    extra = serializers.CharField(allow_null=SOME_FLAG, many=SOME_FLAG)\n\n"
+            "    class Meta:\n"
+            "        model = Author\n"
+            "        fields = ['code', 'note', 'extra', 'name']\n"
+            "        extra_kwargs = {'name': {'read_only': SOME_FLAG, 'required': False}}\n\n"
+            "class FlagViewSet:\n"
+            "    serializer_class = FlagSerializer\n"
+        )
+        extractor = StaticSerializerExtractor(project)
+
+        fields = extractor.viewset_fields(app / "flags.py", "FlagViewSet")
+
+        assert fields["code"] == {"type": "string", "required": True}
+        assert fields["note"] == {"type": "string", "required": True}
+        assert fields["extra"] == {"type": "string", "required": True}
+        # 리터럴인 required=False는 그대로 적용
+        assert fields["name"] == {"type": "string"}
@@ -0,0 +1,93 @@
+import pytest
+from pathlib import Path
+import tempfile
+
+from src.application.use_cases.analyze_code_use_case import (
+    AnalysisRequest,
+    AnalyzeCodeUseCase,
+)
+from src.infrastructure.observability.timings import (
+    FileTimings,
+    PhaseTimer,
+    percentile,
+)
+from src.infrastructure.parsers.python_parser import PythonParser
+
+
+class TestTimings:
+    """단계별/파일별 소요 시간 집계 테스트"""
+
+    def test_percentile_interpolates(self):
+        """백분위가 선형 보간으로 계산되는지 테스트"""
+        values = [1.0, 2.0, 3.0, 4.0]
+
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 90) == 0.0
+
+    def test_phase_timer_accumulates(self):
+        """같은 이름의 단계는 합산되는지 테스트"""
+        timer = PhaseTimer()
+        timer.add("read", 0.5)
+        timer.add("read", 0.25)
+        with timer.span("scan"):
+            pass
+
+        phases = timer.to_dict()
+
+        assert list(phases) == ["read", "scan"]
+        assert phases["read"]["seconds"] == 0.75
+        assert phases["read"]["count"] == 2
+
+    def test_file_summary_ranks_slowest(self):
+        """가장 느린 파일이 크기와 함께 느린 순서로 요약되는지 테스트"""
+        timings = FileTimings()
+        for i in range(10):
+            timings.record(f"f{i}.py", i / 100, size=i * 10, phases={"parse": i / 200})
+
+        summary = timings.summary(slowest=2)
+
+        assert summary["count"] == 10
+        assert [f["path"] for f in summary["slowest"]] == ["f9.py", "f8.py"]
+        assert summary["slowest"][0]["size"] == 90
+        assert summary["percentiles"]["p50"] == pytest.approx(0.045)
+        assert timings.phase_totals()["parse"] == pytest.approx(0.225)
+
+
+class TestAnalysisTimings:
+    """분석 결과의 타이밍 정보 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        """크기가 다른 파일이 있는 테스트용 프로젝트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "pkg").mkdir()
+            (root / "small.py").write_text("x = 1\n")
+            (root / "pkg" / "large.py").write_text(
+                "".join(f"def func_{i}():\n    return {i}\n\n" for i in range(300))
+            )
+            yield root
+
+    def test_parser_records_steps(self, project):
+        """파서가 read/parse/symbols/calls/chunks 단계 시간을 기록하는지 테스트"""
+        timings = {}
+
+        PythonParser().parse_file(project / "small.py", timings)
+
+        assert set(timings) == {"read", "parse", "symbols", "calls", "chunks"}
+
+    def test_result_includes_phases_and_slowest_files(self, project):
+        """분석 결과에 단계별 시간과 가장 느린 파일이 포함되는지 테스트"""
+        result = AnalyzeCodeUseCase().execute(
+            AnalysisRequest(project_path=project, slowest_files=1)
+        )
+
+        phases = result.timings["phases"]
+        for name in ("scan", "read", "parse", "chunks", "index", "statistics"):
+            assert name in phases
+        files = result.timings["files"]
+        assert files["count"] == 2
+        assert set(files["percentiles"]) == {"p50", "p90", "p95", "p99"}
+        assert files["slowest"][0]["path"] == str(Path("pkg") / "large.py")
+        assert files["slowest"][0]["size"] > 1000
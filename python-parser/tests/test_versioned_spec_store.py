@@ -0,0 +1,117 @@
+import copy
+
+from src.infrastructure.repositories.versioned_spec_store import VersionedSpecStore
+
+
+def make_spec():
+    """테스트용 OpenAPI 3 스펙"""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Revenue API", "version": "1.0.0"},
+        "paths": {
+            "/api/v1/revenue/": {
+                "get": {
+                    "parameters": [
+                        {"name": "page", "in": "query", "required": False},
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Revenue"}
+                                }
+                            },
+                        }
+                    },
+                },
+            },
+            "/api/v1/revenue/{id}/": {
+                "delete": {"responses": {"204": {"description": "Deleted"}}},
+            },
+        },
+        "components": {
+            "schemas": {
+                "Revenue": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "amount": {"type": "number"},
+                    },
+                }
+            }
+        },
+    }
+
+
+class TestVersionedSpecStore:
+    """버전별 스펙 저장소와 구조 diff 테스트"""
+
+    def test_unchanged_path_items_are_shared(self):
+        """바뀌지 않은 path item은 버전 사이에 한 번만 보관되는지 테스트"""
+        store = VersionedSpecStore()
+        head = make_spec()
+        head["info"]["version"] = "1.1.0"
+
+        store.put("revenue", "main", make_spec())
+        store.put("revenue", "feature", head)
+
+        stats = store.stats()
+        assert stats["versions"] == 2
+        # 공통부 2개 + path item 2개
+        assert stats["blobs"] == 4
+        assert store.get_spec("revenue", "feature") == head
+
+    def test_identical_versions(self):
+        """내용이 같은 버전은 변경 없음으로 나오는지 테스트"""
+        store = VersionedSpecStore()
+        store.put("revenue", "main", make_spec())
+        store.put("revenue", "feature", make_spec())
+
+        result = store.diff("revenue", "main", "feature")
+
+        assert result["identical"] is True
+        assert result["summary"]["unchanged"] == 2
+        assert result["changed"] == []
+
+    def test_added_removed_and_breaking_changes(self):
+        """추가/삭제/변경 오퍼레이션과 호환성 깨짐 판단 테스트"""
+        store = VersionedSpecStore()
+        head = copy.deepcopy(make_spec())
+        del head["paths"]["/api/v1/revenue/{id}/"]
+        head["paths"]["/api/v1/revenue/"]["post"] = {
+            "responses": {"201": {"description": "Created"}}
+        }
+        # 공유 스키마에서 필드 삭제 -> 참조하는 오퍼레이션이 변경으로 잡혀야 함
+        del head["components"]["schemas"]["Revenue"]["properties"]["amount"]
+        head["paths"]["/api/v1/revenue/"]["get"]["parameters"][0]["required"] = True
+
+        store.put("revenue", "main", make_spec())
+        store.put("revenue", "feature", head)
+        result = store.diff("revenue", "main", "feature")
+
+        assert result["added"] == [
+            {"operation": "POST /api/v1/revenue/", "breaking": False}
+        ]
+        assert result["removed"] == [
+            {"operation": "DELETE /api/v1/revenue/{id}/", "breaking": True}
+        ]
+        changed = result["changed"][0]
+        assert changed["operation"] == "GET /api/v1/revenue/"
+        assert changed["breaking"] is True
+        assert "parameter became required: query:page" in changed["changes"]
+        assert "response field removed: 200 amount" in changed["changes"]
+        assert result["summary"]["breaking"] == 2
+
+    def test_replacing_label_releases_blobs(self):
+        """같은 라벨을 다시 저장하면 이전 blob이 정리되는지 테스트"""
+        store = VersionedSpecStore()
+        changed = make_spec()
+        changed["paths"]["/api/v1/revenue/{id}/"]["delete"]["summary"] = "삭제"
+
+        store.put("revenue", "main", make_spec())
+        store.put("revenue", "main", changed)
+
+        assert store.stats()["blobs"] == 3
+        assert [v["version"] for v in store.list_versions("revenue")] == ["main"]
+        assert store.diff("revenue", "main", "missing") is None
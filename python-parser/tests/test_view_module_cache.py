@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.generators.api_documentation_generator import (
+    ViewModuleCache,
+    import_viewset_class,
+)
+
+
+class TestViewModuleCache:
+    """views 모듈 캐시 테스트"""
+
+    @pytest.fixture
+    def views_file(self):
+        """ViewSet 두 개를 가진 views.py (import 횟수를 모듈 속성으로 기록)"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            app_dir = Path(tmpdir) / "project" / "app" / "cachedemo"
+            app_dir.mkdir(parents=True)
+            views_file = app_dir / "views.py"
+            views_file.write_text(
+                "import builtins\n\n"
+                "builtins._view_module_imports = (\n"
+                "    getattr(builtins, '_view_module_imports', 0) + 1\n"
+                ")\n\n"
+                "class OrderViewSet:\n    pass\n\n"
+                "class RefundViewSet:\n    pass\n"
+            )
+            yield views_file
+
+            import builtins
+
+            builtins.__dict__.pop("_view_module_imports", None)
+            for name in [name for name in sys.modules if "cachedemo" in name]:
+                del sys.modules[name]
+
+    def test_module_imported_once_for_many_viewsets(self, views_file):
+        """같은 views 모듈의 ViewSet 여러 개를 찾아도 한 번만 import"""
+        import builtins
+
+        cache = ViewModuleCache()
+
+        assert import_viewset_class(str(views_file), "OrderViewSet", cache)
+        assert import_viewset_class(str(views_file), "RefundViewSet", cache)
+        assert import_viewset_class(str(views_file), "OrderViewSet", cache)
+
+        assert builtins._view_module_imports == 1
+        assert cache.loads == 1
+        assert cache.hits == 2
+
+    def test_module_reimported_after_mtime_change(self, views_file):
+        """파일이 바뀌면 다음 조회에서 다시 import"""
+        import builtins
+
+        cache = ViewModuleCache()
+        assert import_viewset_class(str(views_file), "OrderViewSet", cache)
+        assert not import_viewset_class(str(views_file), "ExportViewSet", cache)
+
+        views_file.write_text(
+            views_file.read_text() + "\nclass ExportViewSet:\n    pass\n"
+        )
+        stat = views_file.stat()
+        os.utime(views_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert import_viewset_class(str(views_file), "ExportViewSet", cache)
+        assert builtins._view_module_imports == 2
+        assert cache.loads == 2
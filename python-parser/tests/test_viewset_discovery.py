@@ -0,0 +1,131 @@
+import pytest
+from pathlib import Path
+import tempfile
+
+from src.infrastructure.generators.viewset_discovery import ViewSetIndex
+
+
+class TestViewSetIndex:
+    """AST 기반 ViewSet 발견 인덱스 테스트"""
+
+    @pytest.fixture
+    def project(self):
+        """테스트용 Django 프로젝트 구조"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "app" / "revenue" / "views").mkdir(parents=True)
+            (root / "app" / "core").mkdir(parents=True)
+
+            (root / "app" / "core" / "base.py").write_text(
+                "from rest_framework import viewsets\n\n"
+                "class BaseAPI(viewsets.ModelViewSet):\n"
+                "    pass\n"
+            )
+            (root / "app" / "revenue" / "views.py").write_text(
+                "from core.base import BaseAPI\n\n"
+                "class RevenueViewSet(BaseAPI):\n"
+                "    pass\n\n"
+                "class Helper:\n"
+                "    pass\n"
+            )
+            (root / "app" / "revenue" / "views" / "share.py").write_text(
+                "from core.base import BaseAPI as Base\n\n"
+                "class RevenueShare(Base):\n"
+                "    pass\n"
+            )
+            yield root
+
+    def test_discover_indirect_subclasses(self, project):
+        """간접 ViewSet 서브클래스 발견 테스트"""
+        index = ViewSetIndex()
+        viewsets = {v["viewset"]: v for v in index.discover(project)}
+
+        assert "RevenueViewSet" in viewsets
+        assert "RevenueShare" in viewsets
+        # 공통 베이스는 엔드포인트가 아님
+        assert "BaseAPI" not in viewsets
+        assert "Helper" not in viewsets
+
+        revenue = viewsets["RevenueViewSet"]
+        assert revenue["app"] == "revenue"
+        assert revenue["app_name"] == "revenue"
+        assert revenue["url"] == "/api/v1/revenues/"
+        assert viewsets["RevenueShare"]["app"] == "revenue/views/share"
+
+    def test_cache_reparses_only_changed_files(self, project):
+        """변경된 파일만 다시 파싱하는지 테스트"""
+        index = ViewSetIndex()
+        index.discover(project)
+        assert index.last_scan_stats["reparsed"] == 3
+
+        index.discover(project)
+        assert index.last_scan_stats["reparsed"] == 0
+        assert index.last_scan_stats["cache_hits"] == 3
+
+        views_file = project / "app" / "revenue" / "views.py"
+        views_file.write_text(
+            views_file.read_text() + "\nclass ExtraViewSet(BaseAPI):\n    pass\n"
+        )
+        viewsets = index.discover(project)
+
+        assert index.last_scan_stats["reparsed"] == 1
+        assert any(v["viewset"] == "ExtraViewSet" for v in viewsets)
+
+    def test_excludes_bases_and_abstract_classes(self, project):
+        """다른 ViewSet의 베이스와 Meta.abstract 클래스는 제외"""
+        (project / "app" / "revenue" / "viewsets.py").write_text(
+            "from rest_framework.viewsets import GenericViewSet\n\n"
+            "class AuditedViewSet(GenericViewSet):\n"
+            "    class Meta:\n"
+            "        abstract = True\n\n"
+            "class ReportViewSet(GenericViewSet):\n"
+            "    pass\n\n"
+            "class DetailedReportViewSet(ReportViewSet):\n"
+            "    pass\n"
+        )
+
+        viewsets = {v["viewset"] for v in ViewSetIndex().discover(project)}
+
+        assert "DetailedReportViewSet" in viewsets
+        assert "ReportViewSet" not in viewsets
+        assert "AuditedViewSet" not in viewsets
+
+    def test_bases_resolved_through_module_imports(self, project):
+        """같은 이름의 클래스는 각 모듈의 import로 구분"""
+        (project / "app" / "billing").mkdir()
+        # billing의 BaseAPI는 ViewSet이 아님
+        (project / "app" / "billing" / "base.py").write_text(
+            "class BaseAPI:\n    pass\n"
+        )
+        (project / "app" / "billing" / "views.py").write_text(
+            "from .base import BaseAPI\n"
+            "from core import base\n\n"
+            "class InvoiceHelper(BaseAPI):\n"
+            "    pass\n\n"
+            "class InvoiceViewSet(base.BaseAPI):\n"
+            "    pass\n"
+        )
+
+        viewsets = {v["viewset"] for v in ViewSetIndex().discover(project)}
+
+        assert "InvoiceViewSet" in viewsets
+        assert "InvoiceHelper" not in viewsets
+
+    def test_subclassed_concrete_viewset_kept(self, project):
+        """queryset을 가진 구체 ViewSet은 다른 ViewSet이 상속해도 보고"""
+        (project / "app" / "orders").mkdir()
+        (project / "app" / "orders" / "views.py").write_text(
+            "from rest_framework.viewsets import ModelViewSet\n\n"
+            "class OrderViewSet(ModelViewSet):\n"
+            "    queryset = Order.objects.all()\n\n"
+            "class OrderV2ViewSet(OrderViewSet):\n"
+            "    pass\n\n"
+            "class AuditMixin(ModelViewSet):\n"
+            "    def get_queryset(self):\n"
+            "        return super().get_queryset()\n"
+        )
+
+        viewsets = {v["viewset"] for v in ViewSetIndex().discover(project)}
+
+        assert {"OrderViewSet", "OrderV2ViewSet"} <= viewsets
+        assert "AuditMixin" not in viewsets